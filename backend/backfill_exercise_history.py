@@ -0,0 +1,83 @@
+"""
+Exercise History Backfill
+
+Copies each workout's athlete_id and date onto its exercises as athlete_id and
+workout_date, together with the athlete_exercise_type key derived from them, so
+exercises written before the athlete-date and athlete-type indexes existed show up in
+analytics history. Workouts themselves get the athlete_status key of the
+athlete-status index. New writes maintain these attributes themselves; the backfill is
+idempotent and only updates items that are missing or out of date.
+
+Usage:
+    python backfill_exercise_history.py --env dev --dry-run
+    python backfill_exercise_history.py --env prod
+"""
+
+import argparse
+import os
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill the history index attributes of workouts and exercises"
+    )
+    parser.add_argument(
+        "--env", default="dev", help="Environment to backfill (default: dev)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count the items that need updating without writing",
+    )
+    args = parser.parse_args()
+
+    # Table names are read when the config modules are imported
+    os.environ.setdefault("WORKOUTS_TABLE", f"flow-{args.env}-workouts")
+    os.environ.setdefault("EXERCISES_TABLE", f"flow-{args.env}-exercises")
+
+    from src.repositories.exercise_repository import ExerciseRepository
+    from src.repositories.workout_repository import WorkoutRepository
+
+    workout_repository = WorkoutRepository()
+    exercise_repository = ExerciseRepository()
+
+    workouts = 0
+    updated = 0
+    skipped = 0
+    statuses_updated = 0
+
+    for workout in workout_repository.iter_scan(
+        attributes=["workout_id", "athlete_id", "date", "status", "athlete_status"]
+    ):
+        workouts += 1
+        athlete_id = workout.get("athlete_id")
+        workout_date = workout.get("date")
+        if not athlete_id or not workout_date:
+            skipped += 1
+            continue
+
+        athlete_status = WorkoutRepository.with_athlete_status_key(workout).get(
+            "athlete_status"
+        )
+        if athlete_status and workout.get("athlete_status") != athlete_status:
+            statuses_updated += 1
+            if not args.dry_run:
+                workout_repository.update_workout(
+                    workout["workout_id"], {"athlete_status": athlete_status}
+                )
+
+        updated += exercise_repository.update_workout_context(
+            workout["workout_id"], athlete_id, workout_date, dry_run=args.dry_run
+        )
+
+        if workouts % 500 == 0:
+            print(f"   {workouts} workouts scanned, {updated} exercises to update")
+
+    action = "would be updated" if args.dry_run else "updated"
+    print(f"📊 Workouts scanned: {workouts} ({skipped} without athlete or date)")
+    print(f"✅ Workout statuses {action}: {statuses_updated}")
+    print(f"✅ Exercises {action}: {updated}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Notification Unread Index Backfill
+
+Copies coach_id onto every unread notification as unread_coach_id, the key of the
+sparse coach-unread-index, so notifications written before the index existed show up
+in unread-only listings and bulk mark-read. New writes maintain the key themselves; the
+backfill is idempotent and only updates unread notifications that are missing it. Run
+the unread counter reconciliation afterwards so the counters match the index.
+
+Usage:
+    python backfill_notification_unread_index.py --env dev --dry-run
+    python backfill_notification_unread_index.py --env prod
+"""
+
+import argparse
+import os
+
+from botocore.exceptions import ClientError
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill the unread index key of notifications"
+    )
+    parser.add_argument(
+        "--env", default="dev", help="Environment to backfill (default: dev)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count the items that need updating without writing",
+    )
+    args = parser.parse_args()
+
+    # Table names are read when the config modules are imported
+    os.environ.setdefault("NOTIFICATIONS_TABLE", f"flow-{args.env}-notifications")
+
+    from src.repositories.notification_repository import NotificationRepository
+
+    notification_repository = NotificationRepository()
+
+    scan_kwargs = {
+        "ProjectionExpression": "notification_id, coach_id, is_read, unread_coach_id",
+    }
+
+    notifications = 0
+    updated = 0
+
+    while True:
+        response = notification_repository.table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            # Counter items have no coach_id
+            if "coach_id" not in item:
+                continue
+            notifications += 1
+
+            if item.get("is_read", False) or "unread_coach_id" in item:
+                continue
+            updated += 1
+            if not args.dry_run:
+                try:
+                    # Skip notifications marked read since the scan
+                    notification_repository.table.update_item(
+                        Key={"notification_id": item["notification_id"]},
+                        UpdateExpression="SET unread_coach_id = coach_id",
+                        ConditionExpression="is_read = :false",
+                        ExpressionAttributeValues={":false": False},
+                    )
+                except ClientError as e:
+                    if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                        raise
+
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    action = "would be updated" if args.dry_run else "updated"
+    print(f"📊 Notifications scanned: {notifications}")
+    print(f"✅ Unread notifications {action}: {updated}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Workout Exercise Counter Backfill
+
+Stores completed_count and total_count on every workout written before the counters
+existed, so completing an exercise can derive the workout status from the counters
+instead of reloading the workout. Workouts without counters are also recounted the first
+time one of their exercises changes; the backfill only saves those extra reads. It is
+idempotent and never overwrites counters that are already present.
+
+Usage:
+    python backfill_workout_exercise_counts.py --env dev --dry-run
+    python backfill_workout_exercise_counts.py --env prod
+"""
+
+import argparse
+import os
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill the exercise counters of workouts"
+    )
+    parser.add_argument(
+        "--env", default="dev", help="Environment to backfill (default: dev)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count the workouts that need updating without writing",
+    )
+    args = parser.parse_args()
+
+    # Table names are read when the config modules are imported
+    os.environ.setdefault("WORKOUTS_TABLE", f"flow-{args.env}-workouts")
+    os.environ.setdefault("EXERCISES_TABLE", f"flow-{args.env}-exercises")
+
+    from src.repositories.workout_repository import WorkoutRepository
+
+    workout_repository = WorkoutRepository()
+
+    scan_kwargs = {
+        "ProjectionExpression": "workout_id, total_count",
+    }
+
+    workouts = 0
+    updated = 0
+
+    while True:
+        response = workout_repository.table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            workouts += 1
+            if "total_count" in item:
+                continue
+            updated += 1
+            if not args.dry_run:
+                # Skips workouts counted by a concurrent exercise change since the scan
+                workout_repository.recount_exercises(item["workout_id"])
+
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    action = "would be updated" if args.dry_run else "updated"
+    print(f"📊 Workouts scanned: {workouts}")
+    print(f"✅ Workouts {action}: {updated}")
+
+
+if __name__ == "__main__":
+    main()
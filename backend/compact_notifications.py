@@ -0,0 +1,83 @@
+"""
+Notification Compaction
+
+Replaces the full workout_data blob stored on notifications written before
+summaries existed with the compact workout_summary that new notifications carry.
+The full workout is served on demand by GET /notifications/{notification_id}/workout,
+so nothing is lost. The migration is idempotent: compacted items have no
+workout_data and are skipped.
+
+Usage:
+    python compact_notifications.py --env dev --dry-run
+    python compact_notifications.py --env prod
+"""
+
+import argparse
+import os
+
+from botocore.exceptions import ClientError
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replace notification workout_data with a compact workout_summary"
+    )
+    parser.add_argument(
+        "--env", default="dev", help="Environment to migrate (default: dev)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count the items that need compacting without writing",
+    )
+    args = parser.parse_args()
+
+    # Table names are read when the config modules are imported
+    os.environ.setdefault("NOTIFICATIONS_TABLE", f"flow-{args.env}-notifications")
+
+    from boto3.dynamodb.conditions import Attr
+    from src.models.notification import Notification
+    from src.repositories.notification_repository import NotificationRepository
+    from src.utils.decimal_converter import convert_floats_to_decimals
+
+    notification_repository = NotificationRepository()
+
+    scan_kwargs = {
+        "ProjectionExpression": "notification_id, workout_data",
+        "FilterExpression": Attr("workout_data").exists(),
+    }
+
+    compacted = 0
+
+    while True:
+        response = notification_repository.table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            compacted += 1
+            if args.dry_run:
+                continue
+
+            summary = Notification.summarize_workout(item["workout_data"])
+            try:
+                # Skip items compacted by a concurrent run since the scan
+                notification_repository.table.update_item(
+                    Key={"notification_id": item["notification_id"]},
+                    UpdateExpression="SET workout_summary = :summary REMOVE workout_data",
+                    ConditionExpression="attribute_exists(workout_data)",
+                    ExpressionAttributeValues={
+                        ":summary": convert_floats_to_decimals(summary)
+                    },
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    action = "would be compacted" if args.dry_run else "compacted"
+    print(f"✅ Notifications {action}: {compacted}")
+
+
+if __name__ == "__main__":
+    main()
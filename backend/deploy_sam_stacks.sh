@@ -74,18 +74,31 @@ else
 fi
 
 sam build -t "$DATA_TEMPLATE"
-sam deploy -t "$DATA_TEMPLATE" \
-    --stack-name "flow-data-${ENVIRONMENT}" \
-    --parameter-overrides Environment=${ENVIRONMENT} LayerVersion=${LAYER_VERSION} \
-    $SAM_DEPLOY_FLAGS
 
-if [ $? -ne 0 ]; then
-  echo "❌ Failed to deploy data stack."
-  exit 1
-else
-  echo "✅ Data stack deployed successfully."
+# DynamoDB accepts one GSI creation per table per update, so new indexes are rolled
+# out one stage at a time, resuming from the stage the stack is already at. Going back
+# to a lower stage would delete indexes, so the loop never starts below it
+CURRENT_INDEX_STAGE=$(aws cloudformation describe-stacks --stack-name "flow-data-${ENVIRONMENT}" \
+    --query "Stacks[0].Parameters[?ParameterKey=='IndexMigrationStage'].ParameterValue" \
+    --output text 2>/dev/null || echo "")
+if [[ ! "$CURRENT_INDEX_STAGE" =~ ^[123]$ ]]; then
+  CURRENT_INDEX_STAGE=1
 fi
 
+for INDEX_STAGE in $(seq "$CURRENT_INDEX_STAGE" 3); do
+  echo "🗂️  Index migration stage ${INDEX_STAGE}..."
+  sam deploy -t "$DATA_TEMPLATE" \
+      --stack-name "flow-data-${ENVIRONMENT}" \
+      --parameter-overrides Environment=${ENVIRONMENT} LayerVersion=${LAYER_VERSION} IndexMigrationStage=${INDEX_STAGE} \
+      $SAM_DEPLOY_FLAGS
+
+  if [ $? -ne 0 ]; then
+    echo "❌ Failed to deploy data stack at index stage ${INDEX_STAGE}."
+    exit 1
+  fi
+done
+echo "✅ Data stack deployed successfully."
+
 # Step 3: Deploy App Stack  
 echo "⚡ Step 3: Validating and deploying app stack..."
 sam validate --lint -t "$APP_TEMPLATE"
@@ -0,0 +1,108 @@
+"""
+DynamoDB Deserialization Benchmark
+
+Compares the resource read path (TypeDeserializer to Decimal, then
+convert_decimals_to_floats) with the single-pass fast deserializer on a synthetic
+exercise history in low-level wire format.
+
+Usage:
+    python deserialization_benchmark.py --exercises 5000 --repeat 5
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+from boto3.dynamodb.types import TypeDeserializer
+from src.utils.decimal_converter import convert_decimals_to_floats
+from src.utils.fast_deserializer import deserialize_item, serialize_value
+
+
+def build_history(count: int, sets_per_exercise: int) -> List[Dict[str, Any]]:
+    """Builds wire-format exercise items shaped like completed exercise records"""
+    rng = random.Random(42)
+    items = []
+    for index in range(count):
+        weight = rng.choice([60, 80, 100, 120, 140]) + rng.choice([0, 2.5, 5])
+        exercise = {
+            "exercise_id": f"exercise-{index}",
+            "workout_id": f"workout-{index // 5}",
+            "day_id": f"day-{index // 5}",
+            "exercise_type": rng.choice(["Squat", "Bench Press", "Deadlift"]),
+            "sets": sets_per_exercise,
+            "reps": 5,
+            "weight": weight,
+            "rpe": rng.choice([7, 7.5, 8, 8.5, 9]),
+            "status": "completed",
+            "order": index % 5,
+            "is_predefined": True,
+            "sets_data": [
+                {
+                    "set_number": set_number,
+                    "reps": 5,
+                    "weight": weight,
+                    "rpe": rng.choice([7, 7.5, 8]),
+                    "completed": True,
+                }
+                for set_number in range(1, sets_per_exercise + 1)
+            ],
+        }
+        items.append(serialize_value(exercise)["M"])
+    return items
+
+
+def resource_path(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Deserializes the way Table.query results are handled today"""
+    deserializer = TypeDeserializer()
+    return [
+        convert_decimals_to_floats(
+            {key: deserializer.deserialize(value) for key, value in item.items()}
+        )
+        for item in items
+    ]
+
+
+def fast_path(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Deserializes with the single-pass fast deserializer"""
+    return [deserialize_item(item) for item in items]
+
+
+def best_time(run: Callable[[], Any], repeat: int) -> float:
+    """Best CPU time in seconds over a number of runs"""
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        run()
+        timings.append(time.process_time() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark DynamoDB read deserialization paths"
+    )
+    parser.add_argument("--exercises", type=int, default=5000)
+    parser.add_argument("--sets", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = build_history(args.exercises, args.sets)
+    if resource_path(items) != fast_path(items):
+        raise SystemExit("Deserializers disagree on the generated history")
+
+    resource_seconds = best_time(lambda: resource_path(items), args.repeat)
+    fast_seconds = best_time(lambda: fast_path(items), args.repeat)
+
+    print(f"Exercises: {args.exercises} ({args.sets} sets each)")
+    print(
+        f"TypeDeserializer + convert_decimals_to_floats: {resource_seconds * 1000:.1f} ms"
+    )
+    print(f"Single-pass deserializer: {fast_seconds * 1000:.1f} ms")
+    print(
+        f"CPU saved: {(resource_seconds - fast_seconds) * 1000:.1f} ms "
+        f"({resource_seconds / fast_seconds:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -32,15 +32,12 @@ def validate_athlete_access(user_id: str, athlete_id: str) -> bool:
             return True
 
         # Check if user is a coach with active relationship to this athlete
-        from src.services.relationship_service import RelationshipService
-
-        relationship_service = RelationshipService()
-        relationship = relationship_service.get_active_relationship(
+        status = relationship_service.get_active_relationship_status(
             coach_id=user_id, athlete_id=athlete_id
         )
 
         # Return True only if active relationship exists
-        return relationship is not None and relationship.status == "active"
+        return status == "active"
 
     except Exception as e:
         logger.warning(
@@ -31,8 +31,8 @@ def get_user_weight_preference(user_id: str) -> str:
     :return: Weight preference ("auto", "kg", "lb")
     """
     try:
-        user = user_service.get_user(user_id)
-        return user.weight_unit_preference if user else "auto"
+        # Only the preference is needed, not the whole user item
+        return user_service.get_weight_unit_preference(user_id) or "auto"
     except Exception as e:
         logger.warning(f"Failed to get user weight preference for {user_id}: {str(e)}")
         return "auto"
@@ -421,7 +421,7 @@ def reorder_exercises(event, context):
 
         # Reorder exercises
         reorder_exercises = exercise_service.reorder_exercises(
-            workout_id, exercise_order
+            workout_id, exercise_order, exercises=workout.exercises
         )
 
         return create_response(
@@ -473,7 +473,9 @@ def reorder_sets(event, context):
                 )
 
         # Reorder the sets
-        updated_exercise = service.reorder_sets(exercise_id, new_order)
+        updated_exercise = service.reorder_sets(
+            exercise_id, new_order, exercise=exercise
+        )
 
         if not updated_exercise:
             return create_response(404, {"error": "Failed to reorder sets"})
@@ -566,6 +568,7 @@ def track_set(event, context):
             rpe=rpe,
             completed=completed,
             notes=notes,
+            exercise=exercise,
         )
 
         # Convert response back to display units for frontend
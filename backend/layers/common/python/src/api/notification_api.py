@@ -1,6 +1,14 @@
+import json
 import logging
 from src.services.notification_service import NotificationService
+from src.services.workout_service import WorkoutService
+from src.config.notification_config import NotificationConfig
 from src.utils.response import create_response
+from src.utils.pagination import (
+    encode_cursor,
+    next_cursor_headers,
+    parse_pagination_params,
+)
 from src.middleware.middleware import with_middleware
 from src.middleware.common_middleware import log_request, handle_errors
 
@@ -8,6 +16,7 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 notification_service = NotificationService()
+workout_service = WorkoutService()
 
 
 @with_middleware([log_request, handle_errors])
@@ -56,12 +65,25 @@ def get_notifications(event, context):
                 result[athlete_id] = [n.to_dict() for n in athlete_notifications]
             return create_response(200, result)
         else:
-            # Return flat list of notifications
-            notifications = notification_service.get_notifications_for_coach(
-                user_id, limit, unread_only
+            # Return one page of the flat list; the next page's cursor goes in a header
+            cursor_scope = f"notifications:{user_id}:{unread_only}"
+            try:
+                page_limit, start_key = parse_pagination_params(
+                    query_params, cursor_scope, NotificationConfig.MAX_ITEMS
+                )
+            except ValueError as e:
+                return create_response(400, {"error": str(e)})
+
+            (
+                notifications,
+                last_evaluated_key,
+            ) = notification_service.get_notifications_page_for_coach(
+                user_id, page_limit, unread_only, start_key
             )
             return create_response(
-                200, [notification.to_dict() for notification in notifications]
+                200,
+                [notification.to_dict() for notification in notifications],
+                next_cursor_headers(encode_cursor(last_evaluated_key, cursor_scope)),
             )
 
     except Exception as e:
@@ -69,6 +91,80 @@ def get_notifications(event, context):
         return create_response(500, {"error": str(e)})
 
 
+@with_middleware([log_request, handle_errors])
+def get_unread_count(event, context):
+    """
+    Handle GET /notifications/unread-count request to get the authenticated coach's
+    badge count
+    """
+    try:
+        # Extract coach_id from JWT claims
+        user_id = (
+            event.get("requestContext", {})
+            .get("authorizer", {})
+            .get("claims", {})
+            .get("sub")
+        )
+
+        if not user_id:
+            logger.error("No user ID found in request context")
+            return create_response(401, {"error": "Unauthorized"})
+
+        unread_count = notification_service.get_unread_count_for_coach(user_id)
+
+        return create_response(200, {"unread_count": unread_count})
+
+    except Exception as e:
+        logger.error(f"Error getting unread notification count: {str(e)}")
+        return create_response(500, {"error": str(e)})
+
+
+@with_middleware([log_request, handle_errors])
+def get_notification_workout(event, context):
+    """
+    Handle GET /notifications/{notification_id}/workout request to get the full workout
+    behind a notification, which only stores a summary
+    """
+    try:
+        # Extract coach_id from JWT claims for authorization
+        user_id = (
+            event.get("requestContext", {})
+            .get("authorizer", {})
+            .get("claims", {})
+            .get("sub")
+        )
+
+        if not user_id:
+            logger.error("No user ID found in request context")
+            return create_response(401, {"error": "Unauthorized"})
+
+        notification_id = event["pathParameters"]["notification_id"]
+
+        notification = notification_service.get_notification(notification_id)
+
+        if not notification:
+            return create_response(404, {"error": "Notification not found"})
+
+        # The notification grants its coach access to the workout
+        if notification.coach_id != user_id:
+            logger.warning(
+                f"User {user_id} attempted to read the workout of notification "
+                f"{notification_id}, but coach_id is {notification.coach_id}"
+            )
+            return create_response(403, {"error": "Forbidden"})
+
+        workout = workout_service.get_workout(notification.workout_id)
+
+        if not workout:
+            return create_response(404, {"error": "Workout not found"})
+
+        return create_response(200, workout.to_dict())
+
+    except Exception as e:
+        logger.error(f"Error getting notification workout: {str(e)}")
+        return create_response(500, {"error": str(e)})
+
+
 @with_middleware([log_request, handle_errors])
 def mark_notification_as_read(event, context):
     """
@@ -108,7 +204,9 @@ def mark_notification_as_read(event, context):
             return create_response(403, {"error": "Forbidden"})
 
         # Mark as read
-        success = notification_service.mark_notification_as_read(notification_id)
+        success = notification_service.mark_notification_as_read(
+            notification_id, notification.coach_id
+        )
 
         if success:
             return create_response(200, {"message": "Notification marked as read"})
@@ -120,3 +218,61 @@ def mark_notification_as_read(event, context):
     except Exception as e:
         logger.error(f"Error marking notification as read: {str(e)}")
         return create_response(500, {"error": str(e)})
+
+
+@with_middleware([log_request, handle_errors])
+def mark_notifications_as_read(event, context):
+    """
+    Handle PATCH /notifications/read request to mark the authenticated coach's
+    notifications as read in bulk. Marks the listed notification_ids, or every unread
+    notification when the body has none.
+    """
+    try:
+        # Extract coach_id from JWT claims for authorization
+        user_id = (
+            event.get("requestContext", {})
+            .get("authorizer", {})
+            .get("claims", {})
+            .get("sub")
+        )
+
+        if not user_id:
+            logger.error("No user ID found in request context")
+            return create_response(401, {"error": "Unauthorized"})
+
+        try:
+            body = json.loads(event.get("body") or "{}")
+        except json.JSONDecodeError:
+            return create_response(400, {"error": "Invalid JSON in request body"})
+
+        notification_ids = body.get("notification_ids")
+        if notification_ids is not None:
+            if not isinstance(notification_ids, list) or not all(
+                isinstance(notification_id, str) for notification_id in notification_ids
+            ):
+                return create_response(
+                    400, {"error": "notification_ids must be a list of strings"}
+                )
+            if len(notification_ids) > NotificationConfig.MAX_BULK_READ_ITEMS:
+                return create_response(
+                    400,
+                    {
+                        "error": "Cannot mark more than "
+                        f"{NotificationConfig.MAX_BULK_READ_ITEMS} "
+                        "notifications at once"
+                    },
+                )
+
+        count = len(notification_ids) if notification_ids is not None else "all"
+        logger.info(f"Marking {count} notifications as read for user {user_id}")
+
+        # Ownership is enforced per notification by the repository's write condition
+        marked = notification_service.mark_notifications_as_read(
+            user_id, notification_ids
+        )
+
+        return create_response(200, {"marked_read": marked})
+
+    except Exception as e:
+        logger.error(f"Error marking notifications as read: {str(e)}")
+        return create_response(500, {"error": str(e)})
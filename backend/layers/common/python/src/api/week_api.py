@@ -3,6 +3,7 @@ import logging
 from src.services.week_service import WeekService
 from src.services.block_service import BlockService
 from src.services.relationship_service import RelationshipService
+from src.services.program_clone_service import CloneConflictError, ProgramCloneService
 from src.utils.response import create_response
 from src.middleware.middleware import with_middleware
 from src.middleware.common_middleware import log_request, handle_errors
@@ -13,6 +14,7 @@ logger.setLevel(logging.INFO)
 week_service = WeekService()
 block_service = BlockService()
 relationship_service = RelationshipService()
+program_clone_service = ProgramCloneService()
 
 
 @with_middleware([log_request, handle_errors])
@@ -154,11 +156,79 @@ def delete_week(event, context):
                     403, {"error": "Unauthorized access to this week"}
                 )
 
-        # Delete week
-        week_service.delete_week(week_id)
+        # Delete week, reporting how many items the cascade removed
+        counts = week_service.delete_week(week_id)
 
-        return create_response(204, {})
+        return create_response(200, {"deleted": counts})
 
     except Exception as e:
         logger.error(f"Error deleting week: {str(e)}")
         return create_response(500, {"error": str(e)})
+
+
+@with_middleware([log_request, handle_errors])
+def copy_week(event, context):
+    """
+    Handle POST /weeks/{week_id}/copy request to copy a week's workouts onto another week
+    """
+    try:
+        week_id = event["pathParameters"]["week_id"]
+        body = json.loads(event.get("body") or "{}")
+
+        target_week_id = body.get("target_week_id")
+        if not target_week_id:
+            return create_response(
+                400, {"error": "Missing required field: target_week_id"}
+            )
+
+        # Resolve both weeks to their block's athlete in one batched read per level
+        user_id = event["requestContext"]["authorizer"]["claims"]["sub"]
+        week_athletes = program_clone_service.get_week_athletes(
+            [week_id, target_week_id]
+        )
+        if week_id not in week_athletes:
+            return create_response(404, {"error": "Week not found"})
+        if target_week_id not in week_athletes:
+            return create_response(404, {"error": "Target week not found"})
+
+        athlete_id = week_athletes[week_id]
+        if week_athletes[target_week_id] != athlete_id:
+            return create_response(
+                400, {"error": "Source and target weeks belong to different athletes"}
+            )
+
+        # Verify ownership
+        if user_id != athlete_id:
+            relationship = relationship_service.get_active_relationship(
+                coach_id=user_id, athlete_id=athlete_id
+            )
+            if not relationship:
+                return create_response(
+                    403, {"error": "Unauthorized access to this week"}
+                )
+
+        # Copy week
+        try:
+            counts = program_clone_service.clone_week(
+                week_id,
+                target_week_id,
+                athlete_id,
+                strip_sets_data=bool(body.get("strip_sets_data", False)),
+            )
+        except CloneConflictError:
+            return create_response(
+                409,
+                {
+                    "error": "Target week already has workouts. Delete them first to copy."
+                },
+            )
+        except ValueError as e:
+            return create_response(400, {"error": str(e)})
+
+        return create_response(
+            201, {"week_id": week_id, "target_week_id": target_week_id, **counts}
+        )
+
+    except Exception as e:
+        logger.error(f"Error copying week: {str(e)}")
+        return create_response(500, {"error": str(e)})
@@ -47,6 +47,38 @@ class AppConfig(BaseConfig):
     DYNAMODB_RETRY_BASE_DELAY_MS = BaseConfig.get_int_env(
         "DYNAMODB_RETRY_BASE_DELAY_MS", 100
     )
+    DYNAMODB_RETRY_MAX_DELAY_MS = BaseConfig.get_int_env(
+        "DYNAMODB_RETRY_MAX_DELAY_MS", 2000
+    )
+    # Time kept back from the Lambda timeout when deciding whether a retry still fits
+    DYNAMODB_RETRY_TIME_MARGIN_MS = BaseConfig.get_int_env(
+        "DYNAMODB_RETRY_TIME_MARGIN_MS", 500
+    )
+    DYNAMODB_ADAPTIVE_RATE_LIMIT = BaseConfig.get_bool_env(
+        "DYNAMODB_ADAPTIVE_RATE_LIMIT", True
+    )
+
+    # DynamoDB Connection Pool (shared by all repositories in a process)
+    DYNAMODB_MAX_POOL_CONNECTIONS = BaseConfig.get_int_env(
+        "DYNAMODB_MAX_POOL_CONNECTIONS", 25
+    )
+    DYNAMODB_CONNECT_TIMEOUT_SEC = BaseConfig.get_int_env(
+        "DYNAMODB_CONNECT_TIMEOUT_SEC", 2
+    )
+    DYNAMODB_READ_TIMEOUT_SEC = BaseConfig.get_int_env("DYNAMODB_READ_TIMEOUT_SEC", 5)
+    DYNAMODB_TCP_KEEPALIVE = BaseConfig.get_bool_env("DYNAMODB_TCP_KEEPALIVE", True)
+
+    # Repository Fan-out (worker count is capped at the connection pool size)
+    FAN_OUT_MAX_WORKERS = BaseConfig.get_int_env(
+        "FAN_OUT_MAX_WORKERS", DYNAMODB_MAX_POOL_CONNECTIONS
+    )
+    FAN_OUT_MAX_QUEUE = BaseConfig.get_int_env("FAN_OUT_MAX_QUEUE", 100)
+
+    # Cursor Pagination
+    # No default: cursors cannot be signed until the secret is configured
+    PAGINATION_CURSOR_SECRET = BaseConfig.get_env("PAGINATION_CURSOR_SECRET", "")
+    PAGINATION_MAX_LIMIT = BaseConfig.get_int_env("PAGINATION_MAX_LIMIT", 100)
+
     # Cognito
     USER_POOL_ID = BaseConfig.get_env("USER_POOL_ID", "")
     USER_POOL_CLIENT_ID = BaseConfig.get_env("USER_POOL_CLIENT_ID", "")
@@ -58,6 +90,11 @@ class AppConfig(BaseConfig):
     # Cache settings
     CACHE_ENABLED = BaseConfig.get_bool_env("CACHE_ENABLED", True)
     CACHE_TTL = BaseConfig.get_int_env("CACHE_TTL", 300)  # 5 minutes
+    CACHE_MAX_ENTRIES = BaseConfig.get_int_env("CACHE_MAX_ENTRIES", 1024)
+    # Coach access decisions are cached per warm function. Ending a relationship only
+    # clears the cache of the function that ended it, so every other function may keep
+    # granting the coach access for up to this many seconds afterwards.
+    AUTHORIZATION_CACHE_TTL = BaseConfig.get_int_env("AUTHORIZATION_CACHE_TTL", 30)
 
     @classmethod
     def is_production(cls) -> bool:
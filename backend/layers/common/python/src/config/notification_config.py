@@ -14,6 +14,22 @@ class NotificationConfig(BaseConfig):
 
     # DynamoDB Global Secondary Index Names
     COACH_INDEX = "coach-index"
+    # Sparse: only unread notifications carry the unread_coach_id key
+    COACH_UNREAD_INDEX = "coach-unread-index"
+
+    # Per-coach unread counters live in the notifications table under this key prefix
+    UNREAD_COUNTER_PREFIX = "unread-counter#"
+
+    # Recounts per coach when the counter keeps changing during reconciliation
+    RECONCILE_MAX_ATTEMPTS = BaseConfig.get_int_env(
+        "NOTIFICATION_RECONCILE_MAX_ATTEMPTS", 3
+    )
+
+    # The unread index is eventually consistent, so a mismatch is only corrected when
+    # a second count this many seconds later still agrees
+    RECONCILE_CONFIRM_DELAY_SECONDS = BaseConfig.get_int_env(
+        "NOTIFICATION_RECONCILE_CONFIRM_DELAY_SECONDS", 2
+    )
 
     # API Rate Limits (per minute)
     NOTIFICATION_CREATE_RATE_LIMIT_PER_MIN = BaseConfig.get_int_env(
@@ -34,6 +50,11 @@ class NotificationConfig(BaseConfig):
     # Query Limits (maximum items per request)
     MAX_ITEMS = BaseConfig.get_int_env("NOTIFICATION_MAX_ITEMS", 50)
 
+    # Maximum notification IDs accepted by one bulk mark-read request
+    MAX_BULK_READ_ITEMS = BaseConfig.get_int_env(
+        "NOTIFICATION_MAX_BULK_READ_ITEMS", 500
+    )
+
     # Notification Type Options
     TYPE_OPTIONS = ["workout_completion"]
 
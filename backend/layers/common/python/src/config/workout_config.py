@@ -16,11 +16,23 @@ class WorkoutConfig(BaseConfig):
     )
 
     # DynamoDB Global Secondary Index Names
-    ATHLETE_INDEX = "athlete-index"
+    # Keyed by athlete_id and sorted by date, so date ranges are key conditions
+    ATHLETE_DATE_INDEX = "athlete-date-index"
+    # Keyed by "<athlete_id>#<status>" and sorted by date
+    ATHLETE_STATUS_INDEX = "athlete-status-index"
+    # Keyed by day_id and sorted by athlete_id
+    DAY_ATHLETE_INDEX = "day-athlete-index"
+    # Older day_id index, read until day-athlete-index is live
     DAY_INDEX = "day-index"
     WORKOUT_INDEX = "workout-index"
     EXERCISE_INDEX = "exercise-index"
 
+    # Index rollout step of the data stack (IndexMigrationStage). Indexes created at a
+    # later stage are not queried yet; their reads go through the older indexes
+    INDEX_MIGRATION_STAGE = BaseConfig.get_int_env("INDEX_MIGRATION_STAGE", 3)
+    ATHLETE_STATUS_INDEX_STAGE = 2
+    DAY_ATHLETE_INDEX_STAGE = 3
+
     # API Rate Limits (per minute)
     WORKOUT_CREATE_RATE_LIMIT_PER_MIN = BaseConfig.get_int_env(
         "WORKOUT_CREATE_RATE_LIMIT", 10
@@ -2,6 +2,8 @@ import functools
 import logging
 from typing import Callable, Dict, Any, List
 from src.utils.response import create_response
+from src.utils.dynamodb_retry import retry_budget
+from src.utils.identity_map import request_scope
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -55,21 +57,23 @@ class LambdaMiddleware:
                 logger.error(f"Validation error: {str(e)}")
                 return create_response(400, {"error": str(e)})
             except Exception as e:
-                logger.error(f"Middleware error: {str(e)}")
-                return create_response(500, {"error": str(e)})
+                logger.error(f"Middleware error: {str(e)}", exc_info=True)
+                return create_response(500, {"error": "Internal server error"})
 
         # Call the handler
         try:
             response = self.handler(event, context)
             return response
         except Exception as e:
-            logger.error(f"Handler error: {str(e)}")
-            return create_response(500, {"error": str(e)})
+            logger.error(f"Handler error: {str(e)}", exc_info=True)
+            return create_response(500, {"error": "Internal server error"})
 
 
 def with_middleware(middlewares: List[Callable] = None):
     """
     Decorator to apply middleware to a handler function.
+    Each invocation runs inside its own request scope, so services share one identity map,
+    and DynamoDB retries are limited to the time the invocation has left.
 
     :param middlewares: List of middleware functions to apply
     :return: Decorated handler function
@@ -82,7 +86,8 @@ def with_middleware(middlewares: List[Callable] = None):
             if middlewares:
                 for middleware_func in middlewares:
                     middleware.add_middleware(middleware_func)
-            return middleware(event, context)
+            with request_scope(), retry_budget(context):
+                return middleware(event, context)
 
         return wrapper
 
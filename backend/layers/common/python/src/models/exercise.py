@@ -18,6 +18,8 @@ class Exercise:
         exercise_category: Optional[Union[str, ExerciseCategory]] = None,
         sets_data: Optional[List[Dict[str, Any]]] = None,
         planned_sets_data: Optional[List[Dict[str, Any]]] = None,
+        athlete_id: Optional[str] = None,
+        workout_date: Optional[str] = None,
     ):
         if not exercise_id:
             raise ValueError("exercise_id cannot be empty")
@@ -68,9 +70,12 @@ class Exercise:
         self.order: Optional[int] = order
         self.sets_data: Optional[List[Dict[str, Any]]] = sets_data
         self.planned_sets_data: Optional[List[Dict[str, Any]]] = planned_sets_data
+        # Copied from the workout so the athlete's history can be read by date
+        self.athlete_id: Optional[str] = athlete_id
+        self.workout_date: Optional[str] = workout_date
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        exercise_dict = {
             "exercise_id": self.exercise_id,
             "workout_id": self.workout_id,
             "exercise_type": str(self.exercise_type),
@@ -87,6 +92,14 @@ class Exercise:
             "planned_sets_data": self.planned_sets_data,
         }
 
+        # Index key attributes cannot be null, so they are only stored once known
+        if self.athlete_id:
+            exercise_dict["athlete_id"] = self.athlete_id
+        if self.workout_date:
+            exercise_dict["workout_date"] = self.workout_date
+
+        return exercise_dict
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Exercise":
         exercise_category = None
@@ -110,6 +123,8 @@ class Exercise:
             exercise_category=exercise_category,
             sets_data=data.get("sets_data"),
             planned_sets_data=data.get("planned_sets_data"),
+            athlete_id=data.get("athlete_id"),
+            workout_date=data.get("workout_date"),
         )
 
     def add_set_data(self, set_data: Dict[str, Any]) -> None:
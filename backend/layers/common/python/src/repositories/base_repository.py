@@ -1,10 +1,34 @@
-import boto3
-from typing import Dict, Any, Optional
+import functools
+import time
+import uuid
+from typing import Dict, Any, Optional, List, Iterator, Tuple, Callable, Hashable
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
 from src.utils.decimal_converter import (
     convert_floats_to_decimals,
     convert_decimals_to_floats,
 )
-from src.config.app_config import AppConfig
+from src.utils.dynamodb_pool import (
+    get_dynamodb_resource,
+    get_low_level_client,
+    get_table,
+)
+from src.utils.dynamodb_retry import call_with_retry, next_retry_delay
+from src.utils.fan_out import get_fan_out_executor
+from src.utils.fast_deserializer import build_low_level_query, deserialize_item
+from src.utils.identity_map import get_identity_map
+
+# DynamoDB hard limit on keys per BatchGetItem request
+BATCH_GET_MAX_KEYS = 100
+
+# DynamoDB hard limit on requests per BatchWriteItem call
+BATCH_WRITE_MAX_ITEMS = 25
+
+# DynamoDB hard limit on actions per TransactWriteItems request
+TRANSACT_WRITE_MAX_ITEMS = 100
+
+# Requests one query_page call may make before returning a short page with a resume key
+QUERY_PAGE_MAX_REQUESTS = 10
 
 
 class BaseRepository:
@@ -18,24 +42,404 @@ class BaseRepository:
         """
         :param table_name: Name of DynamoDB table.
         """
-        self.dynamodb = boto3.resource("dynamodb", region_name=AppConfig.AWS_REGION)
-        self.table = self.dynamodb.Table(table_name)
+        self.table_name = table_name
+        self.dynamodb = get_dynamodb_resource()
+        self.table = get_table(table_name)
+
+    @staticmethod
+    def _projection_params(
+        attributes: Optional[List[str]],
+        expression_attribute_names: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Builds ProjectionExpression arguments for the given attributes.
+        Every attribute goes through a placeholder so reserved words such as status,
+        name or date can be projected.
+
+        :param attributes: The attribute names to fetch, or None for whole items.
+        :param expression_attribute_names: Placeholders already used by the request.
+        :return: Keyword arguments to merge into a get_item, query or batch_get_item call
+        """
+        if not attributes:
+            return {}
+
+        names = dict(expression_attribute_names or {})
+        placeholders = []
+        for index, attribute in enumerate(dict.fromkeys(attributes)):
+            placeholder = f"#proj{index}"
+            names[placeholder] = attribute
+            placeholders.append(placeholder)
+
+        return {
+            "ProjectionExpression": ", ".join(placeholders),
+            "ExpressionAttributeNames": names,
+        }
+
+    @staticmethod
+    def _project(
+        item: Optional[Dict[str, Any]], attributes: Optional[List[str]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Applies a projection to an item already held in memory.
+
+        :param item: The full item, or None.
+        :param attributes: The attribute names to keep, or None for the whole item.
+        :return: The projected item, or None
+        """
+        if item is None or not attributes:
+            return item
+        return {name: item[name] for name in attributes if name in item}
 
-    def get_by_id(self, id_name: str, id_value: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _key_range(
+        key_condition: Any,
+        sort_key: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> Any:
+        """
+        Narrows a partition key condition to an inclusive range of the sort key, so the
+        range is read from the index instead of being filtered after the read.
+
+        :param key_condition: The partition key condition.
+        :param sort_key: The name of the index's sort key.
+        :param start: Optional first value of the range.
+        :param end: Optional last value of the range.
+        :return: The combined key condition
+        """
+        if start and end:
+            return key_condition & Key(sort_key).between(start, end)
+        if start:
+            return key_condition & Key(sort_key).gte(start)
+        if end:
+            return key_condition & Key(sort_key).lte(end)
+        return key_condition
+
+    def _record_write(
+        self,
+        key: Optional[Dict[str, Any]] = None,
+        item: Optional[Dict[str, Any]] = None,
+        deleted: bool = False,
+        table_name: Optional[str] = None,
+    ) -> None:
+        """
+        Reflects a write in the request's identity map, if one is active.
+
+        :param key: Primary key of the written item; None evicts the whole table.
+        :param item: The full item after the write, if known.
+        :param deleted: True if the item was deleted.
+        :param table_name: The written table; defaults to this repository's table.
+        """
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            identity_map.record_write(table_name or self.table_name, key, item, deleted)
+
+    def get_by_id(
+        self, id_name: str, id_value: str, attributes: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves an item from the table using its primary key.
+        Within a request scope each item is only fetched once.
 
         :param id_name: The name of the primary key attribute.
         :param id_value: The value of the primary key for the item to retrieve.
+        :param attributes: Optional attribute names to fetch instead of the whole item.
         :return: The retrieved item as a dictionary, or None if not found
         """
-        response = self.table.get_item(Key={id_name: id_value})
+        key = {id_name: id_value}
+        identity_map = get_identity_map()
+
+        if identity_map is not None:
+            known, item = identity_map.lookup(self.table_name, key)
+            if known:
+                return self._project(item, attributes)
+
+        response = self.table.get_item(Key=key, **self._projection_params(attributes))
         item = response.get("Item")
+        item = convert_decimals_to_floats(item) if item else None
+
+        # Projected reads are partial, so only whole items (or misses) are remembered
+        if identity_map is not None and (item is None or not attributes):
+            identity_map.remember(self.table_name, key, item)
+
+        return item
+
+    def memoize_query(self, query_key: Hashable, run_query: Callable[[], Any]) -> Any:
+        """
+        Runs a query once per request scope; outside a scope it always runs.
+        Memoized results are dropped whenever this table is written through a repository.
+
+        :param query_key: Hashable identifier of the query within this table.
+        :param run_query: Callable performing the query.
+        :return: The query result
+        """
+        identity_map = get_identity_map()
+        if identity_map is None:
+            return run_query()
+        return identity_map.memoize_query(self.table_name, query_key, run_query)
+
+    def iter_query(
+        self,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+        **query_kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields items from a query, following LastEvaluatedKey page by page.
+        A page is only requested once the caller has consumed the previous one.
+
+        :param page_size: Maximum number of items DynamoDB evaluates per request (Limit).
+        :param max_items: Overall cap on the number of items yielded.
+        :param attributes: Optional attribute names to fetch instead of whole items.
+        :param query_kwargs: Arguments passed through to table.query.
+        :return: An iterator over the raw query items
+        """
+        query_kwargs.update(
+            self._projection_params(
+                attributes, query_kwargs.get("ExpressionAttributeNames")
+            )
+        )
+        return self._paginate(self.table.query, page_size, max_items, query_kwargs)
+
+    def iter_query_native(
+        self,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+        **query_kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Same as iter_query, but reads the low-level client's wire format and converts each
+        item in a single pass. Numbers come back as int or float rather than Decimal, so
+        repositories that opt in must not run convert_decimals_to_floats on the results.
+
+        :param page_size: Maximum number of items DynamoDB evaluates per request (Limit).
+        :param max_items: Overall cap on the number of items yielded.
+        :param attributes: Optional attribute names to fetch instead of whole items.
+        :param query_kwargs: Arguments as accepted by table.query.
+        :return: An iterator over items with native values
+        """
+        query_kwargs.update(
+            self._projection_params(
+                attributes, query_kwargs.get("ExpressionAttributeNames")
+            )
+        )
+        params = build_low_level_query({**query_kwargs, "TableName": self.table_name})
+
+        run_query = functools.partial(
+            call_with_retry, self.table_name, get_low_level_client().query
+        )
+        for item in self._paginate(run_query, page_size, max_items, params):
+            yield deserialize_item(item)
+
+    def iter_scan(
+        self,
+        page_size: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+        **scan_kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields every item of the table, following LastEvaluatedKey page by page.
+        Meant for maintenance jobs such as backfills, not request handling.
+
+        :param page_size: Maximum number of items DynamoDB evaluates per request (Limit).
+        :param attributes: Optional attribute names to fetch instead of whole items.
+        :param scan_kwargs: Arguments passed through to table.scan.
+        :return: An iterator over the raw items
+        """
+        scan_kwargs.update(
+            self._projection_params(
+                attributes, scan_kwargs.get("ExpressionAttributeNames")
+            )
+        )
+        return self._paginate(self.table.scan, page_size, None, scan_kwargs)
+
+    @staticmethod
+    def _paginate(
+        run_query: Callable[..., Dict[str, Any]],
+        page_size: Optional[int],
+        max_items: Optional[int],
+        query_kwargs: Dict[str, Any],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Follows LastEvaluatedKey page by page, requesting a page only once the previous
+        one has been consumed.
+
+        :param run_query: The query callable (table.query or client.query).
+        :param page_size: Maximum number of items DynamoDB evaluates per request (Limit).
+        :param max_items: Overall cap on the number of items yielded.
+        :param query_kwargs: Arguments passed through to run_query.
+        :return: An iterator over the items as returned by run_query
+        """
+        yielded = 0
+
+        while max_items is None or yielded < max_items:
+            if page_size:
+                query_kwargs["Limit"] = (
+                    page_size
+                    if max_items is None
+                    else min(page_size, max_items - yielded)
+                )
+
+            response = run_query(**query_kwargs)
+
+            for item in response.get("Items", []):
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+
+            if "LastEvaluatedKey" not in response:
+                return
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def query_page(
+        self,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        attributes: Optional[List[str]] = None,
+        max_requests: int = QUERY_PAGE_MAX_REQUESTS,
+        **query_kwargs: Any,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Fetches a single page of query results that can be resumed later.
+        Each request only asks for the items still missing from the page, so a filtered
+        query never overshoots and the returned key always points right after the last item.
+        A sparse filter can leave the page short after max_requests requests; the returned
+        key then lets the caller pick up where the page stopped.
+
+        :param limit: Maximum number of items in the page.
+        :param exclusive_start_key: Key to resume from, as returned by a previous page.
+        :param attributes: Optional attribute names to fetch instead of whole items.
+        :param max_requests: Maximum number of query requests spent on the page.
+        :param query_kwargs: Arguments passed through to table.query.
+        :return: Tuple of (items, LastEvaluatedKey or None when the results are exhausted)
+        """
+        query_kwargs.update(
+            self._projection_params(
+                attributes, query_kwargs.get("ExpressionAttributeNames")
+            )
+        )
+        items: List[Dict[str, Any]] = []
+        last_evaluated_key = exclusive_start_key
+        requests = 0
+
+        while len(items) < limit and requests < max_requests:
+            requests += 1
+            if last_evaluated_key:
+                query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+            query_kwargs["Limit"] = limit - len(items)
 
-        if item:
-            return convert_decimals_to_floats(item)
+            response = self.table.query(**query_kwargs)
+            items.extend(response.get("Items", []))
 
-        return None
+            if "LastEvaluatedKey" not in response:
+                return items, None
+            last_evaluated_key = response["LastEvaluatedKey"]
+
+        return items, last_evaluated_key
+
+    def get_many(
+        self,
+        id_name: str,
+        id_values: List[str],
+        attributes: Optional[List[str]] = None,
+        consistent_read: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves many items by primary key using chunked BatchGetItem requests.
+        Unprocessed keys are retried with jittered exponential backoff.
+
+        :param id_name: The name of the primary key attribute.
+        :param id_values: The primary key values of the items to retrieve.
+        :param attributes: Optional attribute names to fetch; the key is always included.
+        :param consistent_read: Read every item from the table, bypassing the identity map.
+        :return: The found items in the order of id_values; missing items are skipped
+        """
+        # BatchGetItem rejects duplicate keys, so dedupe while keeping input order
+        unique_ids = list(dict.fromkeys(v for v in id_values if v))
+        if not unique_ids:
+            return []
+
+        # Items already read in this request are served from the identity map
+        identity_map = get_identity_map()
+        found = {}
+        missing_ids = unique_ids
+        if identity_map is not None and not consistent_read:
+            missing_ids = []
+            for v in unique_ids:
+                known, item = identity_map.lookup(self.table_name, {id_name: v})
+                if not known:
+                    missing_ids.append(v)
+                elif item is not None:
+                    found[v] = self._project(item, attributes)
+
+        # The key is needed to restore input order
+        projection = self._projection_params(
+            [id_name, *attributes] if attributes else None
+        )
+        if consistent_read:
+            projection["ConsistentRead"] = True
+
+        items = []
+        for start in range(0, len(missing_ids), BATCH_GET_MAX_KEYS):
+            chunk = missing_ids[start : start + BATCH_GET_MAX_KEYS]
+            items.extend(
+                self._batch_get_chunk([{id_name: v} for v in chunk], projection)
+            )
+
+        # Convert once for the whole result set, then restore input order
+        fetched = {item[id_name]: item for item in convert_decimals_to_floats(items)}
+        if identity_map is not None:
+            for v in missing_ids:
+                if v not in fetched:
+                    identity_map.remember(self.table_name, {id_name: v}, None)
+                elif not attributes:
+                    identity_map.remember(self.table_name, {id_name: v}, fetched[v])
+
+        found.update(fetched)
+        return [found[v] for v in unique_ids if v in found]
+
+    def _batch_get_chunk(
+        self,
+        keys: List[Dict[str, Any]],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Issues BatchGetItem for a single chunk of keys, retrying UnprocessedKeys.
+
+        :param keys: Up to BATCH_GET_MAX_KEYS primary key dictionaries.
+        :param projection: Optional ProjectionExpression and ConsistentRead arguments.
+        :return: The raw items returned by DynamoDB
+        """
+        items = []
+        request_items = {self.table_name: {"Keys": keys, **(projection or {})}}
+        attempt = 0
+
+        while request_items:
+            response = call_with_retry(
+                self.table_name,
+                self.dynamodb.batch_get_item,
+                RequestItems=request_items,
+            )
+            items.extend(response.get("Responses", {}).get(self.table_name, []))
+            request_items = (
+                response["UnprocessedKeys"] if "UnprocessedKeys" in response else {}
+            )
+
+            if request_items:
+                # Unprocessed keys mean the table is throttling this request
+                delay = next_retry_delay(self.table_name, attempt)
+                if delay is None:
+                    unprocessed = len(request_items[self.table_name]["Keys"])
+                    raise RuntimeError(
+                        f"BatchGetItem on {self.table_name} left {unprocessed} keys unprocessed"
+                    )
+                time.sleep(delay)
+                attempt += 1
+
+        return items
 
     def create(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -45,14 +449,175 @@ class BaseRepository:
         dynamo_item = convert_floats_to_decimals(item)
 
         self.table.put_item(Item=dynamo_item)
+        # The key attribute is not known here, so evict the table's entries
+        self._record_write()
         return item
 
+    def transact_put(self, puts: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Writes items to one or more tables in a single TransactWriteItems request.
+        Either every item is written or none is.
+
+        :param puts: (table name, item) pairs, at most TRANSACT_WRITE_MAX_ITEMS.
+        """
+        if len(puts) > TRANSACT_WRITE_MAX_ITEMS:
+            raise ValueError(
+                f"A transaction can write at most {TRANSACT_WRITE_MAX_ITEMS} items"
+            )
+
+        for table_name in {table_name for table_name, _ in puts}:
+            self._record_write(table_name=table_name)
+
+        try:
+            self.transact_write(
+                [table_name for table_name, _ in puts],
+                [
+                    {
+                        "Put": {
+                            "TableName": table_name,
+                            "Item": convert_floats_to_decimals(item),
+                        }
+                    }
+                    for table_name, item in puts
+                ],
+            )
+        except Exception as e:
+            print(f"Error writing transaction: {e}")
+            raise
+
+    def transact_write(
+        self, tables: List[str], transact_items: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Sends one TransactWriteItems request through the retry layer.
+        A ClientRequestToken makes retries idempotent: if an attempt that timed out was
+        applied, DynamoDB recognises the retry and does not apply it a second time.
+
+        :param tables: The tables the actions touch, used for rate limits and counters.
+        :param transact_items: The TransactWriteItems actions.
+        """
+        # The resource's client serializes plain Python values for us
+        call_with_retry(
+            tables,
+            self.dynamodb.meta.client.transact_write_items,
+            TransactItems=transact_items,
+            ClientRequestToken=str(uuid.uuid4()),
+        )
+
+    def batch_put(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Writes many items with BatchWriteItem. Requests are chunked, throttled calls and
+        unprocessed items are retried; unlike transact_put this is not atomic.
+
+        :param items: The items to write.
+        """
+        self.batch_write_items([(self.table_name, item) for item in items])
+
+    def batch_write_items(
+        self,
+        puts: List[Tuple[str, Dict[str, Any]]],
+        deletes: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+    ) -> None:
+        """
+        Writes items to one or more tables with BatchWriteItem, sending the chunks in
+        parallel so wall time stays close to a single round trip. Unprocessed items are
+        retried with jittered exponential backoff; the write as a whole is not atomic.
+
+        :param puts: (table name, item) pairs to write.
+        :param deletes: Optional (table name, primary key) pairs to delete in the same
+            chunks; no key may also be put.
+        """
+        requests = [
+            (table_name, {"PutRequest": {"Item": convert_floats_to_decimals(item)}})
+            for table_name, item in puts
+        ]
+        requests.extend(
+            (table_name, {"DeleteRequest": {"Key": key}})
+            for table_name, key in deletes or []
+        )
+        self._send_batch_writes(requests)
+
+    def batch_delete_items(self, deletes: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Deletes items from one or more tables with parallel BatchWriteItem chunks.
+        Deleting an item that no longer exists is not an error, so a delete can be re-run.
+
+        :param deletes: (table name, primary key) pairs to delete.
+        """
+        self._send_batch_writes(
+            [
+                (table_name, {"DeleteRequest": {"Key": key}})
+                for table_name, key in deletes
+            ]
+        )
+
+    def _send_batch_writes(self, requests: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Splits write requests into BatchWriteItem chunks and sends them concurrently
+        on the shared fan-out executor.
+
+        :param requests: (table name, PutRequest/DeleteRequest) pairs.
+        """
+        for table_name in {table_name for table_name, _ in requests}:
+            self._record_write(table_name=table_name)
+
+        chunks = [
+            requests[start : start + BATCH_WRITE_MAX_ITEMS]
+            for start in range(0, len(requests), BATCH_WRITE_MAX_ITEMS)
+        ]
+
+        # The first failed chunk is raised here
+        get_fan_out_executor().map(self._batch_write_chunk, chunks)
+
+    def _batch_write_chunk(self, requests: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Issues BatchWriteItem for a single chunk of requests, retrying UnprocessedItems.
+
+        :param requests: Up to BATCH_WRITE_MAX_ITEMS (table name, request) pairs.
+        """
+        request_items: Dict[str, List[Dict[str, Any]]] = {}
+        for table_name, request in requests:
+            request_items.setdefault(table_name, []).append(request)
+
+        attempt = 0
+        while request_items:
+            response = call_with_retry(
+                list(request_items),
+                self.dynamodb.batch_write_item,
+                RequestItems=request_items,
+            )
+            request_items = (
+                response["UnprocessedItems"] if "UnprocessedItems" in response else {}
+            )
+
+            if request_items:
+                # Only the tables with unprocessed items are slowed down
+                delay = next_retry_delay(list(request_items), attempt)
+                if delay is None:
+                    unprocessed = sum(len(reqs) for reqs in request_items.values())
+                    raise RuntimeError(
+                        f"BatchWriteItem left {unprocessed} items unprocessed"
+                    )
+                time.sleep(delay)
+                attempt += 1
+
+    def batch_delete(self, keys: List[Dict[str, Any]]) -> None:
+        """
+        Deletes many items with BatchWriteItem. Requests are chunked, throttled calls and
+        unprocessed items are retried.
+
+        :param keys: Primary key dictionaries of the items to delete.
+        """
+        self.batch_delete_items([(self.table_name, key) for key in keys])
+
     def update(
         self,
         key: Dict[str, str],
         update_expression: str,
         expression_values: Dict[str, Any],
         expression_attribute_names: Dict[str, str] = None,
+        condition_expression: Optional[str] = None,
+        return_values: str = "ALL_NEW",
     ) -> Dict[str, Any]:
         """
         Updates an existing item in the table.
@@ -61,7 +626,10 @@ class BaseRepository:
         :param update_expression: A DynamoDB update expression defining the update.
         :param expression_values: A dictionary mapping expression attribute names to values.
         :param expression_attribute_names:
-        :return: The response containing the updated attributes with decimal conversion applied.
+        :param condition_expression: Optional condition the item must meet; when it does
+            not, the ConditionalCheckFailedException ClientError is raised unlogged.
+        :param return_values: "ALL_NEW", or "ALL_OLD" for the item as it was before the update.
+        :return: The response containing the returned attributes with decimal conversion applied.
         """
         try:
             # Convert all float values in expression_values to Decimal
@@ -71,14 +639,25 @@ class BaseRepository:
                 "Key": key,
                 "UpdateExpression": update_expression,
                 "ExpressionAttributeValues": decimal_expression_values,
-                "ReturnValues": "ALL_NEW",
+                "ReturnValues": return_values,
             }
             # Only add ExpressionAttributeNames if provided
             if expression_attribute_names:
                 update_args["ExpressionAttributeNames"] = expression_attribute_names
+            if condition_expression:
+                update_args["ConditionExpression"] = condition_expression
             response = self.table.update_item(**update_args)
-            attributes = response.get("Attributes", {})
-            return convert_decimals_to_floats(attributes)
+            attributes = convert_decimals_to_floats(response.get("Attributes", {}))
+            # Only the new item can be remembered; otherwise the cached one is evicted
+            new_item = attributes if return_values == "ALL_NEW" else None
+            self._record_write(key, new_item or None)
+            return attributes
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != (
+                "ConditionalCheckFailedException"
+            ):
+                print(f"Error updating item: {e}")
+            raise
         except Exception as e:
             print(f"Error updating item: {e}")
             raise
@@ -92,6 +671,7 @@ class BaseRepository:
         """
         try:
             response = self.table.delete_item(Key=key, ReturnValues="ALL_OLD")
+            self._record_write(key, deleted=True)
             return response.get("Attributes", {})
         except Exception as e:
             print(f"Error deleting item: {e}")
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from .base_repository import BaseRepository
 from boto3.dynamodb.conditions import Key
 from src.config.block_config import BlockConfig
@@ -23,6 +23,18 @@ class BlockRepository(BaseRepository):
         """
         return self.get_by_id("block_id", block_id)
 
+    def batch_get_blocks(
+        self, block_ids: List[str], attributes: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves many training blocks by ID using batched reads.
+
+        :param block_ids: The IDs of the training blocks to retrieve.
+        :param attributes: Optional attribute names to fetch instead of whole items.
+        :return: The found blocks in the order of block_ids; missing IDs are skipped.
+        """
+        return self.get_many("block_id", block_ids, attributes)
+
     def get_blocks_by_athlete(self, athlete_id: str) -> List[Dict[str, Any]]:
         """
         Retrieves all blocks associated with a specific athlete using a DynamoDB GSI.
@@ -30,12 +42,34 @@ class BlockRepository(BaseRepository):
         :param athlete_id: The unique identifier of the athlete.
         :return: A list of block dictionaries associated with the athlete.
         """
-        response = self.table.query(
+        return list(
+            self.iter_query(
+                page_size=BlockConfig.MAX_ITEMS,
+                IndexName=BlockConfig.ATHLETE_INDEX,
+                KeyConditionExpression=Key("athlete_id").eq(athlete_id),
+            )
+        )
+
+    def get_blocks_page_by_athlete(
+        self,
+        athlete_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of blocks associated with a specific athlete.
+
+        :param athlete_id: The unique identifier of the athlete.
+        :param limit: Maximum number of blocks in the page.
+        :param exclusive_start_key: Key returned by the previous page, if any.
+        :return: Tuple of (block dictionaries, key to resume from or None on the last page).
+        """
+        return self.query_page(
+            limit,
+            exclusive_start_key,
             IndexName=BlockConfig.ATHLETE_INDEX,
             KeyConditionExpression=Key("athlete_id").eq(athlete_id),
-            Limit=BlockConfig.MAX_ITEMS,
         )
-        return response.get("Items", [])
 
     def get_blocks_by_coach(self, coach_id: str) -> List[Dict[str, Any]]:
         """
@@ -44,12 +78,13 @@ class BlockRepository(BaseRepository):
         :param coach_id: The unique identifier of the coach.
         :return: A list of block dictionaries associated with the coach.
         """
-        response = self.table.query(
-            IndexName=BlockConfig.COACH_INDEX,
-            KeyConditionExpression=Key("coach_id").eq(coach_id),
-            Limit=BlockConfig.MAX_ITEMS,
+        return list(
+            self.iter_query(
+                page_size=BlockConfig.MAX_ITEMS,
+                IndexName=BlockConfig.COACH_INDEX,
+                KeyConditionExpression=Key("coach_id").eq(coach_id),
+            )
         )
-        return response.get("Items", [])
 
     def create_block(self, block_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
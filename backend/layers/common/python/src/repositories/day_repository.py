@@ -1,8 +1,8 @@
-from concurrent.futures import ThreadPoolExecutor
 from .base_repository import BaseRepository
 from boto3.dynamodb.conditions import Key
 from typing import Dict, Any, Optional, List
 from src.config.day_config import DayConfig
+from src.utils.fan_out import get_fan_out_executor
 
 
 class DayRepository(BaseRepository):
@@ -18,6 +18,18 @@ class DayRepository(BaseRepository):
         """
         return self.get_by_id("day_id", day_id)
 
+    def batch_get_days(
+        self, day_ids: List[str], attributes: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves multiple days from the DAYS_TABLE by day_id using batched reads
+
+        :param day_ids: The IDs of the days to retrieve
+        :param attributes: Optional attribute names to fetch instead of whole items
+        :return: The found days in the order of day_ids; missing IDs are skipped
+        """
+        return self.get_many("day_id", day_ids, attributes)
+
     def get_days_by_week(self, week_id: str) -> List[Dict[str, Any]]:
         """
         Retrieves all days from the DAYS_TABLE for a given week_id
@@ -25,14 +37,14 @@ class DayRepository(BaseRepository):
         :param week_id: The ID of the week to retrieve days for
         :return: A list of dictionaries representing the days for the given week
         """
-        response = self.table.query(
-            IndexName=DayConfig.WEEK_INDEX,
-            KeyConditionExpression=Key("week_id").eq(week_id),
-            Limit=DayConfig.MAX_ITEMS,
+        return list(
+            self.iter_query(
+                page_size=DayConfig.MAX_ITEMS,
+                IndexName=DayConfig.WEEK_INDEX,
+                KeyConditionExpression=Key("week_id").eq(week_id),
+            )
         )
 
-        return response.get("Items", [])
-
     def batch_get_days_by_week_ids(self, week_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Get days for multiple week_ids in parallel.
@@ -43,8 +55,7 @@ class DayRepository(BaseRepository):
         """
         if not week_ids:
             return []
-        with ThreadPoolExecutor(max_workers=min(len(week_ids), 10)) as executor:
-            results = list(executor.map(self.get_days_by_week, week_ids))
+        results = get_fan_out_executor().map(self.get_days_by_week, week_ids)
         return [day for days in results for day in days]
 
     def create_day(self, day_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -95,8 +106,6 @@ class DayRepository(BaseRepository):
         days = self.get_days_by_week(week_id)
 
         # Batch delete all days
-        with self.table.batch_writer() as batch:
-            for day in days:
-                batch.delete_item(Key={"day_id": day["day_id"]})
+        self.batch_delete([{"day_id": day["day_id"]} for day in days])
 
         return len(days)
@@ -1,9 +1,10 @@
-from concurrent.futures import ThreadPoolExecutor
-from .base_repository import BaseRepository
-from boto3.dynamodb.conditions import Key
-from typing import Dict, Any, Optional, List
+from .base_repository import BaseRepository, TRANSACT_WRITE_MAX_ITEMS
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from typing import Dict, Any, Iterator, Optional, List
 from src.config.exercise_config import ExerciseConfig
 from src.utils.decimal_converter import convert_decimals_to_floats
+from src.utils.fan_out import get_fan_out_executor
 
 
 class ExerciseRepository(BaseRepository):
@@ -19,23 +20,54 @@ class ExerciseRepository(BaseRepository):
         """
         return self.get_by_id("exercise_id", exercise_id)
 
-    def get_exercises_by_workout(self, workout_id: str) -> List[Dict[str, Any]]:
+    def batch_get_exercises(
+        self,
+        exercise_ids: List[str],
+        attributes: Optional[List[str]] = None,
+        consistent_read: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get multiple exercises by their IDs using batched reads
+
+        :param exercise_ids: The IDs of the exercises to get
+        :param attributes: Optional attribute names to fetch instead of whole items
+        :param consistent_read: Read the exercises with strongly consistent reads
+        :return: The found exercises in the order of exercise_ids; missing IDs are skipped
+        """
+        return self.get_many("exercise_id", exercise_ids, attributes, consistent_read)
+
+    def get_exercises_by_workout(
+        self, workout_id: str, native: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Get all exercises for a given workout_id
 
         :param workout_id: The workout_id to filter exercises by
+        :param native: Read through the single-pass deserializer; numbers come back as
+            int or float and the result is not shared with the request's identity map
         :return: A list of exercises for the given workout_id
         """
-        response = self.table.query(
-            IndexName=ExerciseConfig.WORKOUT_INDEX,
-            KeyConditionExpression=Key("workout_id").eq(workout_id),
-            Limit=ExerciseConfig.MAX_ITEMS,
-        )
-
-        items = response.get("Items", [])
-
-        # Apply decimal conversion to all items
-        return [convert_decimals_to_floats(item) for item in items]
+        if native:
+            return list(
+                self.iter_query_native(
+                    page_size=ExerciseConfig.MAX_ITEMS,
+                    IndexName=ExerciseConfig.WORKOUT_INDEX,
+                    KeyConditionExpression=Key("workout_id").eq(workout_id),
+                )
+            )
+
+        def run_query() -> List[Dict[str, Any]]:
+            items = self.iter_query(
+                page_size=ExerciseConfig.MAX_ITEMS,
+                IndexName=ExerciseConfig.WORKOUT_INDEX,
+                KeyConditionExpression=Key("workout_id").eq(workout_id),
+            )
+
+            # Apply decimal conversion to all items
+            return [convert_decimals_to_floats(item) for item in items]
+
+        # A workout's exercises are read several times while it is being updated
+        return self.memoize_query(("workout_id", workout_id), run_query)
 
     def get_exercises_by_day(self, day_id: str) -> List[Dict[str, Any]]:
         """
@@ -44,50 +76,276 @@ class ExerciseRepository(BaseRepository):
         :param day_id: The day_id to filter exercises by
         :return: A list of exercises for the given day_id
         """
-        response = self.table.query(
+        items = self.iter_query(
+            page_size=ExerciseConfig.MAX_ITEMS,
             IndexName=ExerciseConfig.DAY_INDEX,
             KeyConditionExpression=Key("day_id").eq(day_id),
-            Limit=ExerciseConfig.MAX_ITEMS,
         )
 
-        items = response.get("Items", [])
-
         # Apply decimal conversion to all items
         return [convert_decimals_to_floats(item) for item in items]
 
-    def get_completed_exercises_by_type(
-        self, athlete_id: str, exercise_type: str
+    def iter_exercises_by_type(
+        self,
+        athlete_id: str,
+        exercise_type: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields an athlete's exercises of a specific type, oldest first.
+        Reads only rows of that type from the athlete-type index; the type is matched
+        case-insensitively and every exercise carries its workout's date as workout_date.
+        Exercises of every status are returned; callers filter for completeness
+        (see AnalyticsService._is_exercise_analytics_complete).
+
+        :param athlete_id: The athlete's ID
+        :param exercise_type: The type of exercise to filter by
+        :param start_date: Optional filter for exercises since date (YYYY-MM-DD)
+        :param end_date: Optional filter for exercises up to and including date (YYYY-MM-DD)
+        :return: An iterator over exercises of the given type
+        """
+        type_key = self.athlete_type_key(athlete_id, exercise_type)
+
+        if (
+            ExerciseConfig.INDEX_MIGRATION_STAGE
+            < ExerciseConfig.ATHLETE_TYPE_INDEX_STAGE
+        ):
+            # The type index is not live yet, so filter the athlete's history by type
+            return self.iter_query_native(
+                IndexName=ExerciseConfig.ATHLETE_DATE_INDEX,
+                KeyConditionExpression=self._key_range(
+                    Key("athlete_id").eq(athlete_id),
+                    "workout_date",
+                    start_date,
+                    end_date,
+                ),
+                FilterExpression=Attr("athlete_exercise_type").eq(type_key),
+            )
+
+        return self.iter_query_native(
+            IndexName=ExerciseConfig.ATHLETE_TYPE_INDEX,
+            KeyConditionExpression=self._key_range(
+                Key("athlete_exercise_type").eq(type_key),
+                "workout_date",
+                start_date,
+                end_date,
+            ),
+        )
+
+    def get_exercises_by_type(
+        self,
+        athlete_id: str,
+        exercise_type: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Get all completed exercises of a specific type
+        Get an athlete's exercises of a specific type, oldest first.
+        Exercises of every status are returned; callers filter for completeness.
 
         :param athlete_id: The athlete's ID
         :param exercise_type: The type of exercise to filter by
-        :return: A list of completed exercises
+        :param start_date: Optional filter for exercises since date (YYYY-MM-DD)
+        :param end_date: Optional filter for exercises up to and including date (YYYY-MM-DD)
+        :return: A list of exercises of the given type
+        """
+        return list(
+            self.iter_exercises_by_type(athlete_id, exercise_type, start_date, end_date)
+        )
+
+    @staticmethod
+    def athlete_type_key(athlete_id: str, exercise_type: str) -> str:
+        """
+        Build the athlete-type index key of an exercise
+
+        :param athlete_id: The athlete's ID
+        :param exercise_type: The type of exercise, in any case
+        :return: The key, e.g. "athlete123#squat"
         """
-        # This would need to join with the workout table
-        # Consider implementing a denormalized data pattern for better performance
-        pass
+        return f"{athlete_id}#{exercise_type.strip().lower()}"
+
+    @classmethod
+    def with_athlete_type_key(cls, exercise_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add the athlete-type index key to an exercise item that has an athlete and type
+
+        :param exercise_dict: The exercise item
+        :return: The item with athlete_exercise_type set, or the item unchanged
+        """
+        athlete_id = exercise_dict.get("athlete_id")
+        exercise_type = exercise_dict.get("exercise_type")
+        if not athlete_id or not exercise_type:
+            return exercise_dict
+
+        return {
+            **exercise_dict,
+            "athlete_exercise_type": cls.athlete_type_key(athlete_id, exercise_type),
+        }
+
+    @classmethod
+    def to_item(cls, exercise_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prepare an exercise for storage. Adds the athlete-type index key and leaves out
+        set lists that are still None, since stored NULLs fail the list conditions of
+        track_set and would send the first sets through a full rewrite.
+
+        :param exercise_dict: The exercise, e.g. from Exercise.to_dict
+        :return: The item to write
+        """
+        return cls.with_athlete_type_key(
+            {
+                key: value
+                for key, value in exercise_dict.items()
+                if value is not None or key not in ("sets_data", "planned_sets_data")
+            }
+        )
 
     def create_exercise(self, exercise_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Create a new exercise
+        Create a new exercise.
+        Exercises created without athlete_id or workout_date get them from their workout,
+        so every exercise shows up in the athlete's history indexes.
 
         :param exercise_dict: The exercise to create
         :return: The created exercise dictionary
         """
-        return self.create(exercise_dict)
+        if not exercise_dict.get("athlete_id") or not exercise_dict.get("workout_date"):
+            exercise_dict = {
+                **exercise_dict,
+                **self._get_workout_context(exercise_dict.get("workout_id")),
+            }
+
+        exercise_dict = self.create(self.to_item(exercise_dict))
+        self._adjust_workout_counts(
+            exercise_dict.get("workout_id"),
+            exercise_dict["exercise_id"],
+            completed_delta=self._completed(exercise_dict),
+            total_delta=1,
+        )
+        return exercise_dict
+
+    @staticmethod
+    def _completed(exercise_dict: Optional[Dict[str, Any]]) -> int:
+        """
+        Count an exercise towards its workout's completed_count
+
+        :param exercise_dict: The exercise item, or None
+        :return: 1 if the exercise is completed, else 0
+        """
+        return int(bool(exercise_dict) and exercise_dict.get("status") == "completed")
+
+    def _adjust_workout_counts(
+        self,
+        workout_id: Optional[str],
+        exercise_id: str,
+        completed_delta: int = 0,
+        total_delta: int = 0,
+    ) -> None:
+        """
+        Keep the exercise counters and status of an exercise's workout up to date
+
+        :param workout_id: The ID of the workout, if the exercise has one
+        :param exercise_id: The ID of the exercise that changed
+        :param completed_delta: Change in the number of completed exercises
+        :param total_delta: Change in the number of exercises
+        """
+        from src.repositories.workout_repository import WorkoutRepository
+
+        if workout_id and (completed_delta or total_delta):
+            WorkoutRepository().adjust_exercise_counts(
+                workout_id, completed_delta, total_delta, [exercise_id]
+            )
+
+    def _get_workout_context(self, workout_id: Optional[str]) -> Dict[str, Any]:
+        """
+        Get the attributes copied from a workout onto its exercises
+
+        :param workout_id: The ID of the workout
+        :return: athlete_id and workout_date, or an empty dict if the workout is unknown
+        """
+        from src.repositories.workout_repository import WorkoutRepository
+
+        workout = (
+            WorkoutRepository().get_by_id(
+                "workout_id", workout_id, attributes=["athlete_id", "date"]
+            )
+            if workout_id
+            else None
+        )
+        if not workout or not workout.get("athlete_id") or not workout.get("date"):
+            return {}
+
+        return {"athlete_id": workout["athlete_id"], "workout_date": workout["date"]}
+
+    def update_workout_context(
+        self, workout_id: str, athlete_id: str, workout_date: str, dry_run: bool = False
+    ) -> int:
+        """
+        Copy a workout's athlete_id and date onto all of its exercises.
+        Used when a workout moves to another date and to backfill existing exercises.
+
+        :param workout_id: The ID of the workout
+        :param athlete_id: The workout's athlete_id
+        :param workout_date: The workout's date (YYYY-MM-DD)
+        :param dry_run: Only count the exercises that are out of date
+        :return: The number of exercises updated
+        """
+        updates = {}
+        for exercise in self.get_exercises_by_workout(workout_id):
+            context = {"athlete_id": athlete_id, "workout_date": workout_date}
+            if exercise.get("exercise_type"):
+                context["athlete_exercise_type"] = self.athlete_type_key(
+                    athlete_id, exercise["exercise_type"]
+                )
+            if any(exercise.get(key) != value for key, value in context.items()):
+                updates[exercise["exercise_id"]] = context
+
+        if not dry_run:
+            get_fan_out_executor().map(
+                lambda exercise_id: self.update_exercise(
+                    exercise_id, updates[exercise_id]
+                ),
+                list(updates),
+            )
+        return len(updates)
 
     def update_exercise(
-        self, exercise_id: str, update_dict: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        self,
+        exercise_id: str,
+        update_dict: Dict[str, Any],
+        require_existing: bool = False,
+        update_workout_counts: bool = True,
+    ) -> Optional[Dict[str, Any]]:
         """
-        Update an existing exercise by exercise_id
+        Update an existing exercise by exercise_id.
+        A status change also moves its workout's completed_count, read from the item as
+        it was before the same write rather than with an extra read.
 
         :param exercise_id: The ID of the exercise to update
         :param update_dict: A dictionary containing the updated exercise data
+        :param require_existing: Write nothing and return None if the exercise does not exist
+        :param update_workout_counts: Set to False when the caller adjusts the workout's
+            counters itself
         :return: The updated exercise dictionary
         """
+        if (
+            update_dict.get("exercise_type")
+            and "athlete_exercise_type" not in update_dict
+        ):
+            # A new type moves the exercise to another athlete-type partition
+            athlete_id = update_dict.get("athlete_id") or (
+                self.get_by_id("exercise_id", exercise_id, attributes=["athlete_id"])
+                or {}
+            ).get("athlete_id")
+            if athlete_id:
+                update_dict = {
+                    **update_dict,
+                    "athlete_exercise_type": self.athlete_type_key(
+                        athlete_id, update_dict["exercise_type"]
+                    ),
+                }
+
         update_expression = "set "
         expression_values = {}
         expression_attribute_names = {}
@@ -101,12 +359,203 @@ class ExerciseRepository(BaseRepository):
         # Remove trailing comma and space
         update_expression = update_expression[:-2]
 
-        return self.update(
-            {"exercise_id": exercise_id},
-            update_expression,
-            expression_values,
-            expression_attribute_names,
+        adjust_counts = update_workout_counts and "status" in update_dict
+        try:
+            result = self.update(
+                {"exercise_id": exercise_id},
+                update_expression,
+                expression_values,
+                expression_attribute_names,
+                condition_expression=(
+                    "attribute_exists(exercise_id)" if require_existing else None
+                ),
+                return_values="ALL_OLD" if adjust_counts else "ALL_NEW",
+            )
+        except ClientError as e:
+            if require_existing and e.response.get("Error", {}).get("Code") == (
+                "ConditionalCheckFailedException"
+            ):
+                return None
+            raise
+
+        if not adjust_counts:
+            return result
+
+        previous = result
+        exercise = {**previous, "exercise_id": exercise_id, **update_dict}
+        self._adjust_workout_counts(
+            exercise.get("workout_id"),
+            exercise_id,
+            completed_delta=self._completed(exercise) - self._completed(previous),
+        )
+        return exercise
+
+    def apply_changes(
+        self,
+        puts: List[Dict[str, Any]],
+        updates: Dict[str, Dict[str, Any]],
+        deletes: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Apply a change set to exercises.
+        New and removed exercises go out together in parallel BatchWriteItem chunks,
+        then the attribute updates run in parallel. Unlike the single-exercise methods
+        this leaves the workouts' exercise counters alone, so the caller can adjust them
+        once for the whole set.
+
+        :param puts: New exercises, including their athlete_id and workout_date
+        :param updates: Changed attributes by exercise ID
+        :param deletes: IDs of the exercises to delete
+        :return: The updated exercises by ID
+        """
+        if puts or deletes:
+            self.batch_write_items(
+                [(self.table_name, self.to_item(ex)) for ex in puts],
+                deletes=[
+                    (self.table_name, {"exercise_id": exercise_id})
+                    for exercise_id in deletes
+                ],
+            )
+
+        exercise_ids = list(updates)
+        updated = get_fan_out_executor().map(
+            lambda exercise_id: self.update_exercise(
+                exercise_id, updates[exercise_id], update_workout_counts=False
+            ),
+            exercise_ids,
         )
+        return dict(zip(exercise_ids, updated))
+
+    def update_exercise_orders(self, workout_id: str, orders: Dict[str, int]) -> None:
+        """
+        Write new order values for a workout's exercises in one TransactWriteItems
+        request, so a reorder is applied completely or not at all. Every update requires
+        the exercise to still belong to the workout. Workouts with more exercises than a
+        transaction allows are written one transaction per chunk.
+
+        :param workout_id: The ID of the workout the exercises belong to
+        :param orders: New order values by exercise ID
+        """
+        exercise_ids = list(orders)
+        self._record_write()
+
+        for start in range(0, len(exercise_ids), TRANSACT_WRITE_MAX_ITEMS):
+            self.transact_write(
+                [self.table_name],
+                [
+                    {
+                        "Update": {
+                            "TableName": self.table_name,
+                            "Key": {"exercise_id": exercise_id},
+                            "UpdateExpression": "SET #order = :order",
+                            "ConditionExpression": "workout_id = :workout_id",
+                            "ExpressionAttributeNames": {"#order": "order"},
+                            "ExpressionAttributeValues": {
+                                ":order": orders[exercise_id],
+                                ":workout_id": workout_id,
+                            },
+                        }
+                    }
+                    for exercise_id in exercise_ids[
+                        start : start + TRANSACT_WRITE_MAX_ITEMS
+                    ]
+                ],
+            )
+
+    def track_set(
+        self,
+        exercise_id: str,
+        set_data: Dict[str, Any],
+        append: bool,
+        start_exercise: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Insert or replace one set in a single conditional UpdateItem.
+
+        Relies on sets_data being numbered 1..n in list order, which track_set,
+        delete_set and reorder_sets maintain, so set n lives at index n - 1 and the
+        sets count equals the list length. The update also snapshots the current
+        sets_data as planned_sets_data if there is none yet and may start the exercise.
+        The first set of an exercise without sets_data creates the list instead.
+        Completed exercises are never touched, so the workout's completed_count stays
+        correct without knowing the previous status; reopening one goes through
+        update_exercise. Starting only applies to planned or in-progress exercises. When
+        the item does not meet these conditions nothing is written and None is returned.
+
+        :param exercise_id: The ID of the exercise
+        :param set_data: The set, including its set_number (1 or more)
+        :param append: Append the set as the next one instead of replacing it in place
+        :param start_exercise: Move the exercise to in_progress
+        :return: The updated exercise, or None if the item did not meet the conditions
+        """
+        set_number = set_data["set_number"]
+        expression_attribute_names = {
+            "#sets_data": "sets_data",
+            "#planned_sets_data": "planned_sets_data",
+            "#sets": "sets",
+            "#status": "status",
+        }
+        expression_values = {":list": "L", ":set_number": set_number}
+
+        # The snapshot comes first so it copies sets_data as it was before this set
+        updates = ["#planned_sets_data = if_not_exists(#planned_sets_data, #sets_data)"]
+        conditions = [
+            "attribute_type(#sets_data, :list)",
+            "(attribute_not_exists(#planned_sets_data) "
+            "OR attribute_type(#planned_sets_data, :list))",
+        ]
+
+        if append and set_number == 1:
+            # A new exercise may have no sets_data yet, which if_not_exists cannot copy
+            updates[
+                0
+            ] = "#planned_sets_data = if_not_exists(#planned_sets_data, :empty)"
+            updates.append("#sets_data = :new_sets")
+            updates.append("#sets = :set_number")
+            conditions[0] = (
+                "(attribute_not_exists(#sets_data) "
+                "OR (attribute_type(#sets_data, :list) AND size(#sets_data) = :zero))"
+            )
+            expression_values[":new_sets"] = [set_data]
+            expression_values[":empty"] = []
+            expression_values[":zero"] = 0
+        elif append:
+            updates.append("#sets_data = list_append(#sets_data, :new_sets)")
+            updates.append("#sets = :set_number")
+            conditions.append("size(#sets_data) = :previous_sets")
+            expression_values[":new_sets"] = [set_data]
+            expression_values[":previous_sets"] = set_number - 1
+        else:
+            index = set_number - 1
+            updates.append(f"#sets_data[{index}] = :set")
+            conditions.append(f"#sets_data[{index}].set_number = :set_number")
+            conditions.append("size(#sets_data) = #sets")
+            expression_values[":set"] = set_data
+
+        if start_exercise:
+            # Only a planned exercise is started; any other status is left as it is
+            updates.append("#status = :in_progress")
+            conditions.append("#status IN (:planned, :in_progress)")
+            expression_values[":planned"] = "planned"
+            expression_values[":in_progress"] = "in_progress"
+        else:
+            conditions.append("#status <> :completed")
+            expression_values[":completed"] = "completed"
+
+        try:
+            return self.update(
+                {"exercise_id": exercise_id},
+                "SET " + ", ".join(updates),
+                expression_values,
+                expression_attribute_names,
+                condition_expression=" AND ".join(conditions),
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == (
+                "ConditionalCheckFailedException"
+            ):
+                return None
+            raise
 
     def delete_exercise(self, exercise_id: str) -> Dict[str, Any]:
         """
@@ -115,7 +564,15 @@ class ExerciseRepository(BaseRepository):
         :param exercise_id: The ID of the exercise to delete
         :return: The deleted exercise dictionary
         """
-        return self.delete({"exercise_id": exercise_id})
+        exercise = self.delete({"exercise_id": exercise_id})
+        if exercise:
+            self._adjust_workout_counts(
+                exercise.get("workout_id"),
+                exercise_id,
+                completed_delta=-self._completed(exercise),
+                total_delta=-1,
+            )
+        return exercise
 
     def delete_exercises_by_workout(self, workout_id: str) -> int:
         """
@@ -127,9 +584,9 @@ class ExerciseRepository(BaseRepository):
         exercises = self.get_exercises_by_workout(workout_id)
 
         # Batch delete all exercises
-        with self.table.batch_writer() as batch:
-            for exercise in exercises:
-                batch.delete_item(Key={"exercise_id": exercise["exercise_id"]})
+        self.batch_delete(
+            [{"exercise_id": exercise["exercise_id"]} for exercise in exercises]
+        )
 
         return len(exercises)
 
@@ -143,26 +600,29 @@ class ExerciseRepository(BaseRepository):
         exercises = self.get_exercises_by_day(day_id)
 
         # Batch delete all exercises
-        with self.table.batch_writer() as batch:
-            for exercise in exercises:
-                batch.delete_item(Key={"exercise_id": exercise["exercise_id"]})
+        self.batch_delete(
+            [{"exercise_id": exercise["exercise_id"]} for exercise in exercises]
+        )
 
         return len(exercises)
 
     def batch_get_exercises_by_workout_ids(
-        self, workout_ids: List[str]
+        self, workout_ids: List[str], native: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Get exercises for multiple workout_ids in parallel.
         Returns a flat combined list; each exercise retains its workout_id attribute.
 
         :param workout_ids: List of workout IDs to fetch exercises for
+        :param native: Read through the single-pass deserializer (see get_exercises_by_workout)
         :return: Combined list of exercises for all workout IDs
         """
         if not workout_ids:
             return []
-        with ThreadPoolExecutor(max_workers=min(len(workout_ids), 10)) as executor:
-            results = list(executor.map(self.get_exercises_by_workout, workout_ids))
+        results = get_fan_out_executor().map(
+            lambda workout_id: self.get_exercises_by_workout(workout_id, native=native),
+            workout_ids,
+        )
         return [ex for exercises in results for ex in exercises]
 
     def batch_get_exercises_by_day_ids(
@@ -177,58 +637,61 @@ class ExerciseRepository(BaseRepository):
         """
         if not day_ids:
             return []
-        with ThreadPoolExecutor(max_workers=min(len(day_ids), 10)) as executor:
-            results = list(executor.map(self.get_exercises_by_day, day_ids))
+        results = get_fan_out_executor().map(self.get_exercises_by_day, day_ids)
         return [ex for exercises in results for ex in exercises]
 
-    def get_exercises_with_workout_context(
+    def iter_exercises_with_workout_context(
         self,
         athlete_id: str,
         exercise_type: Optional[str] = None,
         start_date: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        end_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Get exercises with workout context for analytics.
-        Returns exercises with workout date and status included.
+        Lazily yields an athlete's exercise history for analytics, oldest first.
+        Every exercise carries its workout's date as workout_date.
+
+        The history is one paginated query on the athlete-date index with the date range
+        as key condition, deserialized in a single pass since long histories make
+        conversion a large share of CPU.
 
         :param athlete_id: The athlete's ID
         :param exercise_type: Optional filter by exercise type
         :param start_date: Optional filter for exercises since date (YYYY-MM-DD)
-        :return: List of exercises with workout context
+        :param end_date: Optional filter for exercises up to and including date (YYYY-MM-DD)
+        :return: An iterator over exercises with workout context
         """
-        from src.repositories.workout_repository import WorkoutRepository
+        key_condition = self._key_range(
+            Key("athlete_id").eq(athlete_id), "workout_date", start_date, end_date
+        )
 
-        # Get all workouts for the athlete (1 query)
-        workout_repo = WorkoutRepository()
-        workouts = workout_repo.get_all_workouts_by_athlete(athlete_id)
+        query_kwargs = {
+            "IndexName": ExerciseConfig.ATHLETE_DATE_INDEX,
+            "KeyConditionExpression": key_condition,
+        }
+        if exercise_type:
+            query_kwargs["FilterExpression"] = Attr("exercise_type").eq(exercise_type)
 
-        # Filter workouts by date if specified
-        if start_date:
-            workouts = [w for w in workouts if w.get("date", "") >= start_date]
+        return self.iter_query_native(**query_kwargs)
 
-        # Build lookup for fast context resolution; skip workouts missing workout_id
-        workout_lookup = {w["workout_id"]: w for w in workouts if w.get("workout_id")}
-        if not workout_lookup:
-            return []
+    def get_exercises_with_workout_context(
+        self,
+        athlete_id: str,
+        exercise_type: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get an athlete's exercise history for analytics, oldest first.
 
-        # Parallel-fetch exercises for all workouts (N queries → 1 RTT)
-        all_exercises = self.batch_get_exercises_by_workout_ids(
-            list(workout_lookup.keys())
+        :param athlete_id: The athlete's ID
+        :param exercise_type: Optional filter by exercise type
+        :param start_date: Optional filter for exercises since date (YYYY-MM-DD)
+        :param end_date: Optional filter for exercises up to and including date (YYYY-MM-DD)
+        :return: List of exercises with workout context
+        """
+        return list(
+            self.iter_exercises_with_workout_context(
+                athlete_id, exercise_type, start_date, end_date
+            )
         )
-
-        exercises_with_context = []
-        for exercise in all_exercises:
-            # Filter by exercise type if specified
-            if exercise_type and exercise.get("exercise_type") != exercise_type:
-                continue
-
-            # Resolve workout context via workout_id embedded in the exercise
-            workout = workout_lookup.get(exercise.get("workout_id"), {})
-            exercise_with_context = {
-                **exercise,
-                "workout_date": workout.get("date"),
-                "workout_status": workout.get("status"),
-            }
-            exercises_with_context.append(exercise_with_context)
-
-        return exercises_with_context
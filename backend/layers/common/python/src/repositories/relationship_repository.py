@@ -1,6 +1,6 @@
 from .base_repository import BaseRepository
 from boto3.dynamodb.conditions import Key, Attr
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from src.config.relationship_config import RelationshipConfig
 
 
@@ -30,14 +30,14 @@ class RelationshipRepository(BaseRepository):
         query_params = {
             "IndexName": RelationshipConfig.COACH_INDEX,
             "KeyConditionExpression": Key("coach_id").eq(coach_id),
-            "Limit": RelationshipConfig.MAX_ITEMS,
         }
 
         if status:
             query_params["FilterExpression"] = Attr("status").eq(status)
 
-        response = self.table.query(**query_params)
-        return response.get("Items", [])
+        return list(
+            self.iter_query(page_size=RelationshipConfig.MAX_ITEMS, **query_params)
+        )
 
     def get_relationships_for_athlete(
         self, athlete_id: str, status: Optional[str] = None
@@ -52,68 +52,125 @@ class RelationshipRepository(BaseRepository):
         query_params = {
             "IndexName": RelationshipConfig.ATHLETE_INDEX,
             "KeyConditionExpression": Key("athlete_id").eq(athlete_id),
-            "Limit": RelationshipConfig.MAX_ITEMS,
         }
 
         if status:
             query_params["FilterExpression"] = Attr("status").eq(status)
 
-        response = self.table.query(**query_params)
-        return response.get("Items", [])
+        return list(
+            self.iter_query(page_size=RelationshipConfig.MAX_ITEMS, **query_params)
+        )
+
+    def get_relationships_page_for_coach(
+        self,
+        coach_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of relationships by coach ID, optionally filtered by status.
+
+        :param coach_id: The ID of the coach.
+        :param limit: Maximum number of relationships in the page.
+        :param exclusive_start_key: Key returned by the previous page, if any.
+        :param status: The status of the relationship (optional).
+        :return: Tuple of (relationships data, key to resume from or None on the last page).
+        """
+        query_params = {
+            "IndexName": RelationshipConfig.COACH_INDEX,
+            "KeyConditionExpression": Key("coach_id").eq(coach_id),
+        }
+
+        if status:
+            query_params["FilterExpression"] = Attr("status").eq(status)
+
+        return self.query_page(limit, exclusive_start_key, **query_params)
+
+    def get_relationships_page_for_athlete(
+        self,
+        athlete_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of relationships by athlete ID, optionally filtered by status.
+
+        :param athlete_id: The ID of the athlete.
+        :param limit: Maximum number of relationships in the page.
+        :param exclusive_start_key: Key returned by the previous page, if any.
+        :param status: The status of the relationship (optional).
+        :return: Tuple of (relationships data, key to resume from or None on the last page).
+        """
+        query_params = {
+            "IndexName": RelationshipConfig.ATHLETE_INDEX,
+            "KeyConditionExpression": Key("athlete_id").eq(athlete_id),
+        }
+
+        if status:
+            query_params["FilterExpression"] = Attr("status").eq(status)
+
+        return self.query_page(limit, exclusive_start_key, **query_params)
 
     def get_active_relationship(
-        self, coach_id: str, athlete_id: str
+        self, coach_id: str, athlete_id: str, attributes: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves active relationship between coach and athlete if exists
 
         :param coach_id: The ID of the coach.
         :param athlete_id: The ID of the athlete.
+        :param attributes: Optional attribute names to fetch instead of the whole item.
         :return: A dictionary containing the relationship data if found, None otherwise.
         """
-        response = self.table.query(
+        items = self.iter_query(
+            max_items=1,
+            attributes=attributes,
             IndexName=RelationshipConfig.COACH_ATHLETE_INDEX,
             KeyConditionExpression=Key("coach_id").eq(coach_id)
             & Key("athlete_id").eq(athlete_id),
             FilterExpression=Attr("status").eq("active"),
         )
-
-        items = response.get("Items", [])
-        return items[0] if items else None
+        return next(items, None)
 
     def get_relationship_by_code(
         self, invitation_code: str
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves a relationship by invitation code.
+        Uses the sparse invitation code index, so the cost does not depend on table size.
 
         :param invitation_code: The invitation code to look up
         :return: A dictionary containing the relationship data if found, None otherwise.
         """
-        response = self.table.scan(
-            FilterExpression=Attr("invitation_code").eq(invitation_code)
+        matches = self.iter_query(
+            IndexName=RelationshipConfig.INVITATION_CODE_INDEX,
+            KeyConditionExpression=Key("invitation_code").eq(invitation_code),
         )
 
-        items = response.get("Items", [])
-        return items[0] if items else None
+        # Codes are short, so an expired invite awaiting TTL cleanup may share one
+        # with a live invite; the newest invite wins
+        return max(matches, key=lambda item: item.get("ttl") or 0, default=None)
 
     def get_active_relationship_for_athlete(
-        self, athlete_id: str
+        self, athlete_id: str, attributes: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves active relationship for an athlete if exists
 
         :param athlete_id: The ID of the athlete
+        :param attributes: Optional attribute names to fetch instead of the whole item
         :return: A dictionary containing the relationship data if found, None otherwise.
         """
-        response = self.table.query(
+        items = self.iter_query(
+            max_items=1,
+            attributes=attributes,
             IndexName=RelationshipConfig.ATHLETE_INDEX,
             KeyConditionExpression=Key("athlete_id").eq(athlete_id),
             FilterExpression=Attr("status").eq("active"),
         )
-
-        items = response.get("Items", [])
-        return items[0] if items else None
+        return next(items, None)
 
     def create_relationship(self, relationship_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -134,28 +191,41 @@ class RelationshipRepository(BaseRepository):
         :param update_dict: A dictionary containing the updated data.
         :return: The updated relationship data.
         """
-        update_expression = "set "
+        set_parts = []
+        remove_parts = []
         expression_attribute_values = {}
         expression_attribute_names = {}
 
         for key, value in update_dict.items():
             attribute_placeholder = f"#{key}"
-            value_placeholder = f":{key}"
+            expression_attribute_names[attribute_placeholder] = key
+
+            # None removes the attribute, which also drops the item from sparse indexes
+            if value is None:
+                remove_parts.append(attribute_placeholder)
+                continue
 
-            update_expression += f"{attribute_placeholder} = {value_placeholder}, "
+            value_placeholder = f":{key}"
+            set_parts.append(f"{attribute_placeholder} = {value_placeholder}")
             expression_attribute_values[value_placeholder] = value
-            expression_attribute_names[attribute_placeholder] = key
 
-        # Remove trailing comma and space
-        update_expression = update_expression[:-2]
+        update_expression = ""
+        if set_parts:
+            update_expression = "set " + ", ".join(set_parts)
+        if remove_parts:
+            update_expression += " remove " + ", ".join(remove_parts)
+
+        update_kwargs = {
+            "Key": {"relationship_id": relationship_id},
+            "UpdateExpression": update_expression.strip(),
+            "ExpressionAttributeNames": expression_attribute_names,
+            "ReturnValues": "ALL_NEW",
+        }
+        if expression_attribute_values:
+            update_kwargs["ExpressionAttributeValues"] = expression_attribute_values
 
-        response = self.table.update_item(
-            Key={"relationship_id": relationship_id},
-            UpdateExpression=update_expression,
-            ExpressionAttributeNames=expression_attribute_names,
-            ExpressionAttributeValues=expression_attribute_values,
-            ReturnValues="ALL_NEW",
-        )
+        response = self.table.update_item(**update_kwargs)
+        self._record_write({"relationship_id": relationship_id})
 
         return response.get("Attributes", {})
 
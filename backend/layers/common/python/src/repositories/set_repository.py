@@ -32,16 +32,16 @@ class SetRepository(BaseRepository):
         :return: A list of dictionaries containing the sets data.
         """
 
-        response = self.table.query(
-            IndexName=SetConfig.EXERCISE_INDEX,
-            KeyConditionExpression=Key("completed_exercise_id").eq(
-                completed_exercise_id
-            ),
-            Limit=SetConfig.MAX_ITEMS,
+        return list(
+            self.iter_query(
+                page_size=SetConfig.MAX_ITEMS,
+                IndexName=SetConfig.EXERCISE_INDEX,
+                KeyConditionExpression=Key("completed_exercise_id").eq(
+                    completed_exercise_id
+                ),
+            )
         )
 
-        return response.get("Items", [])
-
     def get_sets_by_workout(self, workout_id: str) -> List[Dict[str, Any]]:
         """
         Retrieves all sets for a specific workout.
@@ -50,12 +50,13 @@ class SetRepository(BaseRepository):
         :return: A list of dictionaries containing the sets data.
         """
 
-        response = self.table.query(
-            IndexName=SetConfig.WORKOUT_INDEX,
-            KeyConditionExpression=Key("workout_id").eq(workout_id),
-            Limit=SetConfig.MAX_ITEMS,
+        return list(
+            self.iter_query(
+                page_size=SetConfig.MAX_ITEMS,
+                IndexName=SetConfig.WORKOUT_INDEX,
+                KeyConditionExpression=Key("workout_id").eq(workout_id),
+            )
         )
-        return response.get("Items", [])
 
     def create_set(self, set_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -109,9 +110,7 @@ class SetRepository(BaseRepository):
         sets = self.get_sets_by_exercise(completed_exercise_id)
 
         # Batch delete all sets
-        with self.table.batch_writer() as batch:
-            for set_item in sets:
-                batch.delete_item(Key={"set_id": set_item["set_id"]})
+        self.batch_delete([{"set_id": set_item["set_id"]} for set_item in sets])
 
         return len(sets)
 
@@ -125,8 +124,6 @@ class SetRepository(BaseRepository):
         sets = self.get_sets_by_workout(workout_id)
 
         # Batch delete all sets
-        with self.table.batch_writer() as batch:
-            for set_item in sets:
-                batch.delete_item(Key={"set_id": set_item["set_id"]})
+        self.batch_delete([{"set_id": set_item["set_id"]} for set_item in sets])
 
         return len(sets)
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from .base_repository import BaseRepository
 from src.config.user_config import UserConfig
 
@@ -13,14 +13,17 @@ class UserRepository(BaseRepository):
     def __init__(self):
         super().__init__(UserConfig.TABLE_NAME)
 
-    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+    def get_user(
+        self, user_id: str, attributes: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves a user from the database using their unique user ID.
 
         :param user_id: The unique identifier of the user.
+        :param attributes: Optional attribute names to fetch instead of the whole user.
         :return: A dictionary containing user details if found, else None.
         """
-        return self.get_by_id("user_id", user_id)
+        return self.get_by_id("user_id", user_id, attributes)
 
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """
@@ -78,5 +81,6 @@ class UserRepository(BaseRepository):
             ExpressionAttributeValues=expression_attribute_values,
             ReturnValues="ALL_NEW",
         )
+        self._record_write({"user_id": user_id})
 
         return response.get("Attributes", {})
@@ -2,6 +2,7 @@ from .base_repository import BaseRepository
 from boto3.dynamodb.conditions import Key
 from typing import Dict, Any, Optional, List
 from src.config.week_config import WeekConfig
+from src.config.day_config import DayConfig
 
 
 class WeekRepository(BaseRepository):
@@ -17,6 +18,18 @@ class WeekRepository(BaseRepository):
         """
         return self.get_by_id("week_id", week_id)
 
+    def batch_get_weeks(
+        self, week_ids: List[str], attributes: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves many weeks by ID using batched reads.
+
+        :param week_ids: The IDs of the weeks to retrieve.
+        :param attributes: Optional attribute names to fetch instead of whole items.
+        :return: The found weeks in the order of week_ids; missing IDs are skipped.
+        """
+        return self.get_many("week_id", week_ids, attributes)
+
     def get_weeks_by_block(self, block_id: str) -> List[Dict[str, Any]]:
         """
         Retrieves all weeks associated with a specific block using a DynamoDB GSI.
@@ -24,12 +37,13 @@ class WeekRepository(BaseRepository):
         :param block_id: The unique identifier of the block.
         :return: A list of week dictionaries associated with the block.
         """
-        response = self.table.query(
-            IndexName=WeekConfig.BLOCK_INDEX,
-            KeyConditionExpression=Key("block_id").eq(block_id),
-            Limit=WeekConfig.MAX_ITEMS,
+        return list(
+            self.iter_query(
+                page_size=WeekConfig.MAX_ITEMS,
+                IndexName=WeekConfig.BLOCK_INDEX,
+                KeyConditionExpression=Key("block_id").eq(block_id),
+            )
         )
-        return response.get("Items", [])
 
     def create_week(self, week_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -40,6 +54,19 @@ class WeekRepository(BaseRepository):
         """
         return self.create(week_dict)
 
+    def create_weeks_with_days(
+        self, week_dicts: List[Dict[str, Any]], day_dicts: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Creates many weeks and their days using parallel batched writes.
+
+        :param week_dicts: The week items to store.
+        :param day_dicts: The day items to store in the days table.
+        """
+        puts = [(self.table_name, week) for week in week_dicts]
+        puts.extend((DayConfig.TABLE_NAME, day) for day in day_dicts)
+        self.batch_write_items(puts)
+
     def update_week(self, week_id: str, update_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
         Updates an existing week in the database.
@@ -79,8 +106,6 @@ class WeekRepository(BaseRepository):
         weeks = self.get_weeks_by_block(block_id)
 
         # Batch delete all weeks
-        with self.table.batch_writer() as batch:
-            for week in weeks:
-                batch.delete_item(Key={"week_id": week["week_id"]})
+        self.batch_delete([{"week_id": week["week_id"]} for week in weeks])
 
         return len(weeks)
@@ -1,7 +1,10 @@
-from .base_repository import BaseRepository
-from boto3.dynamodb.conditions import Key, Attr
-from typing import Dict, Any, Optional, List
+from .base_repository import BaseRepository, TRANSACT_WRITE_MAX_ITEMS
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from src.config.workout_config import WorkoutConfig
+from src.config.exercise_config import ExerciseConfig
+from src.utils.fan_out import get_fan_out_executor
 
 
 class WorkoutRepository(BaseRepository):
@@ -18,6 +21,18 @@ class WorkoutRepository(BaseRepository):
 
         return self.get_by_id("workout_id", workout_id)
 
+    def batch_get_workouts(
+        self, workout_ids: List[str], attributes: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves many workouts by ID using batched reads.
+
+        :param workout_ids: The IDs of the workouts to retrieve.
+        :param attributes: Optional attribute names to fetch instead of whole items.
+        :return: The found workouts in the order of workout_ids; missing IDs are skipped.
+        """
+        return self.get_many("workout_id", workout_ids, attributes)
+
     def get_workouts_by_athlete(self, athlete_id: str) -> List[Dict[str, Any]]:
         """
         Retrieves workouts for a specific athlete (first page, limited).
@@ -25,13 +40,59 @@ class WorkoutRepository(BaseRepository):
         :param athlete_id: The ID of the athlete.
         :return: A list of dictionaries containing the workout data.
         """
-        response = self.table.query(
-            IndexName=WorkoutConfig.ATHLETE_INDEX,
-            KeyConditionExpression=Key("athlete_id").eq(athlete_id),
-            Limit=WorkoutConfig.MAX_ITEMS,
+        workouts, _ = self.get_workouts_page(athlete_id, WorkoutConfig.MAX_ITEMS)
+        return workouts
+
+    def get_workouts_page(
+        self,
+        athlete_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of workouts for a specific athlete, oldest first.
+
+        :param athlete_id: The ID of the athlete.
+        :param limit: Maximum number of workouts in the page.
+        :param exclusive_start_key: Key returned by the previous page, if any.
+        :param start_date: Optional first date of the range (YYYY-MM-DD).
+        :param end_date: Optional last date of the range (YYYY-MM-DD).
+        :return: Tuple of (workouts, key to resume from or None on the last page).
+        """
+        return self.query_page(
+            limit,
+            exclusive_start_key,
+            IndexName=WorkoutConfig.ATHLETE_DATE_INDEX,
+            KeyConditionExpression=self._key_range(
+                Key("athlete_id").eq(athlete_id), "date", start_date, end_date
+            ),
         )
 
-        return response.get("Items", [])
+    def iter_workouts_by_athlete(
+        self,
+        athlete_id: str,
+        max_items: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields workouts for a specific athlete oldest first, fetching one page at a time.
+
+        :param athlete_id: The ID of the athlete.
+        :param max_items: Optional cap on the number of workouts yielded.
+        :param start_date: Optional first date of the range (YYYY-MM-DD).
+        :param end_date: Optional last date of the range (YYYY-MM-DD).
+        :return: An iterator over workout dictionaries.
+        """
+        return self.iter_query(
+            max_items=max_items,
+            IndexName=WorkoutConfig.ATHLETE_DATE_INDEX,
+            KeyConditionExpression=self._key_range(
+                Key("athlete_id").eq(athlete_id), "date", start_date, end_date
+            ),
+        )
 
     def get_all_workouts_by_athlete(self, athlete_id: str) -> List[Dict[str, Any]]:
         """
@@ -41,20 +102,46 @@ class WorkoutRepository(BaseRepository):
         :param athlete_id: The ID of the athlete.
         :return: A list of all workout dictionaries.
         """
-        query_params = {
-            "IndexName": WorkoutConfig.ATHLETE_INDEX,
-            "KeyConditionExpression": Key("athlete_id").eq(athlete_id),
-        }
-
-        items = []
-        while True:
-            response = self.table.query(**query_params)
-            items.extend(response.get("Items", []))
-            if "LastEvaluatedKey" not in response:
-                break
-            query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        return list(self.iter_workouts_by_athlete(athlete_id))
+
+    def iter_workouts_by_status(
+        self,
+        athlete_id: str,
+        status: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields an athlete's workouts with a given status, oldest first.
 
-        return items
+        :param athlete_id: The ID of the athlete.
+        :param status: The workout status, e.g. "completed".
+        :param start_date: Optional first date of the range (YYYY-MM-DD).
+        :param end_date: Optional last date of the range (YYYY-MM-DD).
+        :return: An iterator over workout dictionaries.
+        """
+        if (
+            WorkoutConfig.INDEX_MIGRATION_STAGE
+            < WorkoutConfig.ATHLETE_STATUS_INDEX_STAGE
+        ):
+            # The status index is not live yet, so filter the athlete's date range
+            return self.iter_query(
+                IndexName=WorkoutConfig.ATHLETE_DATE_INDEX,
+                KeyConditionExpression=self._key_range(
+                    Key("athlete_id").eq(athlete_id), "date", start_date, end_date
+                ),
+                FilterExpression=Attr("status").eq(status),
+            )
+
+        return self.iter_query(
+            IndexName=WorkoutConfig.ATHLETE_STATUS_INDEX,
+            KeyConditionExpression=self._key_range(
+                Key("athlete_status").eq(self.athlete_status_key(athlete_id, status)),
+                "date",
+                start_date,
+                end_date,
+            ),
+        )
 
     def get_workout_by_day(
         self, athlete_id: str, day_id: str
@@ -66,20 +153,56 @@ class WorkoutRepository(BaseRepository):
         :param day_id: The ID of the day.
         :return: A dictionary containing the workout data if found, None otherwise.
         """
+        if WorkoutConfig.INDEX_MIGRATION_STAGE < WorkoutConfig.DAY_ATHLETE_INDEX_STAGE:
+            # The day-athlete index is not live yet, so filter the day's workouts
+            items = self.iter_query(
+                max_items=1,
+                IndexName=WorkoutConfig.DAY_INDEX,
+                KeyConditionExpression=Key("day_id").eq(day_id),
+                FilterExpression=Attr("athlete_id").eq(athlete_id),
+            )
+        else:
+            items = self.iter_query(
+                max_items=1,
+                IndexName=WorkoutConfig.DAY_ATHLETE_INDEX,
+                KeyConditionExpression=Key("day_id").eq(day_id)
+                & Key("athlete_id").eq(athlete_id),
+            )
+
+        return next(items, None)
+
+    def get_workouts_by_day(self, day_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieves every workout logged against a specific day, for any athlete.
 
-        # Use the day-index GSI for efficient lookup
-        response = self.table.query(
-            IndexName=WorkoutConfig.DAY_INDEX,
-            KeyConditionExpression=Key("day_id").eq(day_id),
-            FilterExpression=Attr("athlete_id").eq(athlete_id),
+        :param day_id: The ID of the day.
+        :return: A list of dictionaries containing the workout data.
+        """
+        index_name = (
+            WorkoutConfig.DAY_INDEX
+            if WorkoutConfig.INDEX_MIGRATION_STAGE
+            < WorkoutConfig.DAY_ATHLETE_INDEX_STAGE
+            else WorkoutConfig.DAY_ATHLETE_INDEX
+        )
+        return list(
+            self.iter_query(
+                page_size=WorkoutConfig.MAX_ITEMS,
+                IndexName=index_name,
+                KeyConditionExpression=Key("day_id").eq(day_id),
+            )
         )
 
-        items = response.get("Items", [])
-
-        if not items:
-            return None
+    def batch_get_workouts_by_day_ids(self, day_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieves workouts for multiple day_ids in parallel.
 
-        return items[0]
+        :param day_ids: The IDs of the days to fetch workouts for.
+        :return: Combined list of workouts for all day IDs.
+        """
+        if not day_ids:
+            return []
+        results = get_fan_out_executor().map(self.get_workouts_by_day, day_ids)
+        return [workout for workouts in results for workout in workouts]
 
     def get_completed_workouts_since(
         self, athlete_id: str, start_date: str
@@ -91,15 +214,38 @@ class WorkoutRepository(BaseRepository):
         :param start_date: The start date in ISO format (YYYY-MM-DD).
         :return: A list of dictionaries containing the completed workout data.
         """
-        response = self.table.query(
-            IndexName=WorkoutConfig.ATHLETE_INDEX,
-            KeyConditionExpression=Key("athlete_id").eq(athlete_id),
-            FilterExpression=Attr("date").gte(start_date)
-            & Attr("status").eq("completed"),
-            Limit=WorkoutConfig.MAX_ITEMS,
+        return list(
+            self.iter_workouts_by_status(athlete_id, "completed", start_date=start_date)
         )
 
-        return response.get("Items", [])
+    @staticmethod
+    def athlete_status_key(athlete_id: str, status: str) -> str:
+        """
+        Builds the athlete-status index key of a workout.
+
+        :param athlete_id: The ID of the athlete.
+        :param status: The workout status.
+        :return: The key, e.g. "athlete123#completed".
+        """
+        return f"{athlete_id}#{status}"
+
+    @classmethod
+    def with_athlete_status_key(cls, workout_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adds the athlete-status index key to a workout item that has an athlete and status.
+
+        :param workout_dict: The workout item.
+        :return: The item with athlete_status set, or the item unchanged.
+        """
+        athlete_id = workout_dict.get("athlete_id")
+        status = workout_dict.get("status")
+        if not athlete_id or not status:
+            return workout_dict
+
+        return {
+            **workout_dict,
+            "athlete_status": cls.athlete_status_key(athlete_id, status),
+        }
 
     def get_exercises_by_type(
         self, athlete_id: str, exercise_type: str
@@ -136,7 +282,53 @@ class WorkoutRepository(BaseRepository):
         :param workout_dict: A dictionary containing the workout data.
         :return: The created workout data.
         """
-        return self.create(workout_dict)
+        return self.create(self.with_athlete_status_key(workout_dict))
+
+    def create_workout_with_exercises(
+        self, workout_dict: Dict[str, Any], exercise_dicts: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Creates a workout and all of its exercises together.
+
+        Small workouts are written in one transaction. Workouts with more exercises than a
+        transaction allows fall back to batched writes of the exercises followed by the
+        workout, so the workout only becomes visible once its exercises exist; exercises
+        already written are removed again if a later write fails.
+
+        :param workout_dict: The workout data, without exercises.
+        :param exercise_dicts: The exercise items to store in the exercises table.
+        :return: The created workout data.
+        """
+        from src.repositories.exercise_repository import ExerciseRepository
+
+        exercise_dicts = [ExerciseRepository.to_item(ex) for ex in exercise_dicts]
+        workout_dict = {
+            **self.with_athlete_status_key(workout_dict),
+            **self.exercise_counts(exercise_dicts),
+        }
+        puts = [(self.table_name, workout_dict)]
+        puts.extend((ExerciseConfig.TABLE_NAME, ex) for ex in exercise_dicts)
+
+        if len(puts) <= TRANSACT_WRITE_MAX_ITEMS:
+            self.transact_put(puts)
+            return workout_dict
+
+        try:
+            self.batch_write_items(
+                [(ExerciseConfig.TABLE_NAME, ex) for ex in exercise_dicts]
+            )
+            self.create(workout_dict)
+        except Exception as e:
+            print(f"Error creating workout {workout_dict.get('workout_id')}: {e}")
+            self.batch_delete_items(
+                [
+                    (ExerciseConfig.TABLE_NAME, {"exercise_id": ex["exercise_id"]})
+                    for ex in exercise_dicts
+                ]
+            )
+            raise
+
+        return workout_dict
 
     def update_workout(
         self, workout_id: str, update_dict: Dict[str, Any]
@@ -148,6 +340,20 @@ class WorkoutRepository(BaseRepository):
         :param update_dict: A dictionary containing the updated data.
         :return: The updated workout data.
         """
+        if update_dict.get("status") and "athlete_status" not in update_dict:
+            # A new status moves the workout to another athlete-status partition
+            athlete_id = update_dict.get("athlete_id") or (
+                self.get_by_id("workout_id", workout_id, attributes=["athlete_id"])
+                or {}
+            ).get("athlete_id")
+            if athlete_id:
+                update_dict = {
+                    **update_dict,
+                    "athlete_status": self.athlete_status_key(
+                        athlete_id, update_dict["status"]
+                    ),
+                }
+
         update_expression = "set "
         expression_values = {}
         expression_attribute_names = {}
@@ -168,6 +374,171 @@ class WorkoutRepository(BaseRepository):
             expression_attribute_names,
         )
 
+    @staticmethod
+    def exercise_counts(exercise_dicts: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Counts a workout's exercises for the counters stored on the workout item.
+
+        :param exercise_dicts: The workout's exercises.
+        :return: completed_count and total_count.
+        """
+        return {
+            "completed_count": sum(
+                1 for ex in exercise_dicts if ex.get("status") == "completed"
+            ),
+            "total_count": len(exercise_dicts),
+        }
+
+    @staticmethod
+    def derive_status(completed_count: int, total_count: int) -> Optional[str]:
+        """
+        Derives a workout's status from its exercise counters.
+
+        :param completed_count: The number of completed exercises.
+        :param total_count: The number of exercises.
+        :return: The status, or None for a workout without exercises.
+        """
+        if not total_count:
+            return None
+        if completed_count == total_count:
+            return "completed"
+        if completed_count > 0:
+            return "in_progress"
+        return "not_started"
+
+    def adjust_exercise_counts(
+        self,
+        workout_id: str,
+        completed_delta: int = 0,
+        total_delta: int = 0,
+        exercise_ids: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Atomically adds to a workout's completed_count and total_count, and moves the
+        workout to the status they imply when the number of completed exercises changed.
+
+        Costs one write, plus a conditional status write only when the status changes.
+        Workouts stored before the counters existed are recounted from their exercises.
+
+        :param workout_id: The ID of the workout.
+        :param completed_delta: Change in the number of completed exercises.
+        :param total_delta: Change in the number of exercises.
+        :param exercise_ids: The exercises whose change caused the deltas.
+        :return: The updated workout, or None if it does not exist or was not updated.
+        """
+        if not completed_delta and not total_delta:
+            return None
+
+        try:
+            workout = self.update(
+                {"workout_id": workout_id},
+                "ADD completed_count :completed, total_count :total",
+                {":completed": completed_delta, ":total": total_delta},
+                condition_expression="attribute_exists(total_count)",
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != (
+                "ConditionalCheckFailedException"
+            ):
+                raise
+            workout = self.recount_exercises(workout_id, exercise_ids)
+            if not workout:
+                return None
+
+        if completed_delta:
+            workout = self._apply_derived_status(workout)
+        return workout
+
+    def recount_exercises(
+        self, workout_id: str, exercise_ids: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Initializes the exercise counters of a workout stored before they existed.
+
+        The workout index cannot be read consistently and may not reflect a write made
+        just before, so it only supplies exercise IDs. Together with the IDs of the
+        exercises just changed, they are read back from the table with consistent reads.
+
+        :param workout_id: The ID of the workout.
+        :param exercise_ids: Exercises just created, changed or deleted in the workout.
+        :return: The updated workout, or None if it does not exist or already has counters.
+        """
+        from src.repositories.exercise_repository import ExerciseRepository
+
+        exercise_repository = ExerciseRepository()
+        indexed_ids = [
+            exercise["exercise_id"]
+            for exercise in exercise_repository.get_exercises_by_workout(workout_id)
+        ]
+        exercises = exercise_repository.batch_get_exercises(
+            [*indexed_ids, *(exercise_ids or [])],
+            attributes=["workout_id", "status"],
+            consistent_read=True,
+        )
+        counts = self.exercise_counts(
+            [ex for ex in exercises if ex.get("workout_id") == workout_id]
+        )
+        try:
+            return self.update(
+                {"workout_id": workout_id},
+                "SET completed_count = :completed_count, total_count = :total_count",
+                {f":{name}": value for name, value in counts.items()},
+                condition_expression=(
+                    "attribute_exists(workout_id) AND attribute_not_exists(total_count)"
+                ),
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != (
+                "ConditionalCheckFailedException"
+            ):
+                raise
+            return None
+
+    def _apply_derived_status(self, workout: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Writes the status implied by a workout's counters, if it differs.
+
+        The write is conditioned on the counters it was derived from. When another
+        exercise changed them in the meantime, that change derives the status itself.
+
+        :param workout: The workout item, including its counters.
+        :return: The workout as stored after the write.
+        """
+        completed_count = int(workout.get("completed_count", 0))
+        total_count = int(workout.get("total_count", 0))
+        status = self.derive_status(completed_count, total_count)
+        if not status or status == workout.get("status"):
+            return workout
+
+        update_expression = "SET #status = :status"
+        expression_values = {
+            ":status": status,
+            ":completed_count": completed_count,
+            ":total_count": total_count,
+        }
+        if workout.get("athlete_id"):
+            update_expression += ", athlete_status = :athlete_status"
+            expression_values[":athlete_status"] = self.athlete_status_key(
+                workout["athlete_id"], status
+            )
+
+        try:
+            return self.update(
+                {"workout_id": workout["workout_id"]},
+                update_expression,
+                expression_values,
+                {"#status": "status"},
+                condition_expression=(
+                    "completed_count = :completed_count AND total_count = :total_count"
+                ),
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != (
+                "ConditionalCheckFailedException"
+            ):
+                raise
+            return workout
+
     def delete_workout(self, workout_id: str) -> Dict[str, Any]:
         """
         Deletes a workout by its ID and all its associated exercises.
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Iterable, Union, Optional
 from src.repositories.exercise_repository import ExerciseRepository
 from src.repositories.block_repository import BlockRepository
 from src.repositories.week_repository import WeekRepository
@@ -94,24 +94,17 @@ class AnalyticsService:
             return 0.0
 
         try:
-            # Get ALL exercises for athlete (no date filtering)
-            exercises = self.exercise_repository.get_exercises_with_workout_context(
-                athlete_id=athlete_id
+            # Get ALL exercises of this type for athlete (no date filtering)
+            exercises_of_type = self.exercise_repository.iter_exercises_by_type(
+                athlete_id, exercise_type
             )
 
-            # Filter by exercise_type (case-insensitive)
-            exercises_of_type = [
-                exercise
-                for exercise in exercises
-                if exercise.get("exercise_type", "").lower() == exercise_type.lower()
-            ]
-
             # Filter for analytics-complete exercises only
-            completed_exercises = [
+            completed_exercises = (
                 exercise
                 for exercise in exercises_of_type
                 if self._is_exercise_analytics_complete(exercise)
-            ]
+            )
 
             # Find absolute maximum weight across ALL time
             all_time_max = 0.0
@@ -134,24 +127,17 @@ class AnalyticsService:
             return []
 
         try:
-            # Use same pattern as calculate_volume
-            exercises = self.exercise_repository.get_exercises_with_workout_context(
-                athlete_id=athlete_id  # Remove exercise_type parameter
+            # Only this exercise type is read (case-insensitive)
+            exercises_of_type = self.exercise_repository.iter_exercises_by_type(
+                athlete_id, exercise_type
             )
 
-            # Filter by exercise_type AFTER getting all exercises (case-insensitive)
-            exercises_of_type = [
-                exercise
-                for exercise in exercises
-                if exercise.get("exercise_type", "").lower() == exercise_type.lower()
-            ]
-
             # Filter for analytics-complete exercises only
-            completed_exercises = [
+            completed_exercises = (
                 exercise
                 for exercise in exercises_of_type
                 if self._is_exercise_analytics_complete(exercise)
-            ]
+            )
 
             # Group exercises by date and find the maximum weight for each day
             max_weight_by_date = {}
@@ -216,16 +202,16 @@ class AnalyticsService:
                 start_date = "2000-01-01"  # All time
 
             # Get all exercises for the athlete since start_date
-            exercises = self.exercise_repository.get_exercises_with_workout_context(
+            exercises = self.exercise_repository.iter_exercises_with_workout_context(
                 athlete_id=athlete_id, start_date=start_date
             )
 
             # Filter for analytics-complete exercises only
-            completed_exercises = [
+            completed_exercises = (
                 exercise
                 for exercise in exercises
                 if self._is_exercise_analytics_complete(exercise)
-            ]
+            )
 
             # Calculate volume for each day
             volume_data = {}
@@ -283,25 +269,17 @@ class AnalyticsService:
                 start_date = "2000-01-01"
                 period_days = (now - dt.datetime(2000, 1, 1)).days
 
-            # Use same pattern as calculate_volume
-            exercises = self.exercise_repository.get_exercises_with_workout_context(
-                athlete_id=athlete_id,
-                start_date=start_date,  # Remove exercise_type parameter
+            # Only this exercise type is read (case-insensitive)
+            exercises_of_type = self.exercise_repository.iter_exercises_by_type(
+                athlete_id, exercise_type, start_date=start_date
             )
 
-            # Filter by exercise_type after getting all exercises (case-insensitive)
-            exercises_of_type = [
-                exercise
-                for exercise in exercises
-                if exercise.get("exercise_type", "").lower() == exercise_type.lower()
-            ]
-
             # Filter for analytics-complete exercises only
-            completed_exercises = [
+            completed_exercises = (
                 exercise
                 for exercise in exercises_of_type
                 if self._is_exercise_analytics_complete(exercise)
-            ]
+            )
 
             # Count unique training days and total sets
             training_dates = set()
@@ -466,14 +444,11 @@ class AnalyticsService:
             weeks = self.week_repository.get_weeks_by_block(active_block_id)
             week_ids = [w["week_id"] for w in weeks if w.get("week_id")]
             all_days = self.day_repository.batch_get_days_by_week_ids(week_ids)
-            block_end = active_block.get("end_date", "9999-99-99")
-            all_exercises = [
-                e
-                for e in self.exercise_repository.get_exercises_with_workout_context(
-                    athlete_id, start_date=active_block.get("start_date")
-                )
-                if e.get("workout_date", "") <= block_end
-            ]
+            all_exercises = self.exercise_repository.get_exercises_with_workout_context(
+                athlete_id,
+                start_date=active_block.get("start_date"),
+                end_date=active_block.get("end_date"),
+            )
 
             # --- PR cards ---
             current_prs = self._extract_sbd_bests(all_exercises)
@@ -509,8 +484,10 @@ class AnalyticsService:
             print(f"Error in get_dashboard_summary: {e}")
             return {"error": "Failed to get dashboard summary"}
 
-    def _extract_sbd_bests(self, exercises: List[Dict[str, Any]]) -> Dict[str, float]:
-        """Return best top-set weight for each SBD lift from a list of exercises."""
+    def _extract_sbd_bests(
+        self, exercises: Iterable[Dict[str, Any]]
+    ) -> Dict[str, float]:
+        """Return best top-set weight for each SBD lift from an iterable of exercises."""
         # Case-insensitive lookup: lowercase key -> canonical name
         lower_to_canonical = {lift.lower(): lift for lift in self._SBD_EXERCISES}
         bests: Dict[str, float] = {lift: 0.0 for lift in self._SBD_EXERCISES}
@@ -529,15 +506,11 @@ class AnalyticsService:
             block = self.block_repository.get_block(block_id)
             if not block:
                 return {}
-            start_date = block.get("start_date")
-            end_date = block.get("end_date", "9999-99-99")
-            exercises = [
-                e
-                for e in self.exercise_repository.get_exercises_with_workout_context(
-                    athlete_id, start_date=start_date
-                )
-                if e.get("workout_date", "") <= end_date
-            ]
+            exercises = self.exercise_repository.iter_exercises_with_workout_context(
+                athlete_id,
+                start_date=block.get("start_date"),
+                end_date=block.get("end_date"),
+            )
             return self._extract_sbd_bests(exercises)
         except Exception as e:
             print(f"Error fetching previous block SBD bests for {block_id}: {e}")
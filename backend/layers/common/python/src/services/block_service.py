@@ -1,11 +1,14 @@
 import uuid
 import datetime as dt
-from typing import Dict, Any, Optional, List, Literal
+from typing import Dict, Any, Optional, List, Literal, Tuple
 from src.repositories.block_repository import BlockRepository
 from src.repositories.week_repository import WeekRepository
 from src.models.block import Block
+from src.models.week import Week
+from src.models.day import Day
 from src.services.week_service import WeekService
 from src.services.day_service import DayService
+from src.services.cascade_delete_service import CascadeDeleteService
 
 
 class BlockService:
@@ -14,6 +17,7 @@ class BlockService:
         self.week_repository: WeekRepository = WeekRepository()
         self.week_service: WeekService = WeekService()
         self.day_service: DayService = DayService()
+        self.cascade_delete_service: CascadeDeleteService = CascadeDeleteService()
 
     def get_block(self, block_id: str) -> Optional[Block]:
         """
@@ -38,6 +42,28 @@ class BlockService:
         block_data = self.block_repository.get_blocks_by_athlete(athlete_id)
         return [Block(**block) for block in block_data]
 
+    def get_blocks_page_for_athlete(
+        self,
+        athlete_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Block], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of blocks for an athlete
+
+        :param athlete_id: The ID of the athlete
+        :param limit: Maximum number of blocks in the page
+        :param exclusive_start_key: Key returned by the previous page, if any
+        :return: Tuple of (Block objects, key to resume from or None on the last page)
+        """
+        (
+            block_data,
+            last_evaluated_key,
+        ) = self.block_repository.get_blocks_page_by_athlete(
+            athlete_id, limit, exclusive_start_key
+        )
+        return [Block(**block) for block in block_data], last_evaluated_key
+
     def create_block(
         self,
         athlete_id: str,
@@ -91,35 +117,61 @@ class BlockService:
             number_of_weeks=number_of_weeks,
         )
 
+        # Auto-generate weeks and days in one parallel batch, then save the block so it
+        # only becomes visible once its skeleton exists
+        weeks, days = self._build_block_skeleton(
+            block.block_id, number_of_weeks, start_date_utc
+        )
+        self.week_repository.create_weeks_with_days(
+            [week.to_dict() for week in weeks], [day.to_dict() for day in days]
+        )
+
         # Save block to database
         self.block_repository.create_block(block.to_dict())
 
-        # Auto-generate weeks and days
+        return block
+
+    def _build_block_skeleton(
+        self, block_id: str, number_of_weeks: int, start_date_utc: dt.datetime
+    ) -> Tuple[List[Week], List[Day]]:
+        """
+        Builds the weeks and days of a new block in memory
+
+        :param block_id: The ID of the block the weeks belong to
+        :param number_of_weeks: Number of weeks to generate
+        :param start_date_utc: The block start date in UTC
+        :return: Tuple of (Week objects, Day objects)
+        """
+        weeks = []
+        days = []
+
         for week_number in range(1, number_of_weeks + 1):
-            # Create week
-            week = self.week_service.create_week(
-                block_id=block.block_id,
+            week = Week(
+                week_id=str(uuid.uuid4()),
+                block_id=block_id,
                 week_number=week_number,
                 notes=f"Week {week_number}",
             )
+            weeks.append(week)
 
             for day_number in range(1, 8):
                 # Calculate the date for the day
                 current_date = start_date_utc + dt.timedelta(
                     days=((week_number - 1) * 7) + (day_number - 1)
                 )
-                formatted_date = current_date.strftime("%Y-%m-%d")
-
-                # Create day
-                self.day_service.create_day(
-                    week_id=week.week_id,
-                    day_number=day_number,
-                    date=formatted_date,
-                    focus=None,
-                    notes=f"Day {day_number}",
+
+                days.append(
+                    Day(
+                        day_id=str(uuid.uuid4()),
+                        week_id=week.week_id,
+                        day_number=day_number,
+                        date=current_date.strftime("%Y-%m-%d"),
+                        focus=None,
+                        notes=f"Day {day_number}",
+                    )
                 )
 
-        return block
+        return weeks, days
 
     def update_block(
         self, block_id: str, update_data: Dict[str, Any]
@@ -164,20 +216,13 @@ class BlockService:
         self.block_repository.update_block(block_id, update_data)
         return self.get_block(block_id)
 
-    def delete_block(self, block_id: str) -> bool:
+    def delete_block(self, block_id: str) -> Dict[str, int]:
         """
         Deletes a training block
 
         :param block_id: The ID of the block to delete
-        :return: True if the block was successfully deleted, else False
+        :return: The number of deleted items per table
         """
-        try:
-            # First delete all weeks associated with this block (which will cascade delete days and exercises)
-            self.week_repository.delete_weeks_by_block(block_id)
-
-            # Then delete the block itself
-            response = self.block_repository.delete_block(block_id)
-            return bool(response)
-        except Exception as e:
-            print(f"Error deleting block: {e}")
-            return False
+        # Removes weeks, days, workouts and exercises before the block itself.
+        # Failures propagate so a partial delete is reported and can be re-run.
+        return self.cascade_delete_service.delete_block(block_id)
@@ -0,0 +1,133 @@
+from typing import Dict, List
+from src.repositories.block_repository import BlockRepository
+from src.repositories.week_repository import WeekRepository
+from src.repositories.day_repository import DayRepository
+from src.repositories.workout_repository import WorkoutRepository
+from src.repositories.exercise_repository import ExerciseRepository
+from src.config.week_config import WeekConfig
+from src.config.day_config import DayConfig
+from src.config.workout_config import WorkoutConfig
+from src.config.exercise_config import ExerciseConfig
+
+
+class CascadeDeleteService:
+    """
+    Deletes a block, week or day together with everything underneath it.
+
+    Children are read with parallel fan-out queries and removed bottom-up, one level
+    at a time (exercises, workouts, days, weeks, then the root), using chunked
+    BatchWriteItem deletes. A parent is only deleted after all of its children are
+    gone, so if a delete is interrupted the remaining tree is still reachable from
+    its root and re-running the same delete finishes the job.
+    """
+
+    def __init__(self):
+        self.block_repository: BlockRepository = BlockRepository()
+        self.week_repository: WeekRepository = WeekRepository()
+        self.day_repository: DayRepository = DayRepository()
+        self.workout_repository: WorkoutRepository = WorkoutRepository()
+        self.exercise_repository: ExerciseRepository = ExerciseRepository()
+
+    def delete_block(self, block_id: str) -> Dict[str, int]:
+        """
+        Deletes a training block and all of its weeks, days, workouts and exercises
+
+        :param block_id: The ID of the block to delete
+        :return: Number of items deleted per level
+        """
+        weeks = self.week_repository.get_weeks_by_block(block_id)
+        week_ids = [week["week_id"] for week in weeks]
+
+        counts = self._delete_week_children(week_ids)
+        self.week_repository.batch_delete_items(
+            [(WeekConfig.TABLE_NAME, {"week_id": week_id}) for week_id in week_ids]
+        )
+        counts["weeks"] = len(week_ids)
+
+        counts["blocks"] = 1 if self.block_repository.delete_block(block_id) else 0
+        return counts
+
+    def delete_week(self, week_id: str) -> Dict[str, int]:
+        """
+        Deletes a week and all of its days, workouts and exercises
+
+        :param week_id: The ID of the week to delete
+        :return: Number of items deleted per level
+        """
+        counts = self._delete_week_children([week_id])
+        counts["weeks"] = 1 if self.week_repository.delete_week(week_id) else 0
+        return counts
+
+    def delete_day(self, day_id: str) -> Dict[str, int]:
+        """
+        Deletes a day and all of its workouts and exercises
+
+        :param day_id: The ID of the day to delete
+        :return: Number of items deleted per level
+        """
+        counts = self._delete_day_children([day_id])
+        counts["days"] = 1 if self.day_repository.delete_day(day_id) else 0
+        return counts
+
+    def _delete_week_children(self, week_ids: List[str]) -> Dict[str, int]:
+        """
+        Deletes the days of the given weeks and everything underneath them
+
+        :param week_ids: The IDs of the parent weeks
+        :return: Number of items deleted per level
+        """
+        days = self.day_repository.batch_get_days_by_week_ids(week_ids)
+        day_ids = [day["day_id"] for day in days]
+
+        counts = self._delete_day_children(day_ids)
+        self.day_repository.batch_delete_items(
+            [(DayConfig.TABLE_NAME, {"day_id": day_id}) for day_id in day_ids]
+        )
+        counts["days"] = len(day_ids)
+
+        return counts
+
+    def _delete_day_children(self, day_ids: List[str]) -> Dict[str, int]:
+        """
+        Deletes the workouts and exercises of the given days, exercises first
+
+        :param day_ids: The IDs of the parent days
+        :return: Number of items deleted per level
+        """
+        workouts = self.workout_repository.batch_get_workouts_by_day_ids(day_ids)
+        workout_ids = [workout["workout_id"] for workout in workouts]
+
+        # Exercises logged through a workout carry workout_id but not always day_id
+        exercise_ids = {
+            exercise["exercise_id"]
+            for exercise in self.exercise_repository.batch_get_exercises_by_day_ids(
+                day_ids
+            )
+        }
+        exercise_ids.update(
+            exercise["exercise_id"]
+            for exercise in self.exercise_repository.batch_get_exercises_by_workout_ids(
+                workout_ids
+            )
+        )
+
+        self.exercise_repository.batch_delete_items(
+            [
+                (ExerciseConfig.TABLE_NAME, {"exercise_id": exercise_id})
+                for exercise_id in sorted(exercise_ids)
+            ]
+        )
+        self.workout_repository.batch_delete_items(
+            [
+                (WorkoutConfig.TABLE_NAME, {"workout_id": workout_id})
+                for workout_id in workout_ids
+            ]
+        )
+
+        return {
+            "blocks": 0,
+            "weeks": 0,
+            "days": 0,
+            "workouts": len(workout_ids),
+            "exercises": len(exercise_ids),
+        }
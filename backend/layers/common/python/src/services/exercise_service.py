@@ -9,6 +9,20 @@ class ExerciseService:
     def __init__(self):
         self.exercise_repository: ExerciseRepository = ExerciseRepository()
 
+    @staticmethod
+    def _to_exercise(exercise_data: Dict[str, Any]) -> Exercise:
+        """
+        Build an Exercise from a stored item, dropping attributes the model computes
+        or only stores for indexes
+
+        :param exercise_data: The exercise item
+        :return: The Exercise object
+        """
+        exercise_data = dict(exercise_data)
+        exercise_data.pop("is_predefined", None)
+        exercise_data.pop("athlete_exercise_type", None)  # Index key only
+        return Exercise(**exercise_data)
+
     def get_exercise(self, exercise_id: str) -> Optional[Exercise]:
         """
         Retrieves an exercise by exercise_id
@@ -19,22 +33,14 @@ class ExerciseService:
         exercise_data = self.exercise_repository.get_exercise(exercise_id)
 
         if exercise_data:
-            exercise_data.pop("is_predefined", None)
-            return Exercise(**exercise_data)
+            return self._to_exercise(exercise_data)
         return None
 
     def get_exercises_for_workout(self, workout_id: str) -> List[Exercise]:
         exercises_data = self.exercise_repository.get_exercises_by_workout(workout_id)
         exercises_data.sort(key=lambda x: x.get("order", 999))
 
-        # Remove computed properties before creating Exercise objects
-        exercises = []
-        for exercise_data in exercises_data:
-            clean_data = exercise_data.copy()
-            clean_data.pop("is_predefined", None)
-            exercises.append(Exercise(**clean_data))
-
-        return exercises
+        return [self._to_exercise(exercise_data) for exercise_data in exercises_data]
 
     def create_exercise(
         self,
@@ -115,38 +121,60 @@ class ExerciseService:
         return bool(response)
 
     def reorder_exercises(
-        self, workout_id: str, exercise_order: List[str]
+        self,
+        workout_id: str,
+        exercise_order: List[str],
+        exercises: Optional[List[Exercise]] = None,
     ) -> List[Exercise]:
         """
-        Reorder exercises for a workout
+        Reorder exercises for a workout.
+        Only changed order values are written, in one transaction, and the reordered
+        list is built in memory instead of being read back.
 
         :param workout_id: The ID of the workout to reorder exercises for
         :param exercise_order: A list of exercise IDs in the desired order
+        :param exercises: The workout's exercises as already read by the caller, if any
         :return: A list of reordered Exercise objects
         """
-        # Get all exercises for the workout
-        exercises = self.get_exercises_for_workout(workout_id)
+        if exercises is None:
+            exercises = self.get_exercises_for_workout(workout_id)
         exercise_dict = {ex.exercise_id: ex for ex in exercises}
 
-        # Update order for each exercise
+        # Positions follow the requested list; unknown IDs keep their slot empty
+        new_orders = {}
         for i, exercise_id in enumerate(exercise_order):
             if exercise_id in exercise_dict:
-                self.update_exercise(exercise_id, {"order": i + 1})
+                new_orders[exercise_id] = i + 1
+        new_orders = {
+            exercise_id: order
+            for exercise_id, order in new_orders.items()
+            if exercise_dict[exercise_id].order != order
+        }
+
+        if new_orders:
+            self.exercise_repository.update_exercise_orders(workout_id, new_orders)
+            for exercise_id, order in new_orders.items():
+                exercise_dict[exercise_id].order = order
 
-        return self.get_exercises_for_workout(workout_id)
+        return sorted(exercises, key=lambda ex: 999 if ex.order is None else ex.order)
 
     def reorder_sets(
-        self, exercise_id: str, new_order: List[int]
+        self,
+        exercise_id: str,
+        new_order: List[int],
+        exercise: Optional[Exercise] = None,
     ) -> Optional[Exercise]:
         """
         Reorder sets for an exercise by renumbering them according to new_order
 
         :param exercise_id: ID of the exercise
         :param new_order: Array of current set_numbers in desired order [3, 1, 2]
+        :param exercise: The exercise as already read by the caller, if any
         :return: Updated Exercise object if successful, None otherwise
         """
         # Get the exercise
-        exercise = self.get_exercise(exercise_id)
+        if exercise is None:
+            exercise = self.get_exercise(exercise_id)
         if not exercise or not exercise.sets_data:
             return None
 
@@ -176,9 +204,14 @@ class ExerciseService:
         # Sort by new set_number
         updated_sets_data.sort(key=lambda x: x.get("set_number", 0))
 
-        # Update the exercise
-        update_data = {"sets_data": updated_sets_data}
-        return self.update_exercise(exercise_id, update_data)
+        if updated_sets_data == exercise.sets_data:
+            return exercise
+
+        # Update the exercise; the write returns it, so it is not read back
+        exercise_data = self.exercise_repository.update_exercise(
+            exercise_id, {"sets_data": updated_sets_data}
+        )
+        return self._to_exercise(exercise_data)
 
     def delete_exercises_by_workout(self, workout_id: str) -> int:
         """
@@ -187,14 +220,7 @@ class ExerciseService:
         :param workout_id: The workout_id to filter exercises by
         :return: The number of exercises deleted
         """
-        exercises = self.exercise_repository.get_exercises_by_workout(workout_id)
-
-        # Batch delete all exercises
-        with self.exercise_repository.table.batch_writer() as batch:
-            for exercise in exercises:
-                batch.delete_item(Key={"exercise_id": exercise["exercise_id"]})
-
-        return len(exercises)
+        return self.exercise_repository.delete_exercises_by_workout(workout_id)
 
     def capture_planned_snapshot(self, exercise_id: str) -> Optional[Exercise]:
         """
@@ -229,20 +255,26 @@ class ExerciseService:
         rpe: Optional[Union[int, float]] = None,
         completed: bool = False,
         notes: Optional[str] = None,
+        exercise: Optional[Exercise] = None,
     ) -> Optional[Exercise]:
-        """Track a specific set within an exercise"""
-        # Get the exercise
-        exercise = self.get_exercise(exercise_id)
-        if not exercise:
-            return None
+        """
+        Track a specific set within an exercise.
 
-        # Capture planned snapshot on first set tracking if not already captured
-        if exercise.planned_sets_data is None and exercise.sets_data:
-            self.capture_planned_snapshot(exercise_id)
-            # Refresh exercise after snapshot
-            exercise = self.get_exercise(exercise_id)
+        Usually a single conditional update that writes the set, the planned snapshot
+        and the status together; see ExerciseRepository.track_set. Exercises whose sets
+        are not numbered in list order fall back to a read and a full rewrite.
 
-        # Add/update set data as before
+        :param exercise_id: ID of the exercise
+        :param set_number: Number of the set to add or replace
+        :param reps: Reps performed
+        :param weight: Weight used
+        :param rpe: Optional RPE rating
+        :param completed: Whether the set was completed
+        :param notes: Optional notes
+        :param exercise: The exercise as already read by the caller, if any; used only
+            to choose between replacing and appending the set
+        :return: Updated Exercise object if found, else None
+        """
         set_data = {
             "set_number": set_number,
             "reps": reps,
@@ -254,6 +286,43 @@ class ExerciseService:
         if notes:
             set_data["notes"] = notes
 
+        if set_number >= 1:
+            if exercise is not None:
+                attempts = [exercise.get_set_data(set_number) is None]
+            else:
+                # Logging a planned set is the common case, so try replacing first
+                attempts = [False, True]
+
+            for append in attempts:
+                exercise_data = self.exercise_repository.track_set(
+                    exercise_id, set_data, append=append, start_exercise=completed
+                )
+                if exercise_data:
+                    return self._to_exercise(exercise_data)
+
+        return self._track_set_by_rewrite(exercise_id, set_data)
+
+    def _track_set_by_rewrite(
+        self, exercise_id: str, set_data: Dict[str, Any]
+    ) -> Optional[Exercise]:
+        """
+        Track a set by reading the exercise and rewriting its whole sets_data
+
+        :param exercise_id: ID of the exercise
+        :param set_data: The set to add or replace
+        :return: Updated Exercise object if found, else None
+        """
+        exercise = self.get_exercise(exercise_id)
+        if not exercise:
+            return None
+
+        update_data = {}
+
+        # Capture planned snapshot on first set tracking if not already captured.
+        # It is stored even when empty so later sets take the single-update path.
+        if exercise.planned_sets_data is None:
+            update_data["planned_sets_data"] = copy.deepcopy(exercise.sets_data or [])
+
         # Add set data to exercise
         exercise.add_set_data(set_data)
 
@@ -268,26 +337,19 @@ class ExerciseService:
         # Use the maximum of highest set number and completed sets count
         actual_sets_count = max(completed_sets, highest_set_number)
 
-        # Update exercise data
-        update_data = {
-            "sets_data": exercise.sets_data,
-            "sets": actual_sets_count,
-        }
+        update_data["sets_data"] = exercise.sets_data
+        update_data["sets"] = actual_sets_count
 
-        if completed:
-            if exercise.status == "planned":
-                update_data["status"] = "in_progress"
-            elif exercise.status == "completed":
-                # When adding sets to a completed exercise, move back to in_progress
-                update_data["status"] = "in_progress"
-        else:
-            # When adding incomplete sets to completed exercise, also move to in_progress
-            if exercise.status == "completed":
-                update_data["status"] = "in_progress"
+        # Completing a set starts a planned exercise; any set reopens a completed one
+        if exercise.status == "completed" or (
+            set_data["completed"] and exercise.status == "planned"
+        ):
+            update_data["status"] = "in_progress"
 
-        # Update in repository and return
-        self.exercise_repository.update_exercise(exercise_id, update_data)
-        return self.get_exercise(exercise_id)
+        exercise_data = self.exercise_repository.update_exercise(
+            exercise_id, update_data
+        )
+        return self._to_exercise(exercise_data)
 
     def delete_set(self, exercise_id: str, set_number: int) -> Optional[Exercise]:
         """
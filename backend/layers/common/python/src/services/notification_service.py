@@ -1,9 +1,11 @@
+import time
 import uuid
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from src.repositories.notification_repository import NotificationRepository
 from src.repositories.user_repository import UserRepository
 from src.services.relationship_service import RelationshipService
 from src.models.notification import Notification
+from src.config.notification_config import NotificationConfig
 from src.models.workout import Workout
 
 
@@ -21,8 +23,10 @@ class NotificationService:
         :return: True if notification created successfully, False otherwise
         """
         try:
-            # Get athlete information
-            athlete_data = self.user_repository.get_user(workout.athlete_id)
+            # Get athlete information (the key is projected so existence is still visible)
+            athlete_data = self.user_repository.get_user(
+                workout.athlete_id, attributes=["user_id", "name"]
+            )
             if not athlete_data:
                 return False
 
@@ -31,7 +35,7 @@ class NotificationService:
             # Find the coach using relationship service instead of direct coach_id
             # Use the repository method directly since service doesn't expose this method
             relationship_data = self.relationship_service.relationship_repository.get_active_relationship_for_athlete(
-                workout.athlete_id
+                workout.athlete_id, attributes=["coach_id"]
             )
 
             if not relationship_data:
@@ -40,7 +44,7 @@ class NotificationService:
             coach_id = relationship_data.get("coach_id")
 
             # Verify coach exists
-            coach_data = self.user_repository.get_user(coach_id)
+            coach_data = self.user_repository.get_user(coach_id, attributes=["user_id"])
             if not coach_data:
                 return False
 
@@ -57,7 +61,8 @@ class NotificationService:
                 athlete_name=athlete_name,
                 workout_id=workout.workout_id,
                 day_info=day_info,
-                workout_data=workout.to_dict(),  # Store full workout data for modal
+                # Only a summary is stored; the full workout is fetched on demand
+                workout_summary=Notification.summarize_workout(workout.to_dict()),
                 is_read=False,
                 notification_type="workout_completion",
             )
@@ -98,6 +103,42 @@ class NotificationService:
 
         return notifications
 
+    def get_notifications_page_for_coach(
+        self,
+        coach_id: str,
+        limit: int = None,
+        unread_only: bool = False,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Notification], Optional[Dict[str, Any]]]:
+        """
+        Get one page of notifications for a specific coach
+
+        :param coach_id: ID of the coach
+        :param limit: Maximum number of notifications in the page
+        :param unread_only: If True, only return unread notifications
+        :param exclusive_start_key: Key returned by the previous page, if any
+        :return: Tuple of (Notification objects, key to resume from or None)
+        """
+        if limit is None:
+            limit = NotificationConfig.MAX_ITEMS
+
+        (
+            notification_data,
+            last_evaluated_key,
+        ) = self.notification_repository.get_notifications_page_for_coach(
+            coach_id, limit, unread_only, exclusive_start_key
+        )
+
+        notifications = []
+        for data in notification_data:
+            try:
+                notifications.append(Notification.from_dict(data))
+            except Exception:
+                # Skip invalid notification data
+                continue
+
+        return notifications, last_evaluated_key
+
     def get_notifications_grouped_by_athlete(
         self, coach_id: str, limit: int = None
     ) -> Dict[str, List[Notification]]:
@@ -144,14 +185,35 @@ class NotificationService:
                 return None
         return None
 
-    def mark_notification_as_read(self, notification_id: str) -> bool:
+    def mark_notification_as_read(
+        self, notification_id: str, coach_id: Optional[str] = None
+    ) -> bool:
         """
         Mark a notification as read
 
         :param notification_id: ID of the notification to mark as read
+        :param coach_id: ID of the notification's coach, if already known
         :return: True if successfully marked as read, False otherwise
         """
-        return self.notification_repository.mark_notification_as_read(notification_id)
+        return self.notification_repository.mark_notification_as_read(
+            notification_id, coach_id
+        )
+
+    def mark_notifications_as_read(
+        self, coach_id: str, notification_ids: Optional[List[str]] = None
+    ) -> int:
+        """
+        Mark a coach's notifications as read in bulk
+
+        :param coach_id: ID of the coach
+        :param notification_ids: IDs of the notifications to mark, or None for all unread
+        :return: Number of notifications marked as read
+        """
+        if notification_ids is None:
+            return self.notification_repository.mark_all_notifications_as_read(coach_id)
+        return self.notification_repository.mark_notifications_as_read(
+            coach_id, notification_ids
+        )
 
     def get_unread_count_for_coach(self, coach_id: str) -> int:
         """
@@ -161,3 +223,52 @@ class NotificationService:
         :return: Number of unread notifications
         """
         return self.notification_repository.get_unread_count_for_coach(coach_id)
+
+    def reconcile_unread_counts(self) -> int:
+        """
+        Recount every coach's unread notifications and overwrite their counters.
+        Repairs drift from failed or concurrent writes; also seeds counters for coaches
+        whose notifications predate the counters.
+
+        :return: Number of coaches reconciled
+        """
+        coach_ids = self.notification_repository.get_coach_ids_with_notifications()
+        return sum(
+            1 for coach_id in coach_ids if self._reconcile_unread_count(coach_id)
+        )
+
+    def _reconcile_unread_count(self, coach_id: str) -> bool:
+        """
+        Recount one coach's unread notifications and store the count, retrying when a
+        notification is created or read between the counter read and the write.
+
+        The count comes from the eventually consistent unread index, which can miss a
+        notification created just before. A mismatch is therefore only written when a
+        second counter read and count after RECONCILE_CONFIRM_DELAY_SECONDS agree with
+        the first. A missing counter is created from the count right away.
+
+        :param coach_id: ID of the coach
+        :return: True if the counter was reconciled, False if it kept changing
+        """
+        repository = self.notification_repository
+        for _ in range(NotificationConfig.RECONCILE_MAX_ATTEMPTS):
+            expected_count = repository.get_unread_counter(coach_id)
+            unread_count = repository.count_unread_notifications(coach_id)
+            if unread_count == expected_count:
+                return True
+
+            # A coach without a counter has had no unread notification created since
+            # counters exist, since creating one creates the counter first
+            if expected_count is not None:
+                time.sleep(NotificationConfig.RECONCILE_CONFIRM_DELAY_SECONDS)
+                if (
+                    repository.get_unread_counter(coach_id) != expected_count
+                    or repository.count_unread_notifications(coach_id) != unread_count
+                ):
+                    continue
+
+            if repository.set_unread_count(coach_id, unread_count, expected_count):
+                return True
+
+        print(f"Unread counter for coach {coach_id} kept changing; left for next run")
+        return False
@@ -0,0 +1,464 @@
+import uuid
+import datetime as dt
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from src.repositories.block_repository import BlockRepository
+from src.repositories.week_repository import WeekRepository
+from src.repositories.day_repository import DayRepository
+from src.repositories.workout_repository import WorkoutRepository
+from src.repositories.exercise_repository import ExerciseRepository
+from src.models.block import Block
+from src.models.week import Week
+from src.models.day import Day
+from src.models.workout import Workout
+from src.models.exercise import Exercise
+from src.config.block_config import BlockConfig
+from src.config.week_config import WeekConfig
+from src.config.day_config import DayConfig
+from src.config.workout_config import WorkoutConfig
+from src.config.exercise_config import ExerciseConfig
+from src.utils.fan_out import get_fan_out_executor
+
+
+class CloneConflictError(ValueError):
+    """
+    Raised when a copy would land on a day that already has a workout
+    """
+
+
+class ProgramCloneService:
+    """
+    Copies a day, week or block of training together with its workouts and exercises.
+
+    The source tree is read one level at a time with batched gets and parallel fan-out
+    queries, and the copy is built in memory with fresh IDs. It is written bottom-up
+    (exercises, then workouts, days and weeks, then the block) using chunked
+    BatchWriteItem puts, so a copied parent only becomes visible once everything
+    underneath it exists. If a write fails, the items already written are removed.
+
+    Copied workouts start over as not_started with planned exercises. Per-set details
+    are kept with their completion reset, or dropped when strip_sets_data is set.
+    """
+
+    # Primary key of each table a copy writes to, used to undo a failed copy
+    _TABLE_KEYS = {
+        BlockConfig.TABLE_NAME: "block_id",
+        WeekConfig.TABLE_NAME: "week_id",
+        DayConfig.TABLE_NAME: "day_id",
+        WorkoutConfig.TABLE_NAME: "workout_id",
+        ExerciseConfig.TABLE_NAME: "exercise_id",
+    }
+
+    def __init__(self):
+        self.block_repository: BlockRepository = BlockRepository()
+        self.week_repository: WeekRepository = WeekRepository()
+        self.day_repository: DayRepository = DayRepository()
+        self.workout_repository: WorkoutRepository = WorkoutRepository()
+        self.exercise_repository: ExerciseRepository = ExerciseRepository()
+
+    def get_week_athletes(self, week_ids: List[str]) -> Dict[str, str]:
+        """
+        Resolves the athlete owning each week with one batched read per level
+
+        :param week_ids: The IDs of the weeks
+        :return: Athlete ID by week ID; weeks or blocks that do not exist are left out
+        """
+        weeks = self.week_repository.batch_get_weeks(week_ids)
+        blocks = self.block_repository.batch_get_blocks(
+            [week["block_id"] for week in weeks]
+        )
+        block_athletes = {block["block_id"]: block["athlete_id"] for block in blocks}
+
+        return {
+            week["week_id"]: block_athletes[week["block_id"]]
+            for week in weeks
+            if week["block_id"] in block_athletes
+        }
+
+    def get_day_athletes(self, day_ids: List[str]) -> Dict[str, str]:
+        """
+        Resolves the athlete owning each day with one batched read per level
+
+        :param day_ids: The IDs of the days
+        :return: Athlete ID by day ID; days whose week or block is missing are left out
+        """
+        days = self.day_repository.batch_get_days(day_ids)
+        week_athletes = self.get_week_athletes([day["week_id"] for day in days])
+
+        return {
+            day["day_id"]: week_athletes[day["week_id"]]
+            for day in days
+            if day["week_id"] in week_athletes
+        }
+
+    def clone_day(
+        self,
+        source_day_id: str,
+        target_day_id: str,
+        athlete_id: str,
+        strip_sets_data: bool = False,
+    ) -> Optional[Workout]:
+        """
+        Copies an athlete's workout from one day onto another, dated to the target day
+
+        :param source_day_id: The ID of the day to copy from
+        :param target_day_id: The ID of the day to copy to
+        :param athlete_id: The ID of the athlete owning both days
+        :param strip_sets_data: Drop per-set details instead of resetting them
+        :return: The new Workout with its exercises, or None if there is nothing to copy
+        :raises CloneConflictError: If the target day already has a workout
+        """
+        target_day = self.day_repository.get_day(target_day_id)
+        source_workout, target_workout = get_fan_out_executor().map(
+            lambda day_id: self.workout_repository.get_workout_by_day(
+                athlete_id, day_id
+            ),
+            [source_day_id, target_day_id],
+        )
+        if not target_day or not source_workout:
+            return None
+        if target_workout:
+            raise CloneConflictError("Target day already has a workout")
+
+        exercises = self.exercise_repository.get_exercises_by_workout(
+            source_workout["workout_id"]
+        )
+        workout, exercise_dicts = self._copy_workout(
+            source_workout,
+            exercises,
+            target_day_id,
+            target_day["date"],
+            strip_sets_data,
+        )
+
+        self._write_levels(
+            [
+                [(ExerciseConfig.TABLE_NAME, ex) for ex in exercise_dicts],
+                [(WorkoutConfig.TABLE_NAME, workout)],
+            ]
+        )
+
+        return Workout.from_dict({**workout, "exercises": exercise_dicts})
+
+    def clone_week(
+        self,
+        source_week_id: str,
+        target_week_id: str,
+        athlete_id: str,
+        strip_sets_data: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Copies an athlete's workouts from one week onto the matching days of another.
+        Each workout moves to the target day with the same day number and takes its date.
+
+        :param source_week_id: The ID of the week to copy from
+        :param target_week_id: The ID of the week to copy to
+        :param athlete_id: The ID of the athlete owning both weeks
+        :param strip_sets_data: Drop per-set details instead of resetting them
+        :return: Number of items copied per level
+        :raises CloneConflictError: If a target day already has a workout
+        :raises ValueError: If the target week lacks a day that has a workout to copy
+        """
+        days = self.day_repository.batch_get_days_by_week_ids(
+            [source_week_id, target_week_id]
+        )
+        workouts = [
+            workout
+            for workout in self.workout_repository.batch_get_workouts_by_day_ids(
+                [day["day_id"] for day in days]
+            )
+            if workout.get("athlete_id") == athlete_id
+        ]
+
+        source_days = {
+            day["day_id"]: day for day in days if day["week_id"] == source_week_id
+        }
+        target_days = {
+            day["day_number"]: day for day in days if day["week_id"] == target_week_id
+        }
+        target_day_ids = {
+            day["day_id"] for day in days if day["week_id"] == target_week_id
+        }
+
+        if any(workout["day_id"] in target_day_ids for workout in workouts):
+            raise CloneConflictError("Target week already has workouts")
+
+        day_pairs = []
+        for workout in workouts:
+            source_day = source_days.get(workout["day_id"])
+            if not source_day:
+                continue
+            target_day = target_days.get(source_day["day_number"])
+            if not target_day:
+                raise ValueError(
+                    f"Target week has no day {source_day['day_number']} to copy to"
+                )
+            day_pairs.append((workout, target_day["day_id"], target_day["date"]))
+
+        return self._clone_workouts(day_pairs, strip_sets_data)
+
+    def clone_block(
+        self,
+        source_block_id: str,
+        shift_days: int = 0,
+        title: Optional[str] = None,
+        strip_sets_data: bool = False,
+    ) -> Optional[Block]:
+        """
+        Copies a training block with all of its weeks, days, workouts and exercises
+        into a new draft block for the same athlete
+
+        :param source_block_id: The ID of the block to copy
+        :param shift_days: Number of days to move every date of the copy by
+        :param title: Title of the new block; defaults to the source block's title
+        :param strip_sets_data: Drop per-set details instead of resetting them
+        :return: The new Block object, or None if the source block does not exist
+        """
+        source_block = self.block_repository.get_block(source_block_id)
+        if not source_block:
+            return None
+
+        athlete_id = source_block["athlete_id"]
+        block = Block(
+            block_id=str(uuid.uuid4()),
+            athlete_id=athlete_id,
+            coach_id=source_block.get("coach_id"),
+            title=title or source_block["title"],
+            description=source_block.get("description", ""),
+            start_date=self._shift_date(source_block["start_date"], shift_days),
+            end_date=self._shift_date(source_block["end_date"], shift_days),
+            status="draft",
+            number_of_weeks=(
+                int(source_block["number_of_weeks"])
+                if source_block.get("number_of_weeks") is not None
+                else None
+            ),
+        )
+
+        weeks = self.week_repository.get_weeks_by_block(source_block_id)
+        week_ids = {}
+        week_dicts = []
+        for week in weeks:
+            week_ids[week["week_id"]] = str(uuid.uuid4())
+            week_dicts.append(
+                Week(
+                    week_id=week_ids[week["week_id"]],
+                    block_id=block.block_id,
+                    week_number=int(week["week_number"]),
+                    notes=week.get("notes"),
+                ).to_dict()
+            )
+
+        days = self.day_repository.batch_get_days_by_week_ids(list(week_ids))
+        new_days = {}
+        for day in days:
+            new_days[day["day_id"]] = Day(
+                day_id=str(uuid.uuid4()),
+                week_id=week_ids[day["week_id"]],
+                day_number=int(day["day_number"]),
+                date=self._shift_date(day["date"], shift_days),
+                focus=day.get("focus"),
+                notes=day.get("notes"),
+            )
+
+        workouts = [
+            workout
+            for workout in self.workout_repository.batch_get_workouts_by_day_ids(
+                list(new_days)
+            )
+            if workout.get("athlete_id") == athlete_id
+        ]
+        day_pairs = [
+            (
+                workout,
+                new_days[workout["day_id"]].day_id,
+                new_days[workout["day_id"]].date,
+            )
+            for workout in workouts
+        ]
+
+        self._clone_workouts(
+            day_pairs,
+            strip_sets_data,
+            parents=[
+                *[(WeekConfig.TABLE_NAME, week) for week in week_dicts],
+                *[(DayConfig.TABLE_NAME, day.to_dict()) for day in new_days.values()],
+            ],
+            root=(BlockConfig.TABLE_NAME, block.to_dict()),
+        )
+
+        return block
+
+    def _clone_workouts(
+        self,
+        day_pairs: List[Tuple[Dict[str, Any], str, str]],
+        strip_sets_data: bool,
+        parents: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+        root: Optional[Tuple[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, int]:
+        """
+        Copies workouts onto new days and writes them with their exercises and parents
+
+        :param day_pairs: (source workout, target day ID, target date) triples
+        :param strip_sets_data: Drop per-set details instead of resetting them
+        :param parents: New weeks and days to write together with the workouts
+        :param root: New block to write once everything underneath it exists
+        :return: Number of items copied per level
+        """
+        exercises_by_workout = defaultdict(list)
+        for exercise in self.exercise_repository.batch_get_exercises_by_workout_ids(
+            [workout["workout_id"] for workout, _, _ in day_pairs]
+        ):
+            exercises_by_workout[exercise["workout_id"]].append(exercise)
+
+        workout_puts = list(parents or [])
+        exercise_puts = []
+        for source_workout, day_id, date in day_pairs:
+            workout, exercise_dicts = self._copy_workout(
+                source_workout,
+                exercises_by_workout[source_workout["workout_id"]],
+                day_id,
+                date,
+                strip_sets_data,
+            )
+            workout_puts.append((WorkoutConfig.TABLE_NAME, workout))
+            exercise_puts.extend(
+                (ExerciseConfig.TABLE_NAME, ex) for ex in exercise_dicts
+            )
+
+        self._write_levels([exercise_puts, workout_puts, [root] if root else []])
+
+        return {
+            "workouts": len(day_pairs),
+            "exercises": len(exercise_puts),
+        }
+
+    def _copy_workout(
+        self,
+        source_workout: Dict[str, Any],
+        source_exercises: List[Dict[str, Any]],
+        day_id: str,
+        date: str,
+        strip_sets_data: bool,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Builds the items of a fresh copy of a workout and its exercises
+
+        :param source_workout: The workout to copy
+        :param source_exercises: The exercises of the workout to copy
+        :param day_id: The ID of the day the copy belongs to
+        :param date: The date of the copy
+        :param strip_sets_data: Drop per-set details instead of resetting them
+        :return: Tuple of (workout item with counters and index key, exercise items)
+        """
+        workout = Workout(
+            workout_id=str(uuid.uuid4()),
+            athlete_id=source_workout["athlete_id"],
+            day_id=day_id,
+            date=date,
+            status="not_started",
+        )
+
+        source_exercises = sorted(
+            source_exercises,
+            key=lambda ex: ex.get("order") if ex.get("order") is not None else 999,
+        )
+        exercise_dicts = [
+            ExerciseRepository.to_item(
+                Exercise(
+                    exercise_id=str(uuid.uuid4()),
+                    workout_id=workout.workout_id,
+                    exercise_type=exercise["exercise_type"],
+                    sets=exercise["sets"],
+                    reps=exercise["reps"],
+                    weight=exercise["weight"],
+                    notes=exercise.get("notes"),
+                    order=i + 1,
+                    exercise_category=exercise.get("exercise_category"),
+                    sets_data=(
+                        None
+                        if strip_sets_data
+                        else self._reset_sets_data(exercise.get("sets_data"))
+                    ),
+                    # The copy is a fresh plan; its snapshot is taken when tracked
+                    planned_sets_data=None,
+                    athlete_id=workout.athlete_id,
+                    workout_date=date,
+                ).to_dict()
+            )
+            for i, exercise in enumerate(source_exercises)
+        ]
+
+        # The workout item is stored without exercises; they live in the ExerciseTable
+        workout_dict = workout.to_dict()
+        workout_dict.pop("exercises", None)
+        workout_dict = {
+            **WorkoutRepository.with_athlete_status_key(workout_dict),
+            **WorkoutRepository.exercise_counts(exercise_dicts),
+        }
+
+        return workout_dict, exercise_dicts
+
+    @staticmethod
+    def _reset_sets_data(
+        sets_data: Optional[List[Dict[str, Any]]],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Keeps the planned values of each set and clears its completion
+
+        :param sets_data: The per-set details of the source exercise
+        :return: The sets to copy, or None if the exercise has none
+        """
+        if not sets_data:
+            return None
+
+        return [
+            {
+                "set_number": set_data.get("set_number"),
+                "weight": set_data.get("weight"),
+                "reps": set_data.get("reps"),
+                "rpe": set_data.get("rpe"),
+                "completed": False,
+            }
+            for set_data in sets_data
+        ]
+
+    @staticmethod
+    def _shift_date(date: str, shift_days: int) -> str:
+        """
+        Moves a date, with or without a time part, by a number of days
+
+        :param date: The date in ISO format
+        :param shift_days: Number of days to move the date by
+        :return: The shifted date in the same format
+        """
+        if not shift_days or not date:
+            return date
+
+        shifted = dt.date.fromisoformat(date[:10]) + dt.timedelta(days=shift_days)
+        return shifted.isoformat() + date[10:]
+
+    def _write_levels(self, levels: List[List[Tuple[str, Dict[str, Any]]]]) -> None:
+        """
+        Writes the levels of a copy one after another with parallel batched puts.
+        If a level fails, everything written so far is deleted again.
+
+        :param levels: (table name, item) pairs per level, children first
+        """
+        written = []
+        try:
+            for puts in levels:
+                # Items of a failed level may have been written in part
+                written.extend(puts)
+                if puts:
+                    self.workout_repository.batch_write_items(puts)
+        except Exception as e:
+            print(f"Error writing copy, removing {len(written)} items: {e}")
+            self.workout_repository.batch_delete_items(
+                [
+                    (table_name, {key: item[key]})
+                    for table_name, item in written
+                    for key in [self._TABLE_KEYS[table_name]]
+                ]
+            )
+            raise
@@ -21,6 +21,20 @@ class UserService:
             return User(**user_data)
         return None
 
+    def get_weight_unit_preference(self, user_id: str) -> Optional[str]:
+        """
+        Retrieves only the weight unit preference of a user
+
+        :param user_id: The ID of the user
+        :return: The stored preference, or None if the user or preference is missing
+        """
+        user_data = self.user_repository.get_user(
+            user_id, attributes=["weight_unit_preference"]
+        )
+        if user_data:
+            return user_data.get("weight_unit_preference")
+        return None
+
     def create_user(
         self,
         email: str,
@@ -0,0 +1,121 @@
+"""
+Single-pass DynamoDB deserialization
+The boto3 resource layer turns every wire value into Decimal, and the repositories then walk
+each item again to turn those into floats. The helpers here read the low-level client's wire
+format straight into native ints, floats and strings, so hot read paths touch each value once
+and their results serialize to JSON without DecimalEncoder.
+"""
+from typing import Any, Dict, List, Optional
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeSerializer
+from src.utils.decimal_converter import convert_floats_to_decimals
+
+_serializer = TypeSerializer()
+
+
+def _number(value: str) -> Any:
+    # DynamoDB returns integers without a decimal point or exponent
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def deserialize_value(attribute_value: Dict[str, Any]) -> Any:
+    """
+    Convert one wire-format attribute value into a native Python value
+
+    :param attribute_value: A single-key dict such as {"N": "82.5"} or {"S": "Squat"}
+    :return: The native value; numbers become int or float, sets become lists
+    """
+    for type_code, value in attribute_value.items():
+        if type_code == "S":
+            return value
+        if type_code == "N":
+            return _number(value)
+        if type_code == "M":
+            return {key: deserialize_value(item) for key, item in value.items()}
+        if type_code == "L":
+            return [deserialize_value(item) for item in value]
+        if type_code == "BOOL":
+            return value
+        if type_code == "NULL":
+            return None
+        if type_code == "NS":
+            return [_number(item) for item in value]
+        if type_code in ("SS", "BS", "B"):
+            return value
+        raise TypeError(f"Unsupported DynamoDB type: {type_code}")
+
+
+def deserialize_item(item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a wire-format item into a plain dictionary in a single pass
+
+    :param item: An item as returned by the low-level client
+    :return: The item with native values
+    """
+    return {key: deserialize_value(value) for key, value in item.items()}
+
+
+def deserialize_items(items: List[Dict[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Convert a page of wire-format items
+
+    :param items: Items as returned by the low-level client
+    :return: The items with native values
+    """
+    return [deserialize_item(item) for item in items]
+
+
+def serialize_value(value: Any) -> Dict[str, Any]:
+    """
+    Convert a native Python value into wire format
+
+    :param value: The value to serialize; floats are sent as exact decimals
+    :return: A single-key attribute value dict
+    """
+    return _serializer.serialize(convert_floats_to_decimals(value))
+
+
+def build_low_level_query(query_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate resource-style query arguments into low-level client arguments.
+    Condition objects are rendered to expressions and values are serialized.
+
+    :param query_kwargs: Arguments as accepted by Table.query, including TableName
+    :return: Arguments for client.query
+    """
+    params = dict(query_kwargs)
+    names: Dict[str, str] = dict(params.pop("ExpressionAttributeNames", None) or {})
+    values: Dict[str, Any] = {
+        placeholder: serialize_value(value)
+        for placeholder, value in (
+            params.pop("ExpressionAttributeValues", None) or {}
+        ).items()
+    }
+
+    # One builder keeps placeholders unique across the key and filter expressions
+    builder = ConditionExpressionBuilder()
+    for argument, is_key_condition in (
+        ("KeyConditionExpression", True),
+        ("FilterExpression", False),
+    ):
+        condition: Optional[Any] = params.get(argument)
+        if isinstance(condition, ConditionBase):
+            built = builder.build_expression(condition, is_key_condition)
+            params[argument] = built.condition_expression
+            names.update(built.attribute_name_placeholders)
+            values.update(
+                {
+                    placeholder: serialize_value(value)
+                    for placeholder, value in built.attribute_value_placeholders.items()
+                }
+            )
+
+    if names:
+        params["ExpressionAttributeNames"] = names
+    if values:
+        params["ExpressionAttributeValues"] = values
+
+    return params
@@ -0,0 +1,133 @@
+import contextvars
+import copy
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+# The identity map of the request being handled, if any. Worker threads started by
+# repository fan-outs do not inherit it and simply read through to DynamoDB.
+_current_identity_map: contextvars.ContextVar = contextvars.ContextVar(
+    "identity_map", default=None
+)
+
+
+class IdentityMap:
+    """
+    Request-scoped unit of work remembering every item read by primary key, so each
+    entity is fetched at most once per request no matter how many services ask for it.
+
+    Items that turned out not to exist are remembered too. Writes made through the
+    repositories update or evict the affected entries, and drop any memoized query
+    results for the written table.
+    """
+
+    def __init__(self):
+        self._items: Dict[Tuple[str, Tuple], Optional[Dict[str, Any]]] = {}
+        self._queries: Dict[Tuple[str, Hashable], Any] = {}
+
+    @staticmethod
+    def _entry_key(table_name: str, key: Dict[str, Any]) -> Tuple[str, Tuple]:
+        return table_name, tuple(sorted(key.items()))
+
+    def lookup(
+        self, table_name: str, key: Dict[str, Any]
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up an item read earlier in the request
+
+        :param table_name: Name of the table holding the item
+        :param key: Primary key of the item
+        :return: Tuple of (whether the item is known, a copy of the item or None if it does not exist)
+        """
+        entry_key = self._entry_key(table_name, key)
+        if entry_key not in self._items:
+            return False, None
+        return True, copy.deepcopy(self._items[entry_key])
+
+    def remember(
+        self, table_name: str, key: Dict[str, Any], item: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Record the current state of an item, or None if it does not exist
+
+        :param table_name: Name of the table holding the item
+        :param key: Primary key of the item
+        :param item: The full item, or None
+        """
+        self._items[self._entry_key(table_name, key)] = copy.deepcopy(item)
+
+    def record_write(
+        self,
+        table_name: str,
+        key: Optional[Dict[str, Any]] = None,
+        item: Optional[Dict[str, Any]] = None,
+        deleted: bool = False,
+    ) -> None:
+        """
+        Reflect a write in the map. Without a key every entry for the table is evicted.
+
+        :param table_name: Name of the written table
+        :param key: Primary key of the written item, if known
+        :param item: The full item after the write, if known
+        :param deleted: True if the item was deleted
+        """
+        self._queries = {
+            query_key: result
+            for query_key, result in self._queries.items()
+            if query_key[0] != table_name
+        }
+
+        if key is None:
+            self._items = {
+                entry_key: value
+                for entry_key, value in self._items.items()
+                if entry_key[0] != table_name
+            }
+        elif deleted or item is not None:
+            self.remember(table_name, key, None if deleted else item)
+        else:
+            self._items.pop(self._entry_key(table_name, key), None)
+
+    def memoize_query(
+        self, table_name: str, query_key: Hashable, run_query: Callable[[], Any]
+    ) -> Any:
+        """
+        Run a query once per request; later calls get a copy of the first result
+
+        :param table_name: Name of the queried table, used for invalidation on writes
+        :param query_key: Identifies the query within the table
+        :param run_query: Callable performing the query
+        :return: The query result
+        """
+        memo_key = (table_name, query_key)
+        if memo_key not in self._queries:
+            self._queries[memo_key] = copy.deepcopy(run_query())
+        return copy.deepcopy(self._queries[memo_key])
+
+
+def get_identity_map() -> Optional[IdentityMap]:
+    """
+    Get the identity map of the current request
+
+    :return: The active IdentityMap, or None outside a request scope
+    """
+    return _current_identity_map.get()
+
+
+@contextmanager
+def request_scope() -> Iterator[IdentityMap]:
+    """
+    Open an identity map for the duration of one request.
+    Nested scopes share the outermost map.
+
+    :return: Context manager yielding the active IdentityMap
+    """
+    existing = _current_identity_map.get()
+    if existing is not None:
+        yield existing
+        return
+
+    token = _current_identity_map.set(IdentityMap())
+    try:
+        yield _current_identity_map.get()
+    finally:
+        _current_identity_map.reset(token)
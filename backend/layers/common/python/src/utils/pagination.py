@@ -0,0 +1,154 @@
+"""
+Cursor pagination utilities
+List endpoints hand clients an opaque cursor instead of a raw DynamoDB LastEvaluatedKey.
+Cursors are signed and bound to the list they came from, so they cannot be edited or replayed
+against a different athlete, coach or filter.
+"""
+import base64
+import hashlib
+import hmac
+import json
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+from src.config.app_config import AppConfig
+
+# Response header carrying the cursor for the next page, absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed, tampered with or used on the wrong list"""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _sign(payload: bytes) -> bytes:
+    if not AppConfig.PAGINATION_CURSOR_SECRET:
+        raise RuntimeError("PAGINATION_CURSOR_SECRET is not configured")
+    secret = AppConfig.PAGINATION_CURSOR_SECRET.encode("utf-8")
+    return hmac.new(secret, payload, hashlib.sha256).digest()
+
+
+def encode_cursor(
+    last_evaluated_key: Optional[Dict[str, Any]], scope: str
+) -> Optional[str]:
+    """
+    Encode a DynamoDB LastEvaluatedKey as a signed, URL-safe cursor
+
+    :param last_evaluated_key: The key returned by the last query page, or None
+    :param scope: Identifies the list the key belongs to, e.g. "workouts:<athlete_id>"
+    :return: The opaque cursor, or None when there are no more pages
+    """
+    if not last_evaluated_key:
+        return None
+
+    payload = json.dumps(
+        {"s": scope, "k": last_evaluated_key},
+        default=_json_default,
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(cursor: Optional[str], scope: str) -> Optional[Dict[str, Any]]:
+    """
+    Verify a cursor and recover the ExclusiveStartKey it wraps
+
+    :param cursor: The cursor sent by the client, or None for the first page
+    :param scope: The list the cursor must have been issued for
+    :return: The ExclusiveStartKey to resume from, or None for the first page
+    :raises InvalidCursorError: If the cursor is malformed, unsigned or issued for another list
+    """
+    if not cursor:
+        return None
+
+    try:
+        encoded_payload, encoded_signature = cursor.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Invalid cursor")
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursorError("Invalid cursor")
+
+    try:
+        data = json.loads(payload, parse_float=Decimal, parse_int=Decimal)
+    except ValueError:
+        raise InvalidCursorError("Invalid cursor")
+
+    if not isinstance(data, dict) or data.get("s") != scope:
+        raise InvalidCursorError("Cursor does not belong to this list")
+
+    key = data.get("k")
+    if not isinstance(key, dict) or not key:
+        raise InvalidCursorError("Invalid cursor")
+
+    return key
+
+
+def parse_pagination_params(
+    query_params: Optional[Dict[str, Any]], scope: str, default_limit: int
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Read the limit and cursor query parameters of a list request
+
+    :param query_params: The request's queryStringParameters (may be None)
+    :param scope: The list the cursor must have been issued for
+    :param default_limit: Page size used when no limit is given
+    :return: Tuple of (page size, ExclusiveStartKey or None)
+    :raises ValueError: If the limit is not a positive integer or the cursor is invalid
+    """
+    query_params = query_params or {}
+
+    limit = query_params.get("limit")
+    if limit is None or limit == "":
+        limit = default_limit
+    else:
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid limit parameter")
+        if limit < 1:
+            raise ValueError("Invalid limit parameter")
+
+    limit = min(limit, AppConfig.PAGINATION_MAX_LIMIT)
+
+    return limit, decode_cursor(query_params.get("cursor"), scope)
+
+
+def is_pagination_requested(query_params: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a list request asked for a page rather than the full list
+
+    :param query_params: The request's queryStringParameters (may be None)
+    :return: True if a limit or cursor was supplied
+    """
+    query_params = query_params or {}
+    return bool(query_params.get("limit") or query_params.get("cursor"))
+
+
+def next_cursor_headers(next_cursor: Optional[str]) -> Dict[str, str]:
+    """
+    Build the response headers announcing the next page
+
+    :param next_cursor: The cursor for the next page, or None on the last page
+    :return: Headers to merge into the API response
+    """
+    if not next_cursor:
+        return {}
+    return {NEXT_CURSOR_HEADER: next_cursor}
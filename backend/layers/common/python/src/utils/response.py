@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Union
 from decimal import Decimal
 
 
@@ -12,25 +12,35 @@ class DecimalEncoder(json.JSONEncoder):
 
 
 def create_response(
-    status_code: int, body: Union[Dict[str, Any], list]
+    status_code: int,
+    body: Union[Dict[str, Any], list],
+    headers: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Create a standardized API response
 
     :param status_code: The HTTP status code
     :param body: The response body content
+    :param headers: Optional extra headers, e.g. the next-page cursor
     :return: A dictionary representing the API response
     """
     # Get CORS origin from environment variable; "null" fallback denies all cross-origin if unset
     cors_origin = os.environ.get("CORS_ORIGIN", "null")
 
+    response_headers = {
+        "Content-Type": "application/json",
+        "Access-Control-Allow-Origin": cors_origin,
+        "Access-Control-Allow-Methods": "OPTIONS,GET,POST,PUT,DELETE",
+        "Access-Control-Allow-Headers": "Content-Type,Authorization,X-Amz-Date,X-Api-Key,X-Amz-Security-Token",
+    }
+
+    if headers:
+        response_headers.update(headers)
+        # Let browsers read custom headers such as the pagination cursor
+        response_headers["Access-Control-Expose-Headers"] = ",".join(headers)
+
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": cors_origin,
-            "Access-Control-Allow-Methods": "OPTIONS,GET,POST,PUT,DELETE",
-            "Access-Control-Allow-Headers": "Content-Type,Authorization,X-Amz-Date,X-Api-Key,X-Amz-Security-Token",
-        },
+        "headers": response_headers,
         "body": json.dumps(body, cls=DecimalEncoder),
     }
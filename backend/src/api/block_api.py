@@ -1,10 +1,19 @@
 import json
 import logging
+import datetime as dt
 from src.services.block_service import BlockService
+from src.config.block_config import BlockConfig
 from src.utils.response import create_response
+from src.utils.pagination import (
+    encode_cursor,
+    is_pagination_requested,
+    next_cursor_headers,
+    parse_pagination_params,
+)
 from src.middleware.middleware import with_middleware
 from src.middleware.common_middleware import log_request, handle_errors
 from src.services.relationship_service import RelationshipService
+from src.services.program_clone_service import ProgramCloneService
 
 
 logger = logging.getLogger()
@@ -12,6 +21,7 @@ logger.setLevel(logging.INFO)
 
 block_service = BlockService()
 relationship_service = RelationshipService()
+program_clone_service = ProgramCloneService()
 
 
 @with_middleware([log_request, handle_errors])
@@ -124,6 +134,9 @@ def get_block(event, context):
 def get_blocks_by_athlete(event, context):
     """
     Handle GET/athletes/{athlete_id}/blocks request to get blocks by athlete ID
+
+    Returns every block unless limit or cursor is given, in which case a single page is
+    returned and the cursor for the next one is sent in the X-Next-Cursor header.
     """
     try:
         if not event.get("pathParameters") or not event["pathParameters"].get(
@@ -145,6 +158,26 @@ def get_blocks_by_athlete(event, context):
                     403, {"error": "Unauthorized access to this athlete's blocks"}
                 )
 
+        # Return a single page when the client asks for one
+        query_params = event.get("queryStringParameters")
+        if is_pagination_requested(query_params):
+            cursor_scope = f"blocks:{athlete_id}"
+            try:
+                limit, start_key = parse_pagination_params(
+                    query_params, cursor_scope, BlockConfig.MAX_ITEMS
+                )
+            except ValueError as e:
+                return create_response(400, {"error": str(e)})
+
+            blocks, last_evaluated_key = block_service.get_blocks_page_for_athlete(
+                athlete_id, limit, start_key
+            )
+            return create_response(
+                200,
+                [block.to_dict() for block in blocks],
+                next_cursor_headers(encode_cursor(last_evaluated_key, cursor_scope)),
+            )
+
         # Get blocks
         blocks = block_service.get_blocks_for_athlete(athlete_id)
 
@@ -233,11 +266,72 @@ def delete_block(event, context):
                     403, {"error": "Unauthorized access to this block"}
                 )
 
-        # Delete block
-        block_service.delete_block(block_id)
+        # Delete block, reporting how many items the cascade removed
+        counts = block_service.delete_block(block_id)
 
-        return create_response(204, {})
+        return create_response(200, {"deleted": counts})
 
     except Exception as e:
         logger.error(f"Error deleting block: {str(e)}")
         return create_response(500, {"error": str(e)})
+
+
+@with_middleware([log_request, handle_errors])
+def copy_block(event, context):
+    """
+    Handle POST /blocks/{block_id}/copy request to duplicate a block with its workouts.
+    The copy's dates move by shift_days, or so that it begins on start_date.
+    """
+    if not event.get("pathParameters") or not event["pathParameters"].get("block_id"):
+        return create_response(400, {"error": "Missing block_id parameter"})
+
+    try:
+        block_id = event["pathParameters"]["block_id"]
+        body = json.loads(event.get("body") or "{}")
+
+        # Verify ownership
+        user_id = event["requestContext"]["authorizer"]["claims"]["sub"]
+        existing_block = block_service.get_block(block_id)
+        if not existing_block:
+            return create_response(404, {"error": "Block not found"})
+        if user_id != existing_block.athlete_id and user_id != existing_block.coach_id:
+            relationship = relationship_service.get_active_relationship(
+                coach_id=user_id, athlete_id=existing_block.athlete_id
+            )
+            if not relationship:
+                return create_response(
+                    403, {"error": "Unauthorized access to this block"}
+                )
+
+        # Validate the date shift
+        try:
+            if body.get("start_date"):
+                shift_days = (
+                    dt.date.fromisoformat(body["start_date"][:10])
+                    - dt.date.fromisoformat(existing_block.start_date[:10])
+                ).days
+            else:
+                shift_days = int(body.get("shift_days", 0))
+        except (ValueError, TypeError):
+            return create_response(
+                400,
+                {
+                    "error": "shift_days must be an integer and start_date a YYYY-MM-DD date"
+                },
+            )
+
+        # Copy block
+        block = program_clone_service.clone_block(
+            block_id,
+            shift_days=shift_days,
+            title=body.get("title"),
+            strip_sets_data=bool(body.get("strip_sets_data", False)),
+        )
+        if not block:
+            return create_response(404, {"error": "Block not found"})
+
+        return create_response(201, block.to_dict())
+
+    except Exception as e:
+        logger.error(f"Error copying block: {str(e)}")
+        return create_response(500, {"error": str(e)})
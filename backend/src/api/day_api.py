@@ -214,10 +214,10 @@ def delete_day(event, context):
                     403, {"error": "Unauthorized access to this day"}
                 )
 
-        # Delete day
-        day_service.delete_day(day_id)
+        # Delete day, reporting how many items the cascade removed
+        counts = day_service.delete_day(day_id)
 
-        return create_response(204, {})
+        return create_response(200, {"deleted": counts})
 
     except Exception as e:
         logger.error(f"Error deleting day: {str(e)}")
@@ -1,7 +1,14 @@
 import json
 import logging
 from src.services.relationship_service import RelationshipService
+from src.config.relationship_config import RelationshipConfig
 from src.utils.response import create_response
+from src.utils.pagination import (
+    encode_cursor,
+    is_pagination_requested,
+    next_cursor_headers,
+    parse_pagination_params,
+)
 from src.middleware.middleware import with_middleware
 from src.middleware.common_middleware import log_request, handle_errors
 
@@ -120,6 +127,8 @@ def end_relationship(event, context):
 def get_relationships_for_coach(event, context):
     """
     Handle GET /coaches/{coach_id}/relationships request to get all relationships for a coach
+
+    Supports optional limit and cursor query parameters for paging.
     """
     try:
         # Extract coach_id from path parameters
@@ -136,6 +145,28 @@ def get_relationships_for_coach(event, context):
         query_params = event.get("queryStringParameters", {}) or {}
         status = query_params.get("status")
 
+        # Return a single page when the client asks for one
+        if is_pagination_requested(query_params):
+            cursor_scope = f"relationships:coach:{coach_id}:{status or ''}"
+            try:
+                limit, start_key = parse_pagination_params(
+                    query_params, cursor_scope, RelationshipConfig.MAX_ITEMS
+                )
+            except ValueError as e:
+                return create_response(400, {"error": str(e)})
+
+            (
+                relationships,
+                last_evaluated_key,
+            ) = relationship_service.get_relationships_page_for_coach(
+                coach_id, limit, start_key, status
+            )
+            return create_response(
+                200,
+                [relationship.to_dict() for relationship in relationships],
+                next_cursor_headers(encode_cursor(last_evaluated_key, cursor_scope)),
+            )
+
         # Get relationships
         relationships = relationship_service.get_relationships_for_coach(
             coach_id, status
@@ -154,6 +185,8 @@ def get_relationships_for_coach(event, context):
 def get_relationships_for_athlete(event, context):
     """
     Handle GET /athletes/{athlete_id}/relationships request to get all relationships for an athlete
+
+    Supports optional limit and cursor query parameters for paging.
     """
     try:
         # Extract athlete_id from path parameters
@@ -171,6 +204,28 @@ def get_relationships_for_athlete(event, context):
         query_params = event.get("queryStringParameters", {}) or {}
         status = query_params.get("status")
 
+        # Return a single page when the client asks for one
+        if is_pagination_requested(query_params):
+            cursor_scope = f"relationships:athlete:{athlete_id}:{status or ''}"
+            try:
+                limit, start_key = parse_pagination_params(
+                    query_params, cursor_scope, RelationshipConfig.MAX_ITEMS
+                )
+            except ValueError as e:
+                return create_response(400, {"error": str(e)})
+
+            (
+                relationships,
+                last_evaluated_key,
+            ) = relationship_service.get_relationships_page_for_athlete(
+                athlete_id, limit, start_key, status
+            )
+            return create_response(
+                200,
+                [relationship.to_dict() for relationship in relationships],
+                next_cursor_headers(encode_cursor(last_evaluated_key, cursor_scope)),
+            )
+
         # Get relationships
         relationships = relationship_service.get_relationships_for_athlete(
             athlete_id, status
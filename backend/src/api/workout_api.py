@@ -6,7 +6,14 @@ from src.services.day_service import DayService
 from src.services.week_service import WeekService
 from src.services.block_service import BlockService
 from src.services.relationship_service import RelationshipService
+from src.services.program_clone_service import CloneConflictError, ProgramCloneService
+from src.config.workout_config import WorkoutConfig
 from src.utils.response import create_response
+from src.utils.pagination import (
+    encode_cursor,
+    next_cursor_headers,
+    parse_pagination_params,
+)
 from src.middleware.middleware import with_middleware
 from src.middleware.common_middleware import log_request, handle_errors
 from .exercise_api import (
@@ -22,6 +29,7 @@ day_service = DayService()
 week_service = WeekService()
 block_service = BlockService()
 relationship_service = RelationshipService()
+program_clone_service = ProgramCloneService()
 
 
 @with_middleware([log_request, handle_errors])
@@ -231,6 +239,9 @@ def get_workout(event, context):
 def get_workouts_by_athlete(event, context):
     """
     Handle GET /athletes/{athlete_id}/workouts request to get workouts by athlete ID
+
+    Supports limit and cursor query parameters; the cursor for the next page is
+    returned in the X-Next-Cursor header.
     """
     try:
         # Extract athlete_id from path parameters
@@ -247,12 +258,29 @@ def get_workouts_by_athlete(event, context):
                     403, {"error": "Unauthorized access to this athlete's workouts"}
                 )
 
+        # Page through history with limit/cursor query parameters
+        cursor_scope = f"workouts:{athlete_id}"
+        try:
+            limit, start_key = parse_pagination_params(
+                event.get("queryStringParameters"),
+                cursor_scope,
+                WorkoutConfig.MAX_ITEMS,
+            )
+        except ValueError as e:
+            return create_response(400, {"error": str(e)})
+
         # Use workout repository directly since the service doesn't expose this method
         workout_repo = WorkoutRepository()
 
-        workouts = workout_repo.get_workouts_by_athlete(athlete_id)
+        workouts, last_evaluated_key = workout_repo.get_workouts_page(
+            athlete_id, limit, start_key
+        )
 
-        return create_response(200, workouts)
+        return create_response(
+            200,
+            workouts,
+            next_cursor_headers(encode_cursor(last_evaluated_key, cursor_scope)),
+        )
 
     except Exception as e:
         logger.error(f"Error getting workouts: {str(e)}")
@@ -362,6 +390,8 @@ def update_workout(event, context):
 
         return create_response(200, workout_dict)
 
+    except ValueError as e:
+        return create_response(400, {"error": str(e)})
     except Exception as e:
         logger.error(f"Error updating workout: {str(e)}")
         return create_response(500, {"error": str(e)})
@@ -426,24 +456,21 @@ def copy_workout(event, context):
         # Extract current user info from cognito claims
         current_user_id = event["requestContext"]["authorizer"]["claims"]["sub"]
 
-        # Get the source day to determine the actual athlete
-        day_service = DayService()
-        source_day = day_service.get_day(source_day_id)
-        if not source_day:
+        # Resolve both days to their block's athlete in one batched read per level
+        day_athletes = program_clone_service.get_day_athletes(
+            [source_day_id, target_day_id]
+        )
+        if source_day_id not in day_athletes:
             return create_response(404, {"error": "Source day not found"})
-
-        # Get the week to find the block
-        week = week_service.get_week(source_day.week_id)
-        if not week:
-            return create_response(404, {"error": "Week not found"})
-
-        # Get the block to find the actual athlete
-        block = block_service.get_block(week.block_id)
-        if not block:
-            return create_response(404, {"error": "Block not found"})
+        if target_day_id not in day_athletes:
+            return create_response(404, {"error": "Target day not found"})
 
         # Use the block's athlete_id, not the current user's ID
-        athlete_id = block.athlete_id
+        athlete_id = day_athletes[source_day_id]
+        if day_athletes[target_day_id] != athlete_id:
+            return create_response(
+                400, {"error": "Source and target days belong to different athletes"}
+            )
 
         # Verify the current user has permission (either is the athlete or their coach)
         if current_user_id != athlete_id:
@@ -456,63 +483,21 @@ def copy_workout(event, context):
                     403, {"error": "Unauthorized to copy workout for this athlete"}
                 )
 
-        # Get source workout
-        source_workout = workout_service.get_workout_by_day(athlete_id, source_day_id)
-
-        if not source_workout:
-            return create_response(404, {"error": "Source workout not found"})
-
-        # Get target day to ensure it exists and get its date
-        day_service = DayService()
-        target_day = day_service.get_day(target_day_id)
-
-        if not target_day:
-            return create_response(404, {"error": "Target day not found"})
-
-        # Check if a workout already exists for the target day
-        existing_workout = workout_service.get_workout_by_day(athlete_id, target_day_id)
-        if existing_workout:
+        try:
+            new_workout = program_clone_service.clone_day(
+                source_day_id,
+                target_day_id,
+                athlete_id,
+                strip_sets_data=bool(body.get("strip_sets_data", False)),
+            )
+        except CloneConflictError:
             return create_response(
                 409,
                 {"error": "Target day already has a workout. Delete it first to copy."},
             )
 
-        # Extract exercises from source workout to copy (without completion data)
-        exercises_to_copy = []
-        for exercise in source_workout.exercises:
-            exercise_data = {
-                "exercise_id": exercise.exercise_id,
-                "exercise_type": exercise.exercise_type,
-                "sets": exercise.sets,
-                "reps": exercise.reps,
-                "weight": exercise.weight,
-                "notes": exercise.notes,
-            }
-
-            # Include sets_data if it exists to preserve individual set details (without completion data)
-            if hasattr(exercise, "sets_data") and exercise.sets_data:
-                cleaned_sets_data = []
-                for set_data in exercise.sets_data:
-                    cleaned_set = {
-                        "set_number": set_data.get("set_number"),
-                        "weight": set_data.get("weight"),
-                        "reps": set_data.get("reps"),
-                        "rpe": set_data.get("rpe"),
-                        "completed": False,  # Reset completion status
-                    }
-                    cleaned_sets_data.append(cleaned_set)
-                exercise_data["sets_data"] = cleaned_sets_data
-
-            exercises_to_copy.append(exercise_data)
-
-        # Create new workout for target day
-        new_workout = workout_service.create_workout(
-            athlete_id=athlete_id,
-            day_id=target_day_id,
-            date=target_day.date,
-            exercises=exercises_to_copy,
-            status="not_started",
-        )
+        if not new_workout:
+            return create_response(404, {"error": "Source workout not found"})
 
         # Get user preference for weight conversion
         user_preference = get_user_weight_preference(current_user_id)
@@ -15,6 +15,15 @@ class ExerciseConfig(BaseConfig):
     # DynamoDB Global Secondary Index Names
     DAY_INDEX = "day-index"
     WORKOUT_INDEX = "workout-index"
+    # Keyed by athlete_id and sorted by workout_date, both copied from the workout
+    ATHLETE_DATE_INDEX = "athlete-date-index"
+    # Keyed by "<athlete_id>#<lowercased exercise_type>" and sorted by workout_date
+    ATHLETE_TYPE_INDEX = "athlete-type-index"
+
+    # Index rollout step of the data stack (IndexMigrationStage). Before the type index
+    # is live, one type is read by filtering the athlete-date index
+    INDEX_MIGRATION_STAGE = BaseConfig.get_int_env("INDEX_MIGRATION_STAGE", 3)
+    ATHLETE_TYPE_INDEX_STAGE = 2
 
     # API Rate Limits (per minute)
     EXERCISE_CREATE_RATE_LIMIT_PER_MIN = BaseConfig.get_int_env(
@@ -16,6 +16,8 @@ class RelationshipConfig(BaseConfig):
     COACH_INDEX = "coach-index"
     ATHLETE_INDEX = "athlete-index"
     COACH_ATHLETE_INDEX = "coach-athlete-index"
+    # Sparse: only relationships holding an unused invitation code are indexed
+    INVITATION_CODE_INDEX = "invitation-code-index"
 
     # TTL Configuration
     INVITATION_CODE_TTL_HOURS = BaseConfig.get_int_env("INVITATION_CODE_TTL_HOURS", 24)
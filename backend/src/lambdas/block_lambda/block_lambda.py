@@ -13,6 +13,7 @@ ROUTE_MAP = {
     "GET /athletes/{athlete_id}/blocks": block_api.get_blocks_by_athlete,
     "PUT /blocks/{block_id}": block_api.update_block,
     "DELETE /blocks/{block_id}": block_api.delete_block,
+    "POST /blocks/{block_id}/copy": block_api.copy_block,
 }
 
 
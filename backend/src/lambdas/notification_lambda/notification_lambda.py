@@ -2,6 +2,7 @@ import json
 import logging
 from src.utils.cors_utils import add_cors_headers
 from src.api import notification_api
+from src.services.notification_service import NotificationService
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -9,6 +10,9 @@ logger.setLevel(logging.INFO)
 # Map routes to handler functions
 ROUTE_MAP = {
     "GET /notifications": notification_api.get_notifications,
+    "GET /notifications/unread-count": notification_api.get_unread_count,
+    "GET /notifications/{notification_id}/workout": notification_api.get_notification_workout,
+    "PATCH /notifications/read": notification_api.mark_notifications_as_read,
     "PATCH /notifications/{notification_id}/read": notification_api.mark_notification_as_read,
 }
 
@@ -51,3 +55,13 @@ def handler(event, context):
                 "body": json.dumps({"error": "Internal server error"}),
             }
         )
+
+
+def reconcile_unread_counts(event, context):
+    """
+    Scheduled handler that recounts every coach's unread notifications, repairing
+    any drift in the per-coach unread counters.
+    """
+    coaches = NotificationService().reconcile_unread_counts()
+    logger.info(f"Reconciled unread notification counts for {coaches} coaches")
+    return {"coaches_reconciled": coaches}
@@ -12,6 +12,7 @@ ROUTE_MAP = {
     "GET /blocks/{block_id}/weeks": week_api.get_weeks_for_block,
     "PUT /weeks/{week_id}": week_api.update_week,
     "DELETE /weeks/{week_id}": week_api.delete_week,
+    "POST /weeks/{week_id}/copy": week_api.copy_week,
 }
 
 
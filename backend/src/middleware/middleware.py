@@ -2,6 +2,8 @@ import functools
 import logging
 from typing import Callable, Dict, Any, List
 from src.utils.response import create_response
+from src.utils.dynamodb_retry import retry_budget
+from src.utils.identity_map import request_scope
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -70,6 +72,8 @@ class LambdaMiddleware:
 def with_middleware(middlewares: List[Callable] = None):
     """
     Decorator to apply middleware to a handler function.
+    Each invocation runs inside its own request scope, so services share one identity map,
+    and DynamoDB retries are limited to the time the invocation has left.
 
     :param middlewares: List of middleware functions to apply
     :return: Decorated handler function
@@ -82,7 +86,8 @@ def with_middleware(middlewares: List[Callable] = None):
             if middlewares:
                 for middleware_func in middlewares:
                     middleware.add_middleware(middleware_func)
-            return middleware(event, context)
+            with request_scope(), retry_budget(context):
+                return middleware(event, context)
 
         return wrapper
 
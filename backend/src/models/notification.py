@@ -1,6 +1,10 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import copy
+from .workout import Workout
+
+# Number of exercises whose heaviest set is kept in a workout summary
+SUMMARY_TOP_SETS = 3
 
 
 class Notification:
@@ -12,7 +16,7 @@ class Notification:
         athlete_name: str,
         workout_id: str,
         day_info: str,
-        workout_data: Dict[str, Any],
+        workout_summary: Dict[str, Any],
         created_at: Optional[str] = None,
         is_read: bool = False,
         notification_type: str = "workout_completion",
@@ -23,7 +27,8 @@ class Notification:
         self.athlete_name = athlete_name
         self.workout_id = workout_id
         self.day_info = day_info  # e.g., "Day 5 (2024-06-25)"
-        self.workout_data = workout_data  # Full workout object for modal display
+        # Compact summary for the inbox; the full workout is fetched on demand
+        self.workout_summary = workout_summary
         self.created_at = created_at or datetime.now().isoformat() + "Z"
         self.is_read = is_read
         self.notification_type = notification_type
@@ -37,8 +42,8 @@ class Notification:
             "athlete_name": self.athlete_name,
             "workout_id": self.workout_id,
             "day_info": self.day_info,
-            "workout_data": copy.deepcopy(
-                self.workout_data
+            "workout_summary": copy.deepcopy(
+                self.workout_summary
             ),  # Deep copy to prevent mutation
             "created_at": self.created_at,
             "is_read": self.is_read,
@@ -47,7 +52,15 @@ class Notification:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Notification":
-        """Create notification instance from DynamoDB data"""
+        """
+        Create notification instance from DynamoDB data.
+        Items written before summaries existed carry the full workout_data, which is
+        summarized here.
+        """
+        workout_summary = data.get("workout_summary")
+        if workout_summary is None:
+            workout_summary = cls.summarize_workout(data["workout_data"])
+
         return cls(
             notification_id=data["notification_id"],
             coach_id=data["coach_id"],
@@ -55,7 +68,7 @@ class Notification:
             athlete_name=data["athlete_name"],
             workout_id=data["workout_id"],
             day_info=data["day_info"],
-            workout_data=data["workout_data"],
+            workout_summary=workout_summary,
             created_at=data.get("created_at"),
             is_read=data.get("is_read", False),
             notification_type=data.get("notification_type", "workout_completion"),
@@ -64,3 +77,64 @@ class Notification:
     def mark_as_read(self) -> None:
         """Mark notification as read"""
         self.is_read = True
+
+    @staticmethod
+    def summarize_workout(workout_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the compact summary a notification stores instead of the full workout
+
+        :param workout_data: Workout dictionary, as produced by Workout.to_dict
+        :return: Dictionary with status, exercise_count, completed_sets, total_volume,
+                 duration_minutes and the heaviest completed sets as top_sets
+        """
+        completed_sets = 0
+        total_volume = 0.0
+        top_sets: List[Dict[str, Any]] = []
+
+        exercises = workout_data.get("exercises") or []
+        for exercise in exercises:
+            top_set = None
+            for set_data in exercise.get("sets_data") or []:
+                if not set_data.get("completed", False):
+                    continue
+                try:
+                    reps = int(set_data.get("reps", 0))
+                    weight = float(set_data.get("weight", 0))
+                except (ValueError, TypeError):
+                    continue
+
+                completed_sets += 1
+                total_volume += reps * weight
+                if top_set is None or (weight, reps) > (
+                    top_set["weight"],
+                    top_set["reps"],
+                ):
+                    top_set = {
+                        "exercise_type": exercise.get("exercise_type"),
+                        "weight": weight,
+                        "reps": reps,
+                    }
+
+            if top_set is not None:
+                top_sets.append(top_set)
+
+        # The heaviest set of each exercise, heaviest exercises first
+        top_sets.sort(key=lambda s: (s["weight"], s["reps"]), reverse=True)
+
+        workout = Workout(
+            workout_id=workout_data.get("workout_id"),
+            athlete_id=workout_data.get("athlete_id"),
+            day_id=workout_data.get("day_id"),
+            date=workout_data.get("date"),
+            start_time=workout_data.get("start_time"),
+            finish_time=workout_data.get("finish_time"),
+        )
+
+        return {
+            "status": workout_data.get("status"),
+            "exercise_count": len(exercises),
+            "completed_sets": completed_sets,
+            "total_volume": total_volume,
+            "duration_minutes": workout.duration_minutes,
+            "top_sets": top_sets[:SUMMARY_TOP_SETS],
+        }
@@ -26,14 +26,14 @@ class CompletedExerciseRepository(BaseRepository):
         :param workout_id: The ID of the workout to retrieve completed exercises for.
         :return: A list of dictionaries containing the completed exercises data.
         """
-        response = self.table.query(
-            IndexName=WorkoutConfig.WORKOUT_INDEX,
-            KeyConditionExpression=Key("workout_id").eq(workout_id),
-            Limit=WorkoutConfig.MAX_ITEMS,
+        return list(
+            self.iter_query(
+                page_size=WorkoutConfig.MAX_ITEMS,
+                IndexName=WorkoutConfig.WORKOUT_INDEX,
+                KeyConditionExpression=Key("workout_id").eq(workout_id),
+            )
         )
 
-        return response.get("Items", [])
-
     def get_completed_exercises_by_exercise(
         self, exercise_id: str
     ) -> List[Dict[str, Any]]:
@@ -43,14 +43,14 @@ class CompletedExerciseRepository(BaseRepository):
         :param exercise_id: The ID of the exercise to retrieve completed exercises for.
         :return: A list of dictionaries containing the completed exercises data.
         """
-        response = self.table.query(
-            IndexName=WorkoutConfig.EXERCISE_INDEX,
-            KeyConditionExpression=Key("exercise_id").eq(exercise_id),
-            Limit=WorkoutConfig.MAX_ITEMS,
+        return list(
+            self.iter_query(
+                page_size=WorkoutConfig.MAX_ITEMS,
+                IndexName=WorkoutConfig.EXERCISE_INDEX,
+                KeyConditionExpression=Key("exercise_id").eq(exercise_id),
+            )
         )
 
-        return response.get("Items", [])
-
     def create_completed_exercise(
         self, completed_exercise_dict: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -111,8 +111,11 @@ class CompletedExerciseRepository(BaseRepository):
         completed_exercises = self.get_completed_exercises_by_workout(workout_id)
 
         # Batch delete all completed exercises
-        with self.table.batch_writer() as batch:
-            for exercise in completed_exercises:
-                batch.delete_item(Key={"completed_id": exercise["completed_id"]})
+        self.batch_delete(
+            [
+                {"completed_id": exercise["completed_id"]}
+                for exercise in completed_exercises
+            ]
+        )
 
         return len(completed_exercises)
@@ -1,24 +1,124 @@
-import boto3
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
 from src.config.notification_config import NotificationConfig
+from src.repositories.base_repository import BaseRepository, TRANSACT_WRITE_MAX_ITEMS
+from src.utils.decimal_converter import convert_floats_to_decimals
 
 
-class NotificationRepository:
+class NotificationRepository(BaseRepository):
     def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb")
-        self.table_name = NotificationConfig.TABLE_NAME
-        self.table = self.dynamodb.Table(self.table_name)
+        super().__init__(NotificationConfig.TABLE_NAME)
+
+    @staticmethod
+    def _unread_counter_key(coach_id: str) -> Dict[str, str]:
+        """
+        Key of the item holding a coach's unread notification count.
+        The counter has no coach_id or created_at, so it never shows up in coach-index.
+
+        :param coach_id: The ID of the coach
+        :return: The counter item's primary key
+        """
+        return {
+            "notification_id": f"{NotificationConfig.UNREAD_COUNTER_PREFIX}{coach_id}"
+        }
+
+    def _unread_counter_update(self, coach_id: str, delta: int) -> Dict[str, Any]:
+        """
+        Transaction action adding delta to a coach's unread counter.
+        It only applies to an existing counter; ADD on a missing one would start it
+        from zero and lose the notifications that predate it.
+
+        :param coach_id: The ID of the coach
+        :param delta: The amount to add, negative to decrement
+        :return: An Update action for TransactWriteItems
+        """
+        return {
+            "Update": {
+                "TableName": self.table_name,
+                "Key": self._unread_counter_key(coach_id),
+                "UpdateExpression": "ADD unread_count :delta",
+                "ConditionExpression": "attribute_exists(unread_count)",
+                "ExpressionAttributeValues": {":delta": delta},
+            }
+        }
+
+    def _transact_write(self, transact_items: List[Dict[str, Any]]) -> None:
+        """
+        Apply writes to the notifications table atomically
+
+        :param transact_items: TransactWriteItems actions
+        """
+        self.transact_write([self.table_name], transact_items)
+
+    def _transact_write_with_counter(
+        self, coach_id: str, transact_items: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Apply writes whose last action updates the coach's unread counter.
+        When the counter does not exist yet it is created from a recount of the
+        coach's unread notifications, and the writes are applied again.
+
+        :param coach_id: The ID of the coach
+        :param transact_items: TransactWriteItems actions ending with the counter update
+        """
+        try:
+            self._transact_write(transact_items)
+            return
+        except ClientError as e:
+            reasons = e.response.get("CancellationReasons", [])
+            if (
+                len(reasons) != len(transact_items)
+                or reasons[-1].get("Code") != "ConditionalCheckFailed"
+            ):
+                raise
+
+        # The cancelled writes are not counted yet; a concurrent creation is fine
+        self.set_unread_count(coach_id, self.count_unread_notifications(coach_id), None)
+        self._transact_write(transact_items)
+
+    @staticmethod
+    def with_unread_key(notification_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return notification data carrying the unread_coach_id key of the sparse unread
+        index when the notification is unread
+
+        :param notification_data: The notification data
+        :return: A copy including unread_coach_id, or the data unchanged
+        """
+        if not notification_data.get("coach_id") or notification_data.get(
+            "is_read", False
+        ):
+            return notification_data
+        return {**notification_data, "unread_coach_id": notification_data["coach_id"]}
 
     def create_notification(self, notification_data: Dict[str, Any]) -> bool:
         """
-        Create a new notification in DynamoDB
+        Create a new notification in DynamoDB.
+        An unread notification bumps its coach's unread counter in the same transaction.
 
         :param notification_data: The notification data to create
         :return: True if successful, False otherwise
         """
         try:
-            self.table.put_item(Item=notification_data)
+            item = self.with_unread_key(notification_data)
+            transact_items = [
+                {
+                    "Put": {
+                        "TableName": self.table_name,
+                        "Item": convert_floats_to_decimals(item),
+                    }
+                }
+            ]
+            if "unread_coach_id" in item:
+                transact_items.append(
+                    self._unread_counter_update(notification_data["coach_id"], 1)
+                )
+                self._transact_write_with_counter(
+                    notification_data["coach_id"], transact_items
+                )
+            else:
+                self._transact_write(transact_items)
             return True
         except Exception:
             return False
@@ -36,6 +136,27 @@ class NotificationRepository:
         except Exception:
             return None
 
+    @staticmethod
+    def _coach_key_condition(coach_id: str, unread_only: bool) -> Dict[str, Any]:
+        """
+        Index and key condition selecting a coach's notifications by creation time.
+        Unread notifications are read from the sparse unread index, so no filter is
+        applied after Limit.
+
+        :param coach_id: The ID of the coach
+        :param unread_only: If True, select only unread notifications
+        :return: IndexName and KeyConditionExpression query arguments
+        """
+        if unread_only:
+            return {
+                "IndexName": NotificationConfig.COACH_UNREAD_INDEX,
+                "KeyConditionExpression": Key("unread_coach_id").eq(coach_id),
+            }
+        return {
+            "IndexName": NotificationConfig.COACH_INDEX,
+            "KeyConditionExpression": Key("coach_id").eq(coach_id),
+        }
+
     def get_notifications_for_coach(
         self, coach_id: str, limit: int = None, unread_only: bool = False
     ) -> List[Dict[str, Any]]:
@@ -54,22 +175,44 @@ class NotificationRepository:
 
             # Use GSI to query by coach_id and sort by created_at
             query_kwargs = {
-                "IndexName": NotificationConfig.COACH_INDEX,
-                "KeyConditionExpression": Key("coach_id").eq(coach_id),
+                **self._coach_key_condition(coach_id, unread_only),
                 "ScanIndexForward": False,  # Newest first
                 "Limit": limit,
             }
 
-            # Add filter for unread notifications if requested
-            if unread_only:
-                query_kwargs["FilterExpression"] = Key("is_read").eq(False)
-
             response = self.table.query(**query_kwargs)
             return response.get("Items", [])
 
         except Exception:
             return []
 
+    def get_notifications_page_for_coach(
+        self,
+        coach_id: str,
+        limit: int,
+        unread_only: bool = False,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Get one page of notifications for a coach, ordered by creation time (newest first)
+
+        :param coach_id: The ID of the coach
+        :param limit: Maximum number of notifications in the page
+        :param unread_only: If True, only return unread notifications
+        :param exclusive_start_key: Key returned by the previous page, if any
+        :return: Tuple of (notification data dictionaries, key to resume from or None)
+        """
+        try:
+            return self.query_page(
+                limit,
+                exclusive_start_key,
+                ScanIndexForward=False,  # Newest first
+                **self._coach_key_condition(coach_id, unread_only),
+            )
+
+        except Exception:
+            return [], None
+
     def update_notification(
         self, notification_id: str, update_data: Dict[str, Any]
     ) -> bool:
@@ -100,41 +243,312 @@ class NotificationRepository:
         except Exception:
             return False
 
-    def mark_notification_as_read(self, notification_id: str) -> bool:
+    def mark_notification_as_read(
+        self, notification_id: str, coach_id: Optional[str] = None
+    ) -> bool:
         """
-        Mark a notification as read
+        Mark a notification as read and decrement its coach's unread counter.
+        Both happen in one transaction that only applies to unread notifications, so
+        marking a notification twice does not decrement the counter twice.
 
         :param notification_id: The ID of the notification to mark as read
-        :return: True if successful, False otherwise
+        :param coach_id: The notification's coach, looked up when not given
+        :return: True if successful (or already read), False otherwise
         """
-        return self.update_notification(notification_id, {"is_read": True})
+        try:
+            if coach_id is None:
+                notification = self.get_notification(notification_id)
+                if not notification:
+                    return False
+                coach_id = notification["coach_id"]
+
+            self._transact_write_with_counter(
+                coach_id,
+                [
+                    {
+                        "Update": {
+                            "TableName": self.table_name,
+                            "Key": {"notification_id": notification_id},
+                            "UpdateExpression": "SET is_read = :true REMOVE unread_coach_id",
+                            "ConditionExpression": "is_read = :false",
+                            "ExpressionAttributeValues": {
+                                ":true": True,
+                                ":false": False,
+                            },
+                        }
+                    },
+                    self._unread_counter_update(coach_id, -1),
+                ],
+            )
+            return True
+        except ClientError as e:
+            # The condition failed: the notification was already read
+            return e.response.get("Error", {}).get("Code") == (
+                "TransactionCanceledException"
+            ) and any(
+                reason.get("Code") == "ConditionalCheckFailed"
+                for reason in e.response.get("CancellationReasons", [])
+            )
+        except Exception:
+            return False
+
+    def mark_notifications_as_read(
+        self, coach_id: str, notification_ids: List[str]
+    ) -> int:
+        """
+        Mark several of a coach's notifications as read, decrementing the unread counter
+        by the number actually marked. Each transaction marks up to 99 notifications plus
+        the counter; notifications that are missing, already read or owned by another
+        coach fail their condition and are dropped before the transaction is retried.
+
+        :param coach_id: The ID of the coach
+        :param notification_ids: The IDs of the notifications to mark as read
+        :return: Number of notifications marked as read
+        """
+        # dict.fromkeys drops duplicates, which a transaction rejects, keeping order
+        notification_ids = list(dict.fromkeys(notification_ids))
+        chunk_size = TRANSACT_WRITE_MAX_ITEMS - 1  # Leave room for the counter
+
+        marked = 0
+        for start in range(0, len(notification_ids), chunk_size):
+            marked += self._mark_chunk_as_read(
+                coach_id, notification_ids[start : start + chunk_size]
+            )
+        return marked
+
+    def _mark_chunk_as_read(self, coach_id: str, notification_ids: List[str]) -> int:
+        """
+        Mark one transaction's worth of a coach's notifications as read
+
+        :param coach_id: The ID of the coach
+        :param notification_ids: At most 99 distinct notification IDs
+        :return: Number of notifications marked as read
+        """
+        while notification_ids:
+            transact_items = [
+                {
+                    "Update": {
+                        "TableName": self.table_name,
+                        "Key": {"notification_id": notification_id},
+                        "UpdateExpression": "SET is_read = :true REMOVE unread_coach_id",
+                        "ConditionExpression": "coach_id = :coach_id AND is_read = :false",
+                        "ExpressionAttributeValues": {
+                            ":true": True,
+                            ":false": False,
+                            ":coach_id": coach_id,
+                        },
+                    }
+                }
+                for notification_id in notification_ids
+            ]
+            transact_items.append(
+                self._unread_counter_update(coach_id, -len(notification_ids))
+            )
+
+            try:
+                self._transact_write_with_counter(coach_id, transact_items)
+                return len(notification_ids)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != (
+                    "TransactionCanceledException"
+                ):
+                    raise
+                # Reasons line up with TransactItems; retry only the ones that passed
+                reasons = e.response.get("CancellationReasons", [])
+                failed = {
+                    index
+                    for index, reason in enumerate(reasons)
+                    if reason.get("Code") == "ConditionalCheckFailed"
+                }
+                if not failed:
+                    raise
+                notification_ids = [
+                    notification_id
+                    for index, notification_id in enumerate(notification_ids)
+                    if index not in failed
+                ]
+        return 0
+
+    def mark_all_notifications_as_read(self, coach_id: str) -> int:
+        """
+        Mark every unread notification of a coach as read, one page of the sparse unread
+        index per transaction
+
+        :param coach_id: The ID of the coach
+        :return: Number of notifications marked as read
+        """
+        query_kwargs = {
+            **self._coach_key_condition(coach_id, unread_only=True),
+            "ProjectionExpression": "notification_id",
+            "Limit": TRANSACT_WRITE_MAX_ITEMS - 1,
+        }
+
+        marked = 0
+        while True:
+            response = self.table.query(**query_kwargs)
+            notification_ids = [
+                item["notification_id"] for item in response.get("Items", [])
+            ]
+            if notification_ids:
+                marked += self._mark_chunk_as_read(coach_id, notification_ids)
+            if "LastEvaluatedKey" not in response:
+                return marked
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
     def get_unread_count_for_coach(self, coach_id: str) -> int:
         """
-        Get count of unread notifications for a coach
+        Get count of unread notifications for a coach from the coach's counter item
 
         :param coach_id: The ID of the coach
         :return: Number of unread notifications
         """
         try:
-            response = self.table.query(
-                IndexName=NotificationConfig.COACH_INDEX,
-                KeyConditionExpression=Key("coach_id").eq(coach_id),
-                FilterExpression=Key("is_read").eq(False),
-                Select="COUNT",
+            response = self.table.get_item(
+                Key=self._unread_counter_key(coach_id),
+                ProjectionExpression="unread_count",
             )
-            return response.get("Count", 0)
+            # Missing counters are created on the first change, so this only guards
+            # against drift until the next reconciliation
+            return max(0, int(response.get("Item", {}).get("unread_count", 0)))
         except Exception:
             return 0
 
+    def count_unread_notifications(self, coach_id: str) -> int:
+        """
+        Count a coach's unread notifications by querying all of them.
+        Only used to reconcile the unread counter.
+
+        :param coach_id: The ID of the coach
+        :return: Number of unread notifications
+        """
+        query_kwargs = {
+            **self._coach_key_condition(coach_id, unread_only=True),
+            "Select": "COUNT",
+        }
+
+        count = 0
+        while True:
+            response = self.table.query(**query_kwargs)
+            count += response.get("Count", 0)
+            if "LastEvaluatedKey" not in response:
+                return count
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def get_unread_counter(self, coach_id: str) -> Optional[int]:
+        """
+        Read a coach's unread counter as stored, with a strongly consistent read
+
+        :param coach_id: The ID of the coach
+        :return: The stored count, or None if the coach has no counter item yet
+        """
+        response = self.table.get_item(
+            Key=self._unread_counter_key(coach_id),
+            ProjectionExpression="unread_count",
+            ConsistentRead=True,
+        )
+        item = response.get("Item")
+        if item is None or "unread_count" not in item:
+            return None
+        return int(item["unread_count"])
+
+    def set_unread_count(
+        self, coach_id: str, unread_count: int, expected_count: Optional[int]
+    ) -> bool:
+        """
+        Overwrite a coach's unread counter if it still holds the value read before
+        counting, so increments and decrements landing in between are not lost
+
+        :param coach_id: The ID of the coach
+        :param unread_count: The number of unread notifications
+        :param expected_count: The counter value read before counting, None if absent
+        :return: True if the counter was written, False if it changed in the meantime
+        """
+        if expected_count is None:
+            condition = {"ConditionExpression": "attribute_not_exists(notification_id)"}
+        else:
+            condition = {
+                "ConditionExpression": "unread_count = :expected",
+                "ExpressionAttributeValues": {":expected": expected_count},
+            }
+
+        try:
+            self.table.put_item(
+                Item={
+                    **self._unread_counter_key(coach_id),
+                    "unread_count": unread_count,
+                },
+                **condition,
+            )
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == (
+                "ConditionalCheckFailedException"
+            ):
+                return False
+            raise
+
+    def get_coach_ids_with_notifications(self) -> Set[str]:
+        """
+        Get every coach that has received a notification, by scanning the table
+
+        :return: The coach IDs
+        """
+        scan_kwargs = {
+            "ProjectionExpression": "coach_id",
+        }
+
+        coach_ids = set()
+        while True:
+            response = self.table.scan(**scan_kwargs)
+            coach_ids.update(
+                item["coach_id"]
+                for item in response.get("Items", [])
+                if "coach_id" in item
+            )
+            if "LastEvaluatedKey" not in response:
+                return coach_ids
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
     def delete_notification(self, notification_id: str) -> bool:
         """
-        Delete a notification (for future cleanup functionality)
+        Delete a notification (for future cleanup functionality).
+        An unread notification is deleted in one transaction with the decrement of its
+        coach's unread counter, conditioned on it still being unread.
 
         :param notification_id: The ID of the notification to delete
         :return: True if successful, False otherwise
         """
         try:
+            # A consistent read, so a notification created just before is not missed
+            notification = self.table.get_item(
+                Key={"notification_id": notification_id}, ConsistentRead=True
+            ).get("Item")
+            if notification and notification.get("unread_coach_id"):
+                coach_id = notification["unread_coach_id"]
+                try:
+                    self._transact_write_with_counter(
+                        coach_id,
+                        [
+                            {
+                                "Delete": {
+                                    "TableName": self.table_name,
+                                    "Key": {"notification_id": notification_id},
+                                    "ConditionExpression": "is_read = :false",
+                                    "ExpressionAttributeValues": {":false": False},
+                                }
+                            },
+                            self._unread_counter_update(coach_id, -1),
+                        ],
+                    )
+                    return True
+                except ClientError as e:
+                    # Read in the meantime, which already decremented the counter
+                    reasons = e.response.get("CancellationReasons", [])
+                    if not reasons or reasons[0].get("Code") != (
+                        "ConditionalCheckFailed"
+                    ):
+                        raise
+
             self.table.delete_item(Key={"notification_id": notification_id})
             return True
         except Exception:
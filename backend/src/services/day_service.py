@@ -2,6 +2,7 @@ import uuid
 from typing import List, Dict, Any, Optional
 from src.repositories.day_repository import DayRepository
 from src.repositories.exercise_repository import ExerciseRepository
+from src.services.cascade_delete_service import CascadeDeleteService
 from src.models.day import Day
 
 
@@ -9,6 +10,7 @@ class DayService:
     def __init__(self):
         self.day_repository: DayRepository = DayRepository()
         self.exercise_repository: ExerciseRepository = ExerciseRepository()
+        self.cascade_delete_service: CascadeDeleteService = CascadeDeleteService()
 
     def get_day(self, day_id: str) -> Optional[Day]:
         """
@@ -74,17 +76,12 @@ class DayService:
         self.day_repository.update_day(day_id, update_data)
         return self.get_day(day_id)
 
-    def delete_day(self, day_id: str) -> bool:
+    def delete_day(self, day_id: str) -> Dict[str, int]:
         """
         Deletes the day by day_id
 
         :param day_id: The ID of the day to delete
-        :return: True if the day was successfully deleted, else False
+        :return: The number of deleted items per table
         """
-        # Need to delete all exercises in this day first (cascading delete)
-        self.exercise_repository.delete_exercises_by_day(day_id)
-
-        # Delete the day itself
-        response = self.day_repository.delete_day(day_id)
-
-        return bool(response)
+        # Removes workouts and exercises before the day itself
+        return self.cascade_delete_service.delete_day(day_id)
@@ -4,10 +4,27 @@ from datetime import timedelta
 import random
 import string
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from src.repositories.relationship_repository import RelationshipRepository
 from src.models.relationship import Relationship
 from src.config.relationship_config import RelationshipConfig
+from src.config.app_config import AppConfig
+from src.utils.ttl_cache import TTLCache
+
+# Active relationships keyed by (coach_id, athlete_id), shared by warm invocations.
+# Only positive results are cached so newly granted access is visible immediately.
+# Revocations only clear this container's entries; the short TTL bounds how long other
+# warm functions keep granting access after a relationship ends.
+_authorization_cache = TTLCache(
+    AppConfig.CACHE_MAX_ENTRIES, AppConfig.AUTHORIZATION_CACHE_TTL
+)
+
+
+def reset_authorization_cache() -> None:
+    """
+    Drop all cached authorization decisions
+    """
+    _authorization_cache.clear()
 
 
 class RelationshipService:
@@ -65,6 +82,60 @@ class RelationshipService:
             for relationship_data in relationships_data
         ]
 
+    def get_relationships_page_for_coach(
+        self,
+        coach_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Relationship], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of relationships for a specific coach
+
+        :param coach_id: The ID of the coach
+        :param limit: Maximum number of relationships in the page
+        :param exclusive_start_key: Key returned by the previous page, if any
+        :param status: Optional status filter for the relationships
+        :return: Tuple of (Relationship objects, key to resume from or None on the last page)
+        """
+        (
+            relationships_data,
+            last_evaluated_key,
+        ) = self.relationship_repository.get_relationships_page_for_coach(
+            coach_id, limit, exclusive_start_key, status
+        )
+        return [
+            Relationship(**relationship_data)
+            for relationship_data in relationships_data
+        ], last_evaluated_key
+
+    def get_relationships_page_for_athlete(
+        self,
+        athlete_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Relationship], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of relationships for a specific athlete
+
+        :param athlete_id: The ID of the athlete
+        :param limit: Maximum number of relationships in the page
+        :param exclusive_start_key: Key returned by the previous page, if any
+        :param status: Optional status filter for the relationships
+        :return: Tuple of (Relationship objects, key to resume from or None on the last page)
+        """
+        (
+            relationships_data,
+            last_evaluated_key,
+        ) = self.relationship_repository.get_relationships_page_for_athlete(
+            athlete_id, limit, exclusive_start_key, status
+        )
+        return [
+            Relationship(**relationship_data)
+            for relationship_data in relationships_data
+        ], last_evaluated_key
+
     def get_active_relationship(
         self, coach_id: str, athlete_id: str
     ) -> Optional[Relationship]:
@@ -75,13 +146,49 @@ class RelationshipService:
         :param athlete_id: The ID of the athlete
         :return: The Relationship object if found, else None
         """
+        cache_key = (coach_id, athlete_id)
+        if AppConfig.CACHE_ENABLED:
+            relationship_data = _authorization_cache.get(cache_key)
+            if relationship_data:
+                return Relationship(**relationship_data)
+
         relationship_data = self.relationship_repository.get_active_relationship(
             coach_id, athlete_id
         )
         if relationship_data:
+            if AppConfig.CACHE_ENABLED:
+                _authorization_cache.set(cache_key, relationship_data)
             return Relationship(**relationship_data)
         return None
 
+    def get_active_relationship_status(
+        self, coach_id: str, athlete_id: str
+    ) -> Optional[str]:
+        """
+        Retrieves only the status of the active relationship between coach and athlete
+
+        :param coach_id: The ID of the coach
+        :param athlete_id: The ID of the athlete
+        :return: The relationship status if an active relationship exists, else None
+        """
+        # A full item cached by get_active_relationship carries the status too
+        status_key = (coach_id, athlete_id, "status")
+        if AppConfig.CACHE_ENABLED:
+            relationship_data = _authorization_cache.get((coach_id, athlete_id))
+            if relationship_data:
+                return relationship_data.get("status")
+            status = _authorization_cache.get(status_key)
+            if status:
+                return status
+
+        relationship_data = self.relationship_repository.get_active_relationship(
+            coach_id, athlete_id, attributes=["status"]
+        )
+        status = relationship_data.get("status") if relationship_data else None
+        if status and AppConfig.CACHE_ENABLED:
+            _authorization_cache.set(status_key, status)
+        return status
+
     def generate_invitation_code(self, coach_id: str) -> Relationship:
         """
         Generates a unique invitation code for a coach to invite an athlete
@@ -220,5 +327,14 @@ class RelationshipService:
         :param update_data: The data to update the relationship with
         :return: The updated Relationship object if found, else None
         """
-        self.relationship_repository.update_relationship(relationship_id, update_data)
+        updated = self.relationship_repository.update_relationship(
+            relationship_id, update_data
+        )
+
+        # Accepting, ending or claiming a relationship changes who may access the athlete
+        if updated:
+            cache_key = (updated.get("coach_id"), updated.get("athlete_id"))
+            _authorization_cache.invalidate(cache_key)
+            _authorization_cache.invalidate((*cache_key, "status"))
+
         return self.get_relationship(relationship_id)
@@ -2,6 +2,7 @@ import uuid
 from typing import List, Dict, Any, Optional
 from src.repositories.week_repository import WeekRepository
 from src.repositories.day_repository import DayRepository
+from src.services.cascade_delete_service import CascadeDeleteService
 from src.models.week import Week
 
 
@@ -9,6 +10,7 @@ class WeekService:
     def __init__(self):
         self.week_repository: WeekRepository = WeekRepository()
         self.day_repository: DayRepository = DayRepository()
+        self.cascade_delete_service: CascadeDeleteService = CascadeDeleteService()
 
     def get_week(self, week_id: str) -> Optional[Week]:
         """
@@ -64,18 +66,13 @@ class WeekService:
         self.week_repository.update_week(week_id, update_data)
         return self.get_week(week_id)
 
-    def delete_week(self, week_id: str) -> bool:
+    def delete_week(self, week_id: str) -> Dict[str, int]:
         """
         Deletes the week by week_id
 
         :param week_id: The ID of the week to delete
-        :return: True if the week was successfully deleted, else False
+        :return: The number of deleted items per table
         """
 
-        # Need to delete all days in this week first (cascading delete)
-        self.day_repository.delete_days_by_week(week_id)
-
-        # Delete the week itself
-        response = self.week_repository.delete_week(week_id)
-
-        return bool(response)
+        # Removes days, workouts and exercises before the week itself
+        return self.cascade_delete_service.delete_week(week_id)
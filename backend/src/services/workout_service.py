@@ -122,13 +122,10 @@ class WorkoutService:
             status=status,
         )
 
-        # First, create the workout without exercises
+        # The workout item is stored without exercises; they live in the ExerciseTable
         workout_dict = workout.to_dict()
-        # Remove exercises from the dict before saving
         workout_dict.pop("exercises", None)
-        self.workout_repository.create_workout(workout_dict)
 
-        # Then create exercises separately in the ExerciseTable
         for i, exercise_data in enumerate(exercises):
             exercise = Exercise(
                 exercise_id=str(uuid.uuid4()),
@@ -143,13 +140,16 @@ class WorkoutService:
                 order=i + 1,
                 exercise_category=exercise_data.get("exercise_category"),
                 sets_data=exercise_data.get("sets_data"),
+                athlete_id=athlete_id,
+                workout_date=date,
             )
-
-            # Save the exercise in the ExerciseTable
-            self.exercise_repository.create_exercise(exercise.to_dict())
-            # Also add to the workout object for the return
             workout.add_exercise(exercise)
 
+        # Write the workout and its exercises together so a failure leaves nothing behind
+        self.workout_repository.create_workout_with_exercises(
+            workout_dict, [exercise.to_dict() for exercise in workout.exercises]
+        )
+
         return workout
 
     def update_workout(
@@ -158,9 +158,15 @@ class WorkoutService:
         """
         Updates a workout by workout_id, including exercise changes
 
+        The exercise list is diffed against the stored one into a single change set:
+        new and removed exercises go out in batched writes, changed exercises are
+        updated in parallel and the workout's exercise counters are adjusted once.
+        The returned workout is built from the change set rather than re-read.
+
         :param workout_id: The ID of the workout to update
         :param update_data: The data to update the workout with
         :return: The updated Workout object if found, else None
+        :raises ValueError: If a new exercise is missing or has invalid fields
         """
         # Get the existing workout to see what's being updated
         existing_workout = self.get_workout(workout_id)
@@ -171,14 +177,18 @@ class WorkoutService:
         # Handle exercises separately if they're in the update
         exercises_data = update_data.pop("exercises", None)
 
-        if exercises_data:
-            # Map of existing exercises by ID for quick lookup
-            existing_exercises = {
-                ex.exercise_id: ex for ex in existing_workout.exercises
-            }
+        # Exercises carry the workout's athlete and date for the history index
+        workout_date = update_data.get("date") or existing_workout.date
 
-            new_exercise_ids = set()
+        # Map of existing exercises by ID for quick lookup
+        existing_exercises = {ex.exercise_id: ex for ex in existing_workout.exercises}
 
+        kept_ids: List[str] = []
+        updates: Dict[str, Dict[str, Any]] = {}
+        new_exercises: List[Dict[str, Any]] = []
+        created_exercises: List[Exercise] = []
+
+        if exercises_data:
             for i, exercise_data in enumerate(exercises_data):
                 exercise_id = exercise_data.get("exercise_id")
 
@@ -188,15 +198,13 @@ class WorkoutService:
                         k: v for k, v in exercise_data.items() if k != "exercise_id"
                     }
                     if update_fields:
-                        self.exercise_repository.update_exercise(
-                            exercise_id, update_fields
-                        )
-                    new_exercise_ids.add(exercise_id)
+                        updates[exercise_id] = update_fields
+                    kept_ids.append(exercise_id)
                 else:
-                    # Create new exercise in the exercises table
-                    new_id = str(uuid.uuid4())
+                    # Unknown IDs, including other workouts' exercises, become new
+                    # exercises with an ID of their own
                     new_exercise = {
-                        "exercise_id": new_id,
+                        "exercise_id": str(uuid.uuid4()),
                         "workout_id": workout_id,
                         "exercise_type": exercise_data.get("exercise_type"),
                         "sets": exercise_data.get("sets"),
@@ -207,22 +215,88 @@ class WorkoutService:
                         "notes": exercise_data.get("notes"),
                         "order": exercise_data.get("order", i + 1),
                         "exercise_category": exercise_data.get("exercise_category"),
+                        "athlete_id": existing_workout.athlete_id,
+                        "workout_date": workout_date,
                     }
-                    self.exercise_repository.create_exercise(new_exercise)
-                    new_exercise_ids.add(new_id)
+                    # Checked before anything is written
+                    try:
+                        created_exercises.append(Exercise.from_dict(new_exercise))
+                    except (TypeError, ValueError) as e:
+                        raise ValueError(
+                            f"Invalid new exercise at position {i + 1}: {e}"
+                        ) from e
+                    new_exercises.append(new_exercise)
+            # Exercises missing from the list are deleted
+            kept_ids = list(dict.fromkeys(kept_ids))
+        else:
+            kept_ids = list(existing_exercises)
+
+        deleted_ids = [
+            exercise_id
+            for exercise_id in existing_exercises
+            if exercise_id not in kept_ids
+        ]
+
+        for exercise_id in kept_ids:
+            fields = updates.get(exercise_id, {})
+            if workout_date != existing_workout.date:
+                fields = {**fields, "workout_date": workout_date}
+            if fields.get("exercise_type") or "workout_date" in fields:
+                # Spares update_exercise a read for the athlete-type index key
+                fields = {**fields, "athlete_id": existing_workout.athlete_id}
+            if fields:
+                updates[exercise_id] = fields
+
+        updated_exercises = self.exercise_repository.apply_changes(
+            new_exercises, updates, deleted_ids
+        )
 
-            # Delete exercises removed from the list
-            for exercise_id in existing_exercises:
-                if exercise_id not in new_exercise_ids:
-                    self.exercise_repository.delete_exercise(exercise_id)
-            # Exercises are now managed solely via the exercises table;
-            # do NOT embed them in the workout document
+        exercises = [
+            (
+                Exercise.from_dict(updated_exercises[exercise_id])
+                if exercise_id in updated_exercises
+                else existing_exercises[exercise_id]
+            )
+            for exercise_id in kept_ids
+        ]
+        exercises.extend(created_exercises)
+
+        # One counter write for the whole change set; it may also move the status
+        before = WorkoutRepository.exercise_counts(
+            [ex.to_dict() for ex in existing_workout.exercises]
+        )
+        after = WorkoutRepository.exercise_counts([ex.to_dict() for ex in exercises])
+        counted_workout = self.workout_repository.adjust_exercise_counts(
+            workout_id,
+            completed_delta=after["completed_count"] - before["completed_count"],
+            total_delta=after["total_count"] - before["total_count"],
+            exercise_ids=[
+                *updates,
+                *deleted_ids,
+                *(ex["exercise_id"] for ex in new_exercises),
+            ],
+        )
 
         # Update the workout in the repository
-        self.workout_repository.update_workout(workout_id, update_data)
+        stored_workout = (
+            self.workout_repository.update_workout(workout_id, update_data)
+            if update_data
+            else None
+        )
+
+        # Build the response from the change set instead of reading it back
+        workout_data = existing_workout.to_dict()
+        for changes in (counted_workout, stored_workout, update_data):
+            if changes:
+                workout_data.update(changes)
+        workout_data["exercises"] = []
+
+        workout = Workout.from_dict(workout_data)
+        exercises.sort(key=lambda ex: 999 if ex.order is None else ex.order)
+        for exercise in exercises:
+            workout.add_exercise(exercise)
 
-        # Return the updated workout
-        return self.get_workout(workout_id)
+        return workout
 
     def complete_exercise(
         self,
@@ -245,12 +319,6 @@ class WorkoutService:
         :param notes: Additional notes (optional)
         :return: Updated Exercise object if found, else None
         """
-        # Get the exercise from the repository
-        exercise_data = self.exercise_repository.get_exercise(exercise_id)
-
-        if not exercise_data:
-            return None
-
         # Prepare completion data
         completion_data = {
             "status": "completed",
@@ -265,62 +333,25 @@ class WorkoutService:
         if notes:
             completion_data["notes"] = notes
 
-        # Preserve sets_data: use provided value, or fall back to existing
+        # Existing sets_data is kept unless a new value is provided
         if sets_data is not None:
             completion_data["sets_data"] = sets_data
-        elif exercise_data.get("sets_data"):
-            completion_data["sets_data"] = exercise_data["sets_data"]
 
-        # Update the exercise
+        # The repository also moves the workout's completed_count and, when the
+        # counters call for it, the workout status, without reading the workout
         updated_exercise_data = self.exercise_repository.update_exercise(
-            exercise_id, completion_data
+            exercise_id, completion_data, require_existing=True
         )
 
-        # Update the workout status
-        workout_id = exercise_data.get("workout_id")
-        if workout_id:
-            self._update_workout_status(workout_id)
-
         # Convert to Exercise object and return
         if updated_exercise_data:
             exercise_data = updated_exercise_data.copy()
             exercise_data.pop("is_predefined", None)
+            exercise_data.pop("athlete_exercise_type", None)  # Index key only
             return Exercise(**exercise_data)
 
         return None
 
-    def _update_workout_status(self, workout_id: str) -> None:
-        """
-        Updates the workout status based on its exercises completion status
-
-        :param workout_id: ID of the workout to update
-        """
-        workout = self.get_workout(workout_id)
-        if not workout:
-            return
-
-        # Get all exercises for the workout
-        exercises = workout.exercises
-
-        if not exercises:
-            return
-
-        # Count completed exercises
-        completed_count = sum(1 for e in exercises if e.status == "completed")
-        total_count = len(exercises)
-
-        # Determine new status
-        if completed_count == total_count:
-            new_status = "completed"
-        elif completed_count > 0:
-            new_status = "in_progress"
-        else:
-            new_status = "not_started"
-
-        # Only update if status needs to change
-        if new_status != workout.status:
-            self.workout_repository.update_workout(workout_id, {"status": new_status})
-
     def _create_completion_notification(self, workout_id: str) -> None:
         """
         Create a notification when a workout is completed
@@ -0,0 +1,121 @@
+import threading
+from typing import Dict, Any, Optional
+import boto3
+from botocore.config import Config
+from src.config.app_config import AppConfig
+from src.utils.dynamodb_retry import RetryingTable
+
+# Process-wide handles, created lazily on first use and reused across warm invocations
+_lock = threading.RLock()
+_resource: Optional[Any] = None
+_low_level_client: Optional[Any] = None
+_tables: Dict[str, Any] = {}
+
+
+def build_client_config() -> Config:
+    """
+    Build the botocore configuration shared by every DynamoDB handle in the process
+
+    :return: A botocore Config with pool size, timeouts and keep-alive applied
+    """
+    options = {
+        "region_name": AppConfig.AWS_REGION,
+        # Retries are handled by src.utils.dynamodb_retry, so botocore sends each call once
+        "retries": {"total_max_attempts": 1},
+        "max_pool_connections": AppConfig.DYNAMODB_MAX_POOL_CONNECTIONS,
+        "connect_timeout": AppConfig.DYNAMODB_CONNECT_TIMEOUT_SEC,
+        "read_timeout": AppConfig.DYNAMODB_READ_TIMEOUT_SEC,
+    }
+
+    try:
+        return Config(tcp_keepalive=AppConfig.DYNAMODB_TCP_KEEPALIVE, **options)
+    except TypeError:
+        # Older botocore releases do not support the tcp_keepalive option
+        return Config(**options)
+
+
+def get_dynamodb_resource() -> Any:
+    """
+    Get the shared DynamoDB service resource, creating it on first use
+
+    :return: The process-wide boto3 DynamoDB resource
+    """
+    global _resource
+
+    if _resource is None:
+        with _lock:
+            if _resource is None:
+                _resource = boto3.resource(
+                    "dynamodb",
+                    region_name=AppConfig.AWS_REGION,
+                    config=build_client_config(),
+                )
+
+    return _resource
+
+
+def get_dynamodb_client() -> Any:
+    """
+    Get the low-level DynamoDB client backing the shared resource.
+    The client shares the resource's HTTP connection pool.
+
+    :return: The process-wide boto3 DynamoDB client
+    """
+    return get_dynamodb_resource().meta.client
+
+
+def get_low_level_client() -> Any:
+    """
+    Get a plain DynamoDB client that returns the raw wire format.
+    The resource's own client is wired to convert values to Decimal, so reads that
+    deserialize themselves need this separate client and its own connection pool.
+
+    :return: The process-wide low-level boto3 DynamoDB client
+    """
+    global _low_level_client
+
+    if _low_level_client is None:
+        with _lock:
+            if _low_level_client is None:
+                _low_level_client = boto3.client(
+                    "dynamodb",
+                    region_name=AppConfig.AWS_REGION,
+                    config=build_client_config(),
+                )
+
+    return _low_level_client
+
+
+def get_table(table_name: str) -> Any:
+    """
+    Get a cached Table handle for the given table name.
+    Item and query operations on the handle are retried when DynamoDB throttles.
+
+    :param table_name: Name of the DynamoDB table
+    :return: The shared Table handle for the table
+    """
+    table = _tables.get(table_name)
+
+    if table is None:
+        with _lock:
+            table = _tables.get(table_name)
+            if table is None:
+                table = RetryingTable(
+                    get_dynamodb_resource().Table(table_name), table_name
+                )
+                _tables[table_name] = table
+
+    return table
+
+
+def reset_dynamodb_pool() -> None:
+    """
+    Drop all cached handles so the next call builds fresh ones.
+    Used by tests and after configuration changes.
+    """
+    global _resource, _low_level_client
+
+    with _lock:
+        _resource = None
+        _low_level_client = None
+        _tables.clear()
@@ -0,0 +1,368 @@
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Union
+from botocore.exceptions import ClientError, ConnectionError, HTTPClientError
+from src.config.app_config import AppConfig
+
+logger = logging.getLogger()
+
+# Error codes DynamoDB returns when a table or partition is over its throughput
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "ProvisionedThroughputExceededException",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+    }
+)
+
+# Transient server-side errors that are safe to retry as well
+TRANSIENT_ERROR_CODES = frozenset({"InternalServerError", "ServiceUnavailable"})
+
+# Table operations that go through the retry layer; anything else is passed straight through
+RETRIED_TABLE_OPERATIONS = frozenset(
+    {"get_item", "put_item", "update_item", "delete_item", "query", "scan"}
+)
+
+# An ADD clause increments, so applying the update twice counts twice
+_ADD_CLAUSE = re.compile(r"(?:^|\s)ADD\s", re.IGNORECASE)
+
+# Adaptive rate limiting: each throttle halves the allowed request rate, each success
+# raises it again, and once it climbs back to the ceiling the limit is lifted entirely
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_STEP = 1.0
+MIN_REQUESTS_PER_SEC = 5.0
+MAX_REQUESTS_PER_SEC = 1000.0
+
+# Deadline of the invocation being handled. Lambda runs one invocation per process at a
+# time, so a module-level value is safe and is also seen by fan-out worker threads.
+_deadline: Optional[float] = None
+
+_metrics_lock = threading.Lock()
+_metrics: Dict[str, Dict[str, int]] = {}
+
+
+class AdaptiveRateLimiter:
+    """
+    Client-side token bucket per table that only kicks in once DynamoDB starts throttling.
+    Lives for the lifetime of the Lambda container, so warm invocations keep backing off
+    from a hot table instead of rediscovering the limit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Per table: allowed requests per second, or None while unlimited
+        self._rates: Dict[str, Optional[float]] = {}
+        self._tokens: Dict[str, float] = {}
+        self._refilled_at: Dict[str, float] = {}
+        # Send times within the last second, used as the starting rate on the first throttle
+        self._sent: Dict[str, Deque[float]] = {}
+
+    def acquire(self, table_name: str) -> None:
+        """
+        Wait for permission to send one request to a table
+
+        :param table_name: The table about to be called
+        """
+        with self._lock:
+            now = time.monotonic()
+            sent = self._sent.setdefault(table_name, deque())
+            sent.append(now)
+            while sent and sent[0] <= now - 1:
+                sent.popleft()
+
+            rate = self._rates.get(table_name)
+            if rate is None:
+                return
+
+            # Refill up to one second's worth of tokens, then reserve one
+            elapsed = now - self._refilled_at.get(table_name, now)
+            tokens = min(rate, self._tokens.get(table_name, rate) + elapsed * rate)
+            self._tokens[table_name] = tokens - 1
+            self._refilled_at[table_name] = now
+            wait = (1 - tokens) / rate if tokens < 1 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_throttle(self, table_name: str) -> None:
+        """
+        Lower the allowed rate of a table after it was throttled
+
+        :param table_name: The throttled table
+        """
+        with self._lock:
+            rate = self._rates.get(table_name)
+            if rate is None:
+                rate = float(len(self._sent.get(table_name, ())))
+            self._rates[table_name] = max(
+                MIN_REQUESTS_PER_SEC, rate * RATE_DECREASE_FACTOR
+            )
+
+    def on_success(self, table_name: str) -> None:
+        """
+        Raise the allowed rate of a table after a successful request
+
+        :param table_name: The table that answered
+        """
+        with self._lock:
+            rate = self._rates.get(table_name)
+            if rate is None:
+                return
+            rate += RATE_INCREASE_STEP
+            if rate >= MAX_REQUESTS_PER_SEC:
+                self._rates.pop(table_name, None)
+                self._tokens.pop(table_name, None)
+            else:
+                self._rates[table_name] = rate
+
+    def get_rate(self, table_name: str) -> Optional[float]:
+        """
+        Get the allowed request rate of a table
+
+        :param table_name: The table name
+        :return: Requests per second, or None if the table is not limited
+        """
+        with self._lock:
+            return self._rates.get(table_name)
+
+    def reset(self) -> None:
+        """
+        Lift every limit
+        """
+        with self._lock:
+            self._rates.clear()
+            self._tokens.clear()
+            self._refilled_at.clear()
+            self._sent.clear()
+
+
+rate_limiter = AdaptiveRateLimiter()
+
+
+def _table_names(tables: Union[str, Iterable[str]]) -> list:
+    return [tables] if isinstance(tables, str) else sorted(set(tables))
+
+
+def _count(table_names: Iterable[str], counter: str) -> None:
+    with _metrics_lock:
+        for table_name in table_names:
+            counters = _metrics.setdefault(
+                table_name, {"retries": 0, "throttles": 0, "exhausted": 0}
+            )
+            counters[counter] += 1
+
+
+def get_retry_metrics() -> Dict[str, Dict[str, int]]:
+    """
+    Get the retry and throttle counters of every table since the container started
+
+    :return: Mapping of table name to its retries, throttles and exhausted counts
+    """
+    with _metrics_lock:
+        return {table: dict(counters) for table, counters in _metrics.items()}
+
+
+def reset_retry_state() -> None:
+    """
+    Clear the counters, rate limits and invocation deadline.
+    Used by tests.
+    """
+    global _deadline
+
+    with _metrics_lock:
+        _metrics.clear()
+    rate_limiter.reset()
+    _deadline = None
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with full jitter: a random delay between zero and the
+    exponential ceiling, so clients throttled together do not retry in lockstep
+
+    :param attempt: Zero-based retry attempt number
+    :return: Delay in seconds
+    """
+    ceiling = min(
+        AppConfig.DYNAMODB_RETRY_MAX_DELAY_MS,
+        AppConfig.DYNAMODB_RETRY_BASE_DELAY_MS * (2**attempt),
+    )
+    return random.uniform(0, ceiling) / 1000
+
+
+def next_retry_delay(
+    tables: Union[str, Iterable[str]], attempt: int, throttled: bool = True
+) -> Optional[float]:
+    """
+    Record a failed attempt and decide whether it may be retried
+
+    :param tables: The table or tables the failed request went to
+    :param attempt: Zero-based number of retries already made
+    :param throttled: True if the failure was throttling, which slows the tables down
+    :return: Seconds to wait before retrying, or None if the attempts or time budget are used up
+    """
+    table_names = _table_names(tables)
+
+    if throttled:
+        _count(table_names, "throttles")
+        for table_name in table_names:
+            rate_limiter.on_throttle(table_name)
+
+    delay = backoff_delay(attempt)
+    out_of_time = _deadline is not None and time.monotonic() + delay >= _deadline
+    if attempt >= AppConfig.DYNAMODB_MAX_RETRY_ATTEMPTS or out_of_time:
+        _count(table_names, "exhausted")
+        return None
+
+    _count(table_names, "retries")
+    return delay
+
+
+def wait_for_capacity(tables: Union[str, Iterable[str]]) -> None:
+    """
+    Block until the adaptive rate limiter lets a request through to every given table
+
+    :param tables: The table or tables about to be called
+    """
+    if AppConfig.DYNAMODB_ADAPTIVE_RATE_LIMIT:
+        for table_name in _table_names(tables):
+            rate_limiter.acquire(table_name)
+
+
+def is_idempotent_update(kwargs: Dict[str, Any]) -> bool:
+    """
+    Tell whether an UpdateItem request can safely be applied twice
+
+    :param kwargs: The update_item arguments
+    :return: False if the update expression has an ADD clause
+    """
+    return not _ADD_CLAUSE.search(kwargs.get("UpdateExpression", ""))
+
+
+def call_with_retry(
+    tables: Union[str, Iterable[str]],
+    operation: Callable[..., Any],
+    *args: Any,
+    idempotent: bool = True,
+    **kwargs: Any,
+) -> Any:
+    """
+    Call a DynamoDB operation, retrying throttling, transient server errors and
+    dropped connections with backoff until the attempts or the invocation's time run out
+
+    A read timeout or a connection dropped mid-request leaves it unknown whether the
+    server applied the request, so those are only retried for idempotent operations.
+    Failures to connect are always retried, since nothing was sent.
+
+    :param tables: The table or tables the operation touches, used for rate limits and counters
+    :param operation: The boto3 callable to invoke
+    :param idempotent: Whether applying the operation twice has the same effect as once
+    :return: The operation's response
+    """
+    table_names = _table_names(tables)
+    attempt = 0
+
+    while True:
+        wait_for_capacity(table_names)
+        try:
+            response = operation(*args, **kwargs)
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code not in THROTTLING_ERROR_CODES and code not in TRANSIENT_ERROR_CODES:
+                raise
+            delay = next_retry_delay(
+                table_names, attempt, throttled=code in THROTTLING_ERROR_CODES
+            )
+            if delay is None:
+                raise
+        except (ConnectionError, HTTPClientError) as e:
+            if not idempotent and isinstance(e, HTTPClientError):
+                raise
+            delay = next_retry_delay(table_names, attempt, throttled=False)
+            if delay is None:
+                raise
+        else:
+            for table_name in table_names:
+                rate_limiter.on_success(table_name)
+            return response
+
+        time.sleep(delay)
+        attempt += 1
+
+
+class RetryingTable:
+    """
+    Wraps a boto3 Table so its item and query operations go through call_with_retry.
+    Every other attribute, such as name or batch_writer, is the underlying table's.
+    """
+
+    def __init__(self, table: Any, table_name: str):
+        """
+        :param table: The boto3 Table resource
+        :param table_name: Name of the table, used for rate limits and counters
+        """
+        self._table = table
+        self._table_name = table_name
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._table, name)
+        if name not in RETRIED_TABLE_OPERATIONS:
+            return attribute
+
+        def retried(*args: Any, **kwargs: Any) -> Any:
+            idempotent = name != "update_item" or is_idempotent_update(kwargs)
+            return call_with_retry(
+                self._table_name, attribute, *args, idempotent=idempotent, **kwargs
+            )
+
+        return retried
+
+
+@contextmanager
+def retry_budget(context: Any) -> Iterator[None]:
+    """
+    Limit retries to the time the Lambda invocation has left, keeping a safety margin
+    so a throttled request fails cleanly instead of the function timing out.
+    Logs the tables that were throttled during the invocation.
+
+    :param context: The Lambda context; without get_remaining_time_in_millis there is no deadline
+    :return: Context manager active for the invocation
+    """
+    global _deadline
+
+    remaining_ms = None
+    try:
+        remaining_ms = context.get_remaining_time_in_millis()
+    except (AttributeError, TypeError):
+        # Handlers invoked outside Lambda, e.g. locally, have no usable context
+        pass
+
+    before = get_retry_metrics()
+    previous = _deadline
+    if isinstance(remaining_ms, (int, float)):
+        _deadline = (
+            time.monotonic()
+            + (remaining_ms - AppConfig.DYNAMODB_RETRY_TIME_MARGIN_MS) / 1000
+        )
+
+    try:
+        yield
+    finally:
+        _deadline = previous
+
+        for table_name, counters in get_retry_metrics().items():
+            previous_counters = before.get(table_name, {})
+            delta = {
+                name: count - previous_counters.get(name, 0)
+                for name, count in counters.items()
+            }
+            if delta["throttles"] or delta["exhausted"]:
+                logger.warning(
+                    f"DynamoDB throttling on {table_name}: throttles={delta['throttles']}, "
+                    f"retries={delta['retries']}, exhausted={delta['exhausted']}"
+                )
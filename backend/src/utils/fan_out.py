@@ -0,0 +1,150 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from src.config.app_config import AppConfig
+
+_lock = threading.Lock()
+_executor: Optional["FanOutExecutor"] = None
+
+
+class FanOutExecutor:
+    """
+    Bounded thread pool shared by every repository fan-out in the process.
+
+    Threads are started once and reused by warm invocations. The worker count never exceeds
+    the DynamoDB connection pool, so parallel queries do not queue for connections.
+    Once all workers are busy and the queue is full, further tasks run in the calling thread,
+    which throttles the caller instead of growing the queue. A fan-out started from inside a
+    worker also runs in that worker, so nested fan-outs can never wait on themselves.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        """
+        :param max_workers: Number of worker threads
+        :param max_queue: Number of tasks allowed to wait for a free worker
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="fan-out",
+            initializer=self._mark_worker,
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "inline": 0,
+            "queue_wait_ms_total": 0.0,
+            "queue_wait_ms_max": 0.0,
+        }
+
+    def _mark_worker(self) -> None:
+        self._local.is_worker = True
+
+    def _in_worker(self) -> bool:
+        return getattr(self._local, "is_worker", False)
+
+    def _run(self, fn: Callable[[Any], Any], item: Any, submitted_at: float) -> Any:
+        wait_ms = (time.monotonic() - submitted_at) * 1000
+        with self._stats_lock:
+            self._stats["queue_wait_ms_total"] += wait_ms
+            self._stats["queue_wait_ms_max"] = max(
+                self._stats["queue_wait_ms_max"], wait_ms
+            )
+
+        try:
+            return fn(item)
+        finally:
+            self._slots.release()
+
+    def _run_inline(self, fn: Callable[[Any], Any], item: Any) -> Future:
+        with self._stats_lock:
+            self._stats["inline"] += 1
+
+        future: Future = Future()
+        try:
+            future.set_result(fn(item))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Apply fn to every item in parallel
+
+        :param fn: Callable taking one item
+        :param items: The items to process
+        :return: The results in the order of items; the first failure in that order is raised
+        """
+        items = list(items)
+        if len(items) <= 1 or self._in_worker():
+            return [fn(item) for item in items]
+
+        futures = []
+        for item in items:
+            if self._slots.acquire(blocking=False):
+                with self._stats_lock:
+                    self._stats["submitted"] += 1
+                futures.append(
+                    self._executor.submit(self._run, fn, item, time.monotonic())
+                )
+            else:
+                futures.append(self._run_inline(fn, item))
+
+        return [future.result() for future in futures]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get counters since the executor was created
+
+        :return: Tasks submitted to workers, tasks run inline, and total and worst queue wait in ms
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker threads once queued tasks have finished
+        """
+        self._executor.shutdown(wait=True)
+
+
+def get_fan_out_executor() -> FanOutExecutor:
+    """
+    Get the process-wide fan-out executor, creating it on first use
+
+    :return: The shared FanOutExecutor
+    """
+    global _executor
+
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = FanOutExecutor(
+                    max_workers=max(
+                        1,
+                        min(
+                            AppConfig.FAN_OUT_MAX_WORKERS,
+                            AppConfig.DYNAMODB_MAX_POOL_CONNECTIONS,
+                        ),
+                    ),
+                    max_queue=AppConfig.FAN_OUT_MAX_QUEUE,
+                )
+
+    return _executor
+
+
+def reset_fan_out_executor() -> None:
+    """
+    Shut down the shared executor so the next call builds a fresh one.
+    Used by tests and after configuration changes.
+    """
+    global _executor
+
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor = None
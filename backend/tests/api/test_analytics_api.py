@@ -36,10 +36,15 @@ class TestAnalyticsAPI(unittest.TestCase):
         self.block_service_patcher = patch(
             "src.api.analytics_api.block_service", self.mock_block_service
         )
+        self.relationship_service_patcher = patch(
+            "src.api.analytics_api.relationship_service",
+            self.mock_relationship_service,
+        )
 
         self.analytics_service_patcher.start()
         self.user_service_patcher.start()
         self.block_service_patcher.start()
+        self.relationship_service_patcher.start()
 
         # Mock event structure
         self.base_event = {
@@ -56,6 +61,7 @@ class TestAnalyticsAPI(unittest.TestCase):
         self.analytics_service_patcher.stop()
         self.user_service_patcher.stop()
         self.block_service_patcher.stop()
+        self.relationship_service_patcher.stop()
 
     def test_validate_date_format_valid_dates(self):
         """Test validate_date_format with valid date strings"""
@@ -81,8 +87,7 @@ class TestAnalyticsAPI(unittest.TestCase):
                 result = validate_date_format(date_str)
                 self.assertFalse(result, f"Should validate {date_str} as invalid")
 
-    @patch("src.api.analytics_api.RelationshipService")
-    def test_validate_athlete_access_same_user(self, mock_relationship_service_class):
+    def test_validate_athlete_access_same_user(self):
         """Test validate_athlete_access when user accesses their own data"""
         user_id = "test-user-id"
         athlete_id = "test-user-id"
@@ -91,23 +96,17 @@ class TestAnalyticsAPI(unittest.TestCase):
 
         self.assertTrue(result, "User should have access to their own data")
         # Should not check relationships when accessing own data
-        mock_relationship_service_class.assert_not_called()
+        self.mock_relationship_service.get_active_relationship_status.assert_not_called()
 
-    @patch("src.services.relationship_service.RelationshipService")
-    def test_validate_athlete_access_coach_relationship_active(
-        self, mock_relationship_service_class
-    ):
+    def test_validate_athlete_access_coach_relationship_active(self):
         """Test validate_athlete_access when coach has active relationship with athlete"""
         user_id = "coach-id"
         athlete_id = "athlete-id"
 
-        mock_service = MagicMock()
-        mock_relationship_service_class.return_value = mock_service
+        mock_service = self.mock_relationship_service
 
         # Mock active relationship
-        mock_relationship = MagicMock()
-        mock_relationship.status = "active"
-        mock_service.get_active_relationship.return_value = mock_relationship
+        mock_service.get_active_relationship_status.return_value = "active"
 
         # Import here to ensure patch is applied
         from src.api.analytics_api import validate_athlete_access
@@ -117,25 +116,19 @@ class TestAnalyticsAPI(unittest.TestCase):
         self.assertTrue(
             result, "Coach should have access to athlete data with active relationship"
         )
-        mock_service.get_active_relationship.assert_called_once_with(
+        mock_service.get_active_relationship_status.assert_called_once_with(
             coach_id=user_id, athlete_id=athlete_id
         )
 
-    @patch("src.api.analytics_api.RelationshipService")
-    def test_validate_athlete_access_coach_relationship_pending(
-        self, mock_relationship_service_class
-    ):
+    def test_validate_athlete_access_coach_relationship_pending(self):
         """Test validate_athlete_access when coach has pending relationship with athlete"""
         user_id = "coach-id"
         athlete_id = "athlete-id"
 
-        mock_service = MagicMock()
-        mock_relationship_service_class.return_value = mock_service
+        mock_service = self.mock_relationship_service
 
         # Mock pending relationship
-        mock_relationship = MagicMock()
-        mock_relationship.status = "pending"
-        mock_service.get_active_relationship.return_value = mock_relationship
+        mock_service.get_active_relationship_status.return_value = "pending"
 
         result = validate_athlete_access(user_id, athlete_id)
 
@@ -144,17 +137,15 @@ class TestAnalyticsAPI(unittest.TestCase):
         )
 
     @patch("src.api.analytics_api.logger")
-    @patch("src.api.analytics_api.RelationshipService")
-    def test_validate_athlete_access_logs_with_user_details(
-        self, mock_relationship_service_class, mock_logger
-    ):
+    def test_validate_athlete_access_logs_with_user_details(self, mock_logger):
         """Test validate_athlete_access logs with specific user and athlete IDs on error"""
         user_id = "coach-id"
         athlete_id = "athlete-id"
 
-        mock_service = MagicMock()
-        mock_relationship_service_class.return_value = mock_service
-        mock_service.get_active_relationship.side_effect = Exception("Database error")
+        mock_service = self.mock_relationship_service
+        mock_service.get_active_relationship_status.side_effect = Exception(
+            "Database error"
+        )
 
         result = validate_athlete_access(user_id, athlete_id)
 
@@ -167,17 +158,15 @@ class TestAnalyticsAPI(unittest.TestCase):
         self.assertIn("athlete-id", logged_message)
         self.assertIn("Error validating athlete access", logged_message)
 
-    @patch("src.api.analytics_api.RelationshipService")
-    def test_validate_athlete_access_no_relationship(
-        self, mock_relationship_service_class
-    ):
+    def test_validate_athlete_access_no_relationship(self):
         """Test validate_athlete_access when no relationship exists"""
         user_id = "coach-id"
         athlete_id = "athlete-id"
 
-        mock_service = MagicMock()
-        mock_relationship_service_class.return_value = mock_service
-        mock_service.get_active_relationship.return_value = None  # No relationship
+        mock_service = self.mock_relationship_service
+        mock_service.get_active_relationship_status.return_value = (
+            None  # No relationship
+        )
 
         result = validate_athlete_access(user_id, athlete_id)
 
@@ -997,17 +986,13 @@ class TestAnalyticsAPI(unittest.TestCase):
         response_body = json.loads(response["body"])
         self.assertIn("Internal server error", response_body["error"])
 
-    @patch("src.services.relationship_service.RelationshipService")
-    def test_validate_athlete_access_service_exception_details(
-        self, mock_relationship_service_class
-    ):
+    def test_validate_athlete_access_service_exception_details(self):
         """Test validate_athlete_access with detailed exception logging"""
         user_id = "coach-id"
         athlete_id = "athlete-id"
 
-        mock_service = MagicMock()
-        mock_relationship_service_class.return_value = mock_service
-        mock_service.get_active_relationship.side_effect = ConnectionError(
+        mock_service = self.mock_relationship_service
+        mock_service.get_active_relationship_status.side_effect = ConnectionError(
             "Database connection failed"
         )
 
@@ -310,6 +310,31 @@ class TestBlockAPI(BaseTest):
         self.assertEqual(response_body[1]["block_id"], "block2")
         mock_get_blocks.assert_called_once_with("athlete456")
 
+    @patch("src.services.block_service.BlockService.get_blocks_page_for_athlete")
+    def test_get_blocks_by_athlete_paginated(self, mock_get_page):
+        """
+        Test retrieving one page of blocks when a limit is given
+        """
+        mock_block = MagicMock()
+        mock_block.to_dict.return_value = {"block_id": "block1"}
+        mock_get_page.return_value = (
+            [mock_block],
+            {"block_id": "block1", "athlete_id": "athlete456"},
+        )
+
+        event = {
+            "pathParameters": {"athlete_id": "athlete456"},
+            "queryStringParameters": {"limit": "1"},
+            "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+        }
+
+        response = block_api.get_blocks_by_athlete(event, {})
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(json.loads(response["body"]), [{"block_id": "block1"}])
+        self.assertIn("X-Next-Cursor", response["headers"])
+        mock_get_page.assert_called_once_with("athlete456", 1, None)
+
     @patch(
         "src.services.relationship_service.RelationshipService.get_active_relationship"
     )
@@ -625,7 +650,13 @@ class TestBlockAPI(BaseTest):
         mock_existing.athlete_id = "athlete456"
         mock_existing.coach_id = "coach789"
         mock_get_block.return_value = mock_existing
-        mock_delete_block.return_value = True
+        mock_delete_block.return_value = {
+            "blocks": 1,
+            "weeks": 4,
+            "days": 28,
+            "workouts": 3,
+            "exercises": 12,
+        }
 
         event = {
             "pathParameters": {"block_id": "block123"},
@@ -637,7 +668,19 @@ class TestBlockAPI(BaseTest):
         response = block_api.delete_block(event, context)
 
         # Assert
-        self.assertEqual(response["statusCode"], 204)
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(
+            json.loads(response["body"]),
+            {
+                "deleted": {
+                    "blocks": 1,
+                    "weeks": 4,
+                    "days": 28,
+                    "workouts": 3,
+                    "exercises": 12,
+                }
+            },
+        )
         mock_delete_block.assert_called_once_with("block123")
 
     @patch("src.services.block_service.BlockService.get_block")
@@ -732,6 +775,86 @@ class TestBlockAPI(BaseTest):
         self.assertEqual(response["statusCode"], 403)
         mock_delete_block.assert_not_called()
 
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_block")
+    @patch("src.services.block_service.BlockService.get_block")
+    def test_copy_block_success(self, mock_get_block, mock_clone_block):
+        """
+        Test duplicating a block to start on a new date
+        """
+        mock_existing = MagicMock()
+        mock_existing.athlete_id = "athlete456"
+        mock_existing.coach_id = "coach789"
+        mock_existing.start_date = "2025-03-03"
+        mock_get_block.return_value = mock_existing
+
+        mock_copy = MagicMock()
+        mock_copy.to_dict.return_value = {
+            "block_id": "block-copy",
+            "start_date": "2025-05-26",
+        }
+        mock_clone_block.return_value = mock_copy
+
+        event = {
+            "pathParameters": {"block_id": "block123"},
+            "body": json.dumps({"start_date": "2025-05-26", "title": "Block 2"}),
+            "requestContext": {"authorizer": {"claims": {"sub": "coach789"}}},
+        }
+        response = block_api.copy_block(event, {})
+
+        self.assertEqual(response["statusCode"], 201)
+        self.assertEqual(json.loads(response["body"])["block_id"], "block-copy")
+        mock_clone_block.assert_called_once_with(
+            "block123", shift_days=84, title="Block 2", strip_sets_data=False
+        )
+
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_block")
+    @patch("src.services.block_service.BlockService.get_block")
+    def test_copy_block_invalid_shift(self, mock_get_block, mock_clone_block):
+        """
+        Test duplicating a block with a malformed date shift
+        """
+        mock_existing = MagicMock()
+        mock_existing.athlete_id = "athlete456"
+        mock_existing.coach_id = None
+        mock_get_block.return_value = mock_existing
+
+        event = {
+            "pathParameters": {"block_id": "block123"},
+            "body": json.dumps({"shift_days": "next week"}),
+            "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+        }
+        response = block_api.copy_block(event, {})
+
+        self.assertEqual(response["statusCode"], 400)
+        mock_clone_block.assert_not_called()
+
+    @patch(
+        "src.services.relationship_service.RelationshipService.get_active_relationship"
+    )
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_block")
+    @patch("src.services.block_service.BlockService.get_block")
+    def test_copy_block_unauthorized(
+        self, mock_get_block, mock_clone_block, mock_get_relationship
+    ):
+        """
+        Test duplicating another athlete's block without a coaching relationship
+        """
+        mock_existing = MagicMock()
+        mock_existing.athlete_id = "athlete456"
+        mock_existing.coach_id = "coach789"
+        mock_get_block.return_value = mock_existing
+        mock_get_relationship.return_value = None
+
+        event = {
+            "pathParameters": {"block_id": "block123"},
+            "body": json.dumps({}),
+            "requestContext": {"authorizer": {"claims": {"sub": "other-user"}}},
+        }
+        response = block_api.copy_block(event, {})
+
+        self.assertEqual(response["statusCode"], 403)
+        mock_clone_block.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -727,7 +727,13 @@ class TestDayAPI(BaseTest):
         mock_existing.week_id = "week456"
         mock_get_day.return_value = mock_existing
 
-        mock_delete_day.return_value = True
+        mock_delete_day.return_value = {
+            "blocks": 0,
+            "weeks": 0,
+            "days": 1,
+            "workouts": 1,
+            "exercises": 3,
+        }
 
         event = {
             "pathParameters": {"day_id": "day123"},
@@ -739,7 +745,19 @@ class TestDayAPI(BaseTest):
         response = day_api.delete_day(event, context)
 
         # Assert
-        self.assertEqual(response["statusCode"], 204)
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(
+            json.loads(response["body"]),
+            {
+                "deleted": {
+                    "blocks": 0,
+                    "weeks": 0,
+                    "days": 1,
+                    "workouts": 1,
+                    "exercises": 3,
+                }
+            },
+        )
         mock_delete_day.assert_called_once_with("day123")
 
     @patch("src.services.day_service.DayService.get_day")
@@ -235,46 +235,44 @@ class TestExerciseAPI(BaseTest):
         response_body = json.loads(response["body"])
         self.assertEqual(response_body["error"], "Database query failed")
 
-    @patch("src.services.user_service.UserService.get_user")
-    def test_get_user_weight_preference_success(self, mock_get_user):
+    @patch("src.services.user_service.UserService.get_weight_unit_preference")
+    def test_get_user_weight_preference_success(self, mock_get_preference):
         """Test get_user_weight_preference with valid user"""
         # Setup
-        mock_user = MagicMock()
-        mock_user.weight_unit_preference = "kg"
-        mock_get_user.return_value = mock_user
+        mock_get_preference.return_value = "kg"
 
         # Call function
         result = exercise_api.get_user_weight_preference("test-user-id")
 
         # Assert
         self.assertEqual(result, "kg")
-        mock_get_user.assert_called_once_with("test-user-id")
+        mock_get_preference.assert_called_once_with("test-user-id")
 
-    @patch("src.services.user_service.UserService.get_user")
-    def test_get_user_weight_preference_user_not_found(self, mock_get_user):
+    @patch("src.services.user_service.UserService.get_weight_unit_preference")
+    def test_get_user_weight_preference_user_not_found(self, mock_get_preference):
         """Test get_user_weight_preference when user not found"""
         # Setup
-        mock_get_user.return_value = None
+        mock_get_preference.return_value = None
 
         # Call function
         result = exercise_api.get_user_weight_preference("nonexistent-user")
 
         # Assert
         self.assertEqual(result, "auto")
-        mock_get_user.assert_called_once_with("nonexistent-user")
+        mock_get_preference.assert_called_once_with("nonexistent-user")
 
-    @patch("src.services.user_service.UserService.get_user")
-    def test_get_user_weight_preference_exception(self, mock_get_user):
+    @patch("src.services.user_service.UserService.get_weight_unit_preference")
+    def test_get_user_weight_preference_exception(self, mock_get_preference):
         """Test get_user_weight_preference with service exception"""
         # Setup
-        mock_get_user.side_effect = Exception("Database error")
+        mock_get_preference.side_effect = Exception("Database error")
 
         # Call function
         result = exercise_api.get_user_weight_preference("test-user-id")
 
         # Assert
         self.assertEqual(result, "auto")  # Should fallback to "auto"
-        mock_get_user.assert_called_once_with("test-user-id")
+        mock_get_preference.assert_called_once_with("test-user-id")
 
     @patch("src.services.workout_service.WorkoutService.get_workout")
     @patch("src.services.exercise_service.ExerciseService.get_exercise")
@@ -544,7 +542,12 @@ class TestExerciseAPI(BaseTest):
         self.assertEqual(response_body[0]["order"], 1)
         self.assertEqual(response_body[1]["exercise_id"], "ex1")
         self.assertEqual(response_body[1]["order"], 2)
-        mock_reorder_exercises.assert_called_once_with("workout456", ["ex2", "ex1"])
+        # The exercises read for the ownership check are reused
+        mock_reorder_exercises.assert_called_once_with(
+            "workout456",
+            ["ex2", "ex1"],
+            exercises=mock_get_workout.return_value.exercises,
+        )
 
     @patch("src.services.exercise_service.ExerciseService.reorder_exercises")
     def test_reorder_exercises_missing_fields(self, mock_reorder_exercises):
@@ -602,7 +605,12 @@ class TestExerciseAPI(BaseTest):
         self.assertEqual(response["statusCode"], 500)
         response_body = json.loads(response["body"])
         self.assertEqual(response_body["error"], "Reorder operation failed")
-        mock_reorder_exercises.assert_called_once_with("workout456", ["ex2", "ex1"])
+        # The exercises read for the ownership check are reused
+        mock_reorder_exercises.assert_called_once_with(
+            "workout456",
+            ["ex2", "ex1"],
+            exercises=mock_get_workout.return_value.exercises,
+        )
 
     @patch("src.api.exercise_api.get_user_weight_preference", return_value="kg")
     @patch(
@@ -841,6 +849,7 @@ class TestExerciseAPI(BaseTest):
             rpe=8,
             completed=True,
             notes=None,
+            exercise=mock_exercise,
         )
 
     @patch("src.services.exercise_service.ExerciseService")
@@ -1,8 +1,15 @@
 import unittest
 from unittest.mock import MagicMock, patch
 import json
-from src.api.notification_api import get_notifications, mark_notification_as_read
+from src.api.notification_api import (
+    get_notifications,
+    get_notification_workout,
+    get_unread_count,
+    mark_notification_as_read,
+    mark_notifications_as_read,
+)
 from src.models.notification import Notification
+from src.config.notification_config import NotificationConfig
 
 
 class TestNotificationAPI(unittest.TestCase):
@@ -21,7 +28,7 @@ class TestNotificationAPI(unittest.TestCase):
             athlete_name="Test Athlete",
             workout_id="workout-123",
             day_info="Day 3 (2024-06-25)",
-            workout_data={"workout_id": "workout-123", "status": "completed"},
+            workout_summary={"status": "completed", "exercise_count": 3},
             created_at="2024-06-25T10:30:00Z",
             is_read=False,
             notification_type="workout_completion",
@@ -38,9 +45,10 @@ class TestNotificationAPI(unittest.TestCase):
     def test_get_notifications_success_default_params(self, mock_service):
         """Test successful GET /notifications with default parameters"""
         # Arrange
-        mock_service.get_notifications_for_coach.return_value = [
-            self.sample_notification
-        ]
+        mock_service.get_notifications_page_for_coach.return_value = (
+            [self.sample_notification],
+            None,
+        )
 
         event = self.base_event.copy()
         context = {}
@@ -55,17 +63,18 @@ class TestNotificationAPI(unittest.TestCase):
         self.assertEqual(response_body[0]["notification_id"], self.notification_id)
 
         # Verify service called with correct parameters
-        mock_service.get_notifications_for_coach.assert_called_once_with(
-            self.coach_id, None, False
+        mock_service.get_notifications_page_for_coach.assert_called_once_with(
+            self.coach_id, NotificationConfig.MAX_ITEMS, False, None
         )
 
     @patch("src.api.notification_api.notification_service")
     def test_get_notifications_with_limit_parameter(self, mock_service):
         """Test GET /notifications with limit parameter"""
         # Arrange
-        mock_service.get_notifications_for_coach.return_value = [
-            self.sample_notification
-        ]
+        mock_service.get_notifications_page_for_coach.return_value = (
+            [self.sample_notification],
+            None,
+        )
 
         event = self.base_event.copy()
         event["queryStringParameters"] = {"limit": "10"}
@@ -76,17 +85,18 @@ class TestNotificationAPI(unittest.TestCase):
 
         # Assert
         self.assertEqual(response["statusCode"], 200)
-        mock_service.get_notifications_for_coach.assert_called_once_with(
-            self.coach_id, 10, False
+        mock_service.get_notifications_page_for_coach.assert_called_once_with(
+            self.coach_id, 10, False, None
         )
 
     @patch("src.api.notification_api.notification_service")
     def test_get_notifications_unread_only_true(self, mock_service):
         """Test GET /notifications with unread_only=true"""
         # Arrange
-        mock_service.get_notifications_for_coach.return_value = [
-            self.sample_notification
-        ]
+        mock_service.get_notifications_page_for_coach.return_value = (
+            [self.sample_notification],
+            None,
+        )
 
         event = self.base_event.copy()
         event["queryStringParameters"] = {"unread_only": "true"}
@@ -97,8 +107,8 @@ class TestNotificationAPI(unittest.TestCase):
 
         # Assert
         self.assertEqual(response["statusCode"], 200)
-        mock_service.get_notifications_for_coach.assert_called_once_with(
-            self.coach_id, None, True
+        mock_service.get_notifications_page_for_coach.assert_called_once_with(
+            self.coach_id, NotificationConfig.MAX_ITEMS, True, None
         )
 
     @patch("src.api.notification_api.notification_service")
@@ -131,7 +141,7 @@ class TestNotificationAPI(unittest.TestCase):
     def test_get_notifications_combined_parameters(self, mock_service):
         """Test GET /notifications with multiple parameters"""
         # Arrange
-        mock_service.get_notifications_for_coach.return_value = []
+        mock_service.get_notifications_page_for_coach.return_value = ([], None)
 
         event = self.base_event.copy()
         event["queryStringParameters"] = {"limit": "25", "unread_only": "true"}
@@ -142,8 +152,8 @@ class TestNotificationAPI(unittest.TestCase):
 
         # Assert
         self.assertEqual(response["statusCode"], 200)
-        mock_service.get_notifications_for_coach.assert_called_once_with(
-            self.coach_id, 25, True
+        mock_service.get_notifications_page_for_coach.assert_called_once_with(
+            self.coach_id, 25, True, None
         )
 
     def test_get_notifications_missing_auth(self):
@@ -179,7 +189,7 @@ class TestNotificationAPI(unittest.TestCase):
     def test_get_notifications_service_exception(self, mock_service):
         """Test GET /notifications when service throws exception"""
         # Arrange
-        mock_service.get_notifications_for_coach.side_effect = Exception(
+        mock_service.get_notifications_page_for_coach.side_effect = Exception(
             "Database error"
         )
 
@@ -198,7 +208,7 @@ class TestNotificationAPI(unittest.TestCase):
     def test_get_notifications_empty_result(self, mock_service):
         """Test GET /notifications when no notifications exist"""
         # Arrange
-        mock_service.get_notifications_for_coach.return_value = []
+        mock_service.get_notifications_page_for_coach.return_value = ([], None)
 
         event = self.base_event.copy()
         context = {}
@@ -233,9 +243,129 @@ class TestNotificationAPI(unittest.TestCase):
         # Verify service calls
         mock_service.get_notification.assert_called_once_with(self.notification_id)
         mock_service.mark_notification_as_read.assert_called_once_with(
-            self.notification_id
+            self.notification_id, self.coach_id
         )
 
+    @patch("src.api.notification_api.workout_service")
+    @patch("src.api.notification_api.notification_service")
+    def test_get_notification_workout_success(self, mock_service, mock_workout_service):
+        """Test GET /notifications/{id}/workout returns the full workout"""
+        mock_service.get_notification.return_value = self.sample_notification
+        workout = MagicMock()
+        workout.to_dict.return_value = {"workout_id": "workout-123", "exercises": []}
+        mock_workout_service.get_workout.return_value = workout
+
+        event = self.base_event.copy()
+        event["pathParameters"] = {"notification_id": self.notification_id}
+
+        response = get_notification_workout(event, {})
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(
+            json.loads(response["body"]), {"workout_id": "workout-123", "exercises": []}
+        )
+        mock_workout_service.get_workout.assert_called_once_with("workout-123")
+
+    @patch("src.api.notification_api.workout_service")
+    @patch("src.api.notification_api.notification_service")
+    def test_get_notification_workout_wrong_coach(
+        self, mock_service, mock_workout_service
+    ):
+        """Test GET /notifications/{id}/workout for another coach's notification"""
+        mock_service.get_notification.return_value = self.sample_notification
+
+        event = self.base_event.copy()
+        event["requestContext"] = {"authorizer": {"claims": {"sub": "other-coach"}}}
+        event["pathParameters"] = {"notification_id": self.notification_id}
+
+        response = get_notification_workout(event, {})
+
+        self.assertEqual(response["statusCode"], 403)
+        mock_workout_service.get_workout.assert_not_called()
+
+    @patch("src.api.notification_api.workout_service")
+    @patch("src.api.notification_api.notification_service")
+    def test_get_notification_workout_deleted(self, mock_service, mock_workout_service):
+        """Test GET /notifications/{id}/workout when the workout no longer exists"""
+        mock_service.get_notification.return_value = self.sample_notification
+        mock_workout_service.get_workout.return_value = None
+
+        event = self.base_event.copy()
+        event["pathParameters"] = {"notification_id": self.notification_id}
+
+        response = get_notification_workout(event, {})
+
+        self.assertEqual(response["statusCode"], 404)
+
+    @patch("src.api.notification_api.notification_service")
+    def test_get_unread_count_success(self, mock_service):
+        """Test GET /notifications/unread-count returns the coach's counter"""
+        mock_service.get_unread_count_for_coach.return_value = 7
+
+        response = get_unread_count(self.base_event.copy(), {})
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(json.loads(response["body"]), {"unread_count": 7})
+        mock_service.get_unread_count_for_coach.assert_called_once_with(self.coach_id)
+
+    def test_get_unread_count_missing_auth(self):
+        """Test GET /notifications/unread-count without authentication"""
+        response = get_unread_count({"requestContext": {}}, {})
+
+        self.assertEqual(response["statusCode"], 401)
+
+    @patch("src.api.notification_api.notification_service")
+    def test_mark_notifications_as_read_listed(self, mock_service):
+        """Test PATCH /notifications/read marks the listed notifications"""
+        mock_service.mark_notifications_as_read.return_value = 2
+
+        event = self.base_event.copy()
+        event["body"] = json.dumps({"notification_ids": ["n1", "n2"]})
+
+        response = mark_notifications_as_read(event, {})
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(json.loads(response["body"]), {"marked_read": 2})
+        mock_service.mark_notifications_as_read.assert_called_once_with(
+            self.coach_id, ["n1", "n2"]
+        )
+
+    @patch("src.api.notification_api.notification_service")
+    def test_mark_notifications_as_read_all(self, mock_service):
+        """Test PATCH /notifications/read without IDs marks every unread notification"""
+        mock_service.mark_notifications_as_read.return_value = 12
+
+        response = mark_notifications_as_read(self.base_event.copy(), {})
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(json.loads(response["body"]), {"marked_read": 12})
+        mock_service.mark_notifications_as_read.assert_called_once_with(
+            self.coach_id, None
+        )
+
+    @patch("src.api.notification_api.notification_service")
+    def test_mark_notifications_as_read_invalid_ids(self, mock_service):
+        """Test PATCH /notifications/read rejects malformed or oversized ID lists"""
+        for notification_ids in (
+            "n1",
+            [1, 2],
+            ["n"] * (NotificationConfig.MAX_BULK_READ_ITEMS + 1),
+        ):
+            with self.subTest(notification_ids=notification_ids):
+                event = self.base_event.copy()
+                event["body"] = json.dumps({"notification_ids": notification_ids})
+
+                response = mark_notifications_as_read(event, {})
+
+                self.assertEqual(response["statusCode"], 400)
+        mock_service.mark_notifications_as_read.assert_not_called()
+
+    def test_mark_notifications_as_read_missing_auth(self):
+        """Test PATCH /notifications/read without authentication"""
+        response = mark_notifications_as_read({"requestContext": {}}, {})
+
+        self.assertEqual(response["statusCode"], 401)
+
     def test_mark_notification_as_read_missing_auth(self):
         """Test PATCH /notifications/{id}/read without authentication"""
         # Arrange
@@ -286,7 +416,7 @@ class TestNotificationAPI(unittest.TestCase):
             athlete_name="Test Athlete",
             workout_id="workout-123",
             day_info="Day 3 (2024-06-25)",
-            workout_data={"workout_id": "workout-123"},
+            workout_summary={"exercise_count": 1},
             is_read=False,
         )
         mock_service.get_notification.return_value = different_coach_notification
@@ -348,7 +478,7 @@ class TestNotificationAPI(unittest.TestCase):
     def test_get_notifications_case_insensitive_boolean_params(self, mock_service):
         """Test GET /notifications with case-insensitive boolean parameters"""
         # Arrange
-        mock_service.get_notifications_for_coach.return_value = []
+        mock_service.get_notifications_page_for_coach.return_value = ([], None)
 
         test_cases = [
             ("TRUE", True),
@@ -369,8 +499,8 @@ class TestNotificationAPI(unittest.TestCase):
 
                 # Assert
                 self.assertEqual(response["statusCode"], 200)
-                mock_service.get_notifications_for_coach.assert_called_with(
-                    self.coach_id, None, expected_bool
+                mock_service.get_notifications_page_for_coach.assert_called_with(
+                    self.coach_id, NotificationConfig.MAX_ITEMS, expected_bool, None
                 )
 
     @patch("src.api.notification_api.notification_service")
@@ -384,14 +514,17 @@ class TestNotificationAPI(unittest.TestCase):
             athlete_name="Another Athlete",
             workout_id="workout-456",
             day_info="Day 1 (2024-06-24)",
-            workout_data={"workout_id": "workout-456"},
+            workout_summary={"exercise_count": 1},
             is_read=True,
         )
 
-        mock_service.get_notifications_for_coach.return_value = [
-            self.sample_notification,
-            notification2,
-        ]
+        mock_service.get_notifications_page_for_coach.return_value = (
+            [
+                self.sample_notification,
+                notification2,
+            ],
+            None,
+        )
 
         event = self.base_event.copy()
         context = {}
@@ -421,7 +554,7 @@ class TestNotificationAPI(unittest.TestCase):
             athlete_name="Second Athlete",
             workout_id="workout-456",
             day_info="Day 2 (2024-06-24)",
-            workout_data={"workout_id": "workout-456"},
+            workout_summary={"exercise_count": 1},
             is_read=False,
         )
 
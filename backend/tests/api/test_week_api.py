@@ -2,6 +2,7 @@ import json
 import unittest
 from unittest.mock import patch, MagicMock
 from tests.base_test import BaseTest
+from src.services.program_clone_service import CloneConflictError
 
 # Import week after the mocks are set up in BaseTest
 with patch("boto3.resource"):
@@ -433,7 +434,13 @@ class TestWeekAPI(BaseTest):
         mock_block.coach_id = "coach789"
         mock_get_block.return_value = mock_block
 
-        mock_delete_week.return_value = True
+        mock_delete_week.return_value = {
+            "blocks": 0,
+            "weeks": 1,
+            "days": 7,
+            "workouts": 2,
+            "exercises": 10,
+        }
 
         event = {
             "pathParameters": {"week_id": "week123"},
@@ -445,9 +452,53 @@ class TestWeekAPI(BaseTest):
         response = week_api.delete_week(event, context)
 
         # Assert
-        self.assertEqual(response["statusCode"], 204)
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(
+            json.loads(response["body"]),
+            {
+                "deleted": {
+                    "blocks": 0,
+                    "weeks": 1,
+                    "days": 7,
+                    "workouts": 2,
+                    "exercises": 10,
+                }
+            },
+        )
         mock_delete_week.assert_called_once_with("week123")
 
+    @patch("src.services.block_service.BlockService.get_block")
+    @patch("src.services.week_service.WeekService.get_week")
+    @patch("src.services.week_service.WeekService.delete_week")
+    def test_delete_week_cascade_failure(
+        self, mock_delete_week, mock_get_week, mock_get_block
+    ):
+        """
+        Test a cascade that fails partway is reported as a server error
+        """
+        mock_existing = MagicMock()
+        mock_existing.block_id = "block456"
+        mock_get_week.return_value = mock_existing
+
+        mock_block = MagicMock()
+        mock_block.athlete_id = "athlete456"
+        mock_block.coach_id = "coach789"
+        mock_get_block.return_value = mock_block
+
+        mock_delete_week.side_effect = RuntimeError(
+            "BatchWriteItem left 3 requests unprocessed"
+        )
+
+        event = {
+            "pathParameters": {"week_id": "week123"},
+            "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+        }
+
+        response = week_api.delete_week(event, {})
+
+        self.assertEqual(response["statusCode"], 500)
+        self.assertNotIn("deleted", json.loads(response["body"]))
+
     @patch("src.services.week_service.WeekService.get_week")
     def test_delete_week_not_found(self, mock_get_week):
         """
@@ -537,6 +588,111 @@ class TestWeekAPI(BaseTest):
         self.assertEqual(response["statusCode"], 403)
         mock_delete_week.assert_not_called()
 
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_week")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_week_athletes")
+    def test_copy_week_success(self, mock_get_week_athletes, mock_clone_week):
+        """
+        Test copying a week's workouts onto another week
+        """
+        mock_get_week_athletes.return_value = {
+            "week1": "athlete456",
+            "week2": "athlete456",
+        }
+        mock_clone_week.return_value = {"workouts": 3, "exercises": 12}
+
+        event = {
+            "pathParameters": {"week_id": "week1"},
+            "body": json.dumps({"target_week_id": "week2", "strip_sets_data": True}),
+            "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+        }
+        response = week_api.copy_week(event, {})
+
+        self.assertEqual(response["statusCode"], 201)
+        self.assertEqual(
+            json.loads(response["body"]),
+            {
+                "week_id": "week1",
+                "target_week_id": "week2",
+                "workouts": 3,
+                "exercises": 12,
+            },
+        )
+        mock_get_week_athletes.assert_called_once_with(["week1", "week2"])
+        mock_clone_week.assert_called_once_with(
+            "week1", "week2", "athlete456", strip_sets_data=True
+        )
+
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_week")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_week_athletes")
+    def test_copy_week_target_not_found(self, mock_get_week_athletes, mock_clone_week):
+        """
+        Test copying onto a week that doesn't exist
+        """
+        mock_get_week_athletes.return_value = {"week1": "athlete456"}
+
+        event = {
+            "pathParameters": {"week_id": "week1"},
+            "body": json.dumps({"target_week_id": "missing"}),
+            "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+        }
+        response = week_api.copy_week(event, {})
+
+        self.assertEqual(response["statusCode"], 404)
+        self.assertEqual(json.loads(response["body"])["error"], "Target week not found")
+        mock_clone_week.assert_not_called()
+
+    @patch(
+        "src.services.relationship_service.RelationshipService.get_active_relationship"
+    )
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_week")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_week_athletes")
+    def test_copy_week_unauthorized(
+        self, mock_get_week_athletes, mock_clone_week, mock_get_relationship
+    ):
+        """
+        Test copying another athlete's week without a coaching relationship
+        """
+        mock_get_week_athletes.return_value = {
+            "week1": "athlete456",
+            "week2": "athlete456",
+        }
+        mock_get_relationship.return_value = None
+
+        event = {
+            "pathParameters": {"week_id": "week1"},
+            "body": json.dumps({"target_week_id": "week2"}),
+            "requestContext": {"authorizer": {"claims": {"sub": "other-user"}}},
+        }
+        response = week_api.copy_week(event, {})
+
+        self.assertEqual(response["statusCode"], 403)
+        mock_clone_week.assert_not_called()
+
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_week")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_week_athletes")
+    def test_copy_week_target_has_workouts(
+        self, mock_get_week_athletes, mock_clone_week
+    ):
+        """
+        Test copying onto a week that already has workouts
+        """
+        mock_get_week_athletes.return_value = {
+            "week1": "athlete456",
+            "week2": "athlete456",
+        }
+        mock_clone_week.side_effect = CloneConflictError(
+            "Target week already has workouts"
+        )
+
+        event = {
+            "pathParameters": {"week_id": "week1"},
+            "body": json.dumps({"target_week_id": "week2"}),
+            "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+        }
+        response = week_api.copy_week(event, {})
+
+        self.assertEqual(response["statusCode"], 409)
+
 
 if __name__ == "__main__":
     unittest.main()
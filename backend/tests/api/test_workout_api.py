@@ -7,6 +7,8 @@ from src.models.week import Week
 from src.models.block import Block
 from src.models.workout import Workout
 from src.models.relationship import Relationship
+from src.config.workout_config import WorkoutConfig
+from src.services.program_clone_service import CloneConflictError
 
 
 # Import workout after the mocks are set up in BaseTest
@@ -290,9 +292,7 @@ class TestWorkoutAPI(BaseTest):
         response_body = json.loads(response["body"])
         self.assertIn("Workout not found", response_body["error"])
 
-    @patch(
-        "src.repositories.workout_repository.WorkoutRepository.get_workouts_by_athlete"
-    )
+    @patch("src.repositories.workout_repository.WorkoutRepository.get_workouts_page")
     def test_get_workouts_by_athlete(self, mock_get_workouts):
         """
         Test retrieving workouts by athlete
@@ -313,7 +313,7 @@ class TestWorkoutAPI(BaseTest):
                 "date": "2025-03-16",
             },
         ]
-        mock_get_workouts.return_value = mock_workouts
+        mock_get_workouts.return_value = (mock_workouts, None)
 
         # Override the boto3 resource for this specific test
         with patch("boto3.resource", return_value=self.mock_dynamodb):
@@ -332,11 +332,12 @@ class TestWorkoutAPI(BaseTest):
             self.assertEqual(len(response_body), 2)
             self.assertEqual(response_body[0]["workout_id"], "workout1")
             self.assertEqual(response_body[1]["workout_id"], "workout2")
-            mock_get_workouts.assert_called_once_with("athlete456")
+            mock_get_workouts.assert_called_once_with(
+                "athlete456", WorkoutConfig.MAX_ITEMS, None
+            )
+            self.assertNotIn("X-Next-Cursor", response["headers"])
 
-    @patch(
-        "src.repositories.workout_repository.WorkoutRepository.get_workouts_by_athlete"
-    )
+    @patch("src.repositories.workout_repository.WorkoutRepository.get_workouts_page")
     def test_get_workouts_by_athlete_exception(self, mock_get_workouts):
         """
         Test exception handling in get_workouts_by_athlete
@@ -360,6 +361,60 @@ class TestWorkoutAPI(BaseTest):
             response_body = json.loads(response["body"])
             self.assertEqual(response_body["error"], "Test exception")
 
+    @patch("src.repositories.workout_repository.WorkoutRepository.get_workouts_page")
+    def test_get_workouts_by_athlete_paginates_with_cursor(self, mock_get_workouts):
+        """
+        Test that the next-page cursor round-trips through the endpoint
+        """
+        last_key = {"workout_id": "workout1", "athlete_id": "athlete456"}
+        mock_get_workouts.return_value = ([{"workout_id": "workout1"}], last_key)
+
+        event = {
+            "pathParameters": {"athlete_id": "athlete456"},
+            "queryStringParameters": {"limit": "1"},
+            "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+        }
+
+        first_page = workout_api.get_workouts_by_athlete(event, {})
+
+        self.assertEqual(first_page["statusCode"], 200)
+        cursor = first_page["headers"]["X-Next-Cursor"]
+        mock_get_workouts.assert_called_with("athlete456", 1, None)
+
+        # Follow the cursor to the next page
+        mock_get_workouts.return_value = ([{"workout_id": "workout2"}], None)
+        event["queryStringParameters"] = {"limit": "1", "cursor": cursor}
+
+        second_page = workout_api.get_workouts_by_athlete(event, {})
+
+        self.assertEqual(second_page["statusCode"], 200)
+        self.assertNotIn("X-Next-Cursor", second_page["headers"])
+        mock_get_workouts.assert_called_with("athlete456", 1, last_key)
+
+    @patch("src.repositories.workout_repository.WorkoutRepository.get_workouts_page")
+    def test_get_workouts_by_athlete_invalid_cursor(self, mock_get_workouts):
+        """
+        Test that forged or foreign cursors are rejected
+        """
+        foreign_cursor = workout_api.encode_cursor(
+            {"workout_id": "w1", "athlete_id": "someone-else"},
+            "workouts:someone-else",
+        )
+
+        for cursor in ("forged-cursor", foreign_cursor):
+            with self.subTest(cursor=cursor):
+                event = {
+                    "pathParameters": {"athlete_id": "athlete456"},
+                    "queryStringParameters": {"cursor": cursor},
+                    "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+                }
+
+                response = workout_api.get_workouts_by_athlete(event, {})
+
+                self.assertEqual(response["statusCode"], 400)
+
+        mock_get_workouts.assert_not_called()
+
     @patch("src.services.workout_service.WorkoutService.get_workout")
     def test_get_workout_exception(self, mock_get_workout):
         """
@@ -610,6 +665,30 @@ class TestWorkoutAPI(BaseTest):
         self.assertEqual(response_body["error"], "Update error")
         mock_get_workout.assert_called_once()
 
+    @patch("src.services.workout_service.WorkoutService.update_workout")
+    @patch("src.services.workout_service.WorkoutService.get_workout")
+    def test_update_workout_invalid_exercise(
+        self, mock_get_workout, mock_update_workout
+    ):
+        """Test an incomplete new exercise is a bad request"""
+        mock_workout = MagicMock()
+        mock_workout.athlete_id = "test-user-id"
+        mock_get_workout.return_value = mock_workout
+        mock_update_workout.side_effect = ValueError(
+            "Invalid new exercise at position 1: sets must be positive"
+        )
+
+        event = {
+            "pathParameters": {"workout_id": "workout123"},
+            "requestContext": {"authorizer": {"claims": {"sub": "test-user-id"}}},
+            "body": json.dumps({"exercises": [{"exercise_id": "other-ex"}]}),
+        }
+
+        response = workout_api.update_workout(event, {})
+
+        self.assertEqual(response["statusCode"], 400)
+        self.assertIn("position 1", json.loads(response["body"])["error"])
+
     @patch("src.services.workout_service.WorkoutService.delete_workout")
     @patch("src.services.workout_service.WorkoutService.get_workout")
     def test_delete_workout_success(self, mock_get_workout, mock_delete_workout):
@@ -893,18 +972,12 @@ class TestWorkoutAPI(BaseTest):
     @patch(
         "src.services.relationship_service.RelationshipService.get_active_relationship"
     )
-    @patch("src.services.block_service.BlockService.get_block")
-    @patch("src.services.week_service.WeekService.get_week")
-    @patch("src.services.workout_service.WorkoutService.get_workout_by_day")
-    @patch("src.services.day_service.DayService.get_day")
-    @patch("src.services.workout_service.WorkoutService.create_workout")
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_day_athletes")
     def test_copy_workout_success(
         self,
-        mock_create_workout,
-        mock_get_day,
-        mock_get_workout,
-        mock_get_week,
-        mock_get_block,
+        mock_get_day_athletes,
+        mock_clone_day,
         mock_get_relationship,
         mock_get_preference,
         mock_convert_weights,
@@ -912,88 +985,33 @@ class TestWorkoutAPI(BaseTest):
         """
         Test successful workout copying from one day to another with weight conversion
         """
-        # Setup mocks - source day, week, block structure
-        mock_source_day = Day(
-            day_id="source-day-123",
-            week_id="week123",
-            day_number=1,
-            date="2025-03-15",
-            focus="squat",
-            notes="",
-        )
-
-        mock_week = Week(
-            week_id="week123", block_id="block456", week_number=1, notes=""
-        )
-        mock_get_week.return_value = mock_week
+        # Both days belong to the requesting athlete
+        mock_get_day_athletes.return_value = {
+            "source-day-123": "athlete456",
+            "target-day-789": "athlete456",
+        }
 
-        mock_block = Block(
-            block_id="block456",
-            athlete_id="athlete456",
-            coach_id=None,
-            title="Test Block",
-            description="Test",
-            start_date="2025-03-01",
-            end_date="2025-03-31",
-            status="active",
+        mock_clone_day.return_value = Workout.from_dict(
+            {
+                "workout_id": "new-workout-123",
+                "athlete_id": "athlete456",
+                "day_id": "target-day-789",
+                "date": "2025-03-20",
+                "status": "not_started",
+                "exercises": [
+                    {
+                        "exercise_id": "new-ex1",
+                        "workout_id": "new-workout-123",
+                        "exercise_type": "Bench Press",
+                        "sets": 3,
+                        "reps": 10,
+                        "weight": 225.0,
+                        "status": "planned",
+                        "order": 1,
+                    }
+                ],
+            }
         )
-        mock_get_block.return_value = mock_block
-
-        # No relationship needed since user is the athlete
-        mock_get_relationship.return_value = None
-
-        # Source workout with exercises
-        mock_source_workout = MagicMock()
-        mock_source_workout.exercises = [
-            MagicMock(
-                exercise_id="ex1",
-                exercise_type="Bench Press",
-                sets=3,
-                reps=10,
-                weight=225.0,
-                notes="Test notes",
-            ),
-            MagicMock(
-                exercise_id="ex2",
-                exercise_type="Squat",
-                sets=4,
-                reps=8,
-                weight=315.0,
-                notes="",
-            ),
-        ]
-        mock_get_workout.side_effect = [
-            mock_source_workout,
-            None,
-        ]  # First return source workout, then None for target
-
-        # Mock target day
-        mock_target_day = MagicMock()
-        mock_target_day.date = "2025-03-20"
-        mock_get_day.side_effect = [mock_source_day, mock_target_day]
-
-        # Mock new workout
-        mock_new_workout = MagicMock()
-        mock_new_workout.to_dict.return_value = {
-            "workout_id": "new-workout-123",
-            "athlete_id": "athlete456",
-            "day_id": "target-day-789",
-            "date": "2025-03-20",
-            "status": "not_started",
-            "exercises": [
-                {
-                    "exercise_id": "ex1",
-                    "exercise_type": "Bench Press",
-                    "weight": 225.0,
-                },
-                {
-                    "exercise_id": "ex2",
-                    "exercise_type": "Squat",
-                    "weight": 315.0,
-                },
-            ],
-        }
-        mock_create_workout.return_value = mock_new_workout
 
         # Mock user preference and weight conversion
         mock_get_preference.return_value = "auto"
@@ -1002,103 +1020,90 @@ class TestWorkoutAPI(BaseTest):
             "display_unit": "kg",
         }
 
-        # Prepare test event
         event = {
             "body": json.dumps(
                 {"source_day_id": "source-day-123", "target_day_id": "target-day-789"}
             ),
             "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
         }
-        context = {}
 
         # Call API
-        response = workout_api.copy_workout(event, context)
+        response = workout_api.copy_workout(event, {})
 
         # Assert response
         self.assertEqual(response["statusCode"], 201)
         response_body = json.loads(response["body"])
         self.assertEqual(response_body["workout_id"], "new-workout-123")
         self.assertEqual(response_body["day_id"], "target-day-789")
+        self.assertEqual(response_body["exercises"][0]["display_unit"], "kg")
 
-        # Verify weight conversion was called
+        # Both days are resolved together and no relationship lookup is needed
+        mock_get_day_athletes.assert_called_once_with(
+            ["source-day-123", "target-day-789"]
+        )
+        mock_get_relationship.assert_not_called()
+        mock_clone_day.assert_called_once_with(
+            "source-day-123",
+            "target-day-789",
+            "athlete456",
+            strip_sets_data=False,
+        )
         mock_get_preference.assert_called_once_with("athlete456")
-        self.assertTrue(mock_convert_weights.called)
-
-        # Verify service calls
-        mock_get_workout.assert_any_call("athlete456", "source-day-123")
-        mock_get_workout.assert_any_call("athlete456", "target-day-789")
-        # get_day called twice - first for source day, then for target day
-        self.assertEqual(mock_get_day.call_count, 2)
-        mock_get_day.assert_any_call("source-day-123")
-        mock_get_day.assert_any_call("target-day-789")
-
-        # Verify that create_workout was called with transformed exercises
-        mock_create_workout.assert_called_once()
-        call_args = mock_create_workout.call_args[1]
-        self.assertEqual(call_args["athlete_id"], "athlete456")
-        self.assertEqual(call_args["day_id"], "target-day-789")
-        self.assertEqual(call_args["date"], "2025-03-20")
-        self.assertEqual(call_args["status"], "not_started")
-
-        # Check that we properly transformed the exercises
-        exercises = call_args["exercises"]
-        self.assertEqual(len(exercises), 2)
-        self.assertEqual(exercises[0]["exercise_id"], "ex1")
-        self.assertEqual(exercises[0]["exercise_type"], "Bench Press")
-        self.assertEqual(exercises[1]["exercise_id"], "ex2")
-        self.assertEqual(exercises[1]["sets"], 4)
 
     @patch(
         "src.services.relationship_service.RelationshipService.get_active_relationship"
     )
-    @patch("src.services.block_service.BlockService.get_block")
-    @patch("src.services.week_service.WeekService.get_week")
-    @patch("src.services.workout_service.WorkoutService.get_workout_by_day")
-    @patch("src.services.day_service.DayService.get_day")
-    def test_copy_workout_source_not_found(
-        self,
-        mock_get_day,
-        mock_get_workout,
-        mock_get_week,
-        mock_get_block,
-        mock_get_relationship,
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_day_athletes")
+    def test_copy_workout_as_coach_strips_sets_data(
+        self, mock_get_day_athletes, mock_clone_day, mock_get_relationship
     ):
         """
-        Test copying when source workout doesn't exist
+        Test a coach copying an athlete's workout without per-set details
         """
-        # Setup - source day, week, block structure but workout not found
-        mock_source_day = Day(
-            day_id="source-day-123",
-            week_id="week123",
-            day_number=1,
-            date="2025-03-15",
-            focus="squat",
-            notes="",
+        mock_get_day_athletes.return_value = {
+            "source-day": "athlete456",
+            "target-day": "athlete456",
+        }
+        mock_get_relationship.return_value = MagicMock()
+        mock_clone_day.return_value = Workout(
+            workout_id="new-workout",
+            athlete_id="athlete456",
+            day_id="target-day",
+            date="2025-03-20",
         )
-        mock_get_day.return_value = mock_source_day
 
-        mock_week = Week(
-            week_id="week123", block_id="block456", week_number=1, notes=""
-        )
-        mock_get_week.return_value = mock_week
+        event = {
+            "body": json.dumps(
+                {
+                    "source_day_id": "source-day",
+                    "target_day_id": "target-day",
+                    "strip_sets_data": True,
+                }
+            ),
+            "requestContext": {"authorizer": {"claims": {"sub": "coach123"}}},
+        }
+        response = workout_api.copy_workout(event, {})
 
-        mock_block = Block(
-            block_id="block456",
-            athlete_id="athlete456",
-            coach_id=None,
-            title="Test Block",
-            description="Test",
-            start_date="2025-03-01",
-            end_date="2025-03-31",
-            status="active",
+        self.assertEqual(response["statusCode"], 201)
+        mock_get_relationship.assert_called_once_with(
+            coach_id="coach123", athlete_id="athlete456"
+        )
+        mock_clone_day.assert_called_once_with(
+            "source-day", "target-day", "athlete456", strip_sets_data=True
         )
-        mock_get_block.return_value = mock_block
-
-        # No relationship needed since user is the athlete
-        mock_get_relationship.return_value = None
 
-        # Source workout not found
-        mock_get_workout.return_value = None
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_day_athletes")
+    def test_copy_workout_source_not_found(self, mock_get_day_athletes, mock_clone_day):
+        """
+        Test copying when source workout doesn't exist
+        """
+        mock_get_day_athletes.return_value = {
+            "source-day-123": "athlete456",
+            "target-day-789": "athlete456",
+        }
+        mock_clone_day.return_value = None
 
         event = {
             "body": json.dumps(
@@ -1106,71 +1111,20 @@ class TestWorkoutAPI(BaseTest):
             ),
             "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
         }
-        context = {}
-
-        # Call API
-        response = workout_api.copy_workout(event, context)
+        response = workout_api.copy_workout(event, {})
 
         # Assert
         self.assertEqual(response["statusCode"], 404)
         response_body = json.loads(response["body"])
         self.assertEqual(response_body["error"], "Source workout not found")
-        mock_get_workout.assert_called_once_with("athlete456", "source-day-123")
 
-    @patch(
-        "src.services.relationship_service.RelationshipService.get_active_relationship"
-    )
-    @patch("src.services.block_service.BlockService.get_block")
-    @patch("src.services.week_service.WeekService.get_week")
-    @patch("src.services.workout_service.WorkoutService.get_workout_by_day")
-    @patch("src.services.day_service.DayService.get_day")
-    def test_copy_workout_target_not_found(
-        self,
-        mock_get_day,
-        mock_get_workout,
-        mock_get_week,
-        mock_get_block,
-        mock_get_relationship,
-    ):
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_day_athletes")
+    def test_copy_workout_target_not_found(self, mock_get_day_athletes, mock_clone_day):
         """
         Test copying when target day doesn't exist
         """
-        # Setup - source day, week, block exist, source workout exists, but target day doesn't
-        mock_source_day = Day(
-            day_id="source-day-123",
-            week_id="week123",
-            day_number=1,
-            date="2025-03-15",
-            focus="squat",
-            notes="",
-        )
-
-        mock_week = Week(
-            week_id="week123", block_id="block456", week_number=1, notes=""
-        )
-        mock_get_week.return_value = mock_week
-
-        mock_block = Block(
-            block_id="block456",
-            athlete_id="athlete456",
-            coach_id=None,
-            title="Test Block",
-            description="Test",
-            start_date="2025-03-01",
-            end_date="2025-03-31",
-            status="active",
-        )
-        mock_get_block.return_value = mock_block
-
-        # No relationship needed since user is the athlete
-        mock_get_relationship.return_value = None
-
-        # Source workout exists
-        mock_source_workout = MagicMock()
-        mock_get_workout.return_value = mock_source_workout
-
-        # Source day exists, target day doesn't exist
-        mock_get_day.side_effect = [mock_source_day, None]
+        mock_get_day_athletes.return_value = {"source-day-123": "athlete456"}
 
         event = {
             "body": json.dumps(
@@ -1178,76 +1132,29 @@ class TestWorkoutAPI(BaseTest):
             ),
             "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
         }
-        context = {}
-
-        # Call API
-        response = workout_api.copy_workout(event, context)
+        response = workout_api.copy_workout(event, {})
 
         # Assert
         self.assertEqual(response["statusCode"], 404)
         response_body = json.loads(response["body"])
         self.assertEqual(response_body["error"], "Target day not found")
-        # Verify calls - get_day called twice (source + target), get_workout called once
-        self.assertEqual(mock_get_day.call_count, 2)
-        mock_get_workout.assert_called_once_with("athlete456", "source-day-123")
+        mock_clone_day.assert_not_called()
 
-    @patch(
-        "src.services.relationship_service.RelationshipService.get_active_relationship"
-    )
-    @patch("src.services.block_service.BlockService.get_block")
-    @patch("src.services.week_service.WeekService.get_week")
-    @patch("src.services.workout_service.WorkoutService.get_workout_by_day")
-    @patch("src.services.day_service.DayService.get_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_day_athletes")
     def test_copy_workout_target_has_workout(
-        self,
-        mock_get_day,
-        mock_get_workout,
-        mock_get_week,
-        mock_get_block,
-        mock_get_relationship,
+        self, mock_get_day_athletes, mock_clone_day
     ):
         """
         Test copying when target day already has a workout
         """
-        # Setup - source day, week, block structure
-        mock_source_day = Day(
-            day_id="source-day-123",
-            week_id="week123",
-            day_number=1,
-            date="2025-03-15",
-            focus="squat",
-            notes="",
-        )
-
-        mock_week = Week(
-            week_id="week123", block_id="block456", week_number=1, notes=""
-        )
-        mock_get_week.return_value = mock_week
-
-        mock_block = Block(
-            block_id="block456",
-            athlete_id="athlete456",
-            coach_id=None,
-            title="Test Block",
-            description="Test",
-            start_date="2025-03-01",
-            end_date="2025-03-31",
-            status="active",
+        mock_get_day_athletes.return_value = {
+            "source-day-123": "athlete456",
+            "target-day-789": "athlete456",
+        }
+        mock_clone_day.side_effect = CloneConflictError(
+            "Target day already has a workout"
         )
-        mock_get_block.return_value = mock_block
-
-        # No relationship needed since user is the athlete
-        mock_get_relationship.return_value = None
-
-        # Both source and target workouts exist
-        mock_source_workout = MagicMock()
-        mock_target_workout = MagicMock()
-        mock_get_workout.side_effect = [mock_source_workout, mock_target_workout]
-
-        # Both days exist
-        mock_target_day = MagicMock()
-        mock_target_day.date = "2025-03-20"
-        mock_get_day.side_effect = [mock_source_day, mock_target_day]
 
         event = {
             "body": json.dumps(
@@ -1255,10 +1162,7 @@ class TestWorkoutAPI(BaseTest):
             ),
             "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
         }
-        context = {}
-
-        # Call API
-        response = workout_api.copy_workout(event, context)
+        response = workout_api.copy_workout(event, {})
 
         # Assert
         self.assertEqual(response["statusCode"], 409)
@@ -1808,17 +1712,10 @@ class TestWorkoutAPI(BaseTest):
         response_body = json.loads(response["body"])
         self.assertEqual(response_body["error"], "Database connection error")
 
-    @patch(
-        "src.services.relationship_service.RelationshipService.get_active_relationship"
-    )
-    @patch("src.services.block_service.BlockService.get_block")
-    @patch("src.services.week_service.WeekService.get_week")
-    @patch("src.services.day_service.DayService.get_day")
-    def test_copy_workout_source_day_not_found(
-        self, mock_get_day, mock_get_week, mock_get_block, mock_get_relationship
-    ):
-        """Test copying when source day doesn't exist"""
-        mock_get_day.return_value = None
+    @patch("src.services.program_clone_service.ProgramCloneService.get_day_athletes")
+    def test_copy_workout_source_day_not_found(self, mock_get_day_athletes):
+        """Test copying when source day, or its week or block, doesn't exist"""
+        mock_get_day_athletes.return_value = {"target-day": "athlete456"}
 
         event = {
             "body": json.dumps(
@@ -1832,44 +1729,16 @@ class TestWorkoutAPI(BaseTest):
         response_body = json.loads(response["body"])
         self.assertEqual(response_body["error"], "Source day not found")
 
-    @patch(
-        "src.services.relationship_service.RelationshipService.get_active_relationship"
-    )
-    @patch("src.services.block_service.BlockService.get_block")
-    @patch("src.services.week_service.WeekService.get_week")
-    @patch("src.services.day_service.DayService.get_day")
-    def test_copy_workout_week_not_found(
-        self, mock_get_day, mock_get_week, mock_get_block, mock_get_relationship
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_day_athletes")
+    def test_copy_workout_different_athletes(
+        self, mock_get_day_athletes, mock_clone_day
     ):
-        """Test copying when week doesn't exist"""
-        mock_get_day.return_value = MagicMock(day_id="source-day", week_id="week123")
-        mock_get_week.return_value = None
-
-        event = {
-            "body": json.dumps(
-                {"source_day_id": "source-day", "target_day_id": "target-day"}
-            ),
-            "requestContext": {"authorizer": {"claims": {"sub": "athlete456"}}},
+        """Test copying onto a day of another athlete's block"""
+        mock_get_day_athletes.return_value = {
+            "source-day": "athlete456",
+            "target-day": "other-athlete",
         }
-        response = workout_api.copy_workout(event, {})
-
-        self.assertEqual(response["statusCode"], 404)
-        response_body = json.loads(response["body"])
-        self.assertEqual(response_body["error"], "Week not found")
-
-    @patch(
-        "src.services.relationship_service.RelationshipService.get_active_relationship"
-    )
-    @patch("src.services.block_service.BlockService.get_block")
-    @patch("src.services.week_service.WeekService.get_week")
-    @patch("src.services.day_service.DayService.get_day")
-    def test_copy_workout_block_not_found(
-        self, mock_get_day, mock_get_week, mock_get_block, mock_get_relationship
-    ):
-        """Test copying when block doesn't exist"""
-        mock_get_day.return_value = MagicMock(day_id="source-day", week_id="week123")
-        mock_get_week.return_value = MagicMock(week_id="week123", block_id="block456")
-        mock_get_block.return_value = None
 
         event = {
             "body": json.dumps(
@@ -1879,25 +1748,22 @@ class TestWorkoutAPI(BaseTest):
         }
         response = workout_api.copy_workout(event, {})
 
-        self.assertEqual(response["statusCode"], 404)
-        response_body = json.loads(response["body"])
-        self.assertEqual(response_body["error"], "Block not found")
+        self.assertEqual(response["statusCode"], 400)
+        mock_clone_day.assert_not_called()
 
     @patch(
         "src.services.relationship_service.RelationshipService.get_active_relationship"
     )
-    @patch("src.services.block_service.BlockService.get_block")
-    @patch("src.services.week_service.WeekService.get_week")
-    @patch("src.services.day_service.DayService.get_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.clone_day")
+    @patch("src.services.program_clone_service.ProgramCloneService.get_day_athletes")
     def test_copy_workout_unauthorized_coach(
-        self, mock_get_day, mock_get_week, mock_get_block, mock_get_relationship
+        self, mock_get_day_athletes, mock_clone_day, mock_get_relationship
     ):
         """Test copying when coach doesn't have relationship with athlete"""
-        mock_get_day.return_value = MagicMock(day_id="source-day", week_id="week123")
-        mock_get_week.return_value = MagicMock(week_id="week123", block_id="block456")
-        mock_get_block.return_value = MagicMock(
-            block_id="block456", athlete_id="different-athlete"
-        )
+        mock_get_day_athletes.return_value = {
+            "source-day": "different-athlete",
+            "target-day": "different-athlete",
+        }
         mock_get_relationship.return_value = None  # No relationship found
 
         event = {
@@ -1915,6 +1781,7 @@ class TestWorkoutAPI(BaseTest):
         self.assertEqual(
             response_body["error"], "Unauthorized to copy workout for this athlete"
         )
+        mock_clone_day.assert_not_called()
 
     # IDOR Tests
 
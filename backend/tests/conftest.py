@@ -16,6 +16,10 @@ os.environ["COMPLETED_EXERCISES_TABLE"] = "CompletedExercises-Test"
 os.environ["RELATIONSHIPS_TABLE"] = "Relationships-Test"
 os.environ["SETS_TABLE"] = "Sets-Test"
 os.environ["REGION"] = "us-east-1"
+os.environ["PAGINATION_CURSOR_SECRET"] = "test-cursor-secret"
+
+from src.utils.dynamodb_pool import reset_dynamodb_pool  # noqa: E402
+from src.utils.dynamodb_retry import reset_retry_state  # noqa: E402
 
 
 class LambdaContext:
@@ -86,6 +90,16 @@ def mock_boto3():
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def reset_dynamodb_handles():
+    """Drop shared DynamoDB handles so each test's boto3 patches take effect"""
+    reset_dynamodb_pool()
+    reset_retry_state()
+    yield
+    reset_dynamodb_pool()
+    reset_retry_state()
+
+
 @pytest.fixture
 def mock_dynamodb_table():
     """Simple mock for a DynamoDB table"""
@@ -281,11 +295,16 @@ def workouts_table(dynamodb):
             {"AttributeName": "workout_id", "AttributeType": "S"},
             {"AttributeName": "athlete_id", "AttributeType": "S"},
             {"AttributeName": "day_id", "AttributeType": "S"},
+            {"AttributeName": "date", "AttributeType": "S"},
+            {"AttributeName": "athlete_status", "AttributeType": "S"},
         ],
         GlobalSecondaryIndexes=[
             {
-                "IndexName": "athlete-index",
-                "KeySchema": [{"AttributeName": "athlete_id", "KeyType": "HASH"}],
+                "IndexName": "athlete-date-index",
+                "KeySchema": [
+                    {"AttributeName": "athlete_id", "KeyType": "HASH"},
+                    {"AttributeName": "date", "KeyType": "RANGE"},
+                ],
                 "Projection": {"ProjectionType": "ALL"},
                 "ProvisionedThroughput": {
                     "ReadCapacityUnits": 1,
@@ -293,8 +312,23 @@ def workouts_table(dynamodb):
                 },
             },
             {
-                "IndexName": "day-index",
-                "KeySchema": [{"AttributeName": "day_id", "KeyType": "HASH"}],
+                "IndexName": "athlete-status-index",
+                "KeySchema": [
+                    {"AttributeName": "athlete_status", "KeyType": "HASH"},
+                    {"AttributeName": "date", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": 1,
+                    "WriteCapacityUnits": 1,
+                },
+            },
+            {
+                "IndexName": "day-athlete-index",
+                "KeySchema": [
+                    {"AttributeName": "day_id", "KeyType": "HASH"},
+                    {"AttributeName": "athlete_id", "KeyType": "RANGE"},
+                ],
                 "Projection": {"ProjectionType": "ALL"},
                 "ProvisionedThroughput": {
                     "ReadCapacityUnits": 1,
@@ -211,6 +211,37 @@ class TestBlockLambda(BaseTest):
             # Restore the original function
             block_lambda.ROUTE_MAP["DELETE /blocks/{block_id}"] = original_func
 
+    def test_copy_block_route(self):
+        """Test successful routing to copy_block function"""
+        # Setup - Mock the function in the ROUTE_MAP directly
+        original_func = block_lambda.ROUTE_MAP["POST /blocks/{block_id}/copy"]
+
+        # Replace with our mock
+        mock_response = {"statusCode": 201, "body": json.dumps({})}
+        block_lambda.ROUTE_MAP["POST /blocks/{block_id}/copy"] = MagicMock(
+            return_value=mock_response
+        )
+
+        try:
+            event = {
+                "httpMethod": "POST",
+                "resource": "/blocks/{block_id}/copy",
+                "pathParameters": {"block_id": "block123"},
+            }
+            context = {}
+
+            # Call the Lambda handler
+            response = block_lambda.handler(event, context)
+
+            # Assert
+            self.assertEqual(response["statusCode"], 201)
+            block_lambda.ROUTE_MAP[
+                "POST /blocks/{block_id}/copy"
+            ].assert_called_once_with(event, context)
+        finally:
+            # Restore the original function
+            block_lambda.ROUTE_MAP["POST /blocks/{block_id}/copy"] = original_func
+
     def test_route_not_found(self):
         """Test handling of non-existent route"""
         # Setup
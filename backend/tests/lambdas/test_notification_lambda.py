@@ -1,7 +1,11 @@
 import unittest
 from unittest.mock import MagicMock, patch
 import json
-from src.lambdas.notification_lambda.notification_lambda import handler, ROUTE_MAP
+from src.lambdas.notification_lambda.notification_lambda import (
+    handler,
+    reconcile_unread_counts,
+    ROUTE_MAP,
+)
 
 
 class TestNotificationLambda(unittest.TestCase):
@@ -15,6 +19,9 @@ class TestNotificationLambda(unittest.TestCase):
         # Verify expected routes exist in ROUTE_MAP
         expected_routes = [
             "GET /notifications",
+            "GET /notifications/unread-count",
+            "GET /notifications/{notification_id}/workout",
+            "PATCH /notifications/read",
             "PATCH /notifications/{notification_id}/read",
         ]
 
@@ -584,6 +591,16 @@ class TestNotificationLambda(unittest.TestCase):
             # Restore the original function
             ROUTE_MAP["GET /notifications"] = original_func
 
+    @patch("src.lambdas.notification_lambda.notification_lambda.NotificationService")
+    def test_reconcile_unread_counts_reports_coaches(self, mock_service_class):
+        """Test the scheduled reconcile handler delegates to the service"""
+        mock_service_class.return_value.reconcile_unread_counts.return_value = 3
+
+        result = reconcile_unread_counts({}, self.context)
+
+        self.assertEqual(result, {"coaches_reconciled": 3})
+        mock_service_class.return_value.reconcile_unread_counts.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
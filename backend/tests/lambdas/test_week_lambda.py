@@ -163,6 +163,37 @@ class TestWeekLambda(BaseTest):
             # Restore the original function
             week_lambda.ROUTE_MAP["DELETE /weeks/{week_id}"] = original_func
 
+    def test_copy_week_route(self):
+        """Test successful routing to copy_week function"""
+        # Setup - Mock the function in the ROUTE_MAP directly
+        original_func = week_lambda.ROUTE_MAP["POST /weeks/{week_id}/copy"]
+
+        # Replace with our mock
+        mock_response = {"statusCode": 201, "body": json.dumps({})}
+        week_lambda.ROUTE_MAP["POST /weeks/{week_id}/copy"] = MagicMock(
+            return_value=mock_response
+        )
+
+        try:
+            event = {
+                "httpMethod": "POST",
+                "resource": "/weeks/{week_id}/copy",
+                "pathParameters": {"week_id": "week123"},
+            }
+            context = {}
+
+            # Call the Lambda handler
+            response = week_lambda.handler(event, context)
+
+            # Assert
+            self.assertEqual(response["statusCode"], 201)
+            week_lambda.ROUTE_MAP["POST /weeks/{week_id}/copy"].assert_called_once_with(
+                event, context
+            )
+        finally:
+            # Restore the original function
+            week_lambda.ROUTE_MAP["POST /weeks/{week_id}/copy"] = original_func
+
     def test_route_not_found(self):
         """Test handling of non-existent route"""
         # Setup
@@ -226,6 +226,26 @@ class TestLambdaMiddleware(unittest.TestCase):
         # Check that the handler was called with the event
         handler.assert_called_once_with(event, context)
 
+    def test_with_middleware_opens_request_scope(self):
+        """
+        Test each invocation gets its own identity map, closed when it returns
+        """
+        from src.utils.identity_map import get_identity_map
+
+        seen = []
+
+        def handler(event, context):
+            seen.append(get_identity_map())
+            return create_response(200, {"message": "Success"})
+
+        decorated_handler = with_middleware()(handler)
+        decorated_handler({}, MagicMock())
+        decorated_handler({}, MagicMock())
+
+        self.assertIsNotNone(seen[0])
+        self.assertIsNot(seen[0], seen[1])
+        self.assertIsNone(get_identity_map())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -106,6 +106,37 @@ class TestExerciseModel(unittest.TestCase):
         self.assertEqual(exercise_dict["notes"], "Focus on bracing into belt")
         self.assertEqual(exercise_dict["order"], 1)
 
+        # Index keys are left out until known, since they cannot be stored as null
+        self.assertNotIn("athlete_id", exercise_dict)
+        self.assertNotIn("workout_date", exercise_dict)
+
+        self.assertIsNone(exercise_dict["sets_data"])
+        self.assertIsNone(exercise_dict["planned_sets_data"])
+
+    def test_to_dict_with_workout_context(self):
+        """
+        Test athlete_id and workout_date round-trip through to_dict and from_dict
+        """
+        exercise = Exercise(
+            exercise_id="ex123",
+            workout_id="workout456",
+            exercise_type="Squat",
+            sets=5,
+            reps=5,
+            weight=315.0,
+            athlete_id="athlete789",
+            workout_date="2025-03-15",
+        )
+
+        exercise_dict = exercise.to_dict()
+
+        self.assertEqual(exercise_dict["athlete_id"], "athlete789")
+        self.assertEqual(exercise_dict["workout_date"], "2025-03-15")
+
+        restored = Exercise.from_dict(exercise_dict)
+        self.assertEqual(restored.athlete_id, "athlete789")
+        self.assertEqual(restored.workout_date, "2025-03-15")
+
     def test_from_dict(self):
         """
         Test creating Exercise from dictionary using from_dict
@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 from unittest.mock import patch
 from src.models.notification import Notification
 
@@ -15,12 +16,13 @@ class TestNotification(unittest.TestCase):
             "athlete_name": "John Athlete",
             "workout_id": "workout-abc",
             "day_info": "Day 5 (2024-06-25)",
-            "workout_data": {
-                "workout_id": "workout-abc",
-                "exercises": [
-                    {"exercise_type": "Squat", "sets": 3, "reps": 5, "weight": 225}
-                ],
+            "workout_summary": {
+                "status": "completed",
+                "exercise_count": 1,
+                "completed_sets": 3,
+                "total_volume": 3375.0,
                 "duration_minutes": 90,
+                "top_sets": [{"exercise_type": "Squat", "weight": 225.0, "reps": 5}],
             },
             "created_at": self.test_timestamp,
             "is_read": False,
@@ -39,7 +41,7 @@ class TestNotification(unittest.TestCase):
             athlete_name="John Athlete",
             workout_id="workout-abc",
             day_info="Day 5 (2024-06-25)",
-            workout_data={"test": "data"},
+            workout_summary={"test": "data"},
             created_at="2024-06-25T10:30:00Z",
             is_read=True,
             notification_type="workout_completion",
@@ -51,7 +53,7 @@ class TestNotification(unittest.TestCase):
         self.assertEqual(notification.athlete_name, "John Athlete")
         self.assertEqual(notification.workout_id, "workout-abc")
         self.assertEqual(notification.day_info, "Day 5 (2024-06-25)")
-        self.assertEqual(notification.workout_data, {"test": "data"})
+        self.assertEqual(notification.workout_summary, {"test": "data"})
         self.assertEqual(notification.created_at, "2024-06-25T10:30:00Z")
         self.assertTrue(notification.is_read)
         self.assertEqual(notification.notification_type, "workout_completion")
@@ -68,7 +70,7 @@ class TestNotification(unittest.TestCase):
             athlete_name="John Athlete",
             workout_id="workout-abc",
             day_info="Day 5 (2024-06-25)",
-            workout_data={"test": "data"},
+            workout_summary={"test": "data"},
         )
 
         # Check defaults are applied
@@ -93,7 +95,7 @@ class TestNotification(unittest.TestCase):
             "athlete_name",
             "workout_id",
             "day_info",
-            "workout_data",
+            "workout_summary",
             "created_at",
             "is_read",
             "notification_type",
@@ -121,7 +123,8 @@ class TestNotification(unittest.TestCase):
         self.assertEqual(notification.workout_id, "workout-abc")
         self.assertEqual(notification.day_info, "Day 5 (2024-06-25)")
         self.assertEqual(
-            notification.workout_data, self.test_notification_data["workout_data"]
+            notification.workout_summary,
+            self.test_notification_data["workout_summary"],
         )
         self.assertEqual(notification.created_at, self.test_timestamp)
         self.assertFalse(notification.is_read)
@@ -139,7 +142,7 @@ class TestNotification(unittest.TestCase):
             "athlete_name": "John Athlete",
             "workout_id": "workout-abc",
             "day_info": "Day 5 (2024-06-25)",
-            "workout_data": {"test": "data"},
+            "workout_summary": {"test": "data"},
         }
 
         notification = Notification.from_dict(minimal_data)
@@ -180,7 +183,8 @@ class TestNotification(unittest.TestCase):
             original_notification.day_info, reconstructed_notification.day_info
         )
         self.assertEqual(
-            original_notification.workout_data, reconstructed_notification.workout_data
+            original_notification.workout_summary,
+            reconstructed_notification.workout_summary,
         )
         self.assertEqual(
             original_notification.created_at, reconstructed_notification.created_at
@@ -206,53 +210,72 @@ class TestNotification(unittest.TestCase):
         # Should now be read
         self.assertTrue(notification.is_read)
 
-    def test_complex_workout_data_storage(self):
-        """Test that complex workout data is stored and retrieved correctly."""
-        complex_workout_data = {
+    def test_summarize_workout(self):
+        """Test the summary keeps counts, volume, duration and each exercise's top set."""
+        workout_data = {
             "workout_id": "workout-abc",
             "athlete_id": "athlete-789",
+            "status": "completed",
             "exercises": [
                 {
                     "exercise_id": "ex-1",
                     "exercise_type": "Squat",
-                    "sets": 3,
-                    "reps": 5,
-                    "weight": 225,
                     "sets_data": [
-                        {
-                            "reps": 5,
-                            "weight": 225,
-                            "completed": True,
-                            "notes": "Good depth",
-                        },
-                        {"reps": 5, "weight": 225, "completed": True, "notes": ""},
-                        {
-                            "reps": 4,
-                            "weight": 225,
-                            "completed": True,
-                            "notes": "Failed last rep",
-                        },
+                        {"reps": 5, "weight": 225, "completed": True},
+                        {"reps": 3, "weight": 245, "completed": True},
+                        {"reps": 1, "weight": 315, "completed": False},
                     ],
-                }
+                },
+                {
+                    "exercise_id": "ex-2",
+                    "exercise_type": "Bench Press",
+                    "sets_data": [
+                        {"reps": 8, "weight": Decimal("135"), "completed": True},
+                        {"reps": 10, "weight": Decimal("135"), "completed": True},
+                    ],
+                },
+                {"exercise_id": "ex-3", "exercise_type": "Plank", "sets_data": None},
             ],
             "start_time": "2024-06-25T10:00:00Z",
             "finish_time": "2024-06-25T11:30:00Z",
-            "duration_minutes": 90,
-            "notes": "Great session overall",
         }
 
+        summary = Notification.summarize_workout(workout_data)
+
+        self.assertEqual(
+            summary,
+            {
+                "status": "completed",
+                "exercise_count": 3,
+                "completed_sets": 4,
+                "total_volume": 5 * 225 + 3 * 245 + 8 * 135 + 10 * 135,
+                "duration_minutes": 90,
+                "top_sets": [
+                    {"exercise_type": "Squat", "weight": 245.0, "reps": 3},
+                    {"exercise_type": "Bench Press", "weight": 135.0, "reps": 10},
+                ],
+            },
+        )
+
+    def test_from_dict_summarizes_legacy_workout_data(self):
+        """Test items stored with the full workout are summarized when read."""
         data = self.test_notification_data.copy()
-        data["workout_data"] = complex_workout_data
+        del data["workout_summary"]
+        data["workout_data"] = {
+            "workout_id": "workout-abc",
+            "exercises": [
+                {
+                    "exercise_type": "Squat",
+                    "sets_data": [{"reps": 5, "weight": 225, "completed": True}],
+                }
+            ],
+        }
 
         notification = Notification.from_dict(data)
 
-        # Verify complex data is preserved
-        self.assertEqual(notification.workout_data, complex_workout_data)
-        self.assertEqual(
-            notification.workout_data["exercises"][0]["sets_data"][0]["notes"],
-            "Good depth",
-        )
-        self.assertEqual(notification.workout_data["duration_minutes"], 90)
+        self.assertEqual(notification.workout_summary["exercise_count"], 1)
+        self.assertEqual(notification.workout_summary["total_volume"], 1125.0)
+        self.assertNotIn("workout_data", notification.to_dict())
 
     def test_notification_immutability_after_to_dict(self):
         """Test that modifying the dict returned by to_dict doesn't affect the original notification."""
@@ -261,11 +284,11 @@ class TestNotification(unittest.TestCase):
 
         # Modify the returned dict
         result_dict["coach_id"] = "modified-coach"
-        result_dict["workout_data"]["new_field"] = "new_value"
+        result_dict["workout_summary"]["new_field"] = "new_value"
 
         # Original notification should be unchanged
         self.assertEqual(notification.coach_id, "coach-456")
-        self.assertNotIn("new_field", notification.workout_data)
+        self.assertNotIn("new_field", notification.workout_summary)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,10 @@
 import unittest
 from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError, ReadTimeoutError
 from src.repositories.base_repository import BaseRepository
+from src.utils.dynamodb_pool import reset_dynamodb_pool
+from src.utils.dynamodb_retry import get_retry_metrics
+from src.utils.identity_map import request_scope
 from decimal import Decimal
 
 
@@ -26,14 +30,32 @@ class TestBaseRepository(unittest.TestCase):
         """
         Test BaseRepository initialization
         """
-        # Create a new mock to avoid interference from setUp
+        # Create a new mock and drop the shared handles cached by setUp
         new_dynamodb_mock = MagicMock()
+        reset_dynamodb_pool()
 
         # Test initialization with table name
         with patch("boto3.resource", return_value=new_dynamodb_mock):
             repo = BaseRepository("test-table")
             new_dynamodb_mock.Table.assert_called_once_with("test-table")
 
+    def test_init_shares_dynamodb_resource(self):
+        """
+        Test that repositories reuse one DynamoDB resource and table handle
+        """
+        new_dynamodb_mock = MagicMock()
+        reset_dynamodb_pool()
+
+        with patch("boto3.resource", return_value=new_dynamodb_mock) as mock_resource:
+            repo1 = BaseRepository("test-table")
+            repo2 = BaseRepository("test-table")
+            repo3 = BaseRepository("other-table")
+
+        mock_resource.assert_called_once()
+        self.assertIs(repo1.table, repo2.table)
+        self.assertIs(repo1.dynamodb, repo3.dynamodb)
+        self.assertEqual(new_dynamodb_mock.Table.call_count, 2)
+
     def test_get_by_id(self):
         """
         Test retrieving an item by ID
@@ -53,6 +75,73 @@ class TestBaseRepository(unittest.TestCase):
         # Assert the result is the mock item
         self.assertEqual(result, mock_item)
 
+    def test_get_by_id_within_request_scope(self):
+        """
+        Test an item is fetched once per request and projections are served from it
+        """
+        self.table_mock.get_item.return_value = {
+            "Item": {"id": "item123", "name": "Test Item", "weight": Decimal("2.5")}
+        }
+
+        with request_scope():
+            first = self.repo.get_by_id("id", "item123")
+            first["name"] = "Mutated"
+            second = self.repo.get_by_id("id", "item123")
+            projected = self.repo.get_by_id("id", "item123", attributes=["name"])
+
+        self.table_mock.get_item.assert_called_once_with(Key={"id": "item123"})
+        self.assertEqual(second["name"], "Test Item")
+        self.assertEqual(second["weight"], 2.5)
+        self.assertEqual(projected, {"name": "Test Item"})
+
+        # Outside a scope every call reads through
+        self.repo.get_by_id("id", "item123")
+        self.assertEqual(self.table_mock.get_item.call_count, 2)
+
+    def test_get_by_id_within_request_scope_sees_writes(self):
+        """
+        Test updates and deletes made in the request are reflected in later reads
+        """
+        self.table_mock.get_item.return_value = {"Item": {"id": "a", "v": 1}}
+        self.table_mock.update_item.return_value = {"Attributes": {"id": "a", "v": 2}}
+        self.table_mock.delete_item.return_value = {}
+
+        with request_scope():
+            self.repo.get_by_id("id", "a")
+            self.repo.update({"id": "a"}, "set v = :v", {":v": 2})
+            self.assertEqual(self.repo.get_by_id("id", "a"), {"id": "a", "v": 2})
+
+            self.repo.delete({"id": "a"})
+            self.assertIsNone(self.repo.get_by_id("id", "a"))
+
+            self.repo.create({"id": "a", "v": 3})
+            self.assertEqual(self.repo.get_by_id("id", "a"), {"id": "a", "v": 1})
+
+        # Only the read after create had to go back to the table
+        self.assertEqual(self.table_mock.get_item.call_count, 2)
+
+    def test_get_many_within_request_scope(self):
+        """
+        Test get_many only fetches keys not already read in the request
+        """
+        self.table_mock.get_item.return_value = {"Item": {"id": "a", "v": 1}}
+        self.dynamodb_mock.batch_get_item.return_value = {
+            "Responses": {"test-table": [{"id": "b", "v": 2}]}
+        }
+
+        with request_scope():
+            self.repo.get_by_id("id", "a")
+            result = self.repo.get_many("id", ["a", "b", "c"])
+            again = self.repo.get_many("id", ["c", "b"])
+
+        self.assertEqual(result, [{"id": "a", "v": 1}, {"id": "b", "v": 2}])
+        self.assertEqual(again, [{"id": "b", "v": 2}])
+        self.dynamodb_mock.batch_get_item.assert_called_once()
+        keys = self.dynamodb_mock.batch_get_item.call_args.kwargs["RequestItems"][
+            "test-table"
+        ]["Keys"]
+        self.assertEqual(keys, [{"id": "b"}, {"id": "c"}])
+
     def test_get_by_id_not_found(self):
         """
         Test retrieving a non-existent item
@@ -69,6 +158,406 @@ class TestBaseRepository(unittest.TestCase):
         # Assert the result is None
         self.assertIsNone(result)
 
+    def test_iter_query_follows_pages(self):
+        """
+        Test iter_query follows LastEvaluatedKey across pages
+        """
+        self.table_mock.query.side_effect = [
+            {"Items": [{"id": "1"}, {"id": "2"}], "LastEvaluatedKey": {"id": "2"}},
+            {"Items": [{"id": "3"}]},
+        ]
+
+        result = list(self.repo.iter_query(page_size=2, IndexName="test-index"))
+
+        self.assertEqual(result, [{"id": "1"}, {"id": "2"}, {"id": "3"}])
+        self.assertEqual(self.table_mock.query.call_count, 2)
+        self.table_mock.query.assert_called_with(
+            IndexName="test-index", Limit=2, ExclusiveStartKey={"id": "2"}
+        )
+
+    def test_iter_query_is_lazy(self):
+        """
+        Test iter_query only requests a page once items are consumed
+        """
+        self.table_mock.query.side_effect = [
+            {"Items": [{"id": "1"}], "LastEvaluatedKey": {"id": "1"}},
+            {"Items": [{"id": "2"}]},
+        ]
+
+        items = self.repo.iter_query(IndexName="test-index")
+        self.table_mock.query.assert_not_called()
+
+        self.assertEqual(next(items), {"id": "1"})
+        self.assertEqual(self.table_mock.query.call_count, 1)
+
+    def test_iter_query_max_items(self):
+        """
+        Test iter_query stops at the overall cap without fetching further pages
+        """
+        self.table_mock.query.side_effect = [
+            {"Items": [{"id": "1"}, {"id": "2"}], "LastEvaluatedKey": {"id": "2"}},
+            {"Items": [{"id": "3"}, {"id": "4"}], "LastEvaluatedKey": {"id": "4"}},
+            {"Items": [{"id": "5"}]},
+        ]
+
+        result = list(self.repo.iter_query(page_size=2, max_items=3))
+
+        self.assertEqual(result, [{"id": "1"}, {"id": "2"}, {"id": "3"}])
+        self.assertEqual(self.table_mock.query.call_count, 2)
+        # The last page only asks for the items still needed
+        self.assertEqual(self.table_mock.query.call_args.kwargs["Limit"], 1)
+
+    def test_query_page_returns_resume_key(self):
+        """
+        Test query_page returns a full page and the key to resume from
+        """
+        self.table_mock.query.return_value = {
+            "Items": [{"id": "1"}, {"id": "2"}],
+            "LastEvaluatedKey": {"id": "2"},
+        }
+
+        items, last_key = self.repo.query_page(2, IndexName="test-index")
+
+        self.assertEqual(items, [{"id": "1"}, {"id": "2"}])
+        self.assertEqual(last_key, {"id": "2"})
+        self.table_mock.query.assert_called_once_with(IndexName="test-index", Limit=2)
+
+    def test_query_page_resumes_and_fills_filtered_page(self):
+        """
+        Test query_page resumes from a key and keeps reading until the page is full
+        """
+        self.table_mock.query.side_effect = [
+            {"Items": [{"id": "3"}], "LastEvaluatedKey": {"id": "4"}},
+            {"Items": [{"id": "5"}]},
+        ]
+
+        items, last_key = self.repo.query_page(3, {"id": "2"})
+
+        self.assertEqual(items, [{"id": "3"}, {"id": "5"}])
+        self.assertIsNone(last_key)
+        first_call, second_call = self.table_mock.query.call_args_list
+        self.assertEqual(first_call.kwargs["ExclusiveStartKey"], {"id": "2"})
+        self.assertEqual(first_call.kwargs["Limit"], 3)
+        self.assertEqual(second_call.kwargs["ExclusiveStartKey"], {"id": "4"})
+        self.assertEqual(second_call.kwargs["Limit"], 2)
+
+    def test_query_page_stops_after_max_requests(self):
+        """
+        Test query_page returns a short page and a resume key under a sparse filter
+        """
+        self.table_mock.query.return_value = {
+            "Items": [],
+            "LastEvaluatedKey": {"id": "9"},
+        }
+
+        items, last_key = self.repo.query_page(5, max_requests=3)
+
+        self.assertEqual(items, [])
+        self.assertEqual(last_key, {"id": "9"})
+        self.assertEqual(self.table_mock.query.call_count, 3)
+
+    def test_get_by_id_with_projection(self):
+        """
+        Test get_by_id only fetches the requested attributes, using placeholders
+        """
+        self.table_mock.get_item.return_value = {"Item": {"status": "active"}}
+
+        result = self.repo.get_by_id("id", "item123", attributes=["status"])
+
+        self.assertEqual(result, {"status": "active"})
+        self.table_mock.get_item.assert_called_once_with(
+            Key={"id": "item123"},
+            ProjectionExpression="#proj0",
+            ExpressionAttributeNames={"#proj0": "status"},
+        )
+
+    def test_iter_query_with_projection_keeps_existing_names(self):
+        """
+        Test iter_query merges projection placeholders with the caller's names
+        """
+        self.table_mock.query.return_value = {"Items": []}
+
+        list(
+            self.repo.iter_query(
+                attributes=["name", "date"],
+                KeyConditionExpression="#a = :a",
+                ExpressionAttributeNames={"#a": "athlete_id"},
+            )
+        )
+
+        call_kwargs = self.table_mock.query.call_args.kwargs
+        self.assertEqual(call_kwargs["ProjectionExpression"], "#proj0, #proj1")
+        self.assertEqual(
+            call_kwargs["ExpressionAttributeNames"],
+            {"#a": "athlete_id", "#proj0": "name", "#proj1": "date"},
+        )
+
+    @patch("src.utils.dynamodb_retry.time.sleep")
+    def test_transact_put_retries_with_the_same_request_token(self, mock_sleep):
+        """
+        Test a transaction retried after a timeout reuses its ClientRequestToken, so
+        DynamoDB does not apply it twice
+        """
+        client = self.dynamodb_mock.meta.client
+        client.transact_write_items.side_effect = [
+            ReadTimeoutError(endpoint_url="https://dynamodb"),
+            {},
+        ]
+
+        self.repo.transact_put([("test-table", {"id": "a"})])
+
+        first, second = client.transact_write_items.call_args_list
+        self.assertTrue(first.kwargs["ClientRequestToken"])
+        self.assertEqual(
+            first.kwargs["ClientRequestToken"], second.kwargs["ClientRequestToken"]
+        )
+
+    def test_get_many_consistent_read_bypasses_request_scope(self):
+        """
+        Test a consistent get_many reads every key from the table
+        """
+        self.table_mock.get_item.return_value = {"Item": {"id": "a", "v": 1}}
+        self.dynamodb_mock.batch_get_item.return_value = {
+            "Responses": {"test-table": [{"id": "a", "v": 2}]}
+        }
+
+        with request_scope():
+            self.repo.get_by_id("id", "a")
+            result = self.repo.get_many("id", ["a"], consistent_read=True)
+
+        self.assertEqual(result, [{"id": "a", "v": 2}])
+        request = self.dynamodb_mock.batch_get_item.call_args.kwargs["RequestItems"]
+        self.assertEqual(
+            request["test-table"], {"Keys": [{"id": "a"}], "ConsistentRead": True}
+        )
+
+    def test_get_many_with_projection_includes_key(self):
+        """
+        Test get_many always projects the key so results can be ordered
+        """
+        self.dynamodb_mock.batch_get_item.return_value = {
+            "Responses": {"test-table": [{"id": "a", "status": "active"}]}
+        }
+
+        result = self.repo.get_many("id", ["a"], attributes=["status"])
+
+        self.assertEqual(result, [{"id": "a", "status": "active"}])
+        request = self.dynamodb_mock.batch_get_item.call_args.kwargs["RequestItems"]
+        self.assertEqual(
+            request["test-table"]["ProjectionExpression"], "#proj0, #proj1"
+        )
+        self.assertEqual(
+            request["test-table"]["ExpressionAttributeNames"],
+            {"#proj0": "id", "#proj1": "status"},
+        )
+
+    def test_batch_write_items_chunks_across_tables(self):
+        """
+        Test batch_write_items groups puts per table in chunks of 25
+        """
+        self.dynamodb_mock.batch_write_item.return_value = {"UnprocessedItems": {}}
+        puts = [("weeks", {"week_id": f"w{i}"}) for i in range(5)]
+        puts += [("days", {"day_id": f"d{i}", "weight": 1.5}) for i in range(35)]
+
+        self.repo.batch_write_items(puts)
+
+        calls = self.dynamodb_mock.batch_write_item.call_args_list
+        self.assertEqual(len(calls), 2)
+        sizes = sorted(
+            sum(len(reqs) for reqs in call.kwargs["RequestItems"].values())
+            for call in calls
+        )
+        self.assertEqual(sizes, [15, 25])
+        all_days = [
+            req["PutRequest"]["Item"]
+            for call in calls
+            for req in call.kwargs["RequestItems"].get("days", [])
+        ]
+        self.assertEqual(len(all_days), 35)
+        self.assertEqual(all_days[0]["weight"], Decimal("1.5"))
+
+    @patch("src.repositories.base_repository.time.sleep")
+    def test_batch_write_items_retries_unprocessed(self, mock_sleep):
+        """
+        Test batch_write_items resends unprocessed items and gives up eventually
+        """
+        unprocessed = {"days": [{"PutRequest": {"Item": {"day_id": "d1"}}}]}
+        self.dynamodb_mock.batch_write_item.side_effect = [
+            {"UnprocessedItems": unprocessed},
+            {"UnprocessedItems": {}},
+        ]
+
+        self.repo.batch_write_items(
+            [("days", {"day_id": "d0"}), ("days", {"day_id": "d1"})]
+        )
+
+        self.assertEqual(self.dynamodb_mock.batch_write_item.call_count, 2)
+        self.dynamodb_mock.batch_write_item.assert_called_with(RequestItems=unprocessed)
+        mock_sleep.assert_called_once()
+        self.assertEqual(get_retry_metrics()["days"]["throttles"], 1)
+
+        self.dynamodb_mock.batch_write_item.side_effect = None
+        self.dynamodb_mock.batch_write_item.return_value = {
+            "UnprocessedItems": unprocessed
+        }
+        with self.assertRaises(RuntimeError):
+            self.repo.batch_write_items([("days", {"day_id": "d1"})])
+
+    def test_batch_write_items_with_deletes(self):
+        """
+        Test batch_write_items sends puts and deletes in the same chunks
+        """
+        self.dynamodb_mock.batch_write_item.return_value = {"UnprocessedItems": {}}
+
+        self.repo.batch_write_items(
+            [("exercises", {"exercise_id": "e1"})],
+            deletes=[("exercises", {"exercise_id": "e2"})],
+        )
+
+        self.dynamodb_mock.batch_write_item.assert_called_once_with(
+            RequestItems={
+                "exercises": [
+                    {"PutRequest": {"Item": {"exercise_id": "e1"}}},
+                    {"DeleteRequest": {"Key": {"exercise_id": "e2"}}},
+                ]
+            }
+        )
+
+    def test_batch_delete_items_sends_delete_requests(self):
+        """
+        Test batch_delete_items sends DeleteRequests per table in chunks of 25
+        """
+        self.dynamodb_mock.batch_write_item.return_value = {"UnprocessedItems": {}}
+        deletes = [("exercises", {"exercise_id": f"e{i}"}) for i in range(30)]
+        deletes.append(("workouts", {"workout_id": "w1"}))
+
+        self.repo.batch_delete_items(deletes)
+
+        calls = self.dynamodb_mock.batch_write_item.call_args_list
+        self.assertEqual(len(calls), 2)
+        requests = [
+            req
+            for call in calls
+            for reqs in call.kwargs["RequestItems"].values()
+            for req in reqs
+        ]
+        self.assertEqual(len(requests), 31)
+        self.assertIn({"DeleteRequest": {"Key": {"workout_id": "w1"}}}, requests)
+
+        self.dynamodb_mock.batch_write_item.reset_mock()
+        self.repo.batch_delete_items([])
+        self.dynamodb_mock.batch_write_item.assert_not_called()
+
+    def test_get_many(self):
+        """
+        Test batch retrieving items returns them converted and in input order
+        """
+        self.dynamodb_mock.batch_get_item.return_value = {
+            "Responses": {
+                "test-table": [
+                    {"id": "b", "value": Decimal("2.5")},
+                    {"id": "a", "value": Decimal("1")},
+                ]
+            },
+            "UnprocessedKeys": {},
+        }
+
+        result = self.repo.get_many("id", ["a", "missing", "b", "a"])
+
+        self.dynamodb_mock.batch_get_item.assert_called_once_with(
+            RequestItems={
+                "test-table": {"Keys": [{"id": "a"}, {"id": "missing"}, {"id": "b"}]}
+            }
+        )
+        self.assertEqual(result, [{"id": "a", "value": 1.0}, {"id": "b", "value": 2.5}])
+        self.assertIsInstance(result[1]["value"], float)
+
+    def test_get_many_empty(self):
+        """
+        Test batch retrieving with no IDs makes no request
+        """
+        self.assertEqual(self.repo.get_many("id", []), [])
+        self.dynamodb_mock.batch_get_item.assert_not_called()
+
+    def test_get_many_chunks_keys(self):
+        """
+        Test batch retrieving splits keys into chunks of 100
+        """
+        ids = [f"item{i}" for i in range(250)]
+        self.dynamodb_mock.batch_get_item.side_effect = lambda RequestItems: {
+            "Responses": {
+                "test-table": [
+                    {"id": key["id"]} for key in RequestItems["test-table"]["Keys"]
+                ]
+            }
+        }
+
+        result = self.repo.get_many("id", ids)
+
+        chunk_sizes = [
+            len(c.kwargs["RequestItems"]["test-table"]["Keys"])
+            for c in self.dynamodb_mock.batch_get_item.call_args_list
+        ]
+        self.assertEqual(chunk_sizes, [100, 100, 50])
+        self.assertEqual([item["id"] for item in result], ids)
+
+    @patch("src.repositories.base_repository.time.sleep")
+    def test_get_many_retries_unprocessed_keys(self, mock_sleep):
+        """
+        Test unprocessed keys are retried with backoff
+        """
+        unprocessed = {"test-table": {"Keys": [{"id": "b"}]}}
+        self.dynamodb_mock.batch_get_item.side_effect = [
+            {
+                "Responses": {"test-table": [{"id": "a"}]},
+                "UnprocessedKeys": unprocessed,
+            },
+            {"Responses": {"test-table": [{"id": "b"}]}, "UnprocessedKeys": {}},
+        ]
+
+        result = self.repo.get_many("id", ["a", "b"])
+
+        self.assertEqual(result, [{"id": "a"}, {"id": "b"}])
+        self.assertEqual(self.dynamodb_mock.batch_get_item.call_count, 2)
+        self.dynamodb_mock.batch_get_item.assert_called_with(RequestItems=unprocessed)
+        mock_sleep.assert_called_once()
+
+    @patch("src.repositories.base_repository.time.sleep")
+    def test_get_many_unprocessed_keys_exhausted(self, mock_sleep):
+        """
+        Test an error is raised when keys stay unprocessed after all retries
+        """
+        self.dynamodb_mock.batch_get_item.return_value = {
+            "Responses": {"test-table": []},
+            "UnprocessedKeys": {"test-table": {"Keys": [{"id": "a"}]}},
+        }
+
+        with self.assertRaises(RuntimeError):
+            self.repo.get_many("id", ["a"])
+
+    @patch("src.utils.dynamodb_retry.time.sleep")
+    def test_get_by_id_retries_throttling(self, mock_sleep):
+        """
+        Test a throttled read is retried instead of surfacing as an error
+        """
+        self.table_mock.get_item.side_effect = [
+            ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException"}},
+                "GetItem",
+            ),
+            {"Item": {"id": "item123"}},
+        ]
+
+        result = self.repo.get_by_id("id", "item123")
+
+        self.assertEqual(result, {"id": "item123"})
+        self.assertEqual(self.table_mock.get_item.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertEqual(
+            get_retry_metrics()["test-table"],
+            {"retries": 1, "throttles": 1, "exhausted": 0},
+        )
+
     @patch("src.repositories.base_repository.convert_floats_to_decimals")
     def test_create(self, mock_convert):
         """
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 from boto3.dynamodb.conditions import Key
 from src.repositories.block_repository import BlockRepository
+from src.utils.dynamodb_pool import reset_dynamodb_pool
 from src.config.block_config import BlockConfig
 
 
@@ -27,8 +28,9 @@ class TestBlockRepository(unittest.TestCase):
         """
         Test BlockRepository initialization
         """
-        # Create a new mock to avoid interference from setUp
+        # Create a new mock and drop the shared handles cached by setUp
         new_dynamodb_mock = MagicMock()
+        reset_dynamodb_pool()
 
         # Save original value to restore later
         original_table_name = BlockConfig.TABLE_NAME
@@ -72,6 +74,27 @@ class TestBlockRepository(unittest.TestCase):
             # Assert the result is the mock block
             self.assertEqual(result, mock_block)
 
+    def test_batch_get_blocks(self):
+        """
+        Test batch retrieving blocks by ID
+        """
+        self.dynamodb_mock.batch_get_item.return_value = {
+            "Responses": {
+                BlockConfig.TABLE_NAME: [{"block_id": "block2"}, {"block_id": "block1"}]
+            }
+        }
+
+        result = self.block_repository.batch_get_blocks(["block1", "block2"])
+
+        self.dynamodb_mock.batch_get_item.assert_called_once_with(
+            RequestItems={
+                BlockConfig.TABLE_NAME: {
+                    "Keys": [{"block_id": "block1"}, {"block_id": "block2"}]
+                }
+            }
+        )
+        self.assertEqual(result, [{"block_id": "block1"}, {"block_id": "block2"}])
+
     def test_get_blocks_by_athlete(self):
         """
         Test retrieving blocks by athlete_id
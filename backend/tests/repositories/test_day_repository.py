@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 from boto3.dynamodb.conditions import Key
 from src.repositories.day_repository import DayRepository
+from src.utils.dynamodb_pool import reset_dynamodb_pool
 from src.config.day_config import DayConfig
 
 
@@ -27,8 +28,9 @@ class TestDayRepository(unittest.TestCase):
         """
         Test DayRepository initialization
         """
-        # Create a new mock to avoid interference from setUp
+        # Create a new mock and drop the shared handles cached by setUp
         new_dynamodb_mock = MagicMock()
+        reset_dynamodb_pool()
 
         # Test that DayRepository initializes with the correct table name
         with patch("src.config.day_config.DayConfig.TABLE_NAME", "test-days-table"):
@@ -246,30 +248,28 @@ class TestDayRepository(unittest.TestCase):
                 "date": "2025-03-16",
             },
         ]
+        batch_write = self.day_repository.dynamodb.batch_write_item
+        batch_write.return_value = {"UnprocessedItems": {}}
 
         # Configure repository's get_days_by_week to return our mock days
         with patch.object(
             self.day_repository, "get_days_by_week", return_value=mock_days
         ):
-            # Create a mock for the batch writer
-            batch_writer_mock = MagicMock()
-            self.table_mock.batch_writer.return_value.__enter__.return_value = (
-                batch_writer_mock
-            )
-
             # Call the method
             result = self.day_repository.delete_days_by_week("week123")
 
             # Assert get_days_by_week was called
             self.day_repository.get_days_by_week.assert_called_once_with("week123")
 
-            # Assert batch_writer was called
-            self.table_mock.batch_writer.assert_called_once()
-
-            # Assert delete_item was called twice (once for each day)
-            self.assertEqual(batch_writer_mock.delete_item.call_count, 2)
-            batch_writer_mock.delete_item.assert_any_call(Key={"day_id": "day1"})
-            batch_writer_mock.delete_item.assert_any_call(Key={"day_id": "day2"})
+            # Assert both days were deleted in one retried BatchWriteItem call
+            batch_write.assert_called_once_with(
+                RequestItems={
+                    self.day_repository.table_name: [
+                        {"DeleteRequest": {"Key": {"day_id": "day1"}}},
+                        {"DeleteRequest": {"Key": {"day_id": "day2"}}},
+                    ]
+                }
+            )
 
             # Assert the result is the number of days deleted
             self.assertEqual(result, 2)
@@ -278,25 +278,18 @@ class TestDayRepository(unittest.TestCase):
         """
         Test deleting days for a week with no days
         """
+        batch_write = self.day_repository.dynamodb.batch_write_item
+
         # Configure repository's get_days_by_week to return an empty list
         with patch.object(self.day_repository, "get_days_by_week", return_value=[]):
-            # Create a mock for the batch writer
-            batch_writer_mock = MagicMock()
-            self.table_mock.batch_writer.return_value.__enter__.return_value = (
-                batch_writer_mock
-            )
-
             # Call the method
             result = self.day_repository.delete_days_by_week("emptyweek")
 
             # Assert get_days_by_week was called
             self.day_repository.get_days_by_week.assert_called_once_with("emptyweek")
 
-            # Assert batch_writer was called
-            self.table_mock.batch_writer.assert_called_once()
-
-            # Assert delete_item was not called
-            batch_writer_mock.delete_item.assert_not_called()
+            # Assert nothing was sent
+            batch_write.assert_not_called()
 
             # Assert the result is 0 (no days deleted)
             self.assertEqual(result, 0)
@@ -1,7 +1,8 @@
 import unittest
 from decimal import Decimal
 from unittest.mock import MagicMock, patch, ANY
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
 from src.repositories.exercise_repository import ExerciseRepository
 
 
@@ -99,6 +100,53 @@ class TestExerciseRepository(unittest.TestCase):
         # Assert the result is correct
         self.assertEqual(result, exercises_data)
 
+    @patch("src.repositories.base_repository.get_low_level_client")
+    def test_get_exercises_by_workout_native(self, mock_get_client):
+        """
+        Test the native read path queries the low-level client and skips Decimal
+        """
+        client = mock_get_client.return_value
+        client.query.side_effect = [
+            {
+                "Items": [
+                    {
+                        "exercise_id": {"S": "ex1"},
+                        "workout_id": {"S": "workout123"},
+                        "weight": {"N": "102.5"},
+                        "sets": {"N": "3"},
+                    }
+                ],
+                "LastEvaluatedKey": {"exercise_id": {"S": "ex1"}},
+            },
+            {"Items": []},
+        ]
+
+        result = self.repository.get_exercises_by_workout("workout123", native=True)
+
+        self.assertEqual(
+            result,
+            [
+                {
+                    "exercise_id": "ex1",
+                    "workout_id": "workout123",
+                    "weight": 102.5,
+                    "sets": 3,
+                }
+            ],
+        )
+        self.table_mock.query.assert_not_called()
+
+        first_call = client.query.call_args_list[0].kwargs
+        self.assertEqual(first_call["TableName"], self.repository.table_name)
+        self.assertEqual(first_call["IndexName"], "workout-index")
+        self.assertEqual(
+            first_call["ExpressionAttributeValues"], {":v0": {"S": "workout123"}}
+        )
+        self.assertEqual(
+            client.query.call_args_list[1].kwargs["ExclusiveStartKey"],
+            {"exercise_id": {"S": "ex1"}},
+        )
+
     def test_get_exercises_by_day(self):
         """
         Test getting all exercises for a day
@@ -334,16 +382,140 @@ class TestExerciseRepository(unittest.TestCase):
             "sets": 5,
             "reps": 5,
             "weight": 315.0,
+            "athlete_id": "athlete789",
+            "workout_date": "2025-03-01",
         }
 
         # Call the repository method
         result = self.repository.create_exercise(exercise_data)
 
-        # Assert the table was called correctly
+        # Assert the table was called with the athlete-type index key added
+        expected = {**exercise_data, "athlete_exercise_type": "athlete789#squat"}
+        self.table_mock.put_item.assert_called_once_with(Item=expected)
+
+        # The create method returns the stored item
+        self.assertEqual(result, expected)
+
+    @patch("src.repositories.workout_repository.WorkoutRepository")
+    def test_create_exercise_counts_towards_workout(self, mock_workout_repo_class):
+        """
+        Test creating an exercise adds it to its workout's counters
+        """
+        exercise_data = {
+            "exercise_id": "ex123",
+            "workout_id": "workout456",
+            "athlete_id": "athlete789",
+            "workout_date": "2025-03-01",
+            "status": "completed",
+        }
+
+        self.repository.create_exercise(exercise_data)
+
+        mock_workout_repo_class.return_value.adjust_exercise_counts.assert_called_once_with(
+            "workout456", 1, 1, ["ex123"]
+        )
+
+    @patch("src.repositories.workout_repository.WorkoutRepository")
+    def test_create_exercise_copies_workout_context(self, mock_workout_repo_class):
+        """
+        Test an exercise created without athlete and date gets them from its workout
+        """
+        mock_workout_repo = mock_workout_repo_class.return_value
+        mock_workout_repo.get_by_id.return_value = {
+            "athlete_id": "athlete789",
+            "date": "2025-03-01",
+        }
+        exercise_data = {
+            "exercise_id": "ex123",
+            "workout_id": "workout456",
+            "exercise_type": "Squat",
+        }
+
+        result = self.repository.create_exercise(exercise_data)
+
+        mock_workout_repo.get_by_id.assert_called_once_with(
+            "workout_id", "workout456", attributes=["athlete_id", "date"]
+        )
+        expected = {
+            **exercise_data,
+            "athlete_id": "athlete789",
+            "workout_date": "2025-03-01",
+            "athlete_exercise_type": "athlete789#squat",
+        }
+        self.table_mock.put_item.assert_called_once_with(Item=expected)
+        self.assertEqual(result, expected)
+
+    @patch("src.repositories.workout_repository.WorkoutRepository")
+    def test_create_exercise_unknown_workout(self, mock_workout_repo_class):
+        """
+        Test an exercise whose workout is missing is stored without index attributes
+        """
+        mock_workout_repo_class.return_value.get_by_id.return_value = None
+        exercise_data = {"exercise_id": "ex123", "workout_id": "missing"}
+
+        self.repository.create_exercise(exercise_data)
+
         self.table_mock.put_item.assert_called_once_with(Item=exercise_data)
 
-        # The create method returns the original item
-        self.assertEqual(result, exercise_data)
+    def test_update_workout_context(self):
+        """
+        Test only exercises with a stale athlete, date or type key are updated
+        """
+        exercises = [
+            {
+                "exercise_id": "ex1",
+                "exercise_type": "Squat",
+                "athlete_id": "a1",
+                "workout_date": "2025-03-01",
+                "athlete_exercise_type": "a1#squat",
+            },
+            {"exercise_id": "ex2", "athlete_id": "a1", "workout_date": "2025-02-01"},
+            {"exercise_id": "ex3", "exercise_type": "Deadlift"},
+            {
+                "exercise_id": "ex4",
+                "exercise_type": "Bench Press",
+                "athlete_id": "a1",
+                "workout_date": "2025-03-01",
+            },
+        ]
+
+        with patch.object(
+            self.repository, "get_exercises_by_workout", return_value=exercises
+        ), patch.object(self.repository, "update_exercise") as mock_update:
+            count = self.repository.update_workout_context("w1", "a1", "2025-03-01")
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_update.call_args_list),
+            ["ex2", "ex3", "ex4"],
+        )
+        mock_update.assert_any_call(
+            "ex2", {"athlete_id": "a1", "workout_date": "2025-03-01"}
+        )
+        mock_update.assert_any_call(
+            "ex3",
+            {
+                "athlete_id": "a1",
+                "workout_date": "2025-03-01",
+                "athlete_exercise_type": "a1#deadlift",
+            },
+        )
+
+    def test_update_workout_context_dry_run(self):
+        """
+        Test a dry run counts stale exercises without writing
+        """
+        exercises = [{"exercise_id": "ex1"}, {"exercise_id": "ex2"}]
+
+        with patch.object(
+            self.repository, "get_exercises_by_workout", return_value=exercises
+        ), patch.object(self.repository, "update_exercise") as mock_update:
+            count = self.repository.update_workout_context(
+                "w1", "a1", "2025-03-01", dry_run=True
+            )
+
+        self.assertEqual(count, 2)
+        mock_update.assert_not_called()
 
     def test_create_exercise_with_planned_sets_data(self):
         """
@@ -368,6 +540,8 @@ class TestExerciseRepository(unittest.TestCase):
                 {"set_number": 2, "reps": 5, "weight": 225.0, "completed": False},
                 {"set_number": 3, "reps": 5, "weight": 225.0, "completed": False},
             ],
+            "athlete_id": "athlete789",
+            "workout_date": "2025-03-01",
         }
 
         # Configure mock to return the created exercise
@@ -396,7 +570,9 @@ class TestExerciseRepository(unittest.TestCase):
         self.assertEqual(planned_set_1["completed"], False)
 
         # Assert the result is corrects
-        self.assertEqual(result, exercise_data)
+        self.assertEqual(
+            result, {**exercise_data, "athlete_exercise_type": "athlete789#squat"}
+        )
 
     def test_update_exercise(self):
         """
@@ -439,6 +615,96 @@ class TestExerciseRepository(unittest.TestCase):
         # So result should be just {"exercise_id": "ex123"}
         self.assertEqual(result, {"exercise_id": "ex123"})
 
+    @patch("src.repositories.workout_repository.WorkoutRepository")
+    def test_update_exercise_status_adjusts_workout_counts(
+        self, mock_workout_repo_class
+    ):
+        """
+        Test a status change reads the previous status from the same write
+        """
+        self.table_mock.update_item.return_value = {
+            "Attributes": {
+                "exercise_id": "ex123",
+                "workout_id": "workout456",
+                "status": "in_progress",
+                "sets": Decimal("3"),
+            }
+        }
+
+        result = self.repository.update_exercise("ex123", {"status": "completed"})
+
+        call_args = self.table_mock.update_item.call_args.kwargs
+        self.assertEqual(call_args["ReturnValues"], "ALL_OLD")
+        self.assertEqual(
+            result,
+            {
+                "exercise_id": "ex123",
+                "workout_id": "workout456",
+                "status": "completed",
+                "sets": 3.0,
+            },
+        )
+        mock_workout_repo_class.return_value.adjust_exercise_counts.assert_called_once_with(
+            "workout456", 1, 0, ["ex123"]
+        )
+        self.table_mock.get_item.assert_not_called()
+
+    @patch("src.repositories.workout_repository.WorkoutRepository")
+    def test_update_exercise_same_completion_keeps_workout_counts(
+        self, mock_workout_repo_class
+    ):
+        """
+        Test a status change that does not complete or reopen the exercise
+        """
+        self.table_mock.update_item.return_value = {
+            "Attributes": {"exercise_id": "ex123", "workout_id": "workout456"}
+        }
+
+        self.repository.update_exercise("ex123", {"status": "in_progress"})
+
+        mock_workout_repo_class.return_value.adjust_exercise_counts.assert_not_called()
+
+    def test_update_exercise_require_existing(self):
+        """
+        Test an update limited to existing exercises returns None for a missing one
+        """
+        self.table_mock.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+        )
+
+        result = self.repository.update_exercise(
+            "missing", {"status": "completed"}, require_existing=True
+        )
+
+        self.assertIsNone(result)
+        self.assertEqual(
+            self.table_mock.update_item.call_args.kwargs["ConditionExpression"],
+            "attribute_exists(exercise_id)",
+        )
+
+    def test_update_exercise_type_moves_athlete_type_key(self):
+        """
+        Test changing the exercise type also rewrites the athlete-type index key
+        """
+        self.table_mock.get_item.return_value = {"Item": {"athlete_id": "athlete789"}}
+        self.table_mock.update_item.return_value = {
+            "Attributes": {"exercise_id": "ex123"}
+        }
+
+        self.repository.update_exercise("ex123", {"exercise_type": "Front Squat"})
+
+        self.assertEqual(
+            self.table_mock.get_item.call_args.kwargs["Key"], {"exercise_id": "ex123"}
+        )
+        call_args = self.table_mock.update_item.call_args[1]
+        self.assertEqual(
+            call_args["ExpressionAttributeValues"],
+            {
+                ":exercise_type": "Front Squat",
+                ":athlete_exercise_type": "athlete789#front squat",
+            },
+        )
+
     def test_update_exercise_with_planned_sets_data(self):
         """
         Test updating an exercise with planned_sets_data field
@@ -550,6 +816,25 @@ class TestExerciseRepository(unittest.TestCase):
         # So result should be just {"exercise_id": "ex123"}
         self.assertEqual(result, {"exercise_id": "ex123"})
 
+    @patch("src.repositories.workout_repository.WorkoutRepository")
+    def test_delete_exercise_removes_it_from_workout(self, mock_workout_repo_class):
+        """
+        Test deleting an exercise takes it out of its workout's counters
+        """
+        self.table_mock.delete_item.return_value = {
+            "Attributes": {
+                "exercise_id": "ex123",
+                "workout_id": "workout456",
+                "status": "completed",
+            }
+        }
+
+        self.repository.delete_exercise("ex123")
+
+        mock_workout_repo_class.return_value.adjust_exercise_counts.assert_called_once_with(
+            "workout456", -1, -1, ["ex123"]
+        )
+
     def test_delete_exercise_not_found(self):
         """
         Test deleting an exercise that doesn't exist
@@ -591,22 +876,22 @@ class TestExerciseRepository(unittest.TestCase):
         with patch.object(
             self.repository, "get_exercises_by_workout", return_value=exercises_data
         ):
-            # Mock the batch_writer context manager
-            batch_writer_mock = MagicMock()
-            self.table_mock.batch_writer.return_value.__enter__.return_value = (
-                batch_writer_mock
-            )
+            self.repository.dynamodb = MagicMock()
+            batch_write = self.repository.dynamodb.batch_write_item
+            batch_write.return_value = {"UnprocessedItems": {}}
 
             # Call the repository method
             result = self.repository.delete_exercises_by_workout("workout123")
 
-            # Assert batch_writer was called
-            self.table_mock.batch_writer.assert_called_once()
-
-            # Assert delete_item was called for each exercise
-            self.assertEqual(batch_writer_mock.delete_item.call_count, 2)
-            batch_writer_mock.delete_item.assert_any_call(Key={"exercise_id": "ex1"})
-            batch_writer_mock.delete_item.assert_any_call(Key={"exercise_id": "ex2"})
+            # Assert each exercise was deleted in one retried BatchWriteItem call
+            batch_write.assert_called_once_with(
+                RequestItems={
+                    self.repository.table_name: [
+                        {"DeleteRequest": {"Key": {"exercise_id": "ex1"}}},
+                        {"DeleteRequest": {"Key": {"exercise_id": "ex2"}}},
+                    ]
+                }
+            )
 
             # Assert the result is the number of deleted exercises
             self.assertEqual(result, 2)
@@ -639,165 +924,183 @@ class TestExerciseRepository(unittest.TestCase):
         with patch.object(
             self.repository, "get_exercises_by_day", return_value=exercises_data
         ):
-            # Mock the batch_writer context manager
-            batch_writer_mock = MagicMock()
-            self.table_mock.batch_writer.return_value.__enter__.return_value = (
-                batch_writer_mock
-            )
+            self.repository.dynamodb = MagicMock()
+            batch_write = self.repository.dynamodb.batch_write_item
+            batch_write.return_value = {"UnprocessedItems": {}}
 
             # Call the repository method
             result = self.repository.delete_exercises_by_day("day123")
 
-            # Assert batch_writer was called
-            self.table_mock.batch_writer.assert_called_once()
-
-            # Assert delete_item was called for each exercise
-            self.assertEqual(batch_writer_mock.delete_item.call_count, 3)
-            batch_writer_mock.delete_item.assert_any_call(Key={"exercise_id": "ex1"})
-            batch_writer_mock.delete_item.assert_any_call(Key={"exercise_id": "ex2"})
-            batch_writer_mock.delete_item.assert_any_call(Key={"exercise_id": "ex3"})
+            # Assert each exercise was deleted in one retried BatchWriteItem call
+            batch_write.assert_called_once_with(
+                RequestItems={
+                    self.repository.table_name: [
+                        {"DeleteRequest": {"Key": {"exercise_id": "ex1"}}},
+                        {"DeleteRequest": {"Key": {"exercise_id": "ex2"}}},
+                        {"DeleteRequest": {"Key": {"exercise_id": "ex3"}}},
+                    ]
+                }
+            )
 
             # Assert the result is the number of deleted exercises
             self.assertEqual(result, 3)
 
-    @patch("src.repositories.workout_repository.WorkoutRepository")
-    def test_get_exercises_with_workout_context_basic(self, mock_workout_repo_class):
+    def test_get_exercises_with_workout_context_basic(self):
         """
-        Test getting exercises with workout context - basic scenario
+        Test the athlete history is one query on the athlete-date index
         """
-        # Setup mock workout repository
-        mock_workout_repo = MagicMock()
-        mock_workout_repo_class.return_value = mock_workout_repo
-
-        # Mock workout data
-        mock_workouts = [
-            {"workout_id": "workout1", "date": "2025-03-01", "status": "completed"},
-            {"workout_id": "workout2", "date": "2025-03-02", "status": "in_progress"},
-        ]
-        mock_workout_repo.get_all_workouts_by_athlete.return_value = mock_workouts
-
-        # Mock exercise data per workout_id (order-independent via patch.object)
-        workout1_exercises = [
+        history = [
             {
                 "exercise_id": "ex1",
                 "workout_id": "workout1",
+                "athlete_id": "athlete123",
+                "workout_date": "2025-03-01",
                 "exercise_type": "Squat",
-                "sets": 3,
-                "reps": 5,
-                "weight": Decimal("225.0"),
-            }
-        ]
-        workout2_exercises = [
+                "weight": 225.0,
+            },
             {
                 "exercise_id": "ex2",
                 "workout_id": "workout2",
+                "athlete_id": "athlete123",
+                "workout_date": "2025-03-02",
                 "exercise_type": "Bench Press",
-                "sets": 3,
-                "reps": 8,
-                "weight": Decimal("185.0"),
-            }
+                "weight": 185.0,
+            },
         ]
 
-        def mock_get_exercises_by_workout(workout_id):
-            return (
-                workout1_exercises if workout_id == "workout1" else workout2_exercises
-            )
-
         with patch.object(
-            self.repository,
-            "get_exercises_by_workout",
-            side_effect=mock_get_exercises_by_workout,
-        ):
+            self.repository, "iter_query_native", return_value=iter(history)
+        ) as mock_query:
             result = self.repository.get_exercises_with_workout_context("athlete123")
 
-        # Verify workout repository was called
-        mock_workout_repo.get_all_workouts_by_athlete.assert_called_once_with(
-            "athlete123"
+        mock_query.assert_called_once_with(
+            IndexName="athlete-date-index",
+            KeyConditionExpression=Key("athlete_id").eq("athlete123"),
         )
+        self.assertEqual(result, history)
 
-        # Verify results have workout context added
-        self.assertEqual(len(result), 2)
-
-        # Check exercises have correct context (order-agnostic lookup)
-        ex1_result = next(e for e in result if e["exercise_id"] == "ex1")
-        self.assertEqual(ex1_result["workout_date"], "2025-03-01")
-        self.assertEqual(ex1_result["workout_status"], "completed")
+    def test_get_exercises_with_workout_context_with_filters(self):
+        """
+        Test the date range is a key condition and the exercise type a filter
+        """
+        with patch.object(
+            self.repository, "iter_query_native", return_value=iter([])
+        ) as mock_query:
+            self.repository.get_exercises_with_workout_context(
+                athlete_id="athlete123",
+                exercise_type="Squat",
+                start_date="2025-03-01",
+                end_date="2025-03-31",
+            )
+            self.repository.get_exercises_with_workout_context(
+                athlete_id="athlete123", start_date="2025-03-01"
+            )
+            self.repository.get_exercises_with_workout_context(
+                athlete_id="athlete123", end_date="2025-03-31"
+            )
 
-        ex2_result = next(e for e in result if e["exercise_id"] == "ex2")
-        self.assertEqual(ex2_result["workout_date"], "2025-03-02")
-        self.assertEqual(ex2_result["workout_status"], "in_progress")
+        ranged, since, until = [c.kwargs for c in mock_query.call_args_list]
+        self.assertEqual(
+            ranged["KeyConditionExpression"],
+            Key("athlete_id").eq("athlete123")
+            & Key("workout_date").between("2025-03-01", "2025-03-31"),
+        )
+        self.assertEqual(ranged["FilterExpression"], Attr("exercise_type").eq("Squat"))
+        self.assertEqual(
+            since["KeyConditionExpression"],
+            Key("athlete_id").eq("athlete123") & Key("workout_date").gte("2025-03-01"),
+        )
+        self.assertNotIn("FilterExpression", since)
+        self.assertEqual(
+            until["KeyConditionExpression"],
+            Key("athlete_id").eq("athlete123") & Key("workout_date").lte("2025-03-31"),
+        )
 
-    @patch("src.repositories.workout_repository.WorkoutRepository")
-    def test_get_exercises_with_workout_context_with_filters(
-        self, mock_workout_repo_class
-    ):
+    @patch("src.repositories.base_repository.get_low_level_client")
+    def test_get_exercises_with_workout_context_paginates(self, mock_get_client):
         """
-        Test getting exercises with workout context with exercise_type and date filters
+        Test the history query follows pages and returns native numbers
         """
-        # Setup mock workout repository
-        mock_workout_repo = MagicMock()
-        mock_workout_repo_class.return_value = mock_workout_repo
-
-        # Mock workout data (some before start_date, some after)
-        mock_workouts = [
-            {
-                "workout_id": "workout1",
-                "date": "2025-02-28",  # Before start_date — filtered out
-                "status": "completed",
-            },
+        client = mock_get_client.return_value
+        client.query.side_effect = [
             {
-                "workout_id": "workout2",
-                "date": "2025-03-01",  # On/after start_date
-                "status": "completed",
+                "Items": [{"exercise_id": {"S": "ex1"}, "weight": {"N": "100"}}],
+                "LastEvaluatedKey": {"exercise_id": {"S": "ex1"}},
             },
+            {"Items": [{"exercise_id": {"S": "ex2"}, "weight": {"N": "102.5"}}]},
         ]
-        mock_workout_repo.get_all_workouts_by_athlete.return_value = mock_workouts
 
-        # Mock exercise data - mixed exercise types for workout2 only
-        workout2_exercises = [
+        result = self.repository.get_exercises_with_workout_context("athlete123")
+
+        self.assertEqual(
+            result,
+            [
+                {"exercise_id": "ex1", "weight": 100},
+                {"exercise_id": "ex2", "weight": 102.5},
+            ],
+        )
+        self.assertEqual(client.query.call_count, 2)
+        self.assertEqual(
+            client.query.call_args_list[0].kwargs["IndexName"], "athlete-date-index"
+        )
+
+    def test_get_exercises_by_type(self):
+        """
+        Test one exercise type is read from the athlete-type index with a date range
+        """
+        squats = [
             {
                 "exercise_id": "ex1",
-                "workout_id": "workout2",
-                "exercise_type": "Squat",  # Matches filter
-                "sets": 3,
-                "reps": 5,
-                "weight": Decimal("225.0"),
-            },
-            {
-                "exercise_id": "ex2",
-                "workout_id": "workout2",
-                "exercise_type": "Bench Press",  # Doesn't match filter
-                "sets": 3,
-                "reps": 8,
-                "weight": Decimal("185.0"),
-            },
+                "exercise_type": "Squat",
+                "workout_date": "2025-03-01",
+            }
         ]
 
-        mock_get_exercises = MagicMock(return_value=workout2_exercises)
-
         with patch.object(
-            self.repository, "get_exercises_by_workout", mock_get_exercises
-        ):
-            result = self.repository.get_exercises_with_workout_context(
-                athlete_id="athlete123", exercise_type="Squat", start_date="2025-03-01"
+            self.repository, "iter_query_native", return_value=iter(squats)
+        ) as mock_query:
+            result = self.repository.get_exercises_by_type(
+                "athlete123", " Squat ", start_date="2025-03-01"
             )
 
-        # Verify workout repository was called
-        mock_workout_repo.get_all_workouts_by_athlete.assert_called_once_with(
-            "athlete123"
+        mock_query.assert_called_once_with(
+            IndexName="athlete-type-index",
+            KeyConditionExpression=Key("athlete_exercise_type").eq("athlete123#squat")
+            & Key("workout_date").gte("2025-03-01"),
         )
+        self.assertEqual(result, squats)
 
-        # Only workout2 passes date filter, so get_exercises_by_workout called once
-        mock_get_exercises.assert_called_once_with("workout2")
-
-        # Verify results - only Squat exercise should remain after exercise_type filter
-        self.assertEqual(len(result), 1)
+    @patch("src.config.exercise_config.ExerciseConfig.INDEX_MIGRATION_STAGE", 1)
+    def test_get_exercises_by_type_before_type_index(self):
+        """
+        Test one exercise type is filtered from the athlete-date index until the
+        athlete-type index is live
+        """
+        with patch.object(
+            self.repository, "iter_query_native", return_value=iter([])
+        ) as mock_query:
+            self.repository.get_exercises_by_type("athlete123", "Squat")
+
+        mock_query.assert_called_once_with(
+            IndexName="athlete-date-index",
+            KeyConditionExpression=Key("athlete_id").eq("athlete123"),
+            FilterExpression=Attr("athlete_exercise_type").eq("athlete123#squat"),
+        )
 
-        exercise = result[0]
-        self.assertEqual(exercise["exercise_id"], "ex1")
-        self.assertEqual(exercise["exercise_type"], "Squat")
-        self.assertEqual(exercise["workout_date"], "2025-03-01")
-        self.assertEqual(exercise["workout_status"], "completed")
+    def test_with_athlete_type_key(self):
+        """
+        Test the athlete-type key is only added once athlete and type are known
+        """
+        self.assertEqual(
+            ExerciseRepository.with_athlete_type_key(
+                {"athlete_id": "a1", "exercise_type": "Bench Press"}
+            )["athlete_exercise_type"],
+            "a1#bench press",
+        )
+        self.assertNotIn(
+            "athlete_exercise_type",
+            ExerciseRepository.with_athlete_type_key({"exercise_type": "Squat"}),
+        )
 
     def test_batch_get_exercises_by_workout_ids_empty(self):
         """
@@ -829,7 +1132,7 @@ class TestExerciseRepository(unittest.TestCase):
             },
         ]
 
-        def mock_get(workout_id):
+        def mock_get(workout_id, native=False):
             return (
                 workout1_exercises if workout_id == "workout1" else workout2_exercises
             )
@@ -879,32 +1182,196 @@ class TestExerciseRepository(unittest.TestCase):
         self.assertEqual(ids, {"ex1", "ex2"})
 
     @patch("src.repositories.workout_repository.WorkoutRepository")
-    def test_get_exercises_with_workout_context_no_workouts(
-        self, mock_workout_repo_class
-    ):
+    def test_apply_changes(self, mock_workout_repo_class):
         """
-        Test getting exercises with workout context when athlete has no workouts
+        Test a change set batches puts and deletes and updates exercises in parallel
         """
-        # Setup mock workout repository
-        mock_workout_repo = MagicMock()
-        mock_workout_repo_class.return_value = mock_workout_repo
+        self.repository.batch_write_items = MagicMock()
+        self.table_mock.update_item.return_value = {
+            "Attributes": {"exercise_id": "ex1", "status": "completed"}
+        }
 
-        # Mock empty workout data
-        mock_workout_repo.get_all_workouts_by_athlete.return_value = []
+        result = self.repository.apply_changes(
+            [{"exercise_id": "ex2", "athlete_id": "a1", "exercise_type": "Squat"}],
+            {"ex1": {"status": "completed"}},
+            ["ex3"],
+        )
 
-        # Call the method
-        result = self.repository.get_exercises_with_workout_context("athlete123")
+        self.repository.batch_write_items.assert_called_once_with(
+            [
+                (
+                    self.repository.table_name,
+                    {
+                        "exercise_id": "ex2",
+                        "athlete_id": "a1",
+                        "exercise_type": "Squat",
+                        "athlete_exercise_type": "a1#squat",
+                    },
+                )
+            ],
+            deletes=[(self.repository.table_name, {"exercise_id": "ex3"})],
+        )
+        self.assertEqual(
+            self.table_mock.update_item.call_args.kwargs["ReturnValues"], "ALL_NEW"
+        )
+        self.assertEqual(result, {"ex1": {"exercise_id": "ex1", "status": "completed"}})
+        # The caller adjusts the workout counters once for the whole set
+        mock_workout_repo_class.return_value.adjust_exercise_counts.assert_not_called()
+
+    def test_update_exercise_orders(self):
+        """
+        Test new order values are written in one transaction guarded by the workout
+        """
+        client = self.repository.dynamodb.meta.client
+        client.transact_write_items.reset_mock()
 
-        # Verify workout repository was called
-        mock_workout_repo.get_all_workouts_by_athlete.assert_called_once_with(
-            "athlete123"
+        self.repository.update_exercise_orders("workout456", {"ex1": 2, "ex2": 1})
+
+        client.transact_write_items.assert_called_once()
+        items = client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[0]["Update"]["Key"], {"exercise_id": "ex1"})
+        self.assertEqual(items[0]["Update"]["UpdateExpression"], "SET #order = :order")
+        self.assertEqual(
+            items[0]["Update"]["ConditionExpression"], "workout_id = :workout_id"
+        )
+        self.assertEqual(
+            items[1]["Update"]["ExpressionAttributeValues"],
+            {":order": 1, ":workout_id": "workout456"},
         )
 
-        # Verify no table queries for exercises
-        self.table_mock.query.assert_not_called()
+    def test_update_exercise_orders_chunks_transactions(self):
+        """
+        Test workouts with more exercises than a transaction allows are chunked
+        """
+        client = self.repository.dynamodb.meta.client
+        client.transact_write_items.reset_mock()
+
+        self.repository.update_exercise_orders(
+            "workout456", {f"ex{i}": i + 1 for i in range(150)}
+        )
+
+        self.assertEqual(client.transact_write_items.call_count, 2)
+
+    def test_track_set_replaces_in_place(self):
+        """
+        Test replacing a set is one conditional update of its list element
+        """
+        self.table_mock.update_item.return_value = {"Attributes": {"sets": 3}}
+
+        result = self.repository.track_set(
+            "ex123",
+            {"set_number": 2, "reps": 5, "weight": 225.0, "completed": True},
+            append=False,
+            start_exercise=True,
+        )
+
+        self.assertEqual(result, {"sets": 3})
+        kwargs = self.table_mock.update_item.call_args.kwargs
+        self.assertEqual(
+            kwargs["UpdateExpression"],
+            "SET #planned_sets_data = if_not_exists(#planned_sets_data, #sets_data), "
+            "#sets_data[1] = :set, #status = :in_progress",
+        )
+        self.assertIn(
+            "#sets_data[1].set_number = :set_number", kwargs["ConditionExpression"]
+        )
+        self.assertIn("size(#sets_data) = #sets", kwargs["ConditionExpression"])
+        # Only planned exercises are started; completed ones are reopened through
+        # update_exercise and any other status is left alone
+        self.assertIn(
+            "#status IN (:planned, :in_progress)", kwargs["ConditionExpression"]
+        )
+        self.assertEqual(
+            kwargs["ExpressionAttributeValues"][":set"]["weight"], Decimal("225.0")
+        )
+        self.assertEqual(kwargs["ReturnValues"], "ALL_NEW")
+
+    def test_track_set_appends(self):
+        """
+        Test appending a set extends the list and the set count together
+        """
+        self.table_mock.update_item.return_value = {"Attributes": {"sets": 4}}
+
+        self.repository.track_set(
+            "ex123",
+            {"set_number": 4, "reps": 5, "weight": 225.0, "completed": False},
+            append=True,
+            start_exercise=False,
+        )
+
+        kwargs = self.table_mock.update_item.call_args.kwargs
+        self.assertIn(
+            "#sets_data = list_append(#sets_data, :new_sets)",
+            kwargs["UpdateExpression"],
+        )
+        self.assertIn("#sets = :set_number", kwargs["UpdateExpression"])
+        self.assertIn(
+            "size(#sets_data) = :previous_sets", kwargs["ConditionExpression"]
+        )
+        self.assertIn("#status <> :completed", kwargs["ConditionExpression"])
+        self.assertEqual(kwargs["ExpressionAttributeValues"][":previous_sets"], 3)
+
+    def test_to_item_leaves_out_null_set_lists(self):
+        """
+        Test set lists that are still None are not stored as NULL
+        """
+        item = ExerciseRepository.to_item(
+            {
+                "exercise_id": "ex123",
+                "athlete_id": "athlete789",
+                "exercise_type": "Squat",
+                "notes": None,
+                "sets_data": None,
+                "planned_sets_data": None,
+            }
+        )
 
-        # Verify empty result
-        self.assertEqual(len(result), 0)
+        self.assertNotIn("sets_data", item)
+        self.assertNotIn("planned_sets_data", item)
+        self.assertIn("notes", item)
+        self.assertEqual(item["athlete_exercise_type"], "athlete789#squat")
+
+    def test_track_set_first_set_creates_list(self):
+        """
+        Test the first set of an exercise without sets_data creates the list
+        """
+        self.table_mock.update_item.return_value = {"Attributes": {"sets": 1}}
+
+        self.repository.track_set(
+            "ex123",
+            {"set_number": 1, "reps": 5, "weight": 225.0, "completed": True},
+            append=True,
+            start_exercise=True,
+        )
+
+        kwargs = self.table_mock.update_item.call_args.kwargs
+        self.assertEqual(
+            kwargs["UpdateExpression"],
+            "SET #planned_sets_data = if_not_exists(#planned_sets_data, :empty), "
+            "#sets_data = :new_sets, #sets = :set_number, #status = :in_progress",
+        )
+        self.assertIn(
+            "(attribute_not_exists(#sets_data) "
+            "OR (attribute_type(#sets_data, :list) AND size(#sets_data) = :zero))",
+            kwargs["ConditionExpression"],
+        )
+        self.assertNotIn("list_append", kwargs["UpdateExpression"])
+        self.assertEqual(kwargs["ExpressionAttributeValues"][":empty"], [])
+
+    def test_track_set_condition_failed(self):
+        """
+        Test an exercise without the expected set layout is left untouched
+        """
+        self.table_mock.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+        )
+
+        result = self.repository.track_set(
+            "ex123", {"set_number": 1, "reps": 5, "weight": 225.0}, False, True
+        )
+
+        self.assertIsNone(result)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,5 +1,7 @@
 import unittest
+from decimal import Decimal
 from unittest.mock import patch, MagicMock
+from botocore.exceptions import ClientError
 from src.repositories.notification_repository import NotificationRepository
 from src.config.notification_config import NotificationConfig
 
@@ -23,7 +25,7 @@ class TestNotificationRepository(unittest.TestCase):
             "notification_type": "workout_completion",
         }
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_init_creates_dynamodb_connection(self, mock_boto3):
         """Test that repository initialization creates proper DynamoDB connection."""
         # Setup mock
@@ -37,17 +39,15 @@ class TestNotificationRepository(unittest.TestCase):
 
         # Verify initialization
         self.assertEqual(repo.table_name, NotificationConfig.TABLE_NAME)
-        mock_boto3.assert_called_once_with("dynamodb")
+        mock_boto3.assert_called_once()
+        self.assertEqual(mock_boto3.call_args[0], ("dynamodb",))
         mock_dynamodb.Table.assert_called_once_with(NotificationConfig.TABLE_NAME)
-        self.assertEqual(repo.table, mock_table)
+        self.assertIs(repo.table._table, mock_table)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_create_notification_success(self, mock_boto3):
-        """Test successful notification creation."""
-        # Setup mocks
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
-        mock_table.put_item.return_value = {}
+        """Test notification creation bumps the coach's unread counter atomically."""
+        client = mock_boto3.return_value.meta.client
 
         repo = NotificationRepository()
 
@@ -56,15 +56,76 @@ class TestNotificationRepository(unittest.TestCase):
 
         # Verify
         self.assertTrue(result)
-        mock_table.put_item.assert_called_once_with(Item=self.test_notification_data)
+        transact_items = client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(
+            transact_items[0]["Put"]["Item"],
+            {**self.test_notification_data, "unread_coach_id": "coach-456"},
+        )
+        self.assertEqual(
+            transact_items[1]["Update"]["Key"],
+            {"notification_id": "unread-counter#coach-456"},
+        )
+        self.assertEqual(
+            transact_items[1]["Update"]["ExpressionAttributeValues"], {":delta": 1}
+        )
+
+    @patch("boto3.resource")
+    def test_create_notification_creates_missing_counter(self, mock_boto3):
+        """Test a coach without a counter gets one from a recount, not from zero."""
+        client = mock_boto3.return_value.meta.client
+        client.transact_write_items.side_effect = [
+            ClientError(
+                {
+                    "Error": {"Code": "TransactionCanceledException"},
+                    "CancellationReasons": [
+                        {"Code": "None"},
+                        {"Code": "ConditionalCheckFailed"},
+                    ],
+                },
+                "TransactWriteItems",
+            ),
+            {},
+        ]
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.query.return_value = {"Count": 4}
+
+        repo = NotificationRepository()
+
+        self.assertTrue(repo.create_notification(self.test_notification_data))
+        # The counter starts from the unread notifications already stored
+        put = mock_table.put_item.call_args.kwargs
+        self.assertEqual(put["Item"]["unread_count"], 4)
+        self.assertEqual(
+            put["ConditionExpression"], "attribute_not_exists(notification_id)"
+        )
+        self.assertEqual(client.transact_write_items.call_count, 2)
+        counter_update = client.transact_write_items.call_args.kwargs["TransactItems"][
+            1
+        ]["Update"]
+        self.assertEqual(
+            counter_update["ConditionExpression"], "attribute_exists(unread_count)"
+        )
+
+    @patch("boto3.resource")
+    def test_create_read_notification_skips_counter(self, mock_boto3):
+        """Test a notification created as read leaves the unread counter alone."""
+        client = mock_boto3.return_value.meta.client
+
+        repo = NotificationRepository()
+        repo.create_notification({**self.test_notification_data, "is_read": True})
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+        transact_items = client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(len(transact_items), 1)
+        self.assertNotIn("unread_coach_id", transact_items[0]["Put"]["Item"])
+
+    @patch("boto3.resource")
     def test_create_notification_failure(self, mock_boto3):
         """Test notification creation failure handling."""
         # Setup mocks
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
-        mock_table.put_item.side_effect = Exception("DynamoDB error")
+        mock_boto3.return_value.meta.client.transact_write_items.side_effect = (
+            Exception("DynamoDB error")
+        )
 
         repo = NotificationRepository()
 
@@ -74,7 +135,7 @@ class TestNotificationRepository(unittest.TestCase):
         # Verify
         self.assertFalse(result)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_notification_success(self, mock_boto3):
         """Test successful notification retrieval."""
         # Setup mocks
@@ -93,7 +154,7 @@ class TestNotificationRepository(unittest.TestCase):
             Key={"notification_id": "test-notification-123"}
         )
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_notification_not_found(self, mock_boto3):
         """Test notification retrieval when notification doesn't exist."""
         # Setup mocks
@@ -109,7 +170,7 @@ class TestNotificationRepository(unittest.TestCase):
         # Verify
         self.assertIsNone(result)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_notification_failure(self, mock_boto3):
         """Test notification retrieval failure handling."""
         # Setup mocks
@@ -125,7 +186,7 @@ class TestNotificationRepository(unittest.TestCase):
         # Verify
         self.assertIsNone(result)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_notifications_for_coach_success(self, mock_boto3):
         """Test successful retrieval of notifications for a coach."""
         # Setup mocks
@@ -148,7 +209,7 @@ class TestNotificationRepository(unittest.TestCase):
         self.assertEqual(call_args["ScanIndexForward"], False)  # Newest first
         self.assertEqual(call_args["Limit"], 10)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_notifications_for_coach_with_default_limit(self, mock_boto3):
         """Test notifications retrieval uses config default limit when none provided."""
         # Setup mocks
@@ -165,7 +226,7 @@ class TestNotificationRepository(unittest.TestCase):
         call_args = mock_table.query.call_args[1]
         self.assertEqual(call_args["Limit"], NotificationConfig.MAX_ITEMS)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_notifications_for_coach_unread_only(self, mock_boto3):
         """Test retrieval of only unread notifications for a coach."""
         # Setup mocks
@@ -178,11 +239,12 @@ class TestNotificationRepository(unittest.TestCase):
         # Test retrieval with unread_only filter
         repo.get_notifications_for_coach("coach-456", unread_only=True)
 
-        # Verify filter is applied
+        # Verify the sparse unread index is queried instead of filtering after Limit
         call_args = mock_table.query.call_args[1]
-        self.assertIn("FilterExpression", call_args)
+        self.assertEqual(call_args["IndexName"], NotificationConfig.COACH_UNREAD_INDEX)
+        self.assertNotIn("FilterExpression", call_args)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_notifications_for_coach_failure(self, mock_boto3):
         """Test handling of failures when retrieving notifications for coach."""
         # Setup mocks
@@ -198,7 +260,32 @@ class TestNotificationRepository(unittest.TestCase):
         # Verify
         self.assertEqual(result, [])
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
+    def test_get_notifications_page_for_coach_resumes(self, mock_boto3):
+        """Test a notifications page is read newest first from the resume key."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.query.return_value = {
+            "Items": [self.test_notification_data],
+            "LastEvaluatedKey": {"notification_id": "test-notification-123"},
+        }
+
+        repo = NotificationRepository()
+        items, last_key = repo.get_notifications_page_for_coach(
+            "coach-456", 1, exclusive_start_key={"notification_id": "previous"}
+        )
+
+        self.assertEqual(items, [self.test_notification_data])
+        self.assertEqual(last_key, {"notification_id": "test-notification-123"})
+        call_args = mock_table.query.call_args[1]
+        self.assertEqual(call_args["IndexName"], NotificationConfig.COACH_INDEX)
+        self.assertFalse(call_args["ScanIndexForward"])
+        self.assertEqual(
+            call_args["ExclusiveStartKey"], {"notification_id": "previous"}
+        )
+        self.assertEqual(call_args["Limit"], 1)
+
+    @patch("boto3.resource")
     def test_update_notification_success(self, mock_boto3):
         """Test successful notification update."""
         # Setup mocks
@@ -223,7 +310,7 @@ class TestNotificationRepository(unittest.TestCase):
         self.assertIn(":is_read", call_args["ExpressionAttributeValues"])
         self.assertIn(":notes", call_args["ExpressionAttributeValues"])
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_update_notification_failure(self, mock_boto3):
         """Test notification update failure handling."""
         # Setup mocks
@@ -239,30 +326,182 @@ class TestNotificationRepository(unittest.TestCase):
         # Verify
         self.assertFalse(result)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_mark_notification_as_read_success(self, mock_boto3):
-        """Test successful marking notification as read."""
-        # Setup mocks
-        mock_table = MagicMock()
-        mock_boto3.return_value.Table.return_value = mock_table
-        mock_table.update_item.return_value = {}
+        """Test marking as read decrements the unread counter in the same transaction."""
+        client = mock_boto3.return_value.meta.client
 
         repo = NotificationRepository()
 
         # Test marking as read
-        result = repo.mark_notification_as_read("test-notification-123")
+        result = repo.mark_notification_as_read("test-notification-123", "coach-456")
 
         # Verify
         self.assertTrue(result)
-        mock_table.update_item.assert_called_once()
+        transact_items = client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(
+            transact_items[0]["Update"]["ConditionExpression"], "is_read = :false"
+        )
+        self.assertEqual(
+            transact_items[1]["Update"]["Key"],
+            {"notification_id": "unread-counter#coach-456"},
+        )
+        self.assertEqual(
+            transact_items[1]["Update"]["ExpressionAttributeValues"], {":delta": -1}
+        )
+
+    @patch("boto3.resource")
+    def test_mark_notification_as_read_looks_up_coach(self, mock_boto3):
+        """Test the coach is read from the notification when not given."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {"Item": self.test_notification_data}
+        client = mock_boto3.return_value.meta.client
+
+        repo = NotificationRepository()
+
+        self.assertTrue(repo.mark_notification_as_read("test-notification-123"))
+        transact_items = client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(
+            transact_items[1]["Update"]["Key"],
+            {"notification_id": "unread-counter#coach-456"},
+        )
+
+    @patch("boto3.resource")
+    def test_mark_notification_as_read_already_read(self, mock_boto3):
+        """Test marking an already read notification succeeds without decrementing."""
+        mock_boto3.return_value.meta.client.transact_write_items.side_effect = (
+            ClientError(
+                {
+                    "Error": {"Code": "TransactionCanceledException"},
+                    "CancellationReasons": [
+                        {"Code": "ConditionalCheckFailed"},
+                        {"Code": "None"},
+                    ],
+                },
+                "TransactWriteItems",
+            )
+        )
+
+        repo = NotificationRepository()
+
+        self.assertTrue(
+            repo.mark_notification_as_read("test-notification-123", "coach-456")
+        )
+
+    @patch("boto3.resource")
+    def test_mark_notification_as_read_failure(self, mock_boto3):
+        """Test other transaction failures are reported."""
+        mock_boto3.return_value.meta.client.transact_write_items.side_effect = (
+            ClientError(
+                {"Error": {"Code": "ValidationException"}}, "TransactWriteItems"
+            )
+        )
+
+        repo = NotificationRepository()
+
+        self.assertFalse(
+            repo.mark_notification_as_read("test-notification-123", "coach-456")
+        )
+
+    @patch("boto3.resource")
+    def test_mark_notifications_as_read_chunks_transactions(self, mock_boto3):
+        """Test bulk mark-read splits into transactions of 99 updates plus the counter."""
+        client = mock_boto3.return_value.meta.client
+
+        repo = NotificationRepository()
+        notification_ids = [f"n{i}" for i in range(150)] + ["n0"]
+
+        self.assertEqual(
+            repo.mark_notifications_as_read("coach-456", notification_ids), 150
+        )
+
+        calls = client.transact_write_items.call_args_list
+        self.assertEqual(len(calls), 2)
+        first, second = (call.kwargs["TransactItems"] for call in calls)
+        self.assertEqual(len(first), 100)
+        self.assertEqual(len(second), 52)
+        self.assertEqual(
+            first[0]["Update"]["ConditionExpression"],
+            "coach_id = :coach_id AND is_read = :false",
+        )
+        self.assertEqual(
+            first[-1]["Update"]["ExpressionAttributeValues"], {":delta": -99}
+        )
+        self.assertEqual(
+            second[-1]["Update"]["ExpressionAttributeValues"], {":delta": -51}
+        )
+
+    @patch("boto3.resource")
+    def test_mark_notifications_as_read_retries_without_failed_conditions(
+        self, mock_boto3
+    ):
+        """Test notifications failing their condition are dropped and the rest retried."""
+        client = mock_boto3.return_value.meta.client
+        client.transact_write_items.side_effect = [
+            ClientError(
+                {
+                    "Error": {"Code": "TransactionCanceledException"},
+                    "CancellationReasons": [
+                        {"Code": "None"},
+                        {"Code": "ConditionalCheckFailed"},
+                        {"Code": "None"},
+                        {"Code": "None"},
+                    ],
+                },
+                "TransactWriteItems",
+            ),
+            {},
+        ]
+
+        repo = NotificationRepository()
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+        self.assertEqual(
+            repo.mark_notifications_as_read("coach-456", ["n1", "n2", "n3"]), 2
+        )
+        retried = client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(
+            [item["Update"]["Key"] for item in retried[:-1]],
+            [{"notification_id": "n1"}, {"notification_id": "n3"}],
+        )
+        self.assertEqual(
+            retried[-1]["Update"]["ExpressionAttributeValues"], {":delta": -2}
+        )
+
+    @patch("boto3.resource")
+    def test_mark_all_notifications_as_read_follows_unread_index(self, mock_boto3):
+        """Test mark-all reads every page of the unread index and marks each page."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.query.side_effect = [
+            {
+                "Items": [{"notification_id": "n1"}, {"notification_id": "n2"}],
+                "LastEvaluatedKey": {"notification_id": "n2"},
+            },
+            {"Items": [{"notification_id": "n3"}]},
+        ]
+        client = mock_boto3.return_value.meta.client
+
+        repo = NotificationRepository()
+
+        self.assertEqual(repo.mark_all_notifications_as_read("coach-456"), 3)
+        self.assertEqual(client.transact_write_items.call_count, 2)
+        first_query = mock_table.query.call_args_list[0].kwargs
+        self.assertEqual(
+            first_query["IndexName"], NotificationConfig.COACH_UNREAD_INDEX
+        )
+        self.assertEqual(
+            mock_table.query.call_args.kwargs["ExclusiveStartKey"],
+            {"notification_id": "n2"},
+        )
+
+    @patch("boto3.resource")
     def test_get_unread_count_for_coach_success(self, mock_boto3):
-        """Test successful retrieval of unread count for coach."""
+        """Test unread count is a single read of the coach's counter item."""
         # Setup mocks
         mock_table = MagicMock()
         mock_boto3.return_value.Table.return_value = mock_table
-        mock_table.query.return_value = {"Count": 5}
+        mock_table.get_item.return_value = {"Item": {"unread_count": Decimal("5")}}
 
         repo = NotificationRepository()
 
@@ -271,21 +510,19 @@ class TestNotificationRepository(unittest.TestCase):
 
         # Verify
         self.assertEqual(result, 5)
-        mock_table.query.assert_called_once()
-
-        # Verify query parameters
-        call_args = mock_table.query.call_args[1]
-        self.assertEqual(call_args["IndexName"], NotificationConfig.COACH_INDEX)
-        self.assertEqual(call_args["Select"], "COUNT")
-        self.assertIn("FilterExpression", call_args)
+        mock_table.get_item.assert_called_once_with(
+            Key={"notification_id": "unread-counter#coach-456"},
+            ProjectionExpression="unread_count",
+        )
+        mock_table.query.assert_not_called()
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_unread_count_for_coach_zero_count(self, mock_boto3):
-        """Test unread count returns zero when no count in response."""
+        """Test unread count returns zero when the coach has no counter yet."""
         # Setup mocks
         mock_table = MagicMock()
         mock_boto3.return_value.Table.return_value = mock_table
-        mock_table.query.return_value = {}  # No 'Count' key
+        mock_table.get_item.return_value = {}  # No counter item
 
         repo = NotificationRepository()
 
@@ -295,13 +532,13 @@ class TestNotificationRepository(unittest.TestCase):
         # Verify
         self.assertEqual(result, 0)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_get_unread_count_for_coach_failure(self, mock_boto3):
         """Test handling of failures when getting unread count."""
         # Setup mocks
         mock_table = MagicMock()
         mock_boto3.return_value.Table.return_value = mock_table
-        mock_table.query.side_effect = Exception("DynamoDB error")
+        mock_table.get_item.side_effect = Exception("DynamoDB error")
 
         repo = NotificationRepository()
 
@@ -311,12 +548,95 @@ class TestNotificationRepository(unittest.TestCase):
         # Verify
         self.assertEqual(result, 0)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
+    def test_count_unread_notifications_follows_pages(self, mock_boto3):
+        """Test reconciliation counts unread notifications across every page."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.query.side_effect = [
+            {"Count": 3, "LastEvaluatedKey": {"notification_id": "n3"}},
+            {"Count": 2},
+        ]
+
+        repo = NotificationRepository()
+
+        self.assertEqual(repo.count_unread_notifications("coach-456"), 5)
+        self.assertEqual(
+            mock_table.query.call_args_list[1].kwargs["ExclusiveStartKey"],
+            {"notification_id": "n3"},
+        )
+        self.assertEqual(mock_table.query.call_args.kwargs["Select"], "COUNT")
+
+    @patch("boto3.resource")
+    def test_get_unread_counter_reads_consistently(self, mock_boto3):
+        """Test reconciliation reads the stored counter with a consistent read."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {"Item": {"unread_count": Decimal("4")}}
+
+        repo = NotificationRepository()
+
+        self.assertEqual(repo.get_unread_counter("coach-456"), 4)
+        self.assertTrue(mock_table.get_item.call_args.kwargs["ConsistentRead"])
+
+        mock_table.get_item.return_value = {}
+        self.assertIsNone(repo.get_unread_counter("coach-456"))
+
+    @patch("boto3.resource")
+    def test_set_unread_count_is_conditional(self, mock_boto3):
+        """Test the counter is only overwritten if it still holds the value read."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+
+        repo = NotificationRepository()
+
+        self.assertTrue(repo.set_unread_count("coach-456", 3, 1))
+        mock_table.put_item.assert_called_once_with(
+            Item={"notification_id": "unread-counter#coach-456", "unread_count": 3},
+            ConditionExpression="unread_count = :expected",
+            ExpressionAttributeValues={":expected": 1},
+        )
+
+        mock_table.put_item.reset_mock()
+        self.assertTrue(repo.set_unread_count("coach-456", 3, None))
+        self.assertEqual(
+            mock_table.put_item.call_args.kwargs["ConditionExpression"],
+            "attribute_not_exists(notification_id)",
+        )
+
+        mock_table.put_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "PutItem"
+        )
+        self.assertFalse(repo.set_unread_count("coach-456", 3, 1))
+
+    @patch("boto3.resource")
+    def test_get_coach_ids_with_notifications(self, mock_boto3):
+        """Test coaches are collected from every scanned page, skipping counters."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.scan.side_effect = [
+            {
+                "Items": [{"coach_id": "coach-1"}, {}],
+                "LastEvaluatedKey": {"notification_id": "n1"},
+            },
+            {"Items": [{"coach_id": "coach-2"}, {"coach_id": "coach-1"}]},
+        ]
+
+        repo = NotificationRepository()
+
+        self.assertEqual(
+            repo.get_coach_ids_with_notifications(), {"coach-1", "coach-2"}
+        )
+
+    @patch("boto3.resource")
     def test_delete_notification_success(self, mock_boto3):
         """Test successful notification deletion."""
         # Setup mocks
         mock_table = MagicMock()
         mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {
+            "Item": {**self.test_notification_data, "is_read": True}
+        }
         mock_table.delete_item.return_value = {}
 
         repo = NotificationRepository()
@@ -330,12 +650,68 @@ class TestNotificationRepository(unittest.TestCase):
             Key={"notification_id": "test-notification-123"}
         )
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
+    def test_delete_unread_notification_decrements_counter(self, mock_boto3):
+        """Test an unread notification is deleted together with its counter decrement."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {
+            "Item": {**self.test_notification_data, "unread_coach_id": "coach-456"}
+        }
+        client = mock_boto3.return_value.meta.client
+
+        repo = NotificationRepository()
+
+        self.assertTrue(repo.delete_notification("test-notification-123"))
+        self.assertTrue(mock_table.get_item.call_args.kwargs["ConsistentRead"])
+        transact_items = client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(
+            transact_items[0]["Delete"]["ConditionExpression"], "is_read = :false"
+        )
+        self.assertEqual(
+            transact_items[1]["Update"]["Key"],
+            {"notification_id": "unread-counter#coach-456"},
+        )
+        self.assertEqual(
+            transact_items[1]["Update"]["ExpressionAttributeValues"], {":delta": -1}
+        )
+        mock_table.delete_item.assert_not_called()
+
+    @patch("boto3.resource")
+    def test_delete_notification_read_in_the_meantime(self, mock_boto3):
+        """Test a notification read after the lookup is deleted without a decrement."""
+        mock_table = MagicMock()
+        mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {
+            "Item": {**self.test_notification_data, "unread_coach_id": "coach-456"}
+        }
+        mock_boto3.return_value.meta.client.transact_write_items.side_effect = (
+            ClientError(
+                {
+                    "Error": {"Code": "TransactionCanceledException"},
+                    "CancellationReasons": [
+                        {"Code": "ConditionalCheckFailed"},
+                        {"Code": "None"},
+                    ],
+                },
+                "TransactWriteItems",
+            )
+        )
+
+        repo = NotificationRepository()
+
+        self.assertTrue(repo.delete_notification("test-notification-123"))
+        mock_table.delete_item.assert_called_once_with(
+            Key={"notification_id": "test-notification-123"}
+        )
+
+    @patch("boto3.resource")
     def test_delete_notification_failure(self, mock_boto3):
         """Test notification deletion failure handling."""
         # Setup mocks
         mock_table = MagicMock()
         mock_boto3.return_value.Table.return_value = mock_table
+        mock_table.get_item.return_value = {}
         mock_table.delete_item.side_effect = Exception("DynamoDB error")
 
         repo = NotificationRepository()
@@ -346,7 +722,7 @@ class TestNotificationRepository(unittest.TestCase):
         # Verify
         self.assertFalse(result)
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_dynamic_update_expression_building(self, mock_boto3):
         """Test that update expressions are built dynamically from update_data."""
         # Setup mocks
@@ -378,7 +754,7 @@ class TestNotificationRepository(unittest.TestCase):
         self.assertEqual(values[":notes"], "Test notes")
         self.assertEqual(values[":custom_field"], "custom_value")
 
-    @patch("src.repositories.notification_repository.boto3.resource")
+    @patch("boto3.resource")
     def test_complex_workout_data_storage_and_retrieval(self, mock_boto3):
         """Test that complex workout data is stored and retrieved correctly."""
         # Setup mocks
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 from src.repositories.relationship_repository import RelationshipRepository
 from boto3.dynamodb.conditions import Key
+from src.config.relationship_config import RelationshipConfig
 
 
 class TestRelationshipRepository(unittest.TestCase):
@@ -286,31 +287,47 @@ class TestRelationshipRepository(unittest.TestCase):
             "invitation_code": "TEST123",
             "status": "pending",
         }
-        self.mock_table.scan.return_value = {"Items": [mock_data]}
+        self.mock_table.query.return_value = {"Items": [mock_data]}
 
         # Call the method
         result = self.repository.get_relationship_by_code("TEST123")
 
         # Assert
         self.assertEqual(result, mock_data)
-        # Check that scan was called with correct filter
-        from boto3.dynamodb.conditions import Attr
+        # Check that the invitation code index was queried instead of scanning
+        self.mock_table.query.assert_called_once()
+        call_args = self.mock_table.query.call_args[1]
+        self.assertEqual(
+            call_args["IndexName"], RelationshipConfig.INVITATION_CODE_INDEX
+        )
+        self.mock_table.scan.assert_not_called()
 
-        self.mock_table.scan.assert_called_once()
+    def test_get_relationship_by_code_prefers_newest_invite(self):
+        """
+        Test an expired invite sharing a code does not shadow a newer one
+        """
+        expired = {"relationship_id": "old", "invitation_code": "ABC", "ttl": 100}
+        current = {"relationship_id": "new", "invitation_code": "ABC", "ttl": 200}
+        self.mock_table.query.return_value = {"Items": [expired, current]}
+
+        result = self.repository.get_relationship_by_code("ABC")
+
+        self.assertEqual(result["relationship_id"], "new")
 
     def test_get_relationship_by_code_not_found(self):
         """
         Test retrieving a relationship by invitation code when it doesn't exist
         """
         # Setup empty return value
-        self.mock_table.scan.return_value = {"Items": []}
+        self.mock_table.query.return_value = {"Items": []}
 
         # Call the method
         result = self.repository.get_relationship_by_code("NONEXISTENT")
 
         # Assert
         self.assertIsNone(result)
-        self.mock_table.scan.assert_called_once()
+        self.mock_table.query.assert_called_once()
+        self.mock_table.scan.assert_not_called()
 
     def test_get_active_relationship_for_athlete_found(self):
         """
@@ -381,6 +398,32 @@ class TestRelationshipRepository(unittest.TestCase):
         self.assertEqual(call_args["ExpressionAttributeValues"], {":status": "active"})
         self.assertEqual(result, mock_attributes)
 
+    def test_update_relationship_removes_none_values(self):
+        """
+        Test None values are removed so used invitation codes leave the sparse index
+        """
+        self.mock_table.update_item.return_value = {"Attributes": {}}
+
+        self.repository.update_relationship(
+            "rel123",
+            {"athlete_id": "athlete789", "invitation_code": None, "ttl": None},
+        )
+
+        call_args = self.mock_table.update_item.call_args[1]
+        self.assertEqual(
+            call_args["UpdateExpression"],
+            "set #athlete_id = :athlete_id remove #invitation_code, #ttl",
+        )
+        self.assertEqual(
+            call_args["ExpressionAttributeValues"], {":athlete_id": "athlete789"}
+        )
+
+        self.repository.update_relationship("rel123", {"ttl": None})
+
+        call_args = self.mock_table.update_item.call_args[1]
+        self.assertEqual(call_args["UpdateExpression"], "remove #ttl")
+        self.assertNotIn("ExpressionAttributeValues", call_args)
+
     def test_delete_relationship(self):
         """
         Test deleting a relationship
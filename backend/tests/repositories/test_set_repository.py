@@ -234,11 +234,8 @@ class TestSetRepository(unittest.TestCase):
             {"set_id": "set2", "completed_exercise_id": "exercise123"},
         ]
 
-        # Create a batch writer mock
-        mock_batch_writer = MagicMock()
-        mock_batch_context = MagicMock()
-        mock_batch_context.__enter__.return_value = mock_batch_writer
-        self.mock_table.batch_writer.return_value = mock_batch_context
+        batch_write = self.set_repository.dynamodb.batch_write_item
+        batch_write.return_value = {"UnprocessedItems": {}}
 
         # Mock get_sets_by_exercise to return our mock sets
         with patch.object(
@@ -247,13 +244,15 @@ class TestSetRepository(unittest.TestCase):
             # Call the method
             result = self.set_repository.delete_sets_by_exercise("exercise123")
 
-            # Assert batch_writer was called
-            self.mock_table.batch_writer.assert_called_once()
-
-            # Assert delete_item was called for each set
-            self.assertEqual(mock_batch_writer.delete_item.call_count, 2)
-            mock_batch_writer.delete_item.assert_any_call(Key={"set_id": "set1"})
-            mock_batch_writer.delete_item.assert_any_call(Key={"set_id": "set2"})
+            # Assert each set was deleted in one retried BatchWriteItem call
+            batch_write.assert_called_once_with(
+                RequestItems={
+                    self.set_repository.table_name: [
+                        {"DeleteRequest": {"Key": {"set_id": "set1"}}},
+                        {"DeleteRequest": {"Key": {"set_id": "set2"}}},
+                    ]
+                }
+            )
 
             # Assert the result is the number of sets deleted
             self.assertEqual(result, 2)
@@ -269,11 +268,8 @@ class TestSetRepository(unittest.TestCase):
             {"set_id": "set3", "workout_id": "workout123"},
         ]
 
-        # Create a batch writer mock
-        mock_batch_writer = MagicMock()
-        mock_batch_context = MagicMock()
-        mock_batch_context.__enter__.return_value = mock_batch_writer
-        self.mock_table.batch_writer.return_value = mock_batch_context
+        batch_write = self.set_repository.dynamodb.batch_write_item
+        batch_write.return_value = {"UnprocessedItems": {}}
 
         # Mock get_sets_by_workout to return our mock sets
         with patch.object(
@@ -282,14 +278,16 @@ class TestSetRepository(unittest.TestCase):
             # Call the method
             result = self.set_repository.delete_sets_by_workout("workout123")
 
-            # Assert batch_writer was called
-            self.mock_table.batch_writer.assert_called_once()
-
-            # Assert delete_item was called for each set
-            self.assertEqual(mock_batch_writer.delete_item.call_count, 3)
-            mock_batch_writer.delete_item.assert_any_call(Key={"set_id": "set1"})
-            mock_batch_writer.delete_item.assert_any_call(Key={"set_id": "set2"})
-            mock_batch_writer.delete_item.assert_any_call(Key={"set_id": "set3"})
+            # Assert each set was deleted in one retried BatchWriteItem call
+            batch_write.assert_called_once_with(
+                RequestItems={
+                    self.set_repository.table_name: [
+                        {"DeleteRequest": {"Key": {"set_id": "set1"}}},
+                        {"DeleteRequest": {"Key": {"set_id": "set2"}}},
+                        {"DeleteRequest": {"Key": {"set_id": "set3"}}},
+                    ]
+                }
+            )
 
             # Assert the result is the number of sets deleted
             self.assertEqual(result, 3)
@@ -233,10 +233,8 @@ class TestWeekRepository(unittest.TestCase):
             {"week_id": "week3", "block_id": "block123"},
         ]
         self.mock_table.query.return_value = {"Items": mock_weeks}
-
-        # Mock batch writer
-        mock_batch = MagicMock()
-        self.mock_table.batch_writer.return_value.__enter__.return_value = mock_batch
+        batch_write = self.repository.dynamodb.batch_write_item
+        batch_write.return_value = {"UnprocessedItems": {}}
 
         # Call the method
         result = self.repository.delete_weeks_by_block("block123")
@@ -245,11 +243,16 @@ class TestWeekRepository(unittest.TestCase):
         # Verify query was called with correct parameters
         self.mock_table.query.assert_called_once()
 
-        # Verify batch writer was used to delete each week
-        self.assertEqual(mock_batch.delete_item.call_count, 3)
-        mock_batch.delete_item.assert_any_call(Key={"week_id": "week1"})
-        mock_batch.delete_item.assert_any_call(Key={"week_id": "week2"})
-        mock_batch.delete_item.assert_any_call(Key={"week_id": "week3"})
+        # Verify each week was deleted in one retried BatchWriteItem call
+        batch_write.assert_called_once_with(
+            RequestItems={
+                self.repository.table_name: [
+                    {"DeleteRequest": {"Key": {"week_id": "week1"}}},
+                    {"DeleteRequest": {"Key": {"week_id": "week2"}}},
+                    {"DeleteRequest": {"Key": {"week_id": "week3"}}},
+                ]
+            }
+        )
 
         # Verify result is the count of deleted weeks
         self.assertEqual(result, 3)
@@ -260,10 +263,7 @@ class TestWeekRepository(unittest.TestCase):
         """
         # Setup mock to return empty list
         self.mock_table.query.return_value = {"Items": []}
-
-        # Mock batch writer
-        mock_batch = MagicMock()
-        self.mock_table.batch_writer.return_value.__enter__.return_value = mock_batch
+        batch_write = self.repository.dynamodb.batch_write_item
 
         # Call the method
         result = self.repository.delete_weeks_by_block("empty-block")
@@ -271,8 +271,8 @@ class TestWeekRepository(unittest.TestCase):
         # Assert
         self.mock_table.query.assert_called_once()
 
-        # Verify batch writer was not used to delete any weeks
-        mock_batch.delete_item.assert_not_called()
+        # Verify no weeks were sent for deletion
+        batch_write.assert_not_called()
 
         # Verify result is 0 (no weeks deleted)
         self.assertEqual(result, 0)
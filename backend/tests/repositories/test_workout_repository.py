@@ -1,6 +1,11 @@
 import unittest
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
 from src.repositories.workout_repository import WorkoutRepository
+from src.config.workout_config import WorkoutConfig
+from src.config.exercise_config import ExerciseConfig
 
 
 class TestWorkoutRepository(unittest.TestCase):
@@ -123,7 +128,7 @@ class TestWorkoutRepository(unittest.TestCase):
 
         # Assert query was called with correct parameters
         self.mock_table.query.assert_called_once_with(
-            IndexName="athlete-index",
+            IndexName="athlete-date-index",
             KeyConditionExpression=unittest.mock.ANY,
             Limit=unittest.mock.ANY,
         )
@@ -156,13 +161,33 @@ class TestWorkoutRepository(unittest.TestCase):
         # Call the method
         result = self.workout_repository.get_workout_by_day("athlete456", "day789")
 
-        # Assert query was called with correct filter
-        self.mock_table.query.assert_called_once()
+        # Assert the athlete is part of the key condition rather than a filter
+        self.mock_table.query.assert_called_once_with(
+            IndexName="day-athlete-index",
+            KeyConditionExpression=Key("day_id").eq("day789")
+            & Key("athlete_id").eq("athlete456"),
+        )
 
         # Assert the result contains the workout data
         self.assertEqual(result["workout_id"], "workout123")
         self.assertEqual(result["athlete_id"], "athlete456")
 
+    @patch("src.config.workout_config.WorkoutConfig.INDEX_MIGRATION_STAGE", 2)
+    def test_get_workout_by_day_before_day_athlete_index(self):
+        """
+        Test the older day index is filtered by athlete until day-athlete-index is live
+        """
+        self.mock_table.query.return_value = {"Items": [{"workout_id": "workout123"}]}
+
+        result = self.workout_repository.get_workout_by_day("athlete456", "day789")
+
+        self.mock_table.query.assert_called_once_with(
+            IndexName="day-index",
+            KeyConditionExpression=Key("day_id").eq("day789"),
+            FilterExpression=Attr("athlete_id").eq("athlete456"),
+        )
+        self.assertEqual(result, {"workout_id": "workout123"})
+
     def test_get_workout_by_day_not_found(self):
         """
         Test retrieving a workout by day when it doesn't exist
@@ -223,12 +248,71 @@ class TestWorkoutRepository(unittest.TestCase):
             "athlete123", "2025-03-01"
         )
 
-        # Assert query was called with correct parameters
-        self.mock_table.query.assert_called_once()
+        # Assert status and date are key conditions, without a truncating Limit
+        self.mock_table.query.assert_called_once_with(
+            IndexName="athlete-status-index",
+            KeyConditionExpression=Key("athlete_status").eq("athlete123#completed")
+            & Key("date").gte("2025-03-01"),
+        )
 
         # Assert correct number of workouts returned
         self.assertEqual(len(result), 2)
 
+    @patch("src.config.workout_config.WorkoutConfig.INDEX_MIGRATION_STAGE", 1)
+    def test_get_completed_workouts_since_before_status_index(self):
+        """
+        Test completed workouts are filtered from the athlete-date index until the
+        status index is live
+        """
+        self.mock_table.query.return_value = {"Items": [{"workout_id": "w1"}]}
+
+        result = self.workout_repository.get_completed_workouts_since(
+            "athlete123", "2025-03-01"
+        )
+
+        self.mock_table.query.assert_called_once_with(
+            IndexName="athlete-date-index",
+            KeyConditionExpression=Key("athlete_id").eq("athlete123")
+            & Key("date").gte("2025-03-01"),
+            FilterExpression=Attr("status").eq("completed"),
+        )
+        self.assertEqual(result, [{"workout_id": "w1"}])
+
+    def test_get_completed_workouts_since_follows_pages(self):
+        """
+        Test that completed workouts are read across pages instead of being cut short
+        """
+        self.mock_table.query.side_effect = [
+            {"Items": [{"workout_id": "w1"}], "LastEvaluatedKey": {"workout_id": "w1"}},
+            {"Items": [{"workout_id": "w2"}]},
+        ]
+
+        result = self.workout_repository.get_completed_workouts_since(
+            "athlete123", "2025-03-01"
+        )
+
+        self.assertEqual([w["workout_id"] for w in result], ["w1", "w2"])
+        self.assertEqual(
+            self.mock_table.query.call_args_list[1].kwargs["ExclusiveStartKey"],
+            {"workout_id": "w1"},
+        )
+
+    def test_get_workouts_page_date_range(self):
+        """
+        Test that a date range is pushed into the key condition
+        """
+        self.mock_table.query.return_value = {"Items": []}
+
+        self.workout_repository.get_workouts_page(
+            "athlete123", 10, start_date="2025-03-01", end_date="2025-03-31"
+        )
+
+        self.assertEqual(
+            self.mock_table.query.call_args.kwargs["KeyConditionExpression"],
+            Key("athlete_id").eq("athlete123")
+            & Key("date").between("2025-03-01", "2025-03-31"),
+        )
+
     def test_get_completed_exercises_by_type(self):
         """
         Test retrieving completed exercises by type
@@ -331,6 +415,92 @@ class TestWorkoutRepository(unittest.TestCase):
         # Assert that put_item was called on the workout table
         self.mock_table.put_item.assert_called_once()
 
+    def test_create_workout_with_exercises_transaction(self):
+        """
+        Test that a workout and its exercises are written in one transaction
+        """
+        workout = {"workout_id": "workout123", "athlete_id": "athlete456"}
+        exercises = [
+            {
+                "exercise_id": "ex1",
+                "workout_id": "workout123",
+                "weight": 100.5,
+                "athlete_id": "athlete456",
+                "exercise_type": "Squat",
+            },
+            {
+                "exercise_id": "ex2",
+                "workout_id": "workout123",
+                "weight": 80.0,
+                "status": "completed",
+            },
+        ]
+
+        result = self.workout_repository.create_workout_with_exercises(
+            workout, exercises
+        )
+
+        self.assertEqual(result, {**workout, "completed_count": 1, "total_count": 2})
+        client = self.mock_dynamodb.meta.client
+        client.transact_write_items.assert_called_once()
+        items = client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[0]["Put"]["TableName"], WorkoutConfig.TABLE_NAME)
+        self.assertEqual(items[1]["Put"]["TableName"], ExerciseConfig.TABLE_NAME)
+        self.assertEqual(items[1]["Put"]["Item"]["weight"], Decimal("100.5"))
+        self.assertEqual(
+            items[1]["Put"]["Item"]["athlete_exercise_type"], "athlete456#squat"
+        )
+        self.mock_table.put_item.assert_not_called()
+
+    def test_create_workout_with_exercises_over_transaction_limit(self):
+        """
+        Test that large workouts fall back to batched writes, workout last
+        """
+        batch_write = self.mock_dynamodb.batch_write_item
+        batch_write.return_value = {"UnprocessedItems": {}}
+        exercises = [{"exercise_id": f"ex{i}"} for i in range(120)]
+
+        self.workout_repository.create_workout_with_exercises(
+            {"workout_id": "workout123"}, exercises
+        )
+
+        self.mock_dynamodb.meta.client.transact_write_items.assert_not_called()
+        # 120 exercises go out in five chunks of at most 25
+        self.assertEqual(batch_write.call_count, 5)
+        written = [
+            request["PutRequest"]["Item"]["exercise_id"]
+            for call in batch_write.call_args_list
+            for request in call.kwargs["RequestItems"][ExerciseConfig.TABLE_NAME]
+        ]
+        self.assertEqual(sorted(written), sorted(ex["exercise_id"] for ex in exercises))
+        self.mock_table.put_item.assert_called_once_with(
+            Item={"workout_id": "workout123", "completed_count": 0, "total_count": 120}
+        )
+
+    def test_create_workout_with_exercises_rolls_back_on_failure(self):
+        """
+        Test that exercises written by the fallback path are removed if the workout fails
+        """
+        batch_write = self.mock_dynamodb.batch_write_item
+        batch_write.return_value = {"UnprocessedItems": {}}
+        self.mock_table.put_item.side_effect = Exception("Write failed")
+        exercises = [{"exercise_id": f"ex{i}"} for i in range(120)]
+
+        with self.assertRaises(Exception):
+            self.workout_repository.create_workout_with_exercises(
+                {"workout_id": "workout123"}, exercises
+            )
+
+        deleted = [
+            request["DeleteRequest"]["Key"]
+            for call in batch_write.call_args_list
+            for request in call.kwargs["RequestItems"][ExerciseConfig.TABLE_NAME]
+            if "DeleteRequest" in request
+        ]
+        self.assertEqual(len(deleted), 120)
+        self.assertIn({"exercise_id": "ex0"}, deleted)
+
     def test_update_workout(self):
         """
         Test updating a workout
@@ -358,6 +528,176 @@ class TestWorkoutRepository(unittest.TestCase):
         # Assert update was called on the workout itself
         self.mock_table.update_item.assert_called_once()
 
+    def test_update_workout_status_moves_athlete_status_key(self):
+        """
+        Test that a status change also rewrites the athlete-status index key
+        """
+        self.mock_table.get_item.return_value = {"Item": {"athlete_id": "athlete456"}}
+
+        self.workout_repository.update_workout("workout123", {"status": "completed"})
+
+        call_args = self.mock_table.update_item.call_args.kwargs
+        self.assertEqual(
+            call_args["ExpressionAttributeValues"],
+            {":status": "completed", ":athlete_status": "athlete456#completed"},
+        )
+
+    def test_derive_status(self):
+        """
+        Test the status implied by the exercise counters
+        """
+        self.assertIsNone(WorkoutRepository.derive_status(0, 0))
+        self.assertEqual(WorkoutRepository.derive_status(0, 2), "not_started")
+        self.assertEqual(WorkoutRepository.derive_status(1, 2), "in_progress")
+        self.assertEqual(WorkoutRepository.derive_status(2, 2), "completed")
+
+    def test_adjust_exercise_counts_without_status_change(self):
+        """
+        Test that a counter change that keeps the status costs a single write
+        """
+        self.mock_table.update_item.return_value = {
+            "Attributes": {
+                "workout_id": "workout123",
+                "athlete_id": "athlete456",
+                "status": "in_progress",
+                "completed_count": Decimal("2"),
+                "total_count": Decimal("3"),
+            }
+        }
+
+        self.workout_repository.adjust_exercise_counts("workout123", completed_delta=1)
+
+        self.mock_table.update_item.assert_called_once()
+        call_args = self.mock_table.update_item.call_args.kwargs
+        self.assertEqual(
+            call_args["UpdateExpression"],
+            "ADD completed_count :completed, total_count :total",
+        )
+        self.assertEqual(
+            call_args["ExpressionAttributeValues"], {":completed": 1, ":total": 0}
+        )
+        self.assertEqual(
+            call_args["ConditionExpression"], "attribute_exists(total_count)"
+        )
+        self.mock_table.get_item.assert_not_called()
+        self.mock_table.query.assert_not_called()
+
+    def test_adjust_exercise_counts_completes_workout(self):
+        """
+        Test that completing the last exercise moves the workout to completed
+        """
+        self.mock_table.update_item.side_effect = [
+            {
+                "Attributes": {
+                    "workout_id": "workout123",
+                    "athlete_id": "athlete456",
+                    "status": "in_progress",
+                    "completed_count": Decimal("3"),
+                    "total_count": Decimal("3"),
+                }
+            },
+            {"Attributes": {"workout_id": "workout123", "status": "completed"}},
+        ]
+
+        result = self.workout_repository.adjust_exercise_counts(
+            "workout123", completed_delta=1
+        )
+
+        self.assertEqual(result["status"], "completed")
+        status_call = self.mock_table.update_item.call_args_list[1].kwargs
+        self.assertEqual(
+            status_call["ExpressionAttributeValues"],
+            {
+                ":status": "completed",
+                ":completed_count": 3,
+                ":total_count": 3,
+                ":athlete_status": "athlete456#completed",
+            },
+        )
+        self.assertEqual(
+            status_call["ConditionExpression"],
+            "completed_count = :completed_count AND total_count = :total_count",
+        )
+        self.mock_table.get_item.assert_not_called()
+
+    def test_adjust_exercise_counts_ignores_stale_status(self):
+        """
+        Test that a status write losing to a concurrent counter change is dropped
+        """
+        counted = {
+            "workout_id": "workout123",
+            "status": "not_started",
+            "completed_count": Decimal("1"),
+            "total_count": Decimal("3"),
+        }
+        self.mock_table.update_item.side_effect = [
+            {"Attributes": counted},
+            ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+            ),
+        ]
+
+        result = self.workout_repository.adjust_exercise_counts(
+            "workout123", completed_delta=1
+        )
+
+        self.assertEqual(result["status"], "not_started")
+        self.assertEqual(self.mock_table.update_item.call_count, 2)
+
+    @patch("src.repositories.exercise_repository.ExerciseRepository")
+    def test_adjust_exercise_counts_recounts_legacy_workout(
+        self, mock_exercise_repo_class
+    ):
+        """
+        Test that a workout stored without counters is recounted from its exercises,
+        read consistently, including the one just changed
+        """
+        self.mock_table.update_item.side_effect = [
+            ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+            ),
+            {
+                "Attributes": {
+                    "workout_id": "workout123",
+                    "status": "not_started",
+                    "completed_count": Decimal("2"),
+                    "total_count": Decimal("3"),
+                }
+            },
+            {"Attributes": {"workout_id": "workout123", "status": "in_progress"}},
+        ]
+        exercise_repository = mock_exercise_repo_class.return_value
+        # The index has not caught up with ex2 being completed or ex3 being created
+        exercise_repository.get_exercises_by_workout.return_value = [
+            {"exercise_id": "ex1", "status": "completed"},
+            {"exercise_id": "ex2", "status": "planned"},
+        ]
+        exercise_repository.batch_get_exercises.return_value = [
+            {"exercise_id": "ex1", "workout_id": "workout123", "status": "completed"},
+            {"exercise_id": "ex2", "workout_id": "workout123", "status": "completed"},
+            {"exercise_id": "ex3", "workout_id": "workout123", "status": "planned"},
+        ]
+
+        result = self.workout_repository.adjust_exercise_counts(
+            "workout123", completed_delta=1, exercise_ids=["ex2", "ex3"]
+        )
+
+        self.assertEqual(result["status"], "in_progress")
+        exercise_repository.batch_get_exercises.assert_called_once_with(
+            ["ex1", "ex2", "ex2", "ex3"],
+            attributes=["workout_id", "status"],
+            consistent_read=True,
+        )
+        recount_call = self.mock_table.update_item.call_args_list[1].kwargs
+        self.assertEqual(
+            recount_call["ExpressionAttributeValues"],
+            {":completed_count": 2, ":total_count": 3},
+        )
+        self.assertEqual(
+            recount_call["ConditionExpression"],
+            "attribute_exists(workout_id) AND attribute_not_exists(total_count)",
+        )
+
     def test_delete_workout_with_sets(self):
         """
         Test deleting a workout and its sets
@@ -248,16 +248,16 @@ class TestAnalyticsService(unittest.TestCase):
         ]
 
         # Configure mock to return test data
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
         # Call the service method
         result = self.analytics_service.get_max_weight_history("athlete123", "squat")
 
-        # Assert repository was called with correct parameters (NO exercise_type)
-        self.exercise_repository_mock.get_exercises_with_workout_context.assert_called_once_with(
-            athlete_id="athlete123"
+        # Assert only squat rows were read
+        self.exercise_repository_mock.iter_exercises_by_type.assert_called_once_with(
+            "athlete123", "squat"
         )
 
         # Assert the result is correctly processed
@@ -323,7 +323,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -389,7 +389,7 @@ class TestAnalyticsService(unittest.TestCase):
         ]
 
         # Configure mock
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_with_workout_context.return_value = (
             mock_exercises
         )
 
@@ -403,7 +403,7 @@ class TestAnalyticsService(unittest.TestCase):
 
         # Assert repository was called with correct start date
         expected_start_date = "2024-01-01"  # 2024-01-08 - 7 days
-        self.exercise_repository_mock.get_exercises_with_workout_context.assert_called_once_with(
+        self.exercise_repository_mock.iter_exercises_with_workout_context.assert_called_once_with(
             athlete_id="athlete123", start_date=expected_start_date
         )
 
@@ -492,7 +492,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_with_workout_context.return_value = (
             mock_exercises
         )
 
@@ -554,7 +554,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -567,11 +567,10 @@ class TestAnalyticsService(unittest.TestCase):
                 "athlete123", "squat", "month"
             )
 
-        # Assert repository was called with correct parameters (NO exercise_type)
+        # Assert only squat rows of the period were read
         expected_start_date = "2024-01-01"  # 30 days ago
-        self.exercise_repository_mock.get_exercises_with_workout_context.assert_called_once_with(
-            athlete_id="athlete123",
-            start_date=expected_start_date,
+        self.exercise_repository_mock.iter_exercises_by_type.assert_called_once_with(
+            "athlete123", "squat", start_date=expected_start_date
         )
 
         # Assert calculations
@@ -697,8 +696,8 @@ class TestAnalyticsService(unittest.TestCase):
         Should return empty list and handle gracefully
         """
         # Configure mock to raise exception
-        self.exercise_repository_mock.get_exercises_with_workout_context.side_effect = (
-            Exception("Database error")
+        self.exercise_repository_mock.iter_exercises_with_workout_context.side_effect = Exception(
+            "Database error"
         )
 
         with patch("src.services.analytics_service.dt") as mock_dt:
@@ -744,7 +743,7 @@ class TestAnalyticsService(unittest.TestCase):
             }
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_with_workout_context.return_value = (
             mock_exercises
         )
 
@@ -959,7 +958,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -994,7 +993,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_with_workout_context.return_value = (
             mock_exercises
         )
 
@@ -1034,19 +1033,9 @@ class TestAnalyticsService(unittest.TestCase):
                     {"set_number": 1, "reps": 5, "weight": 100, "completed": True},
                 ],
             },
-            {
-                "exercise_id": "ex3",
-                "exercise_type": "deadlift",  # Different exercise type - should be filtered out
-                "status": "completed",
-                "workout_date": "2024-01-01",
-                "workout_status": "completed",
-                "sets_data": [
-                    {"set_number": 1, "reps": 5, "weight": 200, "completed": True},
-                ],
-            },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -1059,7 +1048,6 @@ class TestAnalyticsService(unittest.TestCase):
             )
 
         # Should count all squat sets (2 + 1 = 3) but only 1 training day (ex2 has valid date)
-        # ex3 is filtered out because it's a deadlift, not squat
         expected_result = {
             "exercise_type": "squat",
             "time_period": "month",
@@ -1075,8 +1063,8 @@ class TestAnalyticsService(unittest.TestCase):
         Test get_exercise_frequency when repository raises exception (lines 242-247)
         Should return error response when repository fails
         """
-        self.exercise_repository_mock.get_exercises_with_workout_context.side_effect = (
-            Exception("Database error")
+        self.exercise_repository_mock.iter_exercises_by_type.side_effect = Exception(
+            "Database error"
         )
 
         result = self.analytics_service.get_exercise_frequency(
@@ -1227,7 +1215,7 @@ class TestAnalyticsService(unittest.TestCase):
             }
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -1391,7 +1379,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -1401,8 +1389,8 @@ class TestAnalyticsService(unittest.TestCase):
 
         # Should return 150 (absolute highest across all workouts)
         self.assertEqual(max_weight, 150.0)
-        self.exercise_repository_mock.get_exercises_with_workout_context.assert_called_once_with(
-            athlete_id="test-athlete-id"
+        self.exercise_repository_mock.iter_exercises_by_type.assert_called_once_with(
+            "test-athlete-id", "deadlift"
         )
 
     def test_get_all_time_max_weight_case_insensitive_exercise_type(self):
@@ -1433,7 +1421,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -1492,7 +1480,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -1510,22 +1498,7 @@ class TestAnalyticsService(unittest.TestCase):
         Test get_all_time_max_weight with no exercises matching the exercise type
         Should return 0.0 when no exercises of specified type exist
         """
-        mock_exercises = [
-            {
-                "exercise_id": "ex1",
-                "exercise_type": "squat",  # Different exercise type
-                "status": "completed",
-                "workout_status": "completed",
-                "workout_date": "2025-01-01",
-                "sets_data": [
-                    {"set_number": 1, "reps": 5, "weight": 100, "completed": True},
-                ],
-            },
-        ]
-
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
-            mock_exercises
-        )
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = []
 
         max_weight = self.analytics_service.get_all_time_max_weight(
             "test-athlete-id", "deadlift"
@@ -1563,8 +1536,8 @@ class TestAnalyticsService(unittest.TestCase):
         Should return 0.0 and log error when repository throws exception
         """
         # Mock repository to throw exception
-        self.exercise_repository_mock.get_exercises_with_workout_context.side_effect = (
-            Exception("Database error")
+        self.exercise_repository_mock.iter_exercises_by_type.side_effect = Exception(
+            "Database error"
         )
 
         with patch("builtins.print") as mock_print:
@@ -1577,10 +1550,10 @@ class TestAnalyticsService(unittest.TestCase):
         mock_print.assert_called_once()
         self.assertIn("Error in get_all_time_max_weight", mock_print.call_args[0][0])
 
-    def test_get_all_time_max_weight_multiple_exercise_types_filtered(self):
+    def test_get_all_time_max_weight_reads_only_requested_type(self):
         """
-        Test get_all_time_max_weight correctly filters by exercise type among mixed exercises
-        Should only consider the specified exercise type, ignoring others
+        Test get_all_time_max_weight reads only the requested exercise type
+        Other exercise types are never fetched from the repository
         """
         mock_exercises = [
             {
@@ -1593,36 +1566,6 @@ class TestAnalyticsService(unittest.TestCase):
                     {"set_number": 1, "reps": 5, "weight": 120, "completed": True},
                 ],
             },
-            {
-                "exercise_id": "ex2",
-                "exercise_type": "squat",
-                "status": "completed",
-                "workout_status": "completed",
-                "workout_date": "2025-01-01",
-                "sets_data": [
-                    {
-                        "set_number": 1,
-                        "reps": 5,
-                        "weight": 200,
-                        "completed": True,
-                    },  # Higher weight but different exercise
-                ],
-            },
-            {
-                "exercise_id": "ex3",
-                "exercise_type": "bench press",
-                "status": "completed",
-                "workout_status": "completed",
-                "workout_date": "2025-01-01",
-                "sets_data": [
-                    {
-                        "set_number": 1,
-                        "reps": 5,
-                        "weight": 150,
-                        "completed": True,
-                    },  # Higher weight but different exercise
-                ],
-            },
             {
                 "exercise_id": "ex4",
                 "exercise_type": "deadlift",
@@ -1640,7 +1583,7 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        self.exercise_repository_mock.get_exercises_with_workout_context.return_value = (
+        self.exercise_repository_mock.iter_exercises_by_type.return_value = (
             mock_exercises
         )
 
@@ -1648,8 +1591,11 @@ class TestAnalyticsService(unittest.TestCase):
             "test-athlete-id", "deadlift"
         )
 
-        # Should return 140 (highest deadlift), ignoring 200 (squat) and 150 (bench press)
         self.assertEqual(max_weight, 140.0)
+        self.exercise_repository_mock.iter_exercises_by_type.assert_called_once_with(
+            "test-athlete-id", "deadlift"
+        )
+        self.exercise_repository_mock.iter_exercises_with_workout_context.assert_not_called()
 
     def test_get_dashboard_summary_success(self):
         """Happy path: active block + previous block → PRs with deltas + weekly volume"""
@@ -1712,16 +1658,20 @@ class TestAnalyticsService(unittest.TestCase):
             },
         ]
 
-        def mock_get_exercises(athlete_id, start_date=None):
-            if start_date == "2026-01-15":
+        # The block's date range is pushed down to the repository query
+        def mock_get_exercises(athlete_id, start_date=None, end_date=None):
+            if (start_date, end_date) == ("2026-01-15", "2026-03-15"):
                 return active_exercises
-            elif start_date == "2025-10-01":
+            elif (start_date, end_date) == ("2025-10-01", "2026-01-14"):
                 return prev_exercises
             return []
 
         self.exercise_repository_mock.get_exercises_with_workout_context.side_effect = (
             mock_get_exercises
         )
+        self.exercise_repository_mock.iter_exercises_with_workout_context.side_effect = (
+            mock_get_exercises
+        )
 
         result = self.analytics_service.get_dashboard_summary(
             "athlete-1", "active-block"
@@ -1782,8 +1732,8 @@ class TestAnalyticsService(unittest.TestCase):
             "start_date": "2025-01-01",
             "end_date": "2025-03-01",
         }
-        self.exercise_repository_mock.get_exercises_with_workout_context.side_effect = (
-            Exception("DynamoDB unavailable")
+        self.exercise_repository_mock.iter_exercises_with_workout_context.side_effect = Exception(
+            "DynamoDB unavailable"
         )
         result = self.analytics_service._get_block_sbd_bests(
             "some-block-id", "athlete-1"
@@ -17,6 +17,7 @@ class TestBlockService(unittest.TestCase):
         self.week_repository_mock = MagicMock()
         self.week_service_mock = MagicMock()
         self.day_service_mock = MagicMock()
+        self.cascade_delete_service_mock = MagicMock()
 
         # Create mock objects for week and day services to return
         self.mock_week = MagicMock()
@@ -41,6 +42,7 @@ class TestBlockService(unittest.TestCase):
             self.block_service = BlockService()
             self.block_service.week_service = self.week_service_mock
             self.block_service.day_service = self.day_service_mock
+            self.block_service.cascade_delete_service = self.cascade_delete_service_mock
 
     def tearDown(self):
         """
@@ -189,11 +191,23 @@ class TestBlockService(unittest.TestCase):
         self.assertEqual(result.number_of_weeks, 4)
         self.assertEqual(result.start_date, "2025-03-01")
 
-        # Verify the week_service.create_week was called for each week
-        self.assertEqual(self.week_service_mock.create_week.call_count, 4)
-
-        # Verify day_service.create_day was called for each day (4 weeks * 7 days)
-        self.assertEqual(self.day_service_mock.create_day.call_count, 28)
+        # Verify weeks and days were written in one batch, not one put at a time
+        self.week_repository_mock.create_weeks_with_days.assert_called_once()
+        (
+            week_dicts,
+            day_dicts,
+        ) = self.week_repository_mock.create_weeks_with_days.call_args[0]
+        self.assertEqual(len(week_dicts), 4)
+        self.assertEqual(len(day_dicts), 28)  # 4 weeks * 7 days
+        self.week_service_mock.create_week.assert_not_called()
+        self.day_service_mock.create_day.assert_not_called()
+
+        # Verify the skeleton is linked and dated correctly
+        self.assertEqual([w["week_number"] for w in week_dicts], [1, 2, 3, 4])
+        self.assertTrue(all(w["block_id"] == "test-uuid" for w in week_dicts))
+        self.assertEqual(day_dicts[0]["date"], "2025-03-01")
+        self.assertEqual(day_dicts[-1]["date"], "2025-03-28")
+        self.assertEqual(day_dicts[-1]["day_number"], 7)
 
     def test_create_block_without_coach(self):
         """
@@ -227,38 +241,47 @@ class TestBlockService(unittest.TestCase):
         self.assertEqual(actual_arg["status"], "active")
         self.assertEqual(actual_arg["number_of_weeks"], 4)
 
-        # Verify the week_service.create_week was called for each week
-        self.assertEqual(self.week_service_mock.create_week.call_count, 4)
-
-        # Verify day_service.create_day was called for each day (4 weeks * 7 days)
-        self.assertEqual(self.day_service_mock.create_day.call_count, 28)
+        # Verify weeks and days were written in one batch (4 weeks * 7 days)
+        (
+            week_dicts,
+            day_dicts,
+        ) = self.week_repository_mock.create_weeks_with_days.call_args[0]
+        self.assertEqual(len(week_dicts), 4)
+        self.assertEqual(len(day_dicts), 28)
 
     def test_delete_block(self):
         """
         Test deleting a block
         """
-        # Configure mock to return a successful response
-        self.block_repository_mock.delete_block.return_value = {
-            "ResponseMetadata": {"HTTPStatusCode": 200}
+        # Configure mock to report a full cascade
+        self.cascade_delete_service_mock.delete_block.return_value = {
+            "blocks": 1,
+            "weeks": 4,
+            "days": 28,
+            "workouts": 3,
+            "exercises": 12,
         }
 
         # Call the service method
         success_result = self.block_service.delete_block("block123")
 
-        # Assert repository was called with correct ID
-        self.block_repository_mock.delete_block.assert_called_once_with("block123")
+        # Assert the cascade was run for the block
+        self.cascade_delete_service_mock.delete_block.assert_called_once_with(
+            "block123"
+        )
 
-        # Assert the result is True (successful deletion)
-        self.assertTrue(success_result)
+        # Assert the cascade counts are returned
+        self.assertEqual(success_result["blocks"], 1)
+        self.assertEqual(success_result["exercises"], 12)
 
         # Test handling of an exception
-        self.block_repository_mock.delete_block.side_effect = Exception(
+        self.cascade_delete_service_mock.delete_block.side_effect = Exception(
             "Deletion failed"
         )
-        delete_result = self.block_service.delete_block("block123")
 
-        # Assert result is False due to the exception
-        self.assertFalse(delete_result)
+        # A cascade that fails partway is not reported as a successful delete
+        with self.assertRaises(Exception):
+            self.block_service.delete_block("block123")
 
     def test_update_block(self):
         """
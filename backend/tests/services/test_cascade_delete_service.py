@@ -0,0 +1,191 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from src.services.cascade_delete_service import CascadeDeleteService
+from src.config.week_config import WeekConfig
+from src.config.day_config import DayConfig
+from src.config.workout_config import WorkoutConfig
+from src.config.exercise_config import ExerciseConfig
+
+
+class TestCascadeDeleteService(unittest.TestCase):
+    """
+    Test suite for the CascadeDeleteService class
+    """
+
+    def setUp(self):
+        """
+        Set up test environment before each test method
+        """
+        # Share one mock so every call lands in a single ordered call list
+        self.repository_mock = MagicMock()
+
+        with patch(
+            "src.services.cascade_delete_service.BlockRepository",
+            return_value=self.repository_mock,
+        ), patch(
+            "src.services.cascade_delete_service.WeekRepository",
+            return_value=self.repository_mock,
+        ), patch(
+            "src.services.cascade_delete_service.DayRepository",
+            return_value=self.repository_mock,
+        ), patch(
+            "src.services.cascade_delete_service.WorkoutRepository",
+            return_value=self.repository_mock,
+        ), patch(
+            "src.services.cascade_delete_service.ExerciseRepository",
+            return_value=self.repository_mock,
+        ):
+            self.cascade_delete_service = CascadeDeleteService()
+
+        self.repository_mock.get_weeks_by_block.return_value = [
+            {"week_id": "week1"},
+            {"week_id": "week2"},
+        ]
+        self.repository_mock.batch_get_days_by_week_ids.return_value = [
+            {"day_id": "day1"},
+            {"day_id": "day2"},
+            {"day_id": "day3"},
+        ]
+        self.repository_mock.batch_get_workouts_by_day_ids.return_value = [
+            {"workout_id": "workout1"}
+        ]
+        self.repository_mock.batch_get_exercises_by_day_ids.return_value = [
+            {"exercise_id": "ex1"},
+            {"exercise_id": "ex2"},
+        ]
+        # ex2 is found through both its day and its workout
+        self.repository_mock.batch_get_exercises_by_workout_ids.return_value = [
+            {"exercise_id": "ex2"},
+            {"exercise_id": "ex3"},
+        ]
+        self.repository_mock.delete_block.return_value = {"block_id": "block123"}
+        self.repository_mock.delete_week.return_value = {"week_id": "week1"}
+        self.repository_mock.delete_day.return_value = {"day_id": "day1"}
+
+    def _deleted_tables(self):
+        """
+        Tables passed to batch_delete_items, in call order
+        """
+        return [
+            call.args[0][0][0]
+            for call in self.repository_mock.batch_delete_items.call_args_list
+            if call.args[0]
+        ]
+
+    def test_delete_block(self):
+        """
+        Test deleting a block removes every level bottom-up and reports counts
+        """
+        counts = self.cascade_delete_service.delete_block("block123")
+
+        self.assertEqual(
+            counts,
+            {"blocks": 1, "weeks": 2, "days": 3, "workouts": 1, "exercises": 3},
+        )
+        self.repository_mock.batch_get_days_by_week_ids.assert_called_once_with(
+            ["week1", "week2"]
+        )
+        self.repository_mock.batch_get_exercises_by_workout_ids.assert_called_once_with(
+            ["workout1"]
+        )
+        self.assertEqual(
+            self._deleted_tables(),
+            [
+                ExerciseConfig.TABLE_NAME,
+                WorkoutConfig.TABLE_NAME,
+                DayConfig.TABLE_NAME,
+                WeekConfig.TABLE_NAME,
+            ],
+        )
+
+        exercise_deletes = self.repository_mock.batch_delete_items.call_args_list[0]
+        self.assertEqual(
+            [key for _, key in exercise_deletes.args[0]],
+            [{"exercise_id": "ex1"}, {"exercise_id": "ex2"}, {"exercise_id": "ex3"}],
+        )
+
+        # The block goes last, after all of its children
+        self.assertEqual(self.repository_mock.mock_calls[-1][0], "delete_block")
+        self.repository_mock.delete_block.assert_called_once_with("block123")
+
+    def test_delete_block_resumes_after_interruption(self):
+        """
+        Test a failed level leaves the parents in place so the delete can be re-run
+        """
+        self.repository_mock.batch_delete_items.side_effect = [
+            None,
+            RuntimeError("BatchWriteItem left 1 items unprocessed"),
+        ]
+
+        with self.assertRaises(RuntimeError):
+            self.cascade_delete_service.delete_block("block123")
+
+        self.repository_mock.delete_block.assert_not_called()
+
+        self.repository_mock.batch_delete_items.side_effect = None
+        counts = self.cascade_delete_service.delete_block("block123")
+
+        self.assertEqual(counts["blocks"], 1)
+        self.repository_mock.delete_block.assert_called_once_with("block123")
+
+    def test_delete_block_already_deleted(self):
+        """
+        Test deleting a block that no longer exists reports no block deleted
+        """
+        self.repository_mock.get_weeks_by_block.return_value = []
+        self.repository_mock.batch_get_days_by_week_ids.return_value = []
+        self.repository_mock.batch_get_workouts_by_day_ids.return_value = []
+        self.repository_mock.batch_get_exercises_by_day_ids.return_value = []
+        self.repository_mock.batch_get_exercises_by_workout_ids.return_value = []
+        self.repository_mock.delete_block.return_value = {}
+
+        counts = self.cascade_delete_service.delete_block("missing")
+
+        self.assertEqual(
+            counts,
+            {"blocks": 0, "weeks": 0, "days": 0, "workouts": 0, "exercises": 0},
+        )
+
+    def test_delete_week(self):
+        """
+        Test deleting a week removes its days, workouts and exercises
+        """
+        counts = self.cascade_delete_service.delete_week("week1")
+
+        self.assertEqual(
+            counts,
+            {"blocks": 0, "weeks": 1, "days": 3, "workouts": 1, "exercises": 3},
+        )
+        self.repository_mock.batch_get_days_by_week_ids.assert_called_once_with(
+            ["week1"]
+        )
+        self.assertEqual(
+            self._deleted_tables(),
+            [ExerciseConfig.TABLE_NAME, WorkoutConfig.TABLE_NAME, DayConfig.TABLE_NAME],
+        )
+        self.repository_mock.delete_week.assert_called_once_with("week1")
+        self.repository_mock.delete_block.assert_not_called()
+
+    def test_delete_day(self):
+        """
+        Test deleting a day removes its workouts and exercises
+        """
+        counts = self.cascade_delete_service.delete_day("day1")
+
+        self.assertEqual(
+            counts,
+            {"blocks": 0, "weeks": 0, "days": 1, "workouts": 1, "exercises": 3},
+        )
+        self.repository_mock.batch_get_workouts_by_day_ids.assert_called_once_with(
+            ["day1"]
+        )
+        self.assertEqual(
+            self._deleted_tables(),
+            [ExerciseConfig.TABLE_NAME, WorkoutConfig.TABLE_NAME],
+        )
+        self.repository_mock.delete_day.assert_called_once_with("day1")
+        self.repository_mock.batch_get_days_by_week_ids.assert_not_called()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -11,6 +11,7 @@ class TestDayService(unittest.TestCase):
         """Set up test environment before each test method"""
         self.day_repository_mock = MagicMock()
         self.exercise_repository_mock = MagicMock()
+        self.cascade_delete_service_mock = MagicMock()
 
         # Create patcher for uuid4 to return predictable IDs
         self.uuid_patcher = patch("uuid.uuid4", return_value="test-uuid")
@@ -23,6 +24,9 @@ class TestDayService(unittest.TestCase):
         ), patch(
             "src.services.day_service.ExerciseRepository",
             return_value=self.exercise_repository_mock,
+        ), patch(
+            "src.services.day_service.CascadeDeleteService",
+            return_value=self.cascade_delete_service_mock,
         ):
             self.day_service = DayService()
 
@@ -214,24 +218,25 @@ class TestDayService(unittest.TestCase):
         self.assertEqual(result.focus, "squat")
 
     def test_delete_day(self):
-        """Test deleting a day and its exercises (cascading delete)"""
+        """Test deleting a day and its workouts and exercises (cascading delete)"""
         # Configure mock responses
-        self.exercise_repository_mock.delete_exercises_by_day.return_value = 3
-        self.day_repository_mock.delete_day.return_value = {
-            "ResponseMetadata": {"HTTPStatusCode": 200}
+        self.cascade_delete_service_mock.delete_day.return_value = {
+            "blocks": 0,
+            "weeks": 0,
+            "days": 1,
+            "workouts": 1,
+            "exercises": 3,
         }
 
         # Call the service method
         result = self.day_service.delete_day("day123")
 
-        # Assert repository methods were called in the correct order with correct ID
-        self.exercise_repository_mock.delete_exercises_by_day.assert_called_once_with(
-            "day123"
-        )
-        self.day_repository_mock.delete_day.assert_called_once_with("day123")
+        # Assert the cascade was run for the day
+        self.cascade_delete_service_mock.delete_day.assert_called_once_with("day123")
 
-        # Assert the result is True (successful deletion)
-        self.assertTrue(result)
+        # Assert the cascade counts are returned
+        self.assertEqual(result["days"], 1)
+        self.assertEqual(result["exercises"], 3)
 
     def test_get_days_for_week_empty(self):
         """Test retrieving days for a week that has no days"""
@@ -74,6 +74,27 @@ class TestExerciseService(unittest.TestCase):
         self.assertEqual(result.order, 1)
         self.assertEqual(result.status, "planned")
 
+    def test_get_exercise_ignores_index_key(self):
+        """
+        Test the athlete-type index key stored on exercises is not passed to the model
+        """
+        self.exercise_repository_mock.get_exercise.return_value = {
+            "exercise_id": "ex123",
+            "workout_id": "workout456",
+            "exercise_type": "Squat",
+            "sets": 5,
+            "reps": 5,
+            "weight": 315.0,
+            "athlete_id": "athlete789",
+            "workout_date": "2024-06-25",
+            "athlete_exercise_type": "athlete789#squat",
+        }
+
+        result = self.exercise_service.get_exercise("ex123")
+
+        self.assertIsInstance(result, Exercise)
+        self.assertEqual(result.athlete_id, "athlete789")
+
     def test_get_exercise_not_found(self):
         """
         Test retrieving a non-existent exercise returns None
@@ -316,28 +337,48 @@ class TestExerciseService(unittest.TestCase):
         ]
 
         # Configure mock to return exercises for get_exercises_for_workout
-        # We need to return this twice: once for initially loading, once after reordering
         self.exercise_repository_mock.get_exercises_by_workout.return_value = (
             mock_exercises
         )
 
-        # Mock the update_exercise method to avoid having to set up complex return behavior
-        with patch.object(
-            self.exercise_service, "update_exercise"
-        ) as mock_update_exercise:
-            # Call the service method
-            self.exercise_service.reorder_exercises("workout123", exercise_order)
+        # Call the service method
+        result = self.exercise_service.reorder_exercises("workout123", exercise_order)
+
+        # All three orders change and are written in a single call
+        self.exercise_repository_mock.update_exercise_orders.assert_called_once_with(
+            "workout123", {"ex3": 1, "ex1": 2, "ex2": 3}
+        )
+        self.exercise_repository_mock.update_exercise.assert_not_called()
+
+        # The reordered list is built in memory, not read back
+        self.exercise_repository_mock.get_exercises_by_workout.assert_called_once()
+        self.assertEqual([ex.exercise_id for ex in result], ["ex3", "ex1", "ex2"])
+        self.assertEqual([ex.order for ex in result], [1, 2, 3])
+
+    def test_reorder_exercises_uses_given_exercises(self):
+        """Test reordering exercises the caller already read skips reads and no-op writes"""
+        exercises = [
+            Exercise(
+                exercise_id=f"ex{i}",
+                workout_id="workout123",
+                exercise_type="Squat",
+                sets=3,
+                reps=5,
+                weight=100.0,
+                order=i,
+            )
+            for i in (1, 2, 3)
+        ]
 
-            # Assert update_exercise was called for each exercise with the correct order
-            # First call: update ex3 to order 1
-            mock_update_exercise.assert_any_call("ex3", {"order": 1})
-            # Second call: update ex1 to order 2
-            mock_update_exercise.assert_any_call("ex1", {"order": 2})
-            # Third call: update ex2 to order 3
-            mock_update_exercise.assert_any_call("ex2", {"order": 3})
+        result = self.exercise_service.reorder_exercises(
+            "workout123", ["ex1", "ex3", "ex2"], exercises=exercises
+        )
 
-            # Assert update_exercise was called the correct number of times
-            self.assertEqual(mock_update_exercise.call_count, 3)
+        self.exercise_repository_mock.get_exercises_by_workout.assert_not_called()
+        self.exercise_repository_mock.update_exercise_orders.assert_called_once_with(
+            "workout123", {"ex3": 2, "ex2": 3}
+        )
+        self.assertEqual([ex.exercise_id for ex in result], ["ex1", "ex3", "ex2"])
 
     def test_reorder_exercises_with_invalid_ids(self):
         """Test reordering with some invalid exercise IDs"""
@@ -373,19 +414,13 @@ class TestExerciseService(unittest.TestCase):
             mock_exercises
         )
 
-        # Mock the update_exercise method
-        with patch.object(
-            self.exercise_service, "update_exercise"
-        ) as mock_update_exercise:
-            # Call the service method
-            self.exercise_service.reorder_exercises("workout123", exercise_order)
-
-            # Assert update_exercise was called for valid IDs with the correct order
-            mock_update_exercise.assert_any_call("ex1", {"order": 1})
-            mock_update_exercise.assert_any_call("ex2", {"order": 3})
+        # Call the service method
+        self.exercise_service.reorder_exercises("workout123", exercise_order)
 
-            # Assert update_exercise was called only for valid IDs (2 times, not 3)
-            self.assertEqual(mock_update_exercise.call_count, 2)
+        # Only valid IDs are written; ex1 already has order 1
+        self.exercise_repository_mock.update_exercise_orders.assert_called_once_with(
+            "workout123", {"ex2": 3}
+        )
 
     def test_reorder_sets_success_simple_reorder(self):
         """
@@ -434,40 +469,35 @@ class TestExerciseService(unittest.TestCase):
             {"set_number": 3, "reps": 8, "weight": 105, "completed": True},  # Was set 2
         ]
 
-        # Mock update_exercise to return updated exercise
-        with patch.object(self.exercise_service, "update_exercise") as mock_update:
-            from src.models.exercise import Exercise
-
-            updated_exercise = Exercise.from_dict(updated_exercise_dict)
-            mock_update.return_value = updated_exercise
+        # The repository write returns the updated exercise
+        self.exercise_repository_mock.update_exercise.return_value = (
+            updated_exercise_dict
+        )
 
-            new_order = [3, 1, 2]  # Reorder: set 3 first, then set 1, then set 2
+        new_order = [3, 1, 2]  # Reorder: set 3 first, then set 1, then set 2
 
-            # Act
-            result = self.exercise_service.reorder_sets(exercise_id, new_order)
+        # Act
+        result = self.exercise_service.reorder_sets(exercise_id, new_order)
 
-            # Assert
-            self.assertIsNotNone(result)
-            self.assertEqual(len(result.sets_data), 3)
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(len(result.sets_data), 3)
 
-            # Verify the sets are reordered correctly
-            self.assertEqual(
-                result.sets_data[0]["reps"], 6
-            )  # Original set 3 → position 1
-            self.assertEqual(
-                result.sets_data[1]["reps"], 10
-            )  # Original set 1 → position 2
-            self.assertEqual(
-                result.sets_data[2]["reps"], 8
-            )  # Original set 2 → position 3
+        # Verify the sets are reordered correctly
+        self.assertEqual(result.sets_data[0]["reps"], 6)  # Original set 3 → position 1
+        self.assertEqual(result.sets_data[1]["reps"], 10)  # Original set 1 → position 2
+        self.assertEqual(result.sets_data[2]["reps"], 8)  # Original set 2 → position 3
 
-            # Verify set_numbers are sequential
-            self.assertEqual(result.sets_data[0]["set_number"], 1)
-            self.assertEqual(result.sets_data[1]["set_number"], 2)
-            self.assertEqual(result.sets_data[2]["set_number"], 3)
+        # Verify set_numbers are sequential
+        self.assertEqual(result.sets_data[0]["set_number"], 1)
+        self.assertEqual(result.sets_data[1]["set_number"], 2)
+        self.assertEqual(result.sets_data[2]["set_number"], 3)
 
-            # Verify update_exercise was called with correct data
-            mock_update.assert_called_once()
+        # Verify one write with the renumbered sets and no read back
+        self.exercise_repository_mock.update_exercise.assert_called_once_with(
+            exercise_id, {"sets_data": updated_exercise_dict["sets_data"]}
+        )
+        self.exercise_repository_mock.get_exercise.assert_called_once_with(exercise_id)
 
     def test_reorder_sets_exercise_not_found(self):
         """
@@ -582,23 +612,19 @@ class TestExerciseService(unittest.TestCase):
 
         self.exercise_repository_mock.get_exercise.return_value = exercise_dict
 
-        # Mock update_exercise to return same exercise
-        with patch.object(self.exercise_service, "update_exercise") as mock_update:
-            from src.models.exercise import Exercise
-
-            exercise = Exercise.from_dict(exercise_dict)
-            mock_update.return_value = exercise
+        new_order = [1]
 
-            new_order = [1]
+        # Act
+        result = self.exercise_service.reorder_sets(exercise_id, new_order)
 
-            # Act
-            result = self.exercise_service.reorder_sets(exercise_id, new_order)
+        # Assert
+        self.assertIsNotNone(result)
+        self.assertEqual(len(result.sets_data), 1)
+        self.assertEqual(result.sets_data[0]["set_number"], 1)
+        self.assertEqual(result.sets_data[0]["reps"], 10)
 
-            # Assert
-            self.assertIsNotNone(result)
-            self.assertEqual(len(result.sets_data), 1)
-            self.assertEqual(result.sets_data[0]["set_number"], 1)
-            self.assertEqual(result.sets_data[0]["reps"], 10)
+        # Nothing moved, so nothing is written
+        self.exercise_repository_mock.update_exercise.assert_not_called()
 
     def test_get_exercises_for_workout_empty(self):
         """Test retrieving exercises for a workout that has no exercises"""
@@ -620,89 +646,33 @@ class TestExerciseService(unittest.TestCase):
         """
         Test deleting all exercises associated with a workout
         """
-        # Mock data for exercises
-        mock_exercises = [
-            {
-                "exercise_id": "ex1",
-                "workout_id": "workout123",
-                "exercise_type": "Squat",
-            },
-            {
-                "exercise_id": "ex2",
-                "workout_id": "workout123",
-                "exercise_type": "Bench Press",
-            },
-            {
-                "exercise_id": "ex3",
-                "workout_id": "workout123",
-                "exercise_type": "Deadlift",
-            },
-        ]
-
-        # Mock the batch writer
-        mock_batch_writer = MagicMock()
-        mock_context_manager = MagicMock()
-        mock_context_manager.__enter__ = MagicMock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = MagicMock(return_value=None)
-
-        # Configure mocks
-        self.exercise_repository_mock.get_exercises_by_workout.return_value = (
-            mock_exercises
-        )
-        self.exercise_repository_mock.table.batch_writer.return_value = (
-            mock_context_manager
-        )
+        self.exercise_repository_mock.delete_exercises_by_workout.return_value = 3
 
         # Call the service method
         result = self.exercise_service.delete_exercises_by_workout("workout123")
 
-        # Assert repository was called to get exercises
-        self.exercise_repository_mock.get_exercises_by_workout.assert_called_once_with(
+        # Assert the repository's retried batch delete was used
+        self.exercise_repository_mock.delete_exercises_by_workout.assert_called_once_with(
             "workout123"
         )
 
-        # Assert batch writer was used
-        self.exercise_repository_mock.table.batch_writer.assert_called_once()
-
-        # Assert delete_item was called for each exercise
-        self.assertEqual(mock_batch_writer.delete_item.call_count, 3)
-        mock_batch_writer.delete_item.assert_any_call(Key={"exercise_id": "ex1"})
-        mock_batch_writer.delete_item.assert_any_call(Key={"exercise_id": "ex2"})
-        mock_batch_writer.delete_item.assert_any_call(Key={"exercise_id": "ex3"})
-
-        # Assert the result is the number of exercises deleted
+        # Assert the result is the number of deleted exercises
         self.assertEqual(result, 3)
 
     def test_delete_exercises_by_workout_empty(self):
         """
         Test deleting exercises for a workout that has no exercises
         """
-        # Configure mock to return empty list
-        self.exercise_repository_mock.get_exercises_by_workout.return_value = []
-
-        # Mock the batch writer
-        mock_batch_writer = MagicMock()
-        mock_context_manager = MagicMock()
-        mock_context_manager.__enter__ = MagicMock(return_value=mock_batch_writer)
-        mock_context_manager.__exit__ = MagicMock(return_value=None)
-        self.exercise_repository_mock.table.batch_writer.return_value = (
-            mock_context_manager
-        )
+        self.exercise_repository_mock.delete_exercises_by_workout.return_value = 0
 
         # Call the service method
         result = self.exercise_service.delete_exercises_by_workout("empty-workout")
 
         # Assert repository was called
-        self.exercise_repository_mock.get_exercises_by_workout.assert_called_once_with(
+        self.exercise_repository_mock.delete_exercises_by_workout.assert_called_once_with(
             "empty-workout"
         )
 
-        # Assert batch writer was used
-        self.exercise_repository_mock.table.batch_writer.assert_called_once()
-
-        # Assert delete_item was not called (no exercises to delete)
-        mock_batch_writer.delete_item.assert_not_called()
-
         # Assert the result is 0 (no exercises deleted)
         self.assertEqual(result, 0)
 
@@ -834,6 +804,8 @@ class TestExerciseService(unittest.TestCase):
 
         # Use return_value instead of side_effect to avoid StopIteration
         self.exercise_repository_mock.get_exercise.return_value = mock_exercise_data
+        self.exercise_repository_mock.track_set.return_value = None
+        self.exercise_repository_mock.update_exercise.return_value = mock_exercise_data
 
         # Call track_set
         result = self.exercise_service.track_set(
@@ -855,11 +827,133 @@ class TestExerciseService(unittest.TestCase):
         # Assert result is an Exercise
         self.assertIsInstance(result, Exercise)
 
+    def test_track_set_rewrite_stores_empty_planned_snapshot(self):
+        """
+        Test the rewrite fallback stores a list snapshot even without planned sets
+        """
+        mock_exercise_data = {
+            "exercise_id": "ex123",
+            "workout_id": "workout456",
+            "exercise_type": "Squat",
+            "sets": 3,
+            "reps": 5,
+            "weight": 225.0,
+            "status": "planned",
+            "sets_data": None,
+            "planned_sets_data": None,
+        }
+        self.exercise_repository_mock.get_exercise.return_value = mock_exercise_data
+        self.exercise_repository_mock.track_set.return_value = None
+        self.exercise_repository_mock.update_exercise.return_value = mock_exercise_data
+
+        self.exercise_service.track_set(
+            exercise_id="ex123", set_number=1, reps=5, weight=230.0, completed=True
+        )
+
+        update_data = self.exercise_repository_mock.update_exercise.call_args[0][1]
+        self.assertEqual(update_data["planned_sets_data"], [])
+        self.assertEqual(len(update_data["sets_data"]), 1)
+
+    def test_track_set_single_update(self):
+        """
+        Test tracking a planned set is one conditional update and no reads
+        """
+        updated = {
+            "exercise_id": "ex123",
+            "workout_id": "workout456",
+            "exercise_type": "Squat",
+            "sets": 3,
+            "reps": 5,
+            "weight": 230.0,
+            "status": "in_progress",
+            "sets_data": [
+                {"set_number": 1, "reps": 5, "weight": 230.0, "completed": True}
+            ],
+            "athlete_exercise_type": "athlete789#squat",
+        }
+        self.exercise_repository_mock.track_set.return_value = updated
+
+        result = self.exercise_service.track_set(
+            exercise_id="ex123", set_number=1, reps=5, weight=230.0, completed=True
+        )
+
+        self.exercise_repository_mock.track_set.assert_called_once_with(
+            "ex123",
+            {"set_number": 1, "reps": 5, "weight": 230.0, "completed": True},
+            append=False,
+            start_exercise=True,
+        )
+        self.exercise_repository_mock.get_exercise.assert_not_called()
+        self.exercise_repository_mock.update_exercise.assert_not_called()
+        self.assertEqual(result.status, "in_progress")
+
+    def test_track_set_appends_when_replace_fails(self):
+        """
+        Test a set beyond the existing ones is appended after the replace attempt fails
+        """
+        self.exercise_repository_mock.track_set.side_effect = [
+            None,
+            {
+                "exercise_id": "ex123",
+                "workout_id": "workout456",
+                "exercise_type": "Squat",
+                "sets": 4,
+                "reps": 5,
+                "weight": 225.0,
+                "status": "in_progress",
+            },
+        ]
+
+        result = self.exercise_service.track_set(
+            exercise_id="ex123", set_number=4, reps=5, weight=225.0
+        )
+
+        appends = [
+            call.kwargs["append"]
+            for call in self.exercise_repository_mock.track_set.call_args_list
+        ]
+        self.assertEqual(appends, [False, True])
+        self.assertEqual(result.sets, 4)
+        self.exercise_repository_mock.get_exercise.assert_not_called()
+
+    def test_track_set_uses_known_exercise_to_choose_append(self):
+        """
+        Test a caller's copy of the exercise picks the right update on the first try
+        """
+        exercise = Exercise(
+            exercise_id="ex123",
+            workout_id="workout456",
+            exercise_type="Squat",
+            sets=1,
+            reps=5,
+            weight=225.0,
+            sets_data=[{"set_number": 1, "reps": 5, "weight": 225.0}],
+        )
+        self.exercise_repository_mock.track_set.return_value = {
+            **exercise.to_dict(),
+            "sets": 2,
+        }
+
+        self.exercise_service.track_set(
+            exercise_id="ex123",
+            set_number=2,
+            reps=5,
+            weight=225.0,
+            exercise=exercise,
+        )
+
+        self.exercise_repository_mock.track_set.assert_called_once()
+        self.assertTrue(
+            self.exercise_repository_mock.track_set.call_args.kwargs["append"]
+        )
+
     @patch("src.repositories.exercise_repository.ExerciseRepository")
     def test_track_set(self, mock_repo):
         # Setup
         service = ExerciseService()
         service.exercise_repository = mock_repo
+        # Exercise the read-and-rewrite path
+        mock_repo.track_set.return_value = None
 
         # Mock existing exercise
         exercise = Exercise(
@@ -908,6 +1002,8 @@ class TestExerciseService(unittest.TestCase):
         # Setup
         service = ExerciseService()
         service.exercise_repository = mock_repo
+        # Exercise the read-and-rewrite path
+        mock_repo.track_set.return_value = None
 
         # Mock existing exercise with "planned" status
         exercise = Exercise(
@@ -952,6 +1048,8 @@ class TestExerciseService(unittest.TestCase):
         # Setup
         service = ExerciseService()
         service.exercise_repository = mock_repo
+        # Exercise the read-and-rewrite path
+        mock_repo.track_set.return_value = None
 
         # Setup repository behavior for nonexistent exercise
         mock_repo.get_exercise.return_value = None
@@ -973,6 +1071,8 @@ class TestExerciseService(unittest.TestCase):
         # Setup
         service = ExerciseService()
         service.exercise_repository = mock_repo
+        # Exercise the read-and-rewrite path
+        mock_repo.track_set.return_value = None
 
         # Mock existing exercise
         exercise = Exercise(
@@ -1031,6 +1131,8 @@ class TestExerciseService(unittest.TestCase):
         # Setup
         service = ExerciseService()
         service.exercise_repository = mock_repo
+        # Exercise the read-and-rewrite path
+        mock_repo.track_set.return_value = None
 
         # Mock existing exercise with "in_progress" status
         exercise = Exercise(
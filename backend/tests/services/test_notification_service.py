@@ -120,11 +120,15 @@ class TestNotificationService(unittest.TestCase):
 
         # Verify calls
         self.assertEqual(self.mock_user_repo.get_user.call_count, 2)
-        self.mock_user_repo.get_user.assert_any_call("athlete-456")
-        self.mock_user_repo.get_user.assert_any_call("coach-123")
+        self.mock_user_repo.get_user.assert_any_call(
+            "athlete-456", attributes=["user_id", "name"]
+        )
+        self.mock_user_repo.get_user.assert_any_call(
+            "coach-123", attributes=["user_id"]
+        )
 
         mock_relationship_service.relationship_repository.get_active_relationship_for_athlete.assert_called_once_with(
-            "athlete-456"
+            "athlete-456", attributes=["coach_id"]
         )
         self.mock_notification_repo.create_notification.assert_called_once()
 
@@ -147,7 +151,9 @@ class TestNotificationService(unittest.TestCase):
 
         # Verify
         self.assertFalse(result)
-        self.mock_user_repo.get_user.assert_called_once_with("athlete-456")
+        self.mock_user_repo.get_user.assert_called_once_with(
+            "athlete-456", attributes=["user_id", "name"]
+        )
         self.mock_notification_repo.create_notification.assert_not_called()
 
     @patch("src.services.notification_service.RelationshipService")
@@ -182,9 +188,11 @@ class TestNotificationService(unittest.TestCase):
 
         # Verify - should return True but not create notification
         self.assertTrue(result)
-        self.mock_user_repo.get_user.assert_called_once_with("athlete-456")
+        self.mock_user_repo.get_user.assert_called_once_with(
+            "athlete-456", attributes=["user_id", "name"]
+        )
         mock_relationship_service.relationship_repository.get_active_relationship_for_athlete.assert_called_once_with(
-            "athlete-456"
+            "athlete-456", attributes=["coach_id"]
         )
         self.mock_notification_repo.create_notification.assert_not_called()
 
@@ -229,7 +237,7 @@ class TestNotificationService(unittest.TestCase):
         self.assertFalse(result)
         self.assertEqual(self.mock_user_repo.get_user.call_count, 2)
         mock_relationship_service.relationship_repository.get_active_relationship_for_athlete.assert_called_once_with(
-            "athlete-456"
+            "athlete-456", attributes=["coach_id"]
         )
         self.mock_notification_repo.create_notification.assert_not_called()
 
@@ -279,7 +287,7 @@ class TestNotificationService(unittest.TestCase):
         # Verify calls were made
         self.assertEqual(self.mock_user_repo.get_user.call_count, 2)
         mock_relationship_service.relationship_repository.get_active_relationship_for_athlete.assert_called_once_with(
-            "athlete-456"
+            "athlete-456", attributes=["coach_id"]
         )
         self.mock_notification_repo.create_notification.assert_called_once()
 
@@ -394,7 +402,7 @@ class TestNotificationService(unittest.TestCase):
         # Verify
         self.assertTrue(result)
         self.mock_notification_repo.mark_notification_as_read.assert_called_once_with(
-            "test-notification-uuid"
+            "test-notification-uuid", None
         )
 
     @patch("src.services.notification_service.NotificationRepository")
@@ -417,6 +425,31 @@ class TestNotificationService(unittest.TestCase):
         # Verify
         self.assertFalse(result)
 
+    @patch("src.services.notification_service.NotificationRepository")
+    @patch("src.services.notification_service.UserRepository")
+    def test_mark_notifications_as_read_bulk(
+        self, mock_user_repo_class, mock_notification_repo_class
+    ):
+        """Test bulk mark-read marks the listed notifications, or all when none given."""
+        mock_notification_repo_class.return_value = self.mock_notification_repo
+        mock_user_repo_class.return_value = self.mock_user_repo
+
+        self.mock_notification_repo.mark_notifications_as_read.return_value = 2
+        self.mock_notification_repo.mark_all_notifications_as_read.return_value = 40
+
+        service = NotificationService()
+
+        self.assertEqual(
+            service.mark_notifications_as_read("coach-789", ["n1", "n2"]), 2
+        )
+        self.assertEqual(service.mark_notifications_as_read("coach-789"), 40)
+        self.mock_notification_repo.mark_notifications_as_read.assert_called_once_with(
+            "coach-789", ["n1", "n2"]
+        )
+        self.mock_notification_repo.mark_all_notifications_as_read.assert_called_once_with(
+            "coach-789"
+        )
+
     @patch("src.services.notification_service.NotificationRepository")
     @patch("src.services.notification_service.UserRepository")
     def test_get_unread_count_for_coach(
@@ -440,6 +473,113 @@ class TestNotificationService(unittest.TestCase):
             "coach-789"
         )
 
+    @patch("src.services.notification_service.time.sleep")
+    @patch("src.services.notification_service.NotificationRepository")
+    @patch("src.services.notification_service.UserRepository")
+    def test_reconcile_unread_counts(
+        self, mock_user_repo_class, mock_notification_repo_class, mock_sleep
+    ):
+        """Test every coach's unread counter is overwritten with a fresh count."""
+        mock_notification_repo_class.return_value = self.mock_notification_repo
+        mock_user_repo_class.return_value = self.mock_user_repo
+
+        self.mock_notification_repo.get_coach_ids_with_notifications.return_value = {
+            "coach-1",
+            "coach-2",
+        }
+        self.mock_notification_repo.get_unread_counter.side_effect = lambda coach_id: {
+            "coach-1": 1,
+            "coach-2": None,
+        }[coach_id]
+        self.mock_notification_repo.count_unread_notifications.side_effect = (
+            lambda coach_id: {"coach-1": 3, "coach-2": 0}[coach_id]
+        )
+        self.mock_notification_repo.set_unread_count.return_value = True
+
+        service = NotificationService()
+
+        result = service.reconcile_unread_counts()
+
+        self.assertEqual(result, 2)
+        # Mismatches are confirmed by a second read before anything is written
+        self.assertEqual(mock_sleep.call_count, 1)
+        # Each write is conditional on the counter value read before counting
+        self.mock_notification_repo.set_unread_count.assert_any_call("coach-1", 3, 1)
+        self.mock_notification_repo.set_unread_count.assert_any_call("coach-2", 0, None)
+
+    @patch("src.services.notification_service.time.sleep")
+    @patch("src.services.notification_service.NotificationRepository")
+    @patch("src.services.notification_service.UserRepository")
+    def test_reconcile_unread_counts_retries_when_counter_changes(
+        self, mock_user_repo_class, mock_notification_repo_class, mock_sleep
+    ):
+        """Test a counter changed during the recount is read and counted again."""
+        mock_notification_repo_class.return_value = self.mock_notification_repo
+        mock_user_repo_class.return_value = self.mock_user_repo
+
+        self.mock_notification_repo.get_coach_ids_with_notifications.return_value = {
+            "coach-1"
+        }
+        self.mock_notification_repo.get_unread_counter.side_effect = [2, 2, 4, 4]
+        self.mock_notification_repo.count_unread_notifications.side_effect = [
+            3,
+            3,
+            5,
+            5,
+        ]
+        self.mock_notification_repo.set_unread_count.side_effect = [False, True]
+
+        service = NotificationService()
+
+        self.assertEqual(service.reconcile_unread_counts(), 1)
+        self.assertEqual(
+            self.mock_notification_repo.set_unread_count.call_args_list[1].args,
+            ("coach-1", 5, 4),
+        )
+
+    @patch("src.services.notification_service.time.sleep")
+    @patch("src.services.notification_service.NotificationRepository")
+    @patch("src.services.notification_service.UserRepository")
+    def test_reconcile_unread_counts_waits_for_index_to_catch_up(
+        self, mock_user_repo_class, mock_notification_repo_class, mock_sleep
+    ):
+        """Test a count missing a just-created notification does not lower the counter."""
+        mock_notification_repo_class.return_value = self.mock_notification_repo
+        mock_user_repo_class.return_value = self.mock_user_repo
+
+        self.mock_notification_repo.get_coach_ids_with_notifications.return_value = {
+            "coach-1"
+        }
+        self.mock_notification_repo.get_unread_counter.return_value = 3
+        # The unread index has not caught up with the newest notification at first
+        self.mock_notification_repo.count_unread_notifications.side_effect = [2, 3, 3]
+
+        service = NotificationService()
+
+        self.assertEqual(service.reconcile_unread_counts(), 1)
+        self.mock_notification_repo.set_unread_count.assert_not_called()
+
+    @patch("src.services.notification_service.time.sleep")
+    @patch("src.services.notification_service.NotificationRepository")
+    @patch("src.services.notification_service.UserRepository")
+    def test_reconcile_unread_counts_skips_matching_counter(
+        self, mock_user_repo_class, mock_notification_repo_class, mock_sleep
+    ):
+        """Test a counter that already matches the recount is not rewritten."""
+        mock_notification_repo_class.return_value = self.mock_notification_repo
+        mock_user_repo_class.return_value = self.mock_user_repo
+
+        self.mock_notification_repo.get_coach_ids_with_notifications.return_value = {
+            "coach-1"
+        }
+        self.mock_notification_repo.get_unread_counter.return_value = 3
+        self.mock_notification_repo.count_unread_notifications.return_value = 3
+
+        service = NotificationService()
+
+        self.assertEqual(service.reconcile_unread_counts(), 1)
+        self.mock_notification_repo.set_unread_count.assert_not_called()
+
     @patch("src.services.notification_service.NotificationRepository")
     @patch("src.services.notification_service.UserRepository")
     def test_get_notification_success(
@@ -609,13 +749,13 @@ class TestNotificationService(unittest.TestCase):
     @patch("src.services.notification_service.RelationshipService")
     @patch("src.services.notification_service.NotificationRepository")
     @patch("src.services.notification_service.UserRepository")
-    def test_workout_data_storage_in_notification(
+    def test_workout_summary_storage_in_notification(
         self,
         mock_user_repo_class,
         mock_notification_repo_class,
         mock_relationship_service_class,
     ):
-        """Test that full workout data is stored in notification."""
+        """Test that a workout summary, not the full workout, is stored in notification."""
         # Setup mocks
         mock_notification_repo_class.return_value = self.mock_notification_repo
         mock_user_repo_class.return_value = self.mock_user_repo
@@ -643,10 +783,13 @@ class TestNotificationService(unittest.TestCase):
         # Test notification creation
         result = service.create_workout_completion_notification(self.test_workout)
 
-        # Verify workout data is stored
+        # Verify only the workout summary is stored
         call_args = self.mock_notification_repo.create_notification.call_args[0][0]
-        self.assertIn("workout_data", call_args)
-        self.assertEqual(call_args["workout_data"], self.test_workout.to_dict())
+        self.assertNotIn("workout_data", call_args)
+        self.assertEqual(
+            call_args["workout_summary"],
+            Notification.summarize_workout(self.test_workout.to_dict()),
+        )
 
     @patch("src.services.notification_service.RelationshipService")
     @patch("src.services.notification_service.NotificationRepository")
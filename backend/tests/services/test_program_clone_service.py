@@ -0,0 +1,434 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from src.services.program_clone_service import (
+    CloneConflictError,
+    ProgramCloneService,
+)
+from src.config.block_config import BlockConfig
+from src.config.week_config import WeekConfig
+from src.config.day_config import DayConfig
+from src.config.workout_config import WorkoutConfig
+from src.config.exercise_config import ExerciseConfig
+
+
+class TestProgramCloneService(unittest.TestCase):
+    """
+    Test suite for the ProgramCloneService class
+    """
+
+    def setUp(self):
+        """
+        Set up test environment before each test method
+        """
+        # Share one mock so every write lands in a single ordered call list
+        self.repository_mock = MagicMock()
+
+        with patch(
+            "src.services.program_clone_service.BlockRepository",
+            return_value=self.repository_mock,
+        ), patch(
+            "src.services.program_clone_service.WeekRepository",
+            return_value=self.repository_mock,
+        ), patch(
+            "src.services.program_clone_service.DayRepository",
+            return_value=self.repository_mock,
+        ), patch(
+            "src.services.program_clone_service.WorkoutRepository",
+            return_value=self.repository_mock,
+        ), patch(
+            "src.services.program_clone_service.ExerciseRepository",
+            return_value=self.repository_mock,
+        ):
+            self.program_clone_service = ProgramCloneService()
+
+        self.source_workout = {
+            "workout_id": "workout1",
+            "athlete_id": "athlete1",
+            "day_id": "day1",
+            "date": "2025-03-03",
+            "status": "completed",
+            "notes": "Felt strong",
+            "completed_count": 2,
+            "total_count": 2,
+        }
+        self.source_exercises = [
+            {
+                "exercise_id": "ex2",
+                "workout_id": "workout1",
+                "exercise_type": "Bench Press",
+                "sets": 3,
+                "reps": 8,
+                "weight": 100.0,
+                "status": "completed",
+                "order": 2,
+            },
+            {
+                "exercise_id": "ex1",
+                "workout_id": "workout1",
+                "exercise_type": "Squat",
+                "sets": 2,
+                "reps": 5,
+                "weight": 140.0,
+                "status": "completed",
+                "order": 1,
+                "sets_data": [
+                    {
+                        "set_number": 1,
+                        "weight": 140.0,
+                        "reps": 5,
+                        "rpe": 8,
+                        "completed": True,
+                        "notes": "Grindy",
+                    }
+                ],
+                # Snapshot taken while the source was tracked; not a plan for copies
+                "planned_sets_data": [
+                    {"set_number": 1, "weight": 135.0, "reps": 5, "completed": False}
+                ],
+            },
+        ]
+
+    def _set_day_workouts(self, workouts_by_day):
+        """
+        Serve get_workout_by_day by day, since the lookups run concurrently
+        """
+        self.repository_mock.get_workout_by_day.side_effect = (
+            lambda athlete_id, day_id: workouts_by_day.get(day_id)
+        )
+
+    def _written_levels(self):
+        """
+        Items passed to batch_write_items, one list of (table, item) pairs per call
+        """
+        return [
+            call.args[0]
+            for call in self.repository_mock.batch_write_items.call_args_list
+        ]
+
+    def test_get_day_athletes(self):
+        """
+        Test resolving days to their athlete skips days whose block is missing
+        """
+        self.repository_mock.batch_get_days.return_value = [
+            {"day_id": "day1", "week_id": "week1"},
+            {"day_id": "day2", "week_id": "week2"},
+        ]
+        self.repository_mock.batch_get_weeks.return_value = [
+            {"week_id": "week1", "block_id": "block1"},
+            {"week_id": "week2", "block_id": "missing-block"},
+        ]
+        self.repository_mock.batch_get_blocks.return_value = [
+            {"block_id": "block1", "athlete_id": "athlete1"}
+        ]
+
+        athletes = self.program_clone_service.get_day_athletes(["day1", "day2"])
+
+        self.assertEqual(athletes, {"day1": "athlete1"})
+        self.repository_mock.batch_get_weeks.assert_called_once_with(["week1", "week2"])
+        self.repository_mock.batch_get_blocks.assert_called_once_with(
+            ["block1", "missing-block"]
+        )
+
+    def test_clone_day(self):
+        """
+        Test copying a day writes fresh exercises before the fresh workout
+        """
+        self.repository_mock.get_day.return_value = {
+            "day_id": "day2",
+            "date": "2025-03-10",
+        }
+        self._set_day_workouts({"day1": self.source_workout})
+        self.repository_mock.get_exercises_by_workout.return_value = (
+            self.source_exercises
+        )
+
+        workout = self.program_clone_service.clone_day("day1", "day2", "athlete1")
+
+        exercise_level, workout_level = self._written_levels()
+        self.assertEqual(
+            {table for table, _ in exercise_level}, {ExerciseConfig.TABLE_NAME}
+        )
+        self.assertEqual(len(workout_level), 1)
+
+        table, workout_item = workout_level[0]
+        self.assertEqual(table, WorkoutConfig.TABLE_NAME)
+        self.assertNotEqual(workout_item["workout_id"], "workout1")
+        self.assertEqual(workout_item["day_id"], "day2")
+        self.assertEqual(workout_item["date"], "2025-03-10")
+        self.assertEqual(workout_item["status"], "not_started")
+        self.assertEqual(workout_item["athlete_status"], "athlete1#not_started")
+        self.assertEqual(workout_item["completed_count"], 0)
+        self.assertEqual(workout_item["total_count"], 2)
+        self.assertIsNone(workout_item["notes"])
+
+        # Exercises keep their plan in order, with completion reset
+        squat, bench = [item for _, item in exercise_level]
+        self.assertEqual((squat["exercise_type"], squat["order"]), ("Squat", 1))
+        self.assertEqual((bench["exercise_type"], bench["order"]), ("Bench Press", 2))
+        self.assertEqual(squat["workout_id"], workout_item["workout_id"])
+        self.assertEqual(squat["status"], "planned")
+        self.assertEqual(squat["workout_date"], "2025-03-10")
+        self.assertEqual(squat["athlete_exercise_type"], "athlete1#squat")
+        self.assertEqual(
+            squat["sets_data"],
+            [
+                {
+                    "set_number": 1,
+                    "weight": 140.0,
+                    "reps": 5,
+                    "rpe": 8,
+                    "completed": False,
+                }
+            ],
+        )
+        self.assertNotIn("planned_sets_data", squat)
+
+        self.assertEqual(workout.workout_id, workout_item["workout_id"])
+        self.assertEqual(len(workout.exercises), 2)
+
+    def test_clone_day_strip_sets_data(self):
+        """
+        Test copying a day can drop per-set details
+        """
+        self.repository_mock.get_day.return_value = {
+            "day_id": "day2",
+            "date": "2025-03-10",
+        }
+        self._set_day_workouts({"day1": self.source_workout})
+        self.repository_mock.get_exercises_by_workout.return_value = (
+            self.source_exercises
+        )
+
+        self.program_clone_service.clone_day(
+            "day1", "day2", "athlete1", strip_sets_data=True
+        )
+
+        exercise_level = self._written_levels()[0]
+        self.assertTrue(all("sets_data" not in item for _, item in exercise_level))
+        self.assertTrue(
+            all("planned_sets_data" not in item for _, item in exercise_level)
+        )
+
+    def test_clone_day_without_source_workout(self):
+        """
+        Test copying a day without a workout writes nothing
+        """
+        self.repository_mock.get_day.return_value = {"day_id": "day2"}
+        self._set_day_workouts({})
+
+        result = self.program_clone_service.clone_day("day1", "day2", "athlete1")
+
+        self.assertIsNone(result)
+        self.repository_mock.batch_write_items.assert_not_called()
+
+    def test_clone_day_target_has_workout(self):
+        """
+        Test copying onto a day that already has a workout is a conflict
+        """
+        self.repository_mock.get_day.return_value = {"day_id": "day2"}
+        self._set_day_workouts(
+            {"day1": self.source_workout, "day2": {"workout_id": "existing"}}
+        )
+
+        with self.assertRaises(CloneConflictError):
+            self.program_clone_service.clone_day("day1", "day2", "athlete1")
+
+        self.repository_mock.batch_write_items.assert_not_called()
+
+    def test_clone_week(self):
+        """
+        Test copying a week moves each workout to the day with the same number
+        """
+        self.repository_mock.batch_get_days_by_week_ids.return_value = [
+            {"day_id": "day1", "week_id": "week1", "day_number": 1},
+            {"day_id": "day3", "week_id": "week1", "day_number": 3},
+            {
+                "day_id": "day8",
+                "week_id": "week2",
+                "day_number": 1,
+                "date": "2025-03-10",
+            },
+            {
+                "day_id": "day10",
+                "week_id": "week2",
+                "day_number": 3,
+                "date": "2025-03-12",
+            },
+        ]
+        self.repository_mock.batch_get_workouts_by_day_ids.return_value = [
+            self.source_workout,
+            {**self.source_workout, "workout_id": "workout3", "day_id": "day3"},
+        ]
+        self.repository_mock.batch_get_exercises_by_workout_ids.return_value = (
+            self.source_exercises
+        )
+
+        counts = self.program_clone_service.clone_week("week1", "week2", "athlete1")
+
+        self.assertEqual(counts, {"workouts": 2, "exercises": 2})
+        self.repository_mock.batch_get_exercises_by_workout_ids.assert_called_once_with(
+            ["workout1", "workout3"]
+        )
+
+        # There is no block level to write
+        exercise_level, workout_level = self._written_levels()
+        self.assertEqual(len(exercise_level), 2)
+        self.assertEqual(
+            [(item["day_id"], item["date"]) for _, item in workout_level],
+            [("day8", "2025-03-10"), ("day10", "2025-03-12")],
+        )
+        self.assertEqual([item["total_count"] for _, item in workout_level], [2, 0])
+
+    def test_clone_week_target_has_workouts(self):
+        """
+        Test copying onto a week with workouts is a conflict
+        """
+        self.repository_mock.batch_get_days_by_week_ids.return_value = [
+            {"day_id": "day1", "week_id": "week1", "day_number": 1},
+            {"day_id": "day8", "week_id": "week2", "day_number": 1},
+        ]
+        self.repository_mock.batch_get_workouts_by_day_ids.return_value = [
+            self.source_workout,
+            {**self.source_workout, "workout_id": "workout8", "day_id": "day8"},
+        ]
+
+        with self.assertRaises(CloneConflictError):
+            self.program_clone_service.clone_week("week1", "week2", "athlete1")
+
+        self.repository_mock.batch_write_items.assert_not_called()
+
+    def test_clone_week_missing_target_day(self):
+        """
+        Test copying a workout onto a week without the matching day is rejected
+        """
+        self.repository_mock.batch_get_days_by_week_ids.return_value = [
+            {"day_id": "day1", "week_id": "week1", "day_number": 1},
+            {"day_id": "day9", "week_id": "week2", "day_number": 2},
+        ]
+        self.repository_mock.batch_get_workouts_by_day_ids.return_value = [
+            self.source_workout
+        ]
+
+        with self.assertRaises(ValueError):
+            self.program_clone_service.clone_week("week1", "week2", "athlete1")
+
+        self.repository_mock.batch_write_items.assert_not_called()
+
+    def test_clone_block(self):
+        """
+        Test copying a block shifts every date and writes the block last
+        """
+        self.repository_mock.get_block.return_value = {
+            "block_id": "block1",
+            "athlete_id": "athlete1",
+            "coach_id": "coach1",
+            "title": "Strength",
+            "description": "Base block",
+            "start_date": "2025-03-03",
+            "end_date": "2025-03-30",
+            "status": "active",
+            "number_of_weeks": 4.0,
+        }
+        self.repository_mock.get_weeks_by_block.return_value = [
+            {"week_id": "week1", "block_id": "block1", "week_number": 1}
+        ]
+        self.repository_mock.batch_get_days_by_week_ids.return_value = [
+            {
+                "day_id": "day1",
+                "week_id": "week1",
+                "day_number": 1,
+                "date": "2025-03-03",
+                "focus": "squat",
+            },
+            {
+                "day_id": "day2",
+                "week_id": "week1",
+                "day_number": 2,
+                "date": "2025-03-04",
+            },
+        ]
+        self.repository_mock.batch_get_workouts_by_day_ids.return_value = [
+            self.source_workout,
+            # Workouts of other athletes on the same day are left behind
+            {**self.source_workout, "workout_id": "other", "athlete_id": "athlete2"},
+        ]
+        self.repository_mock.batch_get_exercises_by_workout_ids.return_value = (
+            self.source_exercises
+        )
+
+        block = self.program_clone_service.clone_block(
+            "block1", shift_days=28, title="Strength II"
+        )
+
+        self.assertNotEqual(block.block_id, "block1")
+        self.assertEqual(block.title, "Strength II")
+        self.assertEqual(block.status, "draft")
+        self.assertEqual(block.start_date, "2025-03-31")
+        self.assertEqual(block.end_date, "2025-04-27")
+        self.assertEqual(block.number_of_weeks, 4)
+        self.repository_mock.batch_get_exercises_by_workout_ids.assert_called_once_with(
+            ["workout1"]
+        )
+
+        exercise_level, parent_level, block_level = self._written_levels()
+        self.assertEqual(len(exercise_level), 2)
+        self.assertEqual(block_level, [(BlockConfig.TABLE_NAME, block.to_dict())])
+
+        items = {}
+        for table, item in parent_level:
+            items.setdefault(table, []).append(item)
+        (week,) = items[WeekConfig.TABLE_NAME]
+        self.assertEqual(week["block_id"], block.block_id)
+        days = items[DayConfig.TABLE_NAME]
+        self.assertEqual([day["week_id"] for day in days], [week["week_id"]] * 2)
+        self.assertEqual([day["date"] for day in days], ["2025-03-31", "2025-04-01"])
+        (workout,) = items[WorkoutConfig.TABLE_NAME]
+        self.assertEqual(workout["day_id"], days[0]["day_id"])
+        self.assertEqual(workout["date"], "2025-03-31")
+
+    def test_clone_block_not_found(self):
+        """
+        Test copying a missing block returns None
+        """
+        self.repository_mock.get_block.return_value = None
+
+        self.assertIsNone(self.program_clone_service.clone_block("missing"))
+        self.repository_mock.batch_write_items.assert_not_called()
+
+    def test_failed_write_removes_written_items(self):
+        """
+        Test a failed level deletes everything written for the copy, then re-raises
+        """
+        self.repository_mock.get_day.return_value = {
+            "day_id": "day2",
+            "date": "2025-03-10",
+        }
+        self._set_day_workouts({"day1": self.source_workout})
+        self.repository_mock.get_exercises_by_workout.return_value = (
+            self.source_exercises
+        )
+        self.repository_mock.batch_write_items.side_effect = [
+            None,
+            Exception("Throttled"),
+        ]
+
+        with self.assertRaises(Exception):
+            self.program_clone_service.clone_day("day1", "day2", "athlete1")
+
+        exercise_level, workout_level = self._written_levels()
+        deletes = self.repository_mock.batch_delete_items.call_args.args[0]
+        self.assertEqual(
+            deletes,
+            [
+                (ExerciseConfig.TABLE_NAME, {"exercise_id": item["exercise_id"]})
+                for _, item in exercise_level
+            ]
+            + [
+                (WorkoutConfig.TABLE_NAME, {"workout_id": item["workout_id"]})
+                for _, item in workout_level
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
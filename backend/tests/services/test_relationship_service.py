@@ -1,7 +1,11 @@
 import unittest
 from unittest.mock import MagicMock, patch
+from src.config.app_config import AppConfig
 from src.models.relationship import Relationship
-from src.services.relationship_service import RelationshipService
+from src.services.relationship_service import (
+    RelationshipService,
+    reset_authorization_cache,
+)
 
 
 class TestRelationshipService(unittest.TestCase):
@@ -15,6 +19,9 @@ class TestRelationshipService(unittest.TestCase):
         """
         self.relationship_repository_mock = MagicMock()
 
+        # Authorization decisions are cached per process, start each test cold
+        reset_authorization_cache()
+
         # Create patcher for uuid4 to return predictable IDs
         self.uuid_patcher = patch("uuid.uuid4", return_value="test-uuid")
         self.uuid_mock = self.uuid_patcher.start()
@@ -368,6 +375,153 @@ class TestRelationshipService(unittest.TestCase):
         self.assertEqual(result[1].ttl, 1678701600)  # Pending has TTL
         self.assertEqual(result[2].ttl, 1720958400)  # Ended has TTL
 
+    @patch("src.services.relationship_service.AppConfig.CACHE_ENABLED", False)
+    def test_get_active_relationship_status(self):
+        """
+        Test that only the status of the active relationship is fetched
+        """
+        self.relationship_repository_mock.get_active_relationship.return_value = {
+            "status": "active"
+        }
+
+        result = self.relationship_service.get_active_relationship_status(
+            "coach456", "athlete789"
+        )
+
+        self.assertEqual(result, "active")
+        self.relationship_repository_mock.get_active_relationship.assert_called_once_with(
+            "coach456", "athlete789", attributes=["status"]
+        )
+
+    def test_get_active_relationship_status_none(self):
+        """
+        Test that no status is returned without an active relationship
+        """
+        self.relationship_repository_mock.get_active_relationship.return_value = None
+
+        self.assertIsNone(
+            self.relationship_service.get_active_relationship_status(
+                "coach456", "athlete789"
+            )
+        )
+
+    def test_get_active_relationship_cached(self):
+        """
+        Test repeated access checks for the same pair hit the repository once
+        """
+        self.relationship_repository_mock.get_active_relationship.return_value = {
+            "relationship_id": "rel123",
+            "coach_id": "coach456",
+            "athlete_id": "athlete789",
+            "status": "active",
+        }
+
+        first = self.relationship_service.get_active_relationship(
+            "coach456", "athlete789"
+        )
+        second = self.relationship_service.get_active_relationship(
+            "coach456", "athlete789"
+        )
+        status = self.relationship_service.get_active_relationship_status(
+            "coach456", "athlete789"
+        )
+
+        self.assertEqual(first.relationship_id, "rel123")
+        self.assertEqual(second.relationship_id, "rel123")
+        self.assertEqual(status, "active")
+        self.relationship_repository_mock.get_active_relationship.assert_called_once_with(
+            "coach456", "athlete789"
+        )
+
+    def test_get_active_relationship_status_cached(self):
+        """
+        Test the status-only lookup is cached on its own, still projected
+        """
+        self.relationship_repository_mock.get_active_relationship.return_value = {
+            "status": "active"
+        }
+
+        for _ in range(2):
+            self.assertEqual(
+                self.relationship_service.get_active_relationship_status(
+                    "coach456", "athlete789"
+                ),
+                "active",
+            )
+
+        self.relationship_repository_mock.get_active_relationship.assert_called_once_with(
+            "coach456", "athlete789", attributes=["status"]
+        )
+
+    def test_cached_access_expires_after_authorization_ttl(self):
+        """
+        Test a relationship ended in another function stops granting access once the
+        authorization TTL has passed
+        """
+        self.relationship_repository_mock.get_active_relationship.return_value = {
+            "relationship_id": "rel123",
+            "coach_id": "coach456",
+            "athlete_id": "athlete789",
+            "status": "active",
+        }
+
+        with patch("src.utils.ttl_cache.time.monotonic", return_value=1000.0):
+            self.relationship_service.get_active_relationship("coach456", "athlete789")
+
+        # Ended elsewhere, so this container's cache was not invalidated
+        self.relationship_repository_mock.get_active_relationship.return_value = None
+        with patch(
+            "src.utils.ttl_cache.time.monotonic",
+            return_value=1000.0 + AppConfig.AUTHORIZATION_CACHE_TTL,
+        ):
+            self.assertIsNone(
+                self.relationship_service.get_active_relationship(
+                    "coach456", "athlete789"
+                )
+            )
+
+    def test_get_active_relationship_does_not_cache_misses(self):
+        """
+        Test a missing relationship is looked up again so new access is seen at once
+        """
+        self.relationship_repository_mock.get_active_relationship.return_value = None
+
+        self.relationship_service.get_active_relationship("coach456", "athlete789")
+        self.relationship_service.get_active_relationship("coach456", "athlete789")
+
+        self.assertEqual(
+            self.relationship_repository_mock.get_active_relationship.call_count, 2
+        )
+
+    def test_end_relationship_invalidates_cached_access(self):
+        """
+        Test ending a relationship drops the cached authorization decision
+        """
+        active = {
+            "relationship_id": "rel123",
+            "coach_id": "coach456",
+            "athlete_id": "athlete789",
+            "status": "active",
+        }
+        ended = dict(active, status="ended")
+        self.relationship_repository_mock.get_active_relationship.return_value = active
+        self.relationship_repository_mock.get_relationship.side_effect = [
+            active,
+            ended,
+        ]
+        self.relationship_repository_mock.update_relationship.return_value = ended
+
+        self.relationship_service.get_active_relationship("coach456", "athlete789")
+        self.relationship_service.end_relationship("rel123")
+
+        self.relationship_repository_mock.get_active_relationship.return_value = None
+        self.assertIsNone(
+            self.relationship_service.get_active_relationship("coach456", "athlete789")
+        )
+        self.assertEqual(
+            self.relationship_repository_mock.get_active_relationship.call_count, 2
+        )
+
     def test_generate_invitation_code_with_ttl(self):
         """
         Test generating an invitation code with TTL for a coach
@@ -76,6 +76,29 @@ class TestUserService(unittest.TestCase):
         # Assert the result is None
         self.assertIsNone(result)
 
+    def test_get_weight_unit_preference(self):
+        """
+        Test that only the preference attribute is fetched
+        """
+        self.user_repository_mock.get_user.return_value = {
+            "weight_unit_preference": "lb"
+        }
+
+        result = self.user_service.get_weight_unit_preference("user123")
+
+        self.assertEqual(result, "lb")
+        self.user_repository_mock.get_user.assert_called_once_with(
+            "user123", attributes=["weight_unit_preference"]
+        )
+
+    def test_get_weight_unit_preference_user_not_found(self):
+        """
+        Test that a missing user has no preference
+        """
+        self.user_repository_mock.get_user.return_value = None
+
+        self.assertIsNone(self.user_service.get_weight_unit_preference("missing"))
+
     def test_create_user(self):
         """
         Test creating a new user
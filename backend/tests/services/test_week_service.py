@@ -15,6 +15,7 @@ class TestWeekService(unittest.TestCase):
         """
         self.week_repository_mock = MagicMock()
         self.day_repository_mock = MagicMock()
+        self.cascade_delete_service_mock = MagicMock()
 
         # Create patcher for uuid4 to return predictable IDs
         self.uuid_patcher = patch("uuid.uuid4", return_value="test-uuid")
@@ -27,6 +28,9 @@ class TestWeekService(unittest.TestCase):
         ), patch(
             "src.services.week_service.DayRepository",
             return_value=self.day_repository_mock,
+        ), patch(
+            "src.services.week_service.CascadeDeleteService",
+            return_value=self.cascade_delete_service_mock,
         ):
             self.week_service = WeekService()
 
@@ -255,51 +259,48 @@ class TestWeekService(unittest.TestCase):
 
     def test_delete_week(self):
         """
-        Test deleting a week
+        Test deleting a week cascades through the delete engine
         """
-        # Configure mock to return a success response for delete_week
-        self.week_repository_mock.delete_week.return_value = {
-            "ResponseMetadata": {"HTTPStatusCode": 200}
+        self.cascade_delete_service_mock.delete_week.return_value = {
+            "blocks": 0,
+            "weeks": 1,
+            "days": 7,
+            "workouts": 2,
+            "exercises": 10,
         }
 
-        # Configure mock for cascade delete of days
-        self.day_repository_mock.delete_days_by_week.return_value = 3  # 3 days deleted
-
         # Call the service method
         result = self.week_service.delete_week("week123")
 
-        # Assert cascade delete of days was called first
-        self.day_repository_mock.delete_days_by_week.assert_called_once_with("week123")
-
-        # Assert week deletion was called
-        self.week_repository_mock.delete_week.assert_called_once_with("week123")
+        # Assert the cascade was run for the week
+        self.cascade_delete_service_mock.delete_week.assert_called_once_with("week123")
 
-        # Assert the result is True (successful deletion)
-        self.assertTrue(result)
+        # Assert the cascade counts are returned
+        self.assertEqual(result["weeks"], 1)
+        self.assertEqual(result["days"], 7)
 
     def test_delete_week_failure(self):
         """
         Test deletion failure when the week doesn't exist
         """
-        # Configure mock to return None (unsuccessful deletion)
-        self.week_repository_mock.delete_week.return_value = None
-
-        # Configure mock for cascade delete of days
-        self.day_repository_mock.delete_days_by_week.return_value = 0  # No days deleted
+        self.cascade_delete_service_mock.delete_week.return_value = {
+            "blocks": 0,
+            "weeks": 0,
+            "days": 0,
+            "workouts": 0,
+            "exercises": 0,
+        }
 
         # Call the service method
         result = self.week_service.delete_week("nonexistent")
 
-        # Assert cascade delete of days was still called
-        self.day_repository_mock.delete_days_by_week.assert_called_once_with(
+        # Assert the cascade was still run
+        self.cascade_delete_service_mock.delete_week.assert_called_once_with(
             "nonexistent"
         )
 
-        # Assert week deletion was called
-        self.week_repository_mock.delete_week.assert_called_once_with("nonexistent")
-
-        # Assert the result is False (unsuccessful deletion)
-        self.assertFalse(result)
+        # Assert nothing was reported as deleted
+        self.assertEqual(result["weeks"], 0)
 
 
 if __name__ == "__main__":  # pragma: no cover
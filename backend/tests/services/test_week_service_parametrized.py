@@ -12,18 +12,26 @@ class TestWeekServiceParametrized(BaseTest):
         # Create patchers for repositories
         self.week_repository_patcher = patch("src.services.week_service.WeekRepository")
         self.day_repository_patcher = patch("src.services.week_service.DayRepository")
+        self.cascade_delete_service_patcher = patch(
+            "src.services.week_service.CascadeDeleteService"
+        )
 
         # Start patchers and get mocks
         self.mock_week_repository = self.week_repository_patcher.start()
         self.mock_day_repository = self.day_repository_patcher.start()
+        self.mock_cascade_delete_service = self.cascade_delete_service_patcher.start()
 
         # Create repository instances
         self.week_repository_instance = MagicMock()
         self.day_repository_instance = MagicMock()
+        self.cascade_delete_service_instance = MagicMock()
 
         # Configure mocks to return instances
         self.mock_week_repository.return_value = self.week_repository_instance
         self.mock_day_repository.return_value = self.day_repository_instance
+        self.mock_cascade_delete_service.return_value = (
+            self.cascade_delete_service_instance
+        )
 
         # Create the service
         self.week_service = WeekService()
@@ -37,6 +45,7 @@ class TestWeekServiceParametrized(BaseTest):
         """Clean up after each test."""
         self.week_repository_patcher.stop()
         self.day_repository_patcher.stop()
+        self.cascade_delete_service_patcher.stop()
         self.uuid_patcher.stop()
 
     def test_create_week_scenarios(self):
@@ -149,44 +158,34 @@ class TestWeekServiceParametrized(BaseTest):
         """Test deleting a week with different scenarios."""
         # Define test cases
         test_cases = [
-            # days_deleted, delete_response, expected_result
-            (
-                3,
-                {"ResponseMetadata": {"HTTPStatusCode": 200}},
-                True,
-            ),  # Successful delete with 3 days
-            (
-                0,
-                {"ResponseMetadata": {"HTTPStatusCode": 200}},
-                True,
-            ),  # Successful delete with no days
-            (2, None, False),  # Failed delete
+            # days_deleted, weeks_deleted
+            (7, 1),  # Successful delete with 7 days
+            (0, 1),  # Successful delete with no days
+            (2, 0),  # Week already gone, only leftover days removed
         ]
 
-        for days_deleted, delete_response, expected_result in test_cases:
-            with self.subTest(
-                days_deleted=days_deleted, delete_response=delete_response
-            ):
+        for days_deleted, weeks_deleted in test_cases:
+            with self.subTest(days_deleted=days_deleted, weeks_deleted=weeks_deleted):
                 # Reset mocks
-                self.day_repository_instance.delete_days_by_week.reset_mock()
-                self.week_repository_instance.delete_week.reset_mock()
+                self.cascade_delete_service_instance.delete_week.reset_mock()
 
                 # Configure mock behavior
-                self.day_repository_instance.delete_days_by_week.return_value = (
-                    days_deleted
-                )
-                self.week_repository_instance.delete_week.return_value = delete_response
+                self.cascade_delete_service_instance.delete_week.return_value = {
+                    "blocks": 0,
+                    "weeks": weeks_deleted,
+                    "days": days_deleted,
+                    "workouts": 0,
+                    "exercises": 0,
+                }
 
                 # Call the method
                 result = self.week_service.delete_week("week123")
 
                 # Assertions
-                self.assertEqual(result, expected_result)
+                self.assertEqual(result["weeks"], weeks_deleted)
+                self.assertEqual(result["days"], days_deleted)
 
-                # Verify repository calls
-                self.day_repository_instance.delete_days_by_week.assert_called_once_with(
-                    "week123"
-                )
-                self.week_repository_instance.delete_week.assert_called_once_with(
+                # Verify the cascade was run for the week
+                self.cascade_delete_service_instance.delete_week.assert_called_once_with(
                     "week123"
                 )
@@ -237,10 +237,13 @@ class TestWorkoutService(unittest.TestCase):
         self.workout_repository_mock.get_workout_by_day.assert_called_once_with(
             "athlete123", "day456"
         )
-        self.workout_repository_mock.create_workout.assert_called_once()
+        self.workout_repository_mock.create_workout_with_exercises.assert_called_once()
 
-        # Check the workout data passed to create_workout (no exercises in dict)
-        workout_dict = self.workout_repository_mock.create_workout.call_args[0][0]
+        # Check the workout data written with its exercises (no exercises in dict)
+        create_args = (
+            self.workout_repository_mock.create_workout_with_exercises.call_args[0]
+        )
+        workout_dict = create_args[0]
         self.assertEqual(workout_dict["workout_id"], "workout-uuid")
         self.assertEqual(workout_dict["athlete_id"], "athlete123")
         self.assertEqual(workout_dict["day_id"], "day456")
@@ -249,13 +252,13 @@ class TestWorkoutService(unittest.TestCase):
         self.assertEqual(workout_dict["status"], "not_started")
         self.assertNotIn("exercises", workout_dict)  # Exercises not in the workout dict
 
-        # Check that exercises were created separately in the exercise repository
-        self.assertEqual(self.exercise_repository_mock.create_exercise.call_count, 2)
+        # Check that both exercises were written in the same call, not one by one
+        exercise_dicts = create_args[1]
+        self.assertEqual(len(exercise_dicts), 2)
+        self.exercise_repository_mock.create_exercise.assert_not_called()
 
-        # Check the first exercise creation call
-        first_exercise_call = (
-            self.exercise_repository_mock.create_exercise.call_args_list[0][0][0]
-        )
+        # Check the first exercise item
+        first_exercise_call = exercise_dicts[0]
         self.assertEqual(first_exercise_call["exercise_id"], "exercise1-uuid")
         self.assertEqual(first_exercise_call["workout_id"], "workout-uuid")
         self.assertEqual(first_exercise_call["exercise_type"], "Bench Press")
@@ -264,6 +267,10 @@ class TestWorkoutService(unittest.TestCase):
         self.assertEqual(first_exercise_call["weight"], 225.0)
         self.assertEqual(first_exercise_call["status"], "planned")
 
+        # Exercises carry the workout's athlete and date for the history index
+        self.assertEqual(first_exercise_call["athlete_id"], "athlete123")
+        self.assertEqual(first_exercise_call["workout_date"], "2025-03-15")
+
     def test_create_workout_update_existing(self):
         """
         Test creating a workout that already exists (update case)
@@ -409,14 +416,16 @@ class TestWorkoutService(unittest.TestCase):
         )
 
         # Assert repository methods were called correctly
-        self.exercise_repository_mock.get_exercise.assert_called_once_with("ex123")
         self.exercise_repository_mock.update_exercise.assert_called_once_with(
             "ex123",
             {"status": "completed", "sets": 3, "reps": 8, "weight": 235.0, "rpe": 9.0},
+            require_existing=True,
         )
 
-        # Verify the workout status was updated
-        self.assertTrue(hasattr(self.workout_service, "_update_workout_status"))
+        # The workout counters and status are kept by the repository, without reads
+        self.exercise_repository_mock.get_exercise.assert_not_called()
+        self.workout_repository_mock.get_workout.assert_not_called()
+        self.workout_repository_mock.update_workout.assert_not_called()
 
         # Assert result is the updated exercise
         self.assertEqual(result.exercise_id, "ex123")
@@ -474,9 +483,22 @@ class TestWorkoutService(unittest.TestCase):
 
         self.assertEqual(result.status, "completed")
 
+    def test_complete_exercise_not_found(self):
+        """
+        Test completing an exercise that does not exist
+        """
+        self.exercise_repository_mock.update_exercise.return_value = None
+
+        result = self.workout_service.complete_exercise(
+            exercise_id="missing", sets=3, reps=5, weight=100.0
+        )
+
+        self.assertIsNone(result)
+        self.exercise_repository_mock.get_exercise.assert_not_called()
+
     def test_complete_exercise_preserves_existing_sets_data(self):
         """
-        Test completing an exercise preserves existing sets_data when none provided
+        Test completing an exercise leaves existing sets_data untouched when none provided
         """
         existing_sets_data = [
             {"set_number": 1, "weight": 100.0, "reps": 5, "completed": True},
@@ -511,144 +533,17 @@ class TestWorkoutService(unittest.TestCase):
             updated_exercise_data
         )
 
-        # Call without sets_data — should fall back to existing
+        # Call without sets_data — the stored sets are not rewritten
         result = self.workout_service.complete_exercise(
             exercise_id="ex123", sets=3, reps=5, weight=100.0
         )
 
         call_args = self.exercise_repository_mock.update_exercise.call_args
         update_data = call_args[0][1]
-        self.assertIn("sets_data", update_data)
-        self.assertEqual(update_data["sets_data"], existing_sets_data)
+        self.assertNotIn("sets_data", update_data)
+        self.assertEqual(result.sets_data, existing_sets_data)
         self.assertEqual(result.status, "completed")
 
-    def test_update_workout_status(self):
-        """
-        Test updating workout status based on exercise completion
-        """
-        # Mock workout data with exercises
-        workout_data = {
-            "workout_id": "workout123",
-            "athlete_id": "athlete456",
-            "day_id": "day789",
-            "date": "2025-03-15",
-            "status": "not_started",
-            "exercises": [
-                {
-                    "exercise_id": "ex1",
-                    "workout_id": "workout123",
-                    "exercise_type": "Bench Press",
-                    "sets": 3,
-                    "reps": 5,
-                    "weight": 225.0,
-                    "status": "planned",
-                },
-                {
-                    "exercise_id": "ex2",
-                    "workout_id": "workout123",
-                    "exercise_type": "Squat",
-                    "sets": 3,
-                    "reps": 5,
-                    "weight": 315.0,
-                    "status": "planned",
-                },
-            ],
-        }
-
-        # Configure mock to return workout
-        self.workout_repository_mock.get_workout.return_value = workout_data
-        self.exercise_service_mock.get_exercises_for_workout.side_effect = [
-            [
-                Exercise(
-                    exercise_id="ex1",
-                    workout_id="workout123",
-                    exercise_type="Bench Press",
-                    sets=3,
-                    reps=5,
-                    weight=225.0,
-                    status="planned",
-                ),
-                Exercise(
-                    exercise_id="ex2",
-                    workout_id="workout123",
-                    exercise_type="Squat",
-                    sets=3,
-                    reps=5,
-                    weight=315.0,
-                    status="planned",
-                ),
-            ],
-            [
-                Exercise(
-                    exercise_id="ex1",
-                    workout_id="workout123",
-                    exercise_type="Bench Press",
-                    sets=3,
-                    reps=5,
-                    weight=225.0,
-                    status="completed",
-                ),
-                Exercise(
-                    exercise_id="ex2",
-                    workout_id="workout123",
-                    exercise_type="Squat",
-                    sets=3,
-                    reps=5,
-                    weight=315.0,
-                    status="planned",
-                ),
-            ],
-            [
-                Exercise(
-                    exercise_id="ex1",
-                    workout_id="workout123",
-                    exercise_type="Bench Press",
-                    sets=3,
-                    reps=5,
-                    weight=225.0,
-                    status="completed",
-                ),
-                Exercise(
-                    exercise_id="ex2",
-                    workout_id="workout123",
-                    exercise_type="Squat",
-                    sets=3,
-                    reps=5,
-                    weight=315.0,
-                    status="completed",
-                ),
-            ],
-        ]
-
-        # Call the private method
-        self.workout_service._update_workout_status("workout123")
-
-        # Status should remain "not_started" since no exercises are completed
-        self.workout_repository_mock.update_workout.assert_not_called()
-
-        # Now change one exercise to completed and test again
-        workout_data["exercises"][0]["status"] = "completed"
-
-        # Call the method again
-        self.workout_service._update_workout_status("workout123")
-
-        # Status should be updated to "in_progress"
-        self.workout_repository_mock.update_workout.assert_called_once_with(
-            "workout123", {"status": "in_progress"}
-        )
-
-        # Reset the mock and update all exercises to completed
-        self.workout_repository_mock.update_workout.reset_mock()
-        workout_data["exercises"][1]["status"] = "completed"
-
-        # Call the method again
-        self.workout_service._update_workout_status("workout123")
-
-        # Status should be updated to "completed"
-        self.workout_repository_mock.update_workout.assert_called_once_with(
-            "workout123", {"status": "completed"}
-        )
-
     def test_update_workout(self):
         """
         Test updating a workout with new information
@@ -676,12 +571,12 @@ class TestWorkoutService(unittest.TestCase):
         }
 
         # Configure mocks
-        self.workout_repository_mock.get_workout.side_effect = [
-            initial_workout_data,  # First call to check if workout exists
-            updated_workout_data,  # Second call to get updated workout
-        ]
+        self.workout_repository_mock.get_workout.return_value = initial_workout_data
+        self.workout_repository_mock.adjust_exercise_counts.return_value = None
         self.workout_repository_mock.update_workout.return_value = {
-            "Attributes": {"status": "completed", "notes": "Updated notes"}
+            key: value
+            for key, value in updated_workout_data.items()
+            if key != "exercises"
         }
 
         # Update data to send
@@ -694,7 +589,8 @@ class TestWorkoutService(unittest.TestCase):
         self.workout_repository_mock.update_workout.assert_called_once_with(
             "workout123", update_data
         )
-        self.assertEqual(self.workout_repository_mock.get_workout.call_count, 2)
+        # The response is built from the write, not read back
+        self.assertEqual(self.workout_repository_mock.get_workout.call_count, 1)
 
         # Assert the returned object has the updated values
         self.assertIsInstance(result, Workout)
@@ -706,6 +602,58 @@ class TestWorkoutService(unittest.TestCase):
         self.assertEqual(result.athlete_id, "athlete456")
         self.assertEqual(result.date, "2025-03-15")
 
+        # Neither the exercises nor the date changed, so the exercises are left alone
+        self.exercise_repository_mock.apply_changes.assert_called_once_with([], {}, [])
+
+    def test_update_workout_date_moves_exercises(self):
+        """
+        Test moving a workout to another date updates its exercises' history keys
+        """
+        workout_data = {
+            "workout_id": "workout123",
+            "athlete_id": "athlete456",
+            "day_id": "day789",
+            "date": "2025-03-15",
+            "status": "not_started",
+        }
+        self.workout_repository_mock.get_workout.return_value = workout_data
+        self.exercise_service_mock.get_exercises_for_workout.return_value = [
+            Exercise(
+                exercise_id="ex1",
+                workout_id="workout123",
+                exercise_type="Bench Press",
+                sets=3,
+                reps=5,
+                weight=80.0,
+                order=1,
+            )
+        ]
+        self.exercise_repository_mock.apply_changes.return_value = {}
+
+        self.workout_service.update_workout(
+            "workout123",
+            {
+                "date": "2025-03-16",
+                "exercises": [
+                    {"exercise_id": "ex1"},
+                    {"exercise_type": "Squat", "sets": 3, "reps": 5, "weight": 100},
+                ],
+            },
+        )
+
+        puts, updates, deletes = self.exercise_repository_mock.apply_changes.call_args[
+            0
+        ]
+        self.assertEqual(puts[0]["athlete_id"], "athlete456")
+        self.assertEqual(puts[0]["workout_date"], "2025-03-16")
+        # Kept exercises move along in the same change set
+        self.assertEqual(
+            updates,
+            {"ex1": {"workout_date": "2025-03-16", "athlete_id": "athlete456"}},
+        )
+        self.assertEqual(deletes, [])
+        self.exercise_repository_mock.update_workout_context.assert_not_called()
+
     def test_create_workout_with_minimal_data(self):
         """
         Test creating a workout with minimal required data
@@ -737,19 +685,22 @@ class TestWorkoutService(unittest.TestCase):
         self.workout_repository_mock.get_workout_by_day.assert_called_once_with(
             "athlete123", "day456"
         )
-        self.workout_repository_mock.create_workout.assert_called_once()
+        self.workout_repository_mock.create_workout_with_exercises.assert_called_once()
 
         # Check the workout data uses default values where missing
-        workout_dict = self.workout_repository_mock.create_workout.call_args[0][0]
+        create_args = (
+            self.workout_repository_mock.create_workout_with_exercises.call_args[0]
+        )
+        workout_dict = create_args[0]
         self.assertEqual(workout_dict["status"], "not_started")  # Default status
         self.assertIsNone(workout_dict["notes"])  # Default None for notes
         self.assertNotIn("exercises", workout_dict)  # Exercises not in the workout dict
 
-        # Check that exercise was created separately in the exercise repository
-        self.assertEqual(self.exercise_repository_mock.create_exercise.call_count, 1)
+        # Check that the exercise was written together with the workout
+        self.assertEqual(len(create_args[1]), 1)
 
-        # Check the exercise creation call
-        exercise_call = self.exercise_repository_mock.create_exercise.call_args[0][0]
+        # Check the exercise item
+        exercise_call = create_args[1][0]
         self.assertEqual(exercise_call["status"], "planned")  # Default status
         self.assertIsNone(exercise_call.get("notes"))
         self.assertIsNone(exercise_call.get("rpe"))
@@ -777,7 +728,7 @@ class TestWorkoutService(unittest.TestCase):
             )
 
         # Assert repository methods were not called
-        self.workout_repository_mock.create_workout.assert_not_called()
+        self.workout_repository_mock.create_workout_with_exercises.assert_not_called()
 
     def test_delete_workout(self):
         """
@@ -801,84 +752,60 @@ class TestWorkoutService(unittest.TestCase):
 
     def test_update_workout_with_exercises(self):
         """
-        Test updating a workout with exercises (both existing and new)
+        Test updating a workout with exercises (updated, new and removed) as one change set
         """
-        # Mock the existing workout with exercises
-        existing_workout = Workout(
-            workout_id="workout123",
-            athlete_id="athlete456",
-            day_id="day789",
-            date="2025-03-15",
-            status="not_started",
-        )
-
-        # Add an existing exercise
-        existing_exercise = Exercise(
-            exercise_id="ex1",
-            workout_id="workout123",
-            exercise_type="Squat",
-            sets=3,
-            reps=5,
-            weight=315.0,
-            status="planned",
-            notes="Initial notes",
-        )
-
-        existing_workout.add_exercise(existing_exercise)
-
-        # Mock get_workout to return the existing workout first, then updated workout
-        self.workout_repository_mock.get_workout.side_effect = [
-            # First call when checking if workout exists
-            {
-                "workout_id": "workout123",
-                "athlete_id": "athlete456",
-                "day_id": "day789",
-                "date": "2025-03-15",
-                "status": "not_started",
-                "exercises": [
-                    {
-                        "exercise_id": "ex1",
-                        "workout_id": "workout123",
-                        "exercise_type": "Squat",
-                        "sets": 3,
-                        "reps": 5,
-                        "weight": 315.0,
-                        "status": "planned",
-                        "notes": "Initial notes",
-                    }
-                ],
-            },
-            # Second call after update
-            {
-                "workout_id": "workout123",
-                "athlete_id": "athlete456",
-                "day_id": "day789",
-                "date": "2025-03-15",
-                "status": "in_progress",
-                "exercises": [
-                    {
-                        "exercise_id": "ex1",
-                        "workout_id": "workout123",
-                        "exercise_type": "Squat",
-                        "sets": 3,
-                        "reps": 6,  # Updated
-                        "weight": 325.0,  # Updated
-                        "status": "completed",  # Updated
-                        "notes": "Updated notes",
-                    },
-                    {
-                        "exercise_id": "ex2",
-                        "workout_id": "workout123",
-                        "exercise_type": "Bench Press",
-                        "sets": 3,
-                        "reps": 8,
-                        "weight": 225.0,
-                        "status": "planned",
-                        "notes": "New exercise",
-                    },
-                ],
-            },
+        self.workout_repository_mock.get_workout.return_value = {
+            "workout_id": "workout123",
+            "athlete_id": "athlete456",
+            "day_id": "day789",
+            "date": "2025-03-15",
+            "status": "not_started",
+        }
+        self.exercise_service_mock.get_exercises_for_workout.return_value = [
+            Exercise(
+                exercise_id="ex1",
+                workout_id="workout123",
+                exercise_type="Squat",
+                sets=3,
+                reps=5,
+                weight=315.0,
+                status="planned",
+                notes="Initial notes",
+                order=1,
+            ),
+            Exercise(
+                exercise_id="ex-removed",
+                workout_id="workout123",
+                exercise_type="Deadlift",
+                sets=1,
+                reps=5,
+                weight=405.0,
+                status="completed",
+                order=3,
+            ),
         ]
+        self.exercise_repository_mock.apply_changes.return_value = {
+            "ex1": {
+                "exercise_id": "ex1",
+                "workout_id": "workout123",
+                "exercise_type": "Squat",
+                "sets": 3.0,
+                "reps": 6.0,
+                "weight": 325.0,
+                "status": "completed",
+                "notes": "Updated notes",
+                "order": 1.0,
+                "athlete_exercise_type": "athlete456#squat",
+            }
+        }
+        self.workout_repository_mock.adjust_exercise_counts.return_value = {
+            "workout_id": "workout123",
+            "status": "in_progress",
+        }
+        self.workout_repository_mock.update_workout.return_value = {
+            "workout_id": "workout123",
+            "status": "in_progress",
+        }
 
         # Update data to send
         update_data = {
@@ -905,53 +832,39 @@ class TestWorkoutService(unittest.TestCase):
             ],
         }
 
-        self.exercise_service_mock.get_exercises_for_workout.side_effect = [
-            # Call 1: initial get_workout in update_workout (existing check)
-            [
-                Exercise(
-                    exercise_id="ex1",
-                    workout_id="workout123",
-                    exercise_type="Squat",
-                    sets=3,
-                    reps=5,
-                    weight=315.0,
-                    status="planned",
-                    notes="Initial notes",
-                ),
-            ],
-            # Call 2: final get_workout return after update
-            [
-                Exercise(
-                    exercise_id="ex1",
-                    workout_id="workout123",
-                    exercise_type="Squat",
-                    sets=3,
-                    reps=6,
-                    weight=325.0,
-                    status="completed",
-                    notes="Updated notes",
-                ),
-                Exercise(
-                    exercise_id="ex2",
-                    workout_id="workout123",
-                    exercise_type="Bench Press",
-                    sets=3,
-                    reps=8,
-                    weight=225.0,
-                    status="planned",
-                    notes="New exercise",
-                ),
-            ],
-        ]
-
         # Call the service method
         result = self.workout_service.update_workout("workout123", update_data)
 
-        # Assert repository methods were called correctly
-        self.workout_repository_mock.get_workout.assert_called()
-        self.workout_repository_mock.update_workout.assert_called()
+        # One change set: a new exercise, an updated one and a removed one
+        self.exercise_repository_mock.apply_changes.assert_called_once()
+        puts, updates, deletes = self.exercise_repository_mock.apply_changes.call_args[
+            0
+        ]
+        self.assertEqual(len(puts), 1)
+        self.assertEqual(puts[0]["exercise_type"], "Bench Press")
+        # An ID the workout does not own is not written over; it gets a new one
+        self.assertNotEqual(puts[0]["exercise_id"], "ex2")
+        self.assertEqual(puts[0]["order"], 2)
+        self.assertEqual(updates["ex1"]["reps"], 6)
+        self.assertEqual(updates["ex1"]["athlete_id"], "athlete456")
+        self.assertEqual(deletes, ["ex-removed"])
+        self.exercise_repository_mock.create_exercise.assert_not_called()
+        self.exercise_repository_mock.update_exercise.assert_not_called()
+        self.exercise_repository_mock.delete_exercise.assert_not_called()
+
+        # ex1 was completed and a completed exercise removed; one exercise was added
+        self.workout_repository_mock.adjust_exercise_counts.assert_called_once_with(
+            "workout123",
+            completed_delta=0,
+            total_delta=0,
+            exercise_ids=["ex1", "ex-removed", puts[0]["exercise_id"]],
+        )
+        self.workout_repository_mock.update_workout.assert_called_once_with(
+            "workout123", {"status": "in_progress"}
+        )
 
-        # Assert the result is a Workout with updated data
+        # The response is built from the change set, not read back
+        self.workout_repository_mock.get_workout.assert_called_once()
         self.assertIsInstance(result, Workout)
         self.assertEqual(result.status, "in_progress")
         self.assertEqual(len(result.exercises), 2)
@@ -963,10 +876,41 @@ class TestWorkoutService(unittest.TestCase):
         self.assertEqual(result.exercises[0].status, "completed")
 
         # Check second exercise (new)
-        self.assertEqual(result.exercises[1].exercise_id, "ex2")
+        self.assertEqual(result.exercises[1].exercise_id, puts[0]["exercise_id"])
         self.assertEqual(result.exercises[1].exercise_type, "Bench Press")
         self.assertEqual(result.exercises[1].status, "planned")
 
+    def test_update_workout_incomplete_new_exercise(self):
+        """
+        Test an unknown exercise_id without fields is rejected before anything is written
+        """
+        self.workout_repository_mock.get_workout.return_value = {
+            "workout_id": "workout123",
+            "athlete_id": "athlete456",
+            "date": "2025-03-15",
+            "status": "not_started",
+        }
+        self.exercise_service_mock.get_exercises_for_workout.return_value = [
+            Exercise(
+                exercise_id="ex1",
+                workout_id="workout123",
+                exercise_type="Squat",
+                sets=3,
+                reps=5,
+                weight=315.0,
+            )
+        ]
+
+        with self.assertRaises(ValueError):
+            self.workout_service.update_workout(
+                "workout123",
+                {"exercises": [{"exercise_id": "ex1"}, {"exercise_id": "other-ex"}]},
+            )
+
+        self.exercise_repository_mock.apply_changes.assert_not_called()
+        self.workout_repository_mock.adjust_exercise_counts.assert_not_called()
+        self.workout_repository_mock.update_workout.assert_not_called()
+
     def test_update_workout_nonexistent(self):
         """
         Test updating a workout that doesn't exist
@@ -1024,7 +968,6 @@ class TestWorkoutService(unittest.TestCase):
         self.workout_repository_mock.get_workout.side_effect = [
             existing_workout_data,  # First call in get_workout
             existing_workout_data,  # Second call in update_workout (existing check)
-            updated_workout_data,  # Third call in update_workout (return updated)
         ]
 
         # Call the service method
@@ -1182,7 +1125,6 @@ class TestWorkoutService(unittest.TestCase):
         self.workout_repository_mock.get_workout.side_effect = [
             existing_workout_data,  # First call in get_workout
             existing_workout_data,  # Second call in update_workout (existing check)
-            updated_workout_data,  # Third call in update_workout (return updated)
         ]
         completed_exercises = [
             Exercise(
@@ -1586,10 +1528,8 @@ class TestWorkoutService(unittest.TestCase):
         self.workout_repository_mock.get_workout.side_effect = [
             initial_workout_data,  # get_workout call in start_workout_session
             initial_workout_data,  # get_workout call in update_workout (existing check)
-            started_workout_data,  # get_workout call in update_workout (return updated)
             started_workout_data,  # get_workout call in finish_workout_session
             started_workout_data,  # get_workout call in update_workout (existing check)
-            finished_workout_data,  # get_workout call in update_workout (return updated)
         ]
         ex1_planned = Exercise(
             exercise_id="ex1",
@@ -1614,10 +1554,8 @@ class TestWorkoutService(unittest.TestCase):
         self.exercise_service_mock.get_exercises_for_workout.side_effect = [
             [ex1_planned],  # start_workout_session's get_workout
             [ex1_planned],  # update_workout's existing check
-            [ex1_completed],  # update_workout's return
             [ex1_completed],  # finish_workout_session's get_workout
             [ex1_completed],  # update_workout's existing check
-            [ex1_completed],  # update_workout's return
         ]
 
         # Start the session
@@ -1625,7 +1563,7 @@ class TestWorkoutService(unittest.TestCase):
 
         # Assert start worked correctly
         self.assertIsInstance(start_result, Workout)
-        self.assertEqual(start_result.start_time, start_time)
+        self.assertEqual(start_result.start_time, start_time + "Z")
         self.assertEqual(start_result.status, "in_progress")
         self.assertIsNone(start_result.finish_time)
 
@@ -1635,7 +1573,7 @@ class TestWorkoutService(unittest.TestCase):
         # Assert finish worked correctly
         self.assertIsInstance(finish_result, Workout)
         self.assertEqual(finish_result.start_time, start_time)
-        self.assertEqual(finish_result.finish_time, finish_time)
+        self.assertEqual(finish_result.finish_time, finish_time + "Z")
 
         # Assert notification was created
         mock_notification_instance.create_workout_completion_notification.assert_called_once()
@@ -0,0 +1,95 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from src.config.app_config import AppConfig
+from src.utils import dynamodb_pool
+from src.utils.dynamodb_pool import (
+    build_client_config,
+    get_dynamodb_client,
+    get_dynamodb_resource,
+    get_table,
+    reset_dynamodb_pool,
+)
+
+
+class TestDynamoDBPool(unittest.TestCase):
+    """
+    Test suite for the shared DynamoDB resource registry
+    """
+
+    def setUp(self):
+        reset_dynamodb_pool()
+        self.resource_mock = MagicMock()
+        self.patcher = patch("boto3.resource", return_value=self.resource_mock)
+        self.mock_boto3 = self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        reset_dynamodb_pool()
+
+    def test_build_client_config(self):
+        """
+        Test the shared botocore config carries the pool and timeout settings
+        """
+        config = build_client_config()
+
+        self.assertEqual(
+            config.max_pool_connections, AppConfig.DYNAMODB_MAX_POOL_CONNECTIONS
+        )
+        self.assertEqual(config.connect_timeout, AppConfig.DYNAMODB_CONNECT_TIMEOUT_SEC)
+        self.assertEqual(config.read_timeout, AppConfig.DYNAMODB_READ_TIMEOUT_SEC)
+        self.assertEqual(config.region_name, AppConfig.AWS_REGION)
+
+    def test_get_dynamodb_resource_created_once(self):
+        """
+        Test the resource is created on first use and then reused
+        """
+        first = get_dynamodb_resource()
+        second = get_dynamodb_resource()
+
+        self.assertIs(first, self.resource_mock)
+        self.assertIs(first, second)
+        self.mock_boto3.assert_called_once()
+        args, kwargs = self.mock_boto3.call_args
+        self.assertEqual(args, ("dynamodb",))
+        self.assertEqual(kwargs["region_name"], AppConfig.AWS_REGION)
+        self.assertIn("config", kwargs)
+
+    def test_get_dynamodb_client_uses_resource_client(self):
+        """
+        Test the low-level client is the one backing the shared resource
+        """
+        client = get_dynamodb_client()
+
+        self.assertIs(client, self.resource_mock.meta.client)
+
+    def test_get_table_cached_per_name(self):
+        """
+        Test table handles are cached per table name
+        """
+        self.resource_mock.Table.side_effect = lambda name: MagicMock(name=name)
+
+        users1 = get_table("Users")
+        users2 = get_table("Users")
+        blocks = get_table("Blocks")
+
+        self.assertIs(users1, users2)
+        self.assertIsNot(users1, blocks)
+        self.assertEqual(self.resource_mock.Table.call_count, 2)
+
+    def test_reset_dynamodb_pool(self):
+        """
+        Test reset drops the cached resource and tables
+        """
+        get_table("Users")
+
+        reset_dynamodb_pool()
+
+        self.assertIsNone(dynamodb_pool._resource)
+        self.assertEqual(dynamodb_pool._tables, {})
+
+        get_dynamodb_resource()
+        self.assertEqual(self.mock_boto3.call_count, 2)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,308 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+from src.config.app_config import AppConfig
+from src.utils import dynamodb_retry
+from src.utils.dynamodb_retry import (
+    AdaptiveRateLimiter,
+    RetryingTable,
+    backoff_delay,
+    call_with_retry,
+    get_retry_metrics,
+    rate_limiter,
+    reset_retry_state,
+    retry_budget,
+)
+
+
+def client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "Query")
+
+
+@patch("src.utils.dynamodb_retry.time.sleep")
+class TestCallWithRetry(unittest.TestCase):
+    """
+    Test suite for call_with_retry
+    """
+
+    def setUp(self):
+        reset_retry_state()
+
+    def tearDown(self):
+        reset_retry_state()
+
+    def test_retries_throttling_then_succeeds(self, mock_sleep):
+        """
+        Test a throttled call is retried and its table counted and slowed down
+        """
+        operation = MagicMock(
+            side_effect=[
+                client_error("ProvisionedThroughputExceededException"),
+                {"Items": []},
+            ]
+        )
+
+        result = call_with_retry("Exercises", operation, KeyConditionExpression="k")
+
+        self.assertEqual(result, {"Items": []})
+        self.assertEqual(operation.call_count, 2)
+        operation.assert_called_with(KeyConditionExpression="k")
+        mock_sleep.assert_called_once()
+        self.assertEqual(
+            get_retry_metrics(),
+            {"Exercises": {"retries": 1, "throttles": 1, "exhausted": 0}},
+        )
+        self.assertIsNotNone(rate_limiter.get_rate("Exercises"))
+
+    def test_non_retryable_error_raised_immediately(self, mock_sleep):
+        """
+        Test errors such as failed conditions are not retried
+        """
+        operation = MagicMock(
+            side_effect=client_error("ConditionalCheckFailedException")
+        )
+
+        with self.assertRaises(ClientError):
+            call_with_retry("Workouts", operation)
+
+        operation.assert_called_once()
+        mock_sleep.assert_not_called()
+        self.assertEqual(get_retry_metrics(), {})
+
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        """
+        Test the error surfaces once DYNAMODB_MAX_RETRY_ATTEMPTS retries are used
+        """
+        operation = MagicMock(side_effect=client_error("ThrottlingException"))
+
+        with self.assertRaises(ClientError):
+            call_with_retry("Workouts", operation)
+
+        self.assertEqual(
+            operation.call_count, AppConfig.DYNAMODB_MAX_RETRY_ATTEMPTS + 1
+        )
+        counters = get_retry_metrics()["Workouts"]
+        self.assertEqual(counters["retries"], AppConfig.DYNAMODB_MAX_RETRY_ATTEMPTS)
+        self.assertEqual(counters["exhausted"], 1)
+
+    def test_transient_and_connection_errors_do_not_throttle(self, mock_sleep):
+        """
+        Test server and connection errors are retried without lowering the rate
+        """
+        operation = MagicMock(
+            side_effect=[
+                client_error("InternalServerError"),
+                EndpointConnectionError(endpoint_url="https://dynamodb"),
+                {"Item": {}},
+            ]
+        )
+
+        self.assertEqual(call_with_retry("Days", operation), {"Item": {}})
+
+        self.assertEqual(
+            get_retry_metrics(),
+            {"Days": {"retries": 2, "throttles": 0, "exhausted": 0}},
+        )
+        self.assertIsNone(rate_limiter.get_rate("Days"))
+
+    def test_non_idempotent_call_not_retried_after_read_timeout(self, mock_sleep):
+        """
+        Test a request the server may already have applied is not sent again
+        """
+        operation = MagicMock(
+            side_effect=ReadTimeoutError(endpoint_url="https://dynamodb")
+        )
+
+        with self.assertRaises(ReadTimeoutError):
+            call_with_retry("Workouts", operation, idempotent=False)
+
+        operation.assert_called_once()
+
+    def test_non_idempotent_call_retried_when_connect_fails(self, mock_sleep):
+        """
+        Test a request that never reached the server is retried even if not idempotent
+        """
+        operation = MagicMock(
+            side_effect=[
+                EndpointConnectionError(endpoint_url="https://dynamodb"),
+                {"Attributes": {}},
+            ]
+        )
+
+        self.assertEqual(
+            call_with_retry("Workouts", operation, idempotent=False),
+            {"Attributes": {}},
+        )
+        self.assertEqual(operation.call_count, 2)
+
+    def test_retry_budget_stops_retries_near_timeout(self, mock_sleep):
+        """
+        Test no retry is attempted once the invocation is out of time
+        """
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = (
+            AppConfig.DYNAMODB_RETRY_TIME_MARGIN_MS
+        )
+        operation = MagicMock(side_effect=client_error("ThrottlingException"))
+
+        with retry_budget(context):
+            with self.assertRaises(ClientError):
+                call_with_retry("Blocks", operation)
+
+        operation.assert_called_once()
+        mock_sleep.assert_not_called()
+        self.assertEqual(get_retry_metrics()["Blocks"]["exhausted"], 1)
+        self.assertIsNone(dynamodb_retry._deadline)
+
+    def test_retry_budget_without_lambda_context(self, mock_sleep):
+        """
+        Test handlers called without a Lambda context have no deadline
+        """
+        with retry_budget(None):
+            self.assertIsNone(dynamodb_retry._deadline)
+
+
+class TestBackoff(unittest.TestCase):
+    """
+    Test suite for backoff_delay
+    """
+
+    @patch("src.utils.dynamodb_retry.random.uniform", side_effect=lambda a, b: b)
+    def test_full_jitter_ceiling(self, mock_uniform):
+        """
+        Test the jitter range doubles per attempt and is capped
+        """
+        base = AppConfig.DYNAMODB_RETRY_BASE_DELAY_MS
+        self.assertEqual(backoff_delay(0), base / 1000)
+        self.assertEqual(backoff_delay(1), 2 * base / 1000)
+        self.assertEqual(
+            backoff_delay(50), AppConfig.DYNAMODB_RETRY_MAX_DELAY_MS / 1000
+        )
+        mock_uniform.assert_called_with(0, AppConfig.DYNAMODB_RETRY_MAX_DELAY_MS)
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    """
+    Test suite for AdaptiveRateLimiter
+    """
+
+    def test_unlimited_until_throttled(self):
+        """
+        Test requests pass freely until a throttle, which limits the table
+        """
+        limiter = AdaptiveRateLimiter()
+
+        with patch("src.utils.dynamodb_retry.time.sleep") as mock_sleep:
+            for _ in range(50):
+                limiter.acquire("Exercises")
+            mock_sleep.assert_not_called()
+
+        limiter.on_throttle("Exercises")
+
+        self.assertEqual(limiter.get_rate("Exercises"), 25)
+        self.assertIsNone(limiter.get_rate("Workouts"))
+
+    def test_waits_when_out_of_tokens(self):
+        """
+        Test a limited table makes callers wait once its bucket is empty
+        """
+        limiter = AdaptiveRateLimiter()
+        limiter.on_throttle("Exercises")
+
+        with patch("src.utils.dynamodb_retry.time.sleep") as mock_sleep:
+            for _ in range(int(dynamodb_retry.MIN_REQUESTS_PER_SEC) + 1):
+                limiter.acquire("Exercises")
+
+        mock_sleep.assert_called_once()
+
+    def test_success_lifts_limit(self):
+        """
+        Test successes raise the rate until the limit is removed
+        """
+        limiter = AdaptiveRateLimiter()
+        limiter.on_throttle("Exercises")
+        rate = limiter.get_rate("Exercises")
+
+        limiter.on_success("Exercises")
+        self.assertEqual(
+            limiter.get_rate("Exercises"), rate + dynamodb_retry.RATE_INCREASE_STEP
+        )
+
+        for _ in range(int(dynamodb_retry.MAX_REQUESTS_PER_SEC)):
+            limiter.on_success("Exercises")
+        self.assertIsNone(limiter.get_rate("Exercises"))
+
+
+class TestRetryingTable(unittest.TestCase):
+    """
+    Test suite for RetryingTable
+    """
+
+    def setUp(self):
+        reset_retry_state()
+
+    @patch("src.utils.dynamodb_retry.time.sleep")
+    def test_item_operations_are_retried(self, mock_sleep):
+        """
+        Test table operations retry throttling against the wrapped table's name
+        """
+        table = MagicMock()
+        table.get_item.side_effect = [
+            client_error("ProvisionedThroughputExceededException"),
+            {"Item": {"id": "1"}},
+        ]
+
+        result = RetryingTable(table, "Users").get_item(Key={"id": "1"})
+
+        self.assertEqual(result, {"Item": {"id": "1"}})
+        self.assertEqual(get_retry_metrics()["Users"]["throttles"], 1)
+
+    @patch("src.utils.dynamodb_retry.time.sleep")
+    def test_add_update_not_retried_after_read_timeout(self, mock_sleep):
+        """
+        Test an ADD update is not re-sent when it may already have been applied
+        """
+        table = MagicMock()
+        table.update_item.side_effect = ReadTimeoutError(
+            endpoint_url="https://dynamodb"
+        )
+
+        with self.assertRaises(ReadTimeoutError):
+            RetryingTable(table, "Workouts").update_item(
+                Key={"workout_id": "w1"},
+                UpdateExpression="ADD completed_count :completed",
+            )
+
+        table.update_item.assert_called_once()
+
+    @patch("src.utils.dynamodb_retry.time.sleep")
+    def test_set_update_retried_after_read_timeout(self, mock_sleep):
+        """
+        Test a SET update, which is safe to apply twice, is retried
+        """
+        table = MagicMock()
+        table.update_item.side_effect = [
+            ReadTimeoutError(endpoint_url="https://dynamodb"),
+            {"Attributes": {}},
+        ]
+
+        RetryingTable(table, "Workouts").update_item(
+            Key={"workout_id": "w1"}, UpdateExpression="SET #status = :status"
+        )
+
+        self.assertEqual(table.update_item.call_count, 2)
+
+    def test_other_attributes_pass_through(self):
+        """
+        Test attributes that are not item operations are the underlying table's
+        """
+        table = MagicMock()
+
+        wrapped = RetryingTable(table, "Users")
+
+        self.assertIs(wrapped.batch_writer, table.batch_writer)
+        self.assertIs(wrapped.name, table.name)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
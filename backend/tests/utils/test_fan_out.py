@@ -0,0 +1,116 @@
+import threading
+import unittest
+from unittest.mock import patch
+from src.config.app_config import AppConfig
+from src.utils.fan_out import (
+    FanOutExecutor,
+    get_fan_out_executor,
+    reset_fan_out_executor,
+)
+
+
+class TestFanOutExecutor(unittest.TestCase):
+    """
+    Test suite for the shared fan-out executor
+    """
+
+    def setUp(self):
+        self.executor = FanOutExecutor(max_workers=2, max_queue=4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        reset_fan_out_executor()
+
+    def test_map_keeps_order(self):
+        """
+        Test results come back in input order
+        """
+        self.assertEqual(
+            self.executor.map(lambda x: x * 2, range(6)), [0, 2, 4, 6, 8, 10]
+        )
+        self.assertEqual(self.executor.map(lambda x: x, []), [])
+
+    def test_map_raises_first_failure(self):
+        """
+        Test a failing task is raised to the caller
+        """
+
+        def work(x):
+            if x == 3:
+                raise ValueError("boom")
+            return x
+
+        with self.assertRaises(ValueError):
+            self.executor.map(work, range(5))
+
+    def test_nested_fan_out_does_not_deadlock(self):
+        """
+        Test a fan-out started by a worker runs inline even when every worker is busy
+        """
+        executor = FanOutExecutor(max_workers=1, max_queue=4)
+        try:
+            result = executor.map(
+                lambda x: sum(executor.map(lambda y: x * y, range(3))), range(4)
+            )
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(result, [0, 3, 6, 9])
+
+    def test_full_queue_runs_in_caller(self):
+        """
+        Test tasks beyond the worker and queue capacity run in the calling thread
+        """
+        executor = FanOutExecutor(max_workers=1, max_queue=0)
+        release = threading.Event()
+        threads = []
+
+        def work(x):
+            threads.append(threading.current_thread().name)
+            if x == 0:
+                release.wait(timeout=5)
+            else:
+                release.set()
+            return x
+
+        try:
+            self.assertEqual(executor.map(work, range(2)), [0, 1])
+        finally:
+            executor.shutdown()
+
+        self.assertIn(threading.current_thread().name, threads)
+        stats = executor.get_stats()
+        self.assertEqual(stats["submitted"], 1)
+        self.assertEqual(stats["inline"], 1)
+
+    def test_records_queue_wait(self):
+        """
+        Test queue wait time is recorded for submitted tasks
+        """
+        self.executor.map(lambda x: x, range(4))
+
+        stats = self.executor.get_stats()
+        self.assertEqual(stats["submitted"], 4)
+        self.assertGreaterEqual(stats["queue_wait_ms_max"], 0)
+        self.assertGreaterEqual(
+            stats["queue_wait_ms_total"], stats["queue_wait_ms_max"]
+        )
+
+    def test_shared_executor_matches_pool_size(self):
+        """
+        Test the process-wide executor is reused and capped at the connection pool size
+        """
+        reset_fan_out_executor()
+        with patch.object(
+            AppConfig,
+            "FAN_OUT_MAX_WORKERS",
+            AppConfig.DYNAMODB_MAX_POOL_CONNECTIONS * 4,
+        ):
+            first = get_fan_out_executor()
+
+        self.assertIs(get_fan_out_executor(), first)
+        self.assertEqual(first.max_workers, AppConfig.DYNAMODB_MAX_POOL_CONNECTIONS)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
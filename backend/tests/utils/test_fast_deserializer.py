@@ -0,0 +1,112 @@
+import unittest
+from decimal import Decimal
+from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.types import TypeDeserializer
+from src.utils.decimal_converter import convert_decimals_to_floats
+from src.utils.fast_deserializer import (
+    build_low_level_query,
+    deserialize_item,
+    deserialize_value,
+    serialize_value,
+)
+
+
+class TestFastDeserializer(unittest.TestCase):
+    """
+    Test suite for the single-pass DynamoDB deserializer
+    """
+
+    def test_deserialize_item(self):
+        """
+        Test every wire type converts to the matching native value
+        """
+        item = {
+            "exercise_id": {"S": "ex1"},
+            "sets": {"N": "3"},
+            "weight": {"N": "102.5"},
+            "is_predefined": {"BOOL": True},
+            "notes": {"NULL": True},
+            "sets_data": {
+                "L": [{"M": {"set_number": {"N": "1"}, "rpe": {"N": "7.5"}}}]
+            },
+            "tags": {"SS": ["a", "b"]},
+            "plates": {"NS": ["20", "2.5"]},
+        }
+
+        self.assertEqual(
+            deserialize_item(item),
+            {
+                "exercise_id": "ex1",
+                "sets": 3,
+                "weight": 102.5,
+                "is_predefined": True,
+                "notes": None,
+                "sets_data": [{"set_number": 1, "rpe": 7.5}],
+                "tags": ["a", "b"],
+                "plates": [20, 2.5],
+            },
+        )
+
+    def test_matches_resource_conversion(self):
+        """
+        Test results equal boto3 deserialization followed by convert_decimals_to_floats
+        """
+        item = {
+            "weight": {"N": "315"},
+            "rpe": {"N": "8.5"},
+            "exponent": {"N": "1E+2"},
+            "nested": {"M": {"reps": {"L": [{"N": "5"}, {"N": "-3"}]}}},
+        }
+        deserializer = TypeDeserializer()
+        expected = convert_decimals_to_floats(
+            {key: deserializer.deserialize(value) for key, value in item.items()}
+        )
+
+        self.assertEqual(deserialize_item(item), expected)
+
+    def test_deserialize_value_unknown_type(self):
+        """
+        Test an unknown type code is rejected
+        """
+        with self.assertRaises(TypeError):
+            deserialize_value({"XX": "?"})
+
+    def test_serialize_value(self):
+        """
+        Test floats are serialized as exact decimals
+        """
+        self.assertEqual(serialize_value(102.5), {"N": "102.5"})
+        self.assertEqual(serialize_value({"w": 0.1}), {"M": {"w": {"N": "0.1"}}})
+
+    def test_build_low_level_query(self):
+        """
+        Test conditions are rendered and values serialized for the low-level client
+        """
+        params = build_low_level_query(
+            {
+                "TableName": "Exercises",
+                "IndexName": "workout-index",
+                "KeyConditionExpression": Key("workout_id").eq("w1"),
+                "FilterExpression": Attr("weight").gt(Decimal("100")),
+                "ProjectionExpression": "#proj0",
+                "ExpressionAttributeNames": {"#proj0": "status"},
+                "Limit": 10,
+            }
+        )
+
+        self.assertEqual(params["TableName"], "Exercises")
+        self.assertEqual(params["Limit"], 10)
+        self.assertEqual(params["KeyConditionExpression"], "#n0 = :v0")
+        self.assertEqual(params["FilterExpression"], "#n1 > :v1")
+        self.assertEqual(
+            params["ExpressionAttributeNames"],
+            {"#proj0": "status", "#n0": "workout_id", "#n1": "weight"},
+        )
+        self.assertEqual(
+            params["ExpressionAttributeValues"],
+            {":v0": {"S": "w1"}, ":v1": {"N": "100"}},
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from src.utils.identity_map import IdentityMap, get_identity_map, request_scope
+
+
+class TestIdentityMap(unittest.TestCase):
+    """
+    Test suite for the request-scoped identity map
+    """
+
+    def test_lookup_unknown_item(self):
+        """
+        Test an item never read is reported as unknown
+        """
+        identity_map = IdentityMap()
+
+        self.assertEqual(identity_map.lookup("Days", {"day_id": "d1"}), (False, None))
+
+    def test_remember_returns_copies(self):
+        """
+        Test callers cannot mutate the remembered item
+        """
+        identity_map = IdentityMap()
+        item = {"day_id": "d1", "notes": ["a"]}
+        identity_map.remember("Days", {"day_id": "d1"}, item)
+        item["notes"].append("b")
+
+        known, found = identity_map.lookup("Days", {"day_id": "d1"})
+        found["notes"].append("c")
+
+        self.assertTrue(known)
+        self.assertEqual(
+            identity_map.lookup("Days", {"day_id": "d1"})[1]["notes"], ["a"]
+        )
+
+    def test_remember_missing_item(self):
+        """
+        Test a known-missing item is distinguished from an unknown one
+        """
+        identity_map = IdentityMap()
+        identity_map.remember("Days", {"day_id": "d1"}, None)
+
+        self.assertEqual(identity_map.lookup("Days", {"day_id": "d1"}), (True, None))
+
+    def test_record_write(self):
+        """
+        Test writes update, delete or evict entries and drop the table's queries
+        """
+        identity_map = IdentityMap()
+        identity_map.remember("Days", {"day_id": "d1"}, {"day_id": "d1"})
+        identity_map.remember("Days", {"day_id": "d2"}, {"day_id": "d2"})
+        identity_map.remember("Weeks", {"week_id": "w1"}, {"week_id": "w1"})
+
+        identity_map.record_write("Days", {"day_id": "d1"}, {"day_id": "d1", "x": 1})
+        self.assertEqual(
+            identity_map.lookup("Days", {"day_id": "d1"}),
+            (True, {"day_id": "d1", "x": 1}),
+        )
+
+        identity_map.record_write("Days", {"day_id": "d1"}, deleted=True)
+        self.assertEqual(identity_map.lookup("Days", {"day_id": "d1"}), (True, None))
+
+        identity_map.record_write("Days", {"day_id": "d1"})
+        self.assertEqual(identity_map.lookup("Days", {"day_id": "d1"}), (False, None))
+
+        identity_map.record_write("Days")
+        self.assertEqual(identity_map.lookup("Days", {"day_id": "d2"}), (False, None))
+        self.assertTrue(identity_map.lookup("Weeks", {"week_id": "w1"})[0])
+
+    def test_memoize_query(self):
+        """
+        Test a query runs once until its table is written
+        """
+        identity_map = IdentityMap()
+        calls = []
+
+        def run_query():
+            calls.append(1)
+            return [{"exercise_id": "e1"}]
+
+        identity_map.memoize_query("Exercises", ("workout_id", "w1"), run_query)
+        result = identity_map.memoize_query(
+            "Exercises", ("workout_id", "w1"), run_query
+        )
+        self.assertEqual(result, [{"exercise_id": "e1"}])
+        self.assertEqual(len(calls), 1)
+
+        identity_map.record_write("Exercises", {"exercise_id": "e2"}, {"x": 1})
+        identity_map.memoize_query("Exercises", ("workout_id", "w1"), run_query)
+        self.assertEqual(len(calls), 2)
+
+    def test_request_scope(self):
+        """
+        Test the scope is active only inside the block and nested scopes share it
+        """
+        self.assertIsNone(get_identity_map())
+
+        with request_scope() as outer:
+            self.assertIs(get_identity_map(), outer)
+            with request_scope() as inner:
+                self.assertIs(inner, outer)
+            self.assertIs(get_identity_map(), outer)
+
+        self.assertIsNone(get_identity_map())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
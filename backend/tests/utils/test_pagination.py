@@ -0,0 +1,168 @@
+import unittest
+from decimal import Decimal
+from src.config.app_config import AppConfig
+from src.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    is_pagination_requested,
+    next_cursor_headers,
+    parse_pagination_params,
+)
+
+
+class TestPagination(unittest.TestCase):
+    """
+    Test suite for the cursor pagination utilities
+    """
+
+    def setUp(self):
+        self.key = {"workout_id": "workout-2", "athlete_id": "athlete-1"}
+        self.scope = "workouts:athlete-1"
+
+    def test_cursor_round_trip(self):
+        """
+        Test that a cursor decodes back to the key it was built from
+        """
+        cursor = encode_cursor(self.key, self.scope)
+
+        self.assertIsInstance(cursor, str)
+        self.assertNotIn("workout-2", cursor)
+        self.assertEqual(decode_cursor(cursor, self.scope), self.key)
+
+    def test_cursor_round_trip_numeric_key(self):
+        """
+        Test that numeric key attributes survive as Decimal for DynamoDB
+        """
+        key = {"coach_id": "coach-1", "created_at": Decimal("1718000000")}
+
+        result = decode_cursor(encode_cursor(key, "scope"), "scope")
+
+        self.assertEqual(result["created_at"], Decimal("1718000000"))
+        self.assertIsInstance(result["created_at"], Decimal)
+
+    def test_encode_cursor_without_key(self):
+        """
+        Test that the last page yields no cursor
+        """
+        self.assertIsNone(encode_cursor(None, self.scope))
+        self.assertIsNone(encode_cursor({}, self.scope))
+
+    def test_decode_cursor_empty(self):
+        """
+        Test that a missing cursor means the first page
+        """
+        self.assertIsNone(decode_cursor(None, self.scope))
+        self.assertIsNone(decode_cursor("", self.scope))
+
+    def test_decode_cursor_tampered(self):
+        """
+        Test that editing the payload invalidates the signature
+        """
+        cursor = encode_cursor(self.key, self.scope)
+        forged = encode_cursor({"workout_id": "other"}, self.scope)
+        tampered = forged.split(".")[0] + "." + cursor.split(".")[1]
+
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor(tampered, self.scope)
+
+    def test_decode_cursor_malformed(self):
+        """
+        Test that garbage cursors are rejected
+        """
+        for cursor in ("not-a-cursor", "abc.def", "%%%.%%%"):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursorError):
+                    decode_cursor(cursor, self.scope)
+
+    def test_decode_cursor_wrong_scope(self):
+        """
+        Test that a cursor cannot be replayed against another list
+        """
+        cursor = encode_cursor(self.key, self.scope)
+
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor(cursor, "workouts:athlete-2")
+
+    def test_decode_cursor_wrong_secret(self):
+        """
+        Test that cursors signed with another secret are rejected
+        """
+        original_secret = AppConfig.PAGINATION_CURSOR_SECRET
+        try:
+            AppConfig.PAGINATION_CURSOR_SECRET = "other-secret"
+            cursor = encode_cursor(self.key, self.scope)
+        finally:
+            AppConfig.PAGINATION_CURSOR_SECRET = original_secret
+
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor(cursor, self.scope)
+
+    def test_encode_cursor_without_secret(self):
+        """
+        Test that cursors are never signed when no secret is configured
+        """
+        original_secret = AppConfig.PAGINATION_CURSOR_SECRET
+        try:
+            AppConfig.PAGINATION_CURSOR_SECRET = ""
+            with self.assertRaises(RuntimeError):
+                encode_cursor(self.key, self.scope)
+        finally:
+            AppConfig.PAGINATION_CURSOR_SECRET = original_secret
+
+    def test_parse_pagination_params_defaults(self):
+        """
+        Test the default page size and first page when no parameters are given
+        """
+        self.assertEqual(parse_pagination_params(None, self.scope, 25), (25, None))
+
+    def test_parse_pagination_params_with_cursor(self):
+        """
+        Test that limit and cursor are both read
+        """
+        cursor = encode_cursor(self.key, self.scope)
+
+        limit, start_key = parse_pagination_params(
+            {"limit": "10", "cursor": cursor}, self.scope, 25
+        )
+
+        self.assertEqual(limit, 10)
+        self.assertEqual(start_key, self.key)
+
+    def test_parse_pagination_params_caps_limit(self):
+        """
+        Test that oversized pages are capped
+        """
+        limit, _ = parse_pagination_params({"limit": "100000"}, self.scope, 25)
+
+        self.assertEqual(limit, AppConfig.PAGINATION_MAX_LIMIT)
+
+    def test_parse_pagination_params_invalid_limit(self):
+        """
+        Test that non-positive or non-numeric limits are rejected
+        """
+        for limit in ("abc", "0", "-5"):
+            with self.subTest(limit=limit):
+                with self.assertRaises(ValueError):
+                    parse_pagination_params({"limit": limit}, self.scope, 25)
+
+    def test_is_pagination_requested(self):
+        """
+        Test detection of paged requests
+        """
+        self.assertFalse(is_pagination_requested(None))
+        self.assertFalse(is_pagination_requested({"status": "active"}))
+        self.assertTrue(is_pagination_requested({"limit": "5"}))
+        self.assertTrue(is_pagination_requested({"cursor": "abc"}))
+
+    def test_next_cursor_headers(self):
+        """
+        Test that the header is only set when there is a next page
+        """
+        self.assertEqual(next_cursor_headers(None), {})
+        self.assertEqual(next_cursor_headers("abc"), {NEXT_CURSOR_HEADER: "abc"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,18 @@ class TestResponseUtil(unittest.TestCase):
         self.assertEqual(parsed_body["message"], "Success")
         self.assertEqual(parsed_body["data"]["id"], 123)
 
+    def test_create_response_with_extra_headers(self):
+        """
+        Test that extra headers are added and exposed to browsers
+        """
+        response = create_response(200, [], {"X-Next-Cursor": "abc"})
+
+        self.assertEqual(response["headers"]["X-Next-Cursor"], "abc")
+        self.assertEqual(
+            response["headers"]["Access-Control-Expose-Headers"], "X-Next-Cursor"
+        )
+        self.assertEqual(response["headers"]["Content-Type"], "application/json")
+
     def test_create_response_with_list(self):
         """
         Test creating a response with a list body
@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import patch
+from src.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """
+    Test suite for the TTLCache utility
+    """
+
+    def test_get_returns_stored_value(self):
+        """
+        Test a stored value is returned until it is invalidated
+        """
+        cache = TTLCache(max_size=10, ttl_seconds=60)
+        cache.set(("coach", "athlete"), {"status": "active"})
+
+        self.assertEqual(cache.get(("coach", "athlete")), {"status": "active"})
+
+        cache.invalidate(("coach", "athlete"))
+        self.assertIsNone(cache.get(("coach", "athlete")))
+
+    @patch("src.utils.ttl_cache.time.monotonic")
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        """
+        Test entries are dropped once their TTL has elapsed
+        """
+        mock_monotonic.return_value = 1000.0
+        cache = TTLCache(max_size=10, ttl_seconds=300)
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 1299.0
+        self.assertEqual(cache.get("key"), "value")
+
+        mock_monotonic.return_value = 1300.0
+        self.assertEqual(cache.get("key", "miss"), "miss")
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """
+        Test the cache stays within max_size by evicting the least recently used entry
+        """
+        cache = TTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Touch "a" so "b" becomes the least recently used
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_disabled_cache_stores_nothing(self):
+        """
+        Test a zero TTL or size turns the cache into a no-op
+        """
+        for cache in (TTLCache(max_size=0, ttl_seconds=60), TTLCache(10, 0)):
+            cache.set("key", "value")
+            self.assertIsNone(cache.get("key"))
+
+    def test_clear(self):
+        """
+        Test clear drops every entry
+        """
+        cache = TTLCache(max_size=10, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
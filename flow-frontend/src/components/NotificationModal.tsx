@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
-import { getNotifications, markNotificationAsRead } from '../services/api';
-import type { Notification } from '../services/api';
+import { getNotifications, getNotificationWorkout, markNotificationAsRead } from '../services/api';
+import type { Notification, Workout } from '../services/api';
 import WorkoutCompletion from './WorkoutCompletion';
 import {
   Dialog,
@@ -19,6 +19,7 @@ interface NotificationModalProps {
 const NotificationModal: React.FC<NotificationModalProps> = ({ isOpen, onClose }) => {
   const [notifications, setNotifications] = useState<Notification[]>([]);
   const [selectedNotification, setSelectedNotification] = useState<Notification | null>(null);
+  const [selectedWorkout, setSelectedWorkout] = useState<Workout | null>(null);
   const [isLoading, setIsLoading] = useState(false);
   const [groupBy, setGroupBy] = useState<'date' | 'athlete'>('date');
 
@@ -67,6 +68,15 @@ const NotificationModal: React.FC<NotificationModalProps> = ({ isOpen, onClose }
   const handleNotificationClick = async (notification: Notification) => {
     await handleMarkAsRead(notification);
     setSelectedNotification(notification);
+    setSelectedWorkout(null);
+
+    // Notifications only carry a summary; load the full workout for the detail panel
+    try {
+      const workout = await getNotificationWorkout(notification.notification_id);
+      setSelectedWorkout(workout);
+    } catch (error) {
+      console.error('Error fetching workout details:', error);
+    }
   };
 
   const formatDate = (dateString: string): string => {
@@ -239,9 +249,14 @@ const NotificationModal: React.FC<NotificationModalProps> = ({ isOpen, onClose }
                 </div>
 
                 {/* Use WorkoutCompletion component to display workout details */}
-                <WorkoutCompletion
-                  workout={selectedNotification.workout_data}
-                />
+                {selectedWorkout?.workout_id === selectedNotification.workout_id ? (
+                  <WorkoutCompletion workout={selectedWorkout} />
+                ) : (
+                  <p className="text-sm text-gray-500">
+                    {selectedNotification.workout_summary.exercise_count} exercises ·{' '}
+                    {selectedNotification.workout_summary.completed_sets} sets completed
+                  </p>
+                )}
               </div>
             ) : (
               <div className="flex items-center justify-center h-full text-gray-500">
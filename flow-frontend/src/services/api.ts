@@ -204,6 +204,16 @@ export const getAuthHeaders = async () => {
   }
 };
 
+// Compact workout summary stored on a notification; the full workout is fetched on demand
+export interface NotificationWorkoutSummary {
+  status: string | null;
+  exercise_count: number;
+  completed_sets: number;
+  total_volume: number;
+  duration_minutes: number | null;
+  top_sets: { exercise_type: string; weight: number; reps: number }[];
+}
+
 // Notification interface
 export interface Notification {
   notification_id: string;
@@ -212,7 +222,7 @@ export interface Notification {
   athlete_name: string;
   workout_id: string;
   day_info: string; // e.g., "Day 5 (2024-06-25)"
-  workout_data: Workout;
+  workout_summary: NotificationWorkoutSummary;
   is_read: boolean;
   created_at: string;
   notification_type: string;
@@ -1901,6 +1911,29 @@ export const getNotifications = async (): Promise<Notification[]> => {
   }
 };
 
+export const getNotificationWorkout = async (notificationId: string): Promise<Workout> => {
+  try {
+    const headers = await getAuthHeaders();
+
+    const apiResponse = await get({
+      apiName: 'flow-api',
+      path: `/notifications/${notificationId}/workout`,
+      options: { headers },
+    });
+
+    const actualResponse = await apiResponse.response;
+
+    if (actualResponse && actualResponse.body) {
+      return await actualResponse.body.json() as unknown as Workout;
+    }
+
+    throw new Error('No response data');
+  } catch (error) {
+    console.error('Error fetching notification workout:', error);
+    throw error;
+  }
+};
+
 export const markNotificationAsRead = async (notificationId: string): Promise<void> => {
   try {
     const headers = await getAuthHeaders();